@@ -15,18 +15,66 @@ from app.backtesting.dataset import (
     DatasetSourceIdentity,
     DatasetStreamQuality,
     DatasetSerializer,
+    DatasetVerificationCache,
+    DatasetVerificationCacheStats,
     MissingRange,
     Timeframe,
+    VerifiedDataset,
+)
+from app.backtesting.columnar import (
+    ColumnarCandleError,
+    ColumnarCandleStore,
+    ColumnarCandleStream,
+    ScaledIntegerColumn,
 )
 from app.backtesting.contracts import DatasetStreamCoverage
+from app.backtesting.dataset_streaming import (
+    StreamingBuildOrderError,
+    StreamingDatasetBuild,
+    StreamingDatasetBuilder,
+)
+from app.backtesting.dataset_append import DatasetAppender, DatasetAppendRejected
+from app.backtesting.dataset_blobs import (
+    DatasetBlobError,
+    DatasetBlobManifest,
+    DatasetBlobRef,
+)
+from app.backtesting.dataset_catalog import DatasetCatalog
+from app.backtesting.dataset_compression import (
+    DatasetCompressionError,
+    DatasetCompressionRecord,
+)
+from app.backtesting.dataset_index import (
+    DatasetStreamIndex,
+    DatasetStreamIndexError,
+    DatasetStreamRange,
+)
+from app.backtesting.dataset_mapped import MappedCandleStream, MappedDatasetArtifacts
 from app.backtesting.dataset_store import (
+    DatasetBatchPublicationConflict,
+    DatasetNotPublished,
     DatasetPublicationConflict,
     DatasetPublicationResult,
     DatasetPublicationStatus,
     DatasetPublisher,
+    DatasetUsage,
+)
+from app.backtesting.dataset_retention import (
+    DatasetEviction,
+    DatasetEvictionReason,
+    DatasetRetention,
+    DatasetRetentionPlan,
+    DatasetRetentionPolicy,
+)
+from app.backtesting.php_worker_pool import PhpWorkerError, PhpWorkerPool
+from app.backtesting.resampling import (
+    ResampledCandleStream,
+    ResamplingError,
+    TimeframeResampler,
 )
 from app.backtesting.tradingcore_bridge import (
     BacktestTradingCoreBridge,
+    CanonicalBacktestRuleOutcome,
     CanonicalBacktestRuleRequest,
     CanonicalBacktestRuleResult,
     CanonicalIndicatorSnapshot,
@@ -34,42 +82,106 @@ from app.backtesting.tradingcore_bridge import (
 )
 from app.backtesting.indicator_bridge import (
     BacktestIndicatorBridge,
+    CanonicalIndicatorBatchProjectionRequest,
+    CanonicalIndicatorBatchProjectionResult,
     CanonicalIndicatorDatasetBinding,
     CanonicalIndicatorProjectionRequest,
     CanonicalIndicatorProjectionResult,
     CanonicalProjectedIndicatorSnapshot,
     IndicatorBridgeError,
     VerifiedIndicatorWindowBuilder,
+    VerifiedIndicatorWindowIndex,
+)
+from app.backtesting.indicator_cache import (
+    IndicatorProjectionCache,
+    IndicatorProjectionCacheStats,
+)
+from app.backtesting.indicator_engine import (
+    NATIVE_INDICATOR_ENGINE_VERSION,
+    NativeIndicatorProjector,
+    calculate_indicator_context,
+    indicator_engine_mismatches,
 )
+from app.backtesting.indicator_state import IncrementalIndicatorState
+from app.backtesting.rule_memo import RuleResultMemo, RuleResultMemoStats
 
 __all__ = (
     "CandleRecord",
+    "ColumnarCandleError",
+    "ColumnarCandleStore",
+    "ColumnarCandleStream",
+    "DatasetAppender",
+    "DatasetAppendRejected",
     "DatasetArtifacts",
     "DatasetArtifactVerificationError",
+    "DatasetBatchPublicationConflict",
+    "DatasetBlobError",
+    "DatasetBlobManifest",
+    "DatasetBlobRef",
     "DatasetBuilder",
     "DatasetBuildRejected",
     "DatasetBuildResult",
+    "DatasetCatalog",
+    "DatasetCompressionError",
+    "DatasetCompressionRecord",
+    "DatasetEviction",
+    "DatasetEvictionReason",
     "DatasetQualityReport",
+    "DatasetNotPublished",
     "DatasetPublicationConflict",
     "DatasetPublicationResult",
     "DatasetPublicationStatus",
     "DatasetPublisher",
+    "DatasetRetention",
+    "DatasetRetentionPlan",
+    "DatasetRetentionPolicy",
     "DatasetSourceIdentity",
     "DatasetStreamQuality",
     "DatasetStreamCoverage",
+    "DatasetStreamIndex",
+    "DatasetStreamIndexError",
+    "DatasetStreamRange",
     "DatasetSerializer",
+    "DatasetUsage",
+    "DatasetVerificationCache",
+    "DatasetVerificationCacheStats",
+    "MappedCandleStream",
+    "MappedDatasetArtifacts",
     "MissingRange",
+    "PhpWorkerError",
+    "PhpWorkerPool",
+    "ResampledCandleStream",
+    "ResamplingError",
+    "ScaledIntegerColumn",
+    "StreamingBuildOrderError",
+    "StreamingDatasetBuild",
+    "StreamingDatasetBuilder",
     "Timeframe",
+    "TimeframeResampler",
+    "VerifiedDataset",
     "BacktestTradingCoreBridge",
+    "CanonicalBacktestRuleOutcome",
     "CanonicalBacktestRuleRequest",
     "CanonicalBacktestRuleResult",
     "CanonicalIndicatorSnapshot",
     "TradingCoreBridgeError",
     "BacktestIndicatorBridge",
+    "CanonicalIndicatorBatchProjectionRequest",
+    "CanonicalIndicatorBatchProjectionResult",
     "CanonicalIndicatorDatasetBinding",
     "CanonicalIndicatorProjectionRequest",
     "CanonicalIndicatorProjectionResult",
     "CanonicalProjectedIndicatorSnapshot",
     "IndicatorBridgeError",
     "VerifiedIndicatorWindowBuilder",
+    "VerifiedIndicatorWindowIndex",
+    "IndicatorProjectionCache",
+    "IndicatorProjectionCacheStats",
+    "NATIVE_INDICATOR_ENGINE_VERSION",
+    "NativeIndicatorProjector",
+    "calculate_indicator_context",
+    "indicator_engine_mismatches",
+    "IncrementalIndicatorState",
+    "RuleResultMemo",
+    "RuleResultMemoStats",
 )
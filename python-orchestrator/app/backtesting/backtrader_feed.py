@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from app.backtesting.columnar import ColumnarCandleStore
 from app.backtesting.dataset import CandleRecord, DatasetArtifacts, DatasetSerializer
+from app.backtesting.dataset_mapped import MappedDatasetArtifacts
 
 
 class BacktraderFeedError(ValueError):
@@ -39,19 +41,38 @@ class VerifiedBacktraderFeedAdapter:
 
     def __init__(
         self,
-        artifacts: DatasetArtifacts,
+        artifacts: DatasetArtifacts | MappedDatasetArtifacts,
         *,
         symbol: str,
         timeframe: str,
         period_start: datetime,
         period_end: datetime,
+        columnar: ColumnarCandleStore | None = None,
     ) -> None:
         try:
-            descriptor = DatasetSerializer.verify(artifacts)
-            records = tuple(
-                CandleRecord.model_validate_json(line)
-                for line in artifacts.candles_ndjson.rstrip(b"\n").split(b"\n")
-            )
+            if isinstance(artifacts, MappedDatasetArtifacts):
+                # Mapped artifacts are verified in bounded memory and decode
+                # only the requested stream's lines.
+                if columnar is not None:
+                    raise ValueError("backtrader_feed_columnar_binding_invalid")
+                descriptor = artifacts.verify()
+                stream = artifacts.find(symbol=symbol, timeframe=timeframe)
+                records = () if stream is None else tuple(stream.records())
+            elif columnar is None:
+                verified = DatasetSerializer.verified(artifacts)
+                descriptor = verified.descriptor
+                records = verified.records
+            else:
+                # A prepared store decodes only the requested stream, but it
+                # must be bound to the exact verified candle bytes.
+                descriptor = DatasetSerializer.verify(artifacts)
+                if (
+                    not isinstance(columnar, ColumnarCandleStore)
+                    or columnar.candles_checksum != descriptor.candles_checksum
+                ):
+                    raise ValueError("backtrader_feed_columnar_binding_invalid")
+                stream = columnar.find(symbol=symbol, timeframe=timeframe)
+                records = () if stream is None else tuple(stream.records())
         except Exception as exc:
             raise BacktraderFeedError("backtrader_feed_artifacts_invalid") from exc
         records = tuple(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
@@ -39,12 +40,17 @@ from app.backtesting.visible_queue_depletion import (
 )
 
 
-_ENGINE_VERSION = "backtrader-1.9.78.123+canonical-runtime.v1"
-_VISIBLE_FILL_ENGINE_VERSION = "backtrader-1.9.78.123+canonical-runtime.v2"
-_STAGED_FILL_ENGINE_VERSION = "backtrader-1.9.78.123+canonical-runtime.v3"
+BACKTRADER_DELIVERY_ENGINE = "backtrader-1.9.78.123"
+NATIVE_DELIVERY_ENGINE = "native-sequential.v1"
+_DELIVERY_ENGINES = frozenset({BACKTRADER_DELIVERY_ENGINE, NATIVE_DELIVERY_ENGINE})
+_ENGINE_VERSION = f"{BACKTRADER_DELIVERY_ENGINE}+canonical-runtime.v1"
+_VISIBLE_FILL_ENGINE_VERSION = f"{BACKTRADER_DELIVERY_ENGINE}+canonical-runtime.v2"
+_STAGED_FILL_ENGINE_VERSION = f"{BACKTRADER_DELIVERY_ENGINE}+canonical-runtime.v3"
 
 
 def _canonical(value: Any) -> str:
+    if isinstance(value, _Encoded):
+        return value
     if isinstance(value, dict):
         return "{" + ",".join(
             json.dumps(key, ensure_ascii=False, separators=(",", ":"))
@@ -61,6 +67,10 @@ def _canonical(value: Any) -> str:
     return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
 
 
+class _Encoded(str):
+    """Canonical JSON encoded ahead of time and embedded verbatim."""
+
+
 def _hash(value: Any) -> str:
     return "sha256:" + hashlib.sha256(_canonical(value).encode()).hexdigest()
 
@@ -88,6 +98,22 @@ class _VerifiedBars(bt.feed.DataBase):
 
 
 class CanonicalBacktraderRuntime:
+    def __init__(self, *, delivery_engine: str = BACKTRADER_DELIVERY_ENGINE) -> None:
+        """``delivery_engine`` selects the temporal driver and prefixes ``engine_version``.
+
+        ``NATIVE_DELIVERY_ENGINE`` walks the verified feed directly instead of
+        through Cerebro; it delivers the same bars in the same order and
+        rejects the same out-of-range values.
+        """
+
+        if delivery_engine not in _DELIVERY_ENGINES:
+            raise ValueError("backtrader_runtime_delivery_engine_unsupported")
+        self._delivery_engine = delivery_engine
+
+    @property
+    def delivery_engine(self) -> str:
+        return self._delivery_engine
+
     def run(
         self,
         plan: CanonicalBacktestOrderPlan,
@@ -98,6 +124,101 @@ class CanonicalBacktraderRuntime:
         maker_fill_evidence: VisibleQueueDepletionResult | None = None,
         partial_fill_cost_bridge: PartialFillCostBridge | None = None,
     ) -> str:
+        (result,) = self.run_many(
+            (plan,),
+            feed,
+            funding_schedule=funding_schedule,
+            funding_bridge=funding_bridge,
+            maker_fill_evidence=(maker_fill_evidence,),
+            partial_fill_cost_bridge=partial_fill_cost_bridge,
+        )
+        return result
+
+    def run_many(
+        self,
+        plans: Sequence[CanonicalBacktestOrderPlan],
+        feed: VerifiedBacktraderFeedAdapter,
+        *,
+        funding_schedule: VerifiedHistoricalFundingSchedule | None = None,
+        funding_bridge: HistoricalFundingBridge | None = None,
+        maker_fill_evidence: Sequence[VisibleQueueDepletionResult | None] | None = None,
+        partial_fill_cost_bridge: PartialFillCostBridge | None = None,
+    ) -> tuple[str, ...]:
+        """Run every plan against one delivery of ``feed``; results follow plan order.
+
+        Each result is byte-identical to ``run`` for the same plan. Bars are
+        delivered once, the funding schedule is verified once and the
+        ``source_record_ids`` list is encoded once for every ``input_hash``.
+        ``maker_fill_evidence``, when given, pairs one entry with each plan.
+        Any invalid plan fails the whole call.
+        """
+
+        if not isinstance(plans, Sequence):
+            raise ValueError("backtrader_runtime_plans_invalid")
+        if maker_fill_evidence is None:
+            maker_fill_evidence = (None,) * len(plans)
+        elif (
+            not isinstance(maker_fill_evidence, Sequence)
+            or len(maker_fill_evidence) != len(plans)
+        ):
+            raise ValueError("backtrader_runtime_visible_fill_evidence_invalid")
+        prepared = [
+            self._prepared(
+                plan,
+                feed,
+                funding_schedule=funding_schedule,
+                funding_bridge=funding_bridge,
+                maker_fill_evidence=evidence,
+                partial_fill_cost_bridge=partial_fill_cost_bridge,
+            )
+            for plan, evidence in zip(plans, maker_fill_evidence)
+        ]
+        if not prepared:
+            return ()
+        delivered_bars = (
+            _native_delivery(feed)
+            if self._delivery_engine == NATIVE_DELIVERY_ENGINE
+            else _backtrader_delivery(feed)
+        )
+        encoded_source_record_ids = _Encoded(
+            _canonical([bar.source_record_id for bar in feed.bars])
+        )
+        results: list[str] = []
+        verified_schedule: VerifiedHistoricalFundingSchedule | None = None
+        for plan, evidence, uses_visible_fill, uses_staged_fill in prepared:
+            outcome = _execute(plan, delivered_bars, evidence, uses_staged_fill)
+            if verified_schedule is None and (
+                funding_schedule is not None or funding_bridge is not None
+            ):
+                verified_schedule = _verified_funding_schedule(
+                    feed, funding_schedule, funding_bridge
+                )
+            results.append(
+                self._result(
+                    plan,
+                    feed,
+                    outcome,
+                    encoded_source_record_ids,
+                    uses_visible_fill=uses_visible_fill,
+                    uses_staged_fill=uses_staged_fill,
+                    funding_schedule=verified_schedule,
+                    funding_bridge=funding_bridge,
+                    maker_fill_evidence=evidence,
+                    partial_fill_cost_bridge=partial_fill_cost_bridge,
+                )
+            )
+        return tuple(results)
+
+    @staticmethod
+    def _prepared(
+        plan: CanonicalBacktestOrderPlan,
+        feed: VerifiedBacktraderFeedAdapter,
+        *,
+        funding_schedule: VerifiedHistoricalFundingSchedule | None,
+        funding_bridge: HistoricalFundingBridge | None,
+        maker_fill_evidence: VisibleQueueDepletionResult | None,
+        partial_fill_cost_bridge: PartialFillCostBridge | None,
+    ) -> tuple[CanonicalBacktestOrderPlan, VisibleQueueDepletionResult | None, bool, bool]:
         wire_plan = plan.model_dump(mode="json", by_alias=True)
         for optional_key in (
             "marketFallback", "cancelAfterAt", "holdingExpiresAt", "orderBookInputHash",
@@ -149,38 +270,22 @@ class CanonicalBacktraderRuntime:
             raise ValueError(
                 "backtrader_runtime_staged_historical_funding_forbidden"
             )
+        return plan, maker_fill_evidence, uses_visible_fill, uses_staged_fill
 
-        # Cerebro remains the deterministic temporal driver. The strategy only
-        # records delivery order; all execution semantics live in the pure state
-        # machine and all trading authorities stay in the PHP plan.
-        delivered: list[int] = []
-
-        class DeliveryStrategy(bt.Strategy):
-            def next(self) -> None:
-                delivered.append(len(self) - 1)
-
-        cerebro = bt.Cerebro(stdstats=False, maxcpus=1)
-        cerebro.adddata(_VerifiedBars(bars=feed.bars))
-        cerebro.addstrategy(DeliveryStrategy)
-        cerebro.run(runonce=False, preload=False, exactbars=True)
-        if delivered != list(range(len(feed.bars))):
-            raise ValueError("backtrader_runtime_delivery_invalid")
-
-        delivered_bars = tuple(feed.bars[index] for index in delivered)
-        if maker_fill_evidence is None:
-            outcome = execute_plan(plan, delivered_bars)
-        elif maker_fill_evidence.status == "unfilled":
-            outcome = BacktestExecutionResult(
-                "not_executed", "visible_queue_unfilled", ()
-            )
-        elif uses_staged_fill:
-            outcome = execute_plan_from_staged_visible_fills(
-                plan, delivered_bars, maker_fill_evidence
-            )
-        else:
-            outcome = execute_plan_from_visible_fill(
-                plan, delivered_bars, maker_fill_evidence
-            )
+    def _result(
+        self,
+        plan: CanonicalBacktestOrderPlan,
+        feed: VerifiedBacktraderFeedAdapter,
+        outcome: BacktestExecutionResult,
+        encoded_source_record_ids: _Encoded,
+        *,
+        uses_visible_fill: bool,
+        uses_staged_fill: bool,
+        funding_schedule: VerifiedHistoricalFundingSchedule | None,
+        funding_bridge: HistoricalFundingBridge | None,
+        maker_fill_evidence: VisibleQueueDepletionResult | None,
+        partial_fill_cost_bridge: PartialFillCostBridge | None,
+    ) -> str:
         partial_cost_settlement: CanonicalPartialFillCostResult | None = None
         if uses_staged_fill and outcome.status == "closed":
             assert partial_fill_cost_bridge is not None
@@ -190,28 +295,11 @@ class CanonicalBacktraderRuntime:
                 )
             )
         funding_settlement = None
-        if funding_schedule is not None or funding_bridge is not None:
-            if funding_schedule is None or funding_bridge is None:
-                raise ValueError("backtrader_runtime_historical_funding_evidence_required")
-            if type(funding_bridge) is not HistoricalFundingBridge:
-                raise ValueError("backtrader_runtime_historical_funding_authority_invalid")
-            try:
-                funding_schedule = VerifiedHistoricalFundingSchedule(funding_schedule.artifacts)
-            except Exception as exc:
-                raise ValueError("backtrader_runtime_historical_funding_schedule_binding_invalid") from exc
-            if (
-                funding_schedule.dataset_id != feed.dataset_id
-                or funding_schedule.dataset_checksum != feed.dataset_checksum
-                or funding_schedule.source_network != feed.source_network
-                or funding_schedule.market_data_venue != feed.market_data_venue
-                or funding_schedule.market_type != feed.market_type
-                or funding_schedule.symbol != feed.symbol
-            ):
-                raise ValueError("backtrader_runtime_historical_funding_schedule_binding_invalid")
-            if outcome.status == "closed":
-                funding_settlement = funding_bridge.settle(
-                    canonical_historical_funding_request(plan, outcome, funding_schedule)
-                )
+        if funding_schedule is not None and outcome.status == "closed":
+            assert funding_bridge is not None
+            funding_settlement = funding_bridge.settle(
+                canonical_historical_funding_request(plan, outcome, funding_schedule)
+            )
         if outcome.status != "closed":
             net_outcome = None
         elif uses_staged_fill:
@@ -266,13 +354,13 @@ class CanonicalBacktraderRuntime:
             else _VISIBLE_FILL_ENGINE_VERSION
             if uses_visible_fill
             else _ENGINE_VERSION
-        )
+        ).replace(BACKTRADER_DELIVERY_ENGINE, self._delivery_engine, 1)
         input_payload = {
             "dataset_checksum": feed.dataset_checksum,
             "dataset_id": feed.dataset_id,
             "engine_version": engine_version,
             "plan_hash": plan.plan.plan_hash,
-            "source_record_ids": [bar.source_record_id for bar in feed.bars],
+            "source_record_ids": encoded_source_record_ids,
             "timeframe": feed.timeframe,
             **({"funding_schedule_checksum": funding_schedule.schedule_checksum} if funding_schedule is not None else {}),
             **(
@@ -335,6 +423,81 @@ class CanonicalBacktraderRuntime:
         return _canonical(result) + "\n"
 
 
+def _execute(
+    plan: CanonicalBacktestOrderPlan,
+    delivered_bars: tuple[VerifiedBacktraderBar, ...],
+    maker_fill_evidence: VisibleQueueDepletionResult | None,
+    uses_staged_fill: bool,
+) -> BacktestExecutionResult:
+    if maker_fill_evidence is None:
+        return execute_plan(plan, delivered_bars)
+    if maker_fill_evidence.status == "unfilled":
+        return BacktestExecutionResult("not_executed", "visible_queue_unfilled", ())
+    if uses_staged_fill:
+        return execute_plan_from_staged_visible_fills(
+            plan, delivered_bars, maker_fill_evidence
+        )
+    return execute_plan_from_visible_fill(plan, delivered_bars, maker_fill_evidence)
+
+
+def _verified_funding_schedule(
+    feed: VerifiedBacktraderFeedAdapter,
+    funding_schedule: VerifiedHistoricalFundingSchedule | None,
+    funding_bridge: HistoricalFundingBridge | None,
+) -> VerifiedHistoricalFundingSchedule:
+    if funding_schedule is None or funding_bridge is None:
+        raise ValueError("backtrader_runtime_historical_funding_evidence_required")
+    if type(funding_bridge) is not HistoricalFundingBridge:
+        raise ValueError("backtrader_runtime_historical_funding_authority_invalid")
+    try:
+        funding_schedule = VerifiedHistoricalFundingSchedule(funding_schedule.artifacts)
+    except Exception as exc:
+        raise ValueError("backtrader_runtime_historical_funding_schedule_binding_invalid") from exc
+    if (
+        funding_schedule.dataset_id != feed.dataset_id
+        or funding_schedule.dataset_checksum != feed.dataset_checksum
+        or funding_schedule.source_network != feed.source_network
+        or funding_schedule.market_data_venue != feed.market_data_venue
+        or funding_schedule.market_type != feed.market_type
+        or funding_schedule.symbol != feed.symbol
+    ):
+        raise ValueError("backtrader_runtime_historical_funding_schedule_binding_invalid")
+    return funding_schedule
+
+
+def _backtrader_delivery(
+    feed: VerifiedBacktraderFeedAdapter,
+) -> tuple[VerifiedBacktraderBar, ...]:
+    # Cerebro remains the reference temporal driver. The strategy only records
+    # delivery order; all execution semantics live in the pure state machine
+    # and all trading authorities stay in the PHP plan.
+    delivered: list[int] = []
+
+    class DeliveryStrategy(bt.Strategy):
+        def next(self) -> None:
+            delivered.append(len(self) - 1)
+
+    cerebro = bt.Cerebro(stdstats=False, maxcpus=1)
+    cerebro.adddata(_VerifiedBars(bars=feed.bars))
+    cerebro.addstrategy(DeliveryStrategy)
+    cerebro.run(runonce=False, preload=False, exactbars=True)
+    if delivered != list(range(len(feed.bars))):
+        raise ValueError("backtrader_runtime_delivery_invalid")
+    return tuple(feed.bars[index] for index in delivered)
+
+
+def _native_delivery(
+    feed: VerifiedBacktraderFeedAdapter,
+) -> tuple[VerifiedBacktraderBar, ...]:
+    # The feed adapter already proved one contiguous stream in strictly
+    # increasing ``available_at`` order, which is exactly the order Cerebro
+    # delivers. What remains of the Cerebro path is its float line check.
+    for bar in feed.bars:
+        for value in (bar.open, bar.high, bar.low, bar.close, bar.volume):
+            _backtrader_float(value)
+    return feed.bars
+
+
 def _backtrader_float(value: Any) -> float:
     converted = float(value)
     if not math.isfinite(converted):
@@ -0,0 +1,246 @@
+"""Process-pool plan sweeps over one published, memory-mapped dataset.
+
+Plans are split into contiguous chunks and each chunk runs through
+``CanonicalBacktraderRuntime.run_many``. Workers never receive bars: each
+one opens the published dataset through ``MappedDatasetArtifacts`` (the
+candle bytes stay in the shared page cache), builds the verified feed once
+and keeps it for every later chunk of the same sweep. Only plans, visible
+fill evidence and canonical result lines cross the process boundary.
+
+Results are written in plan order whatever order the chunks finish in, so
+the NDJSON stream is byte-identical to ``run_many`` over the same plans for
+any worker count.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import MAX_PREC, Decimal, localcontext
+from typing import BinaryIO
+
+from app.backtesting.backtrader_contracts import CanonicalBacktestOrderPlan
+from app.backtesting.backtrader_feed import VerifiedBacktraderFeedAdapter
+from app.backtesting.backtrader_runtime import (
+    BACKTRADER_DELIVERY_ENGINE,
+    CanonicalBacktraderRuntime,
+)
+from app.backtesting.dataset_mapped import MappedDatasetArtifacts
+from app.backtesting.dataset_store import DatasetPublisher
+from app.backtesting.visible_queue_depletion import VisibleQueueDepletionResult
+
+
+_MAX_CHUNK_PLANS = 256
+
+# (root, stream_index, compression, deduplicate, dataset_id, symbol,
+#  timeframe, period_start, period_end, delivery_engine)
+_FeedSpec = tuple[str, bool, str | None, bool, str, str, str, datetime, datetime, str]
+# (feed spec, plans, per-plan maker fill evidence)
+_SweepChunk = tuple[
+    _FeedSpec,
+    tuple[CanonicalBacktestOrderPlan, ...],
+    tuple[VisibleQueueDepletionResult | None, ...],
+]
+# (result lines, status counts, reason counts, net pnl total)
+_ChunkResult = tuple[
+    tuple[str, ...],
+    tuple[tuple[str, int], ...],
+    tuple[tuple[str, int], ...],
+    str,
+]
+_worker_feed: (
+    tuple[_FeedSpec, CanonicalBacktraderRuntime, VerifiedBacktraderFeedAdapter] | None
+) = None
+
+
+@dataclass(frozen=True, slots=True)
+class BacktraderPlanSweepSummary:
+    plan_count: int
+    status_counts: tuple[tuple[str, int], ...]
+    reason_counts: tuple[tuple[str, int], ...]
+    net_pnl_quote_total: str
+    results_hash: str
+
+
+class BacktraderPlanSweep:
+    """Run many plans over one published dataset stream in a process pool."""
+
+    def __init__(
+        self,
+        publisher: DatasetPublisher,
+        dataset_id: str,
+        *,
+        symbol: str,
+        timeframe: str,
+        period_start: datetime,
+        period_end: datetime,
+        workers: int = 1,
+        delivery_engine: str = BACKTRADER_DELIVERY_ENGINE,
+    ) -> None:
+        """``workers > 1`` opts into a process pool; ``workers=1`` runs in-process.
+
+        Sweeps carry no funding or partial-fill cost authority: plans that
+        need one fail exactly as they would in ``run_many``.
+        """
+
+        if not isinstance(publisher, DatasetPublisher):
+            raise TypeError("BacktraderPlanSweep requires a DatasetPublisher")
+        if type(workers) is not int or workers < 1:
+            raise ValueError("backtrader_sweep_workers_invalid")
+        # Validates the engine name before any worker is started.
+        CanonicalBacktraderRuntime(delivery_engine=delivery_engine)
+        self._spec: _FeedSpec = (
+            os.fspath(publisher.root),
+            publisher.stream_index,
+            publisher.compression,
+            publisher.deduplicate,
+            dataset_id,
+            symbol,
+            timeframe,
+            period_start,
+            period_end,
+            delivery_engine,
+        )
+        self._workers = workers
+
+    def run(
+        self,
+        plans: Sequence[CanonicalBacktestOrderPlan],
+        output: BinaryIO,
+        *,
+        maker_fill_evidence: Sequence[VisibleQueueDepletionResult | None] | None = None,
+    ) -> BacktraderPlanSweepSummary:
+        """Write one canonical result line per plan to ``output``, in plan order.
+
+        Lines are written as soon as every earlier chunk is done. A failing
+        chunk stops the sweep after the lines that precede it.
+        """
+
+        if not isinstance(plans, Sequence):
+            raise ValueError("backtrader_runtime_plans_invalid")
+        if maker_fill_evidence is None:
+            maker_fill_evidence = (None,) * len(plans)
+        elif (
+            not isinstance(maker_fill_evidence, Sequence)
+            or len(maker_fill_evidence) != len(plans)
+        ):
+            raise ValueError("backtrader_runtime_visible_fill_evidence_invalid")
+        chunks = self._chunks(plans, maker_fill_evidence)
+        digest = hashlib.sha256()
+        statuses: Counter[str] = Counter()
+        reasons: Counter[str] = Counter()
+        with localcontext() as context:
+            # Sums of finite decimals stay exact.
+            context.prec = MAX_PREC
+            net_total = Decimal(0)
+            for lines, chunk_statuses, chunk_reasons, chunk_net in self._map(chunks):
+                for line in lines:
+                    encoded = line.encode()
+                    output.write(encoded)
+                    digest.update(encoded)
+                statuses.update(dict(chunk_statuses))
+                reasons.update(dict(chunk_reasons))
+                net_total += Decimal(chunk_net)
+        return BacktraderPlanSweepSummary(
+            plan_count=len(plans),
+            status_counts=tuple(sorted(statuses.items())),
+            reason_counts=tuple(sorted(reasons.items())),
+            net_pnl_quote_total=str(net_total),
+            results_hash="sha256:" + digest.hexdigest(),
+        )
+
+    def _chunks(
+        self,
+        plans: Sequence[CanonicalBacktestOrderPlan],
+        maker_fill_evidence: Sequence[VisibleQueueDepletionResult | None],
+    ) -> list[_SweepChunk]:
+        # Several chunks per worker even out uneven plans; chunks stay
+        # contiguous so concatenating their lines keeps plan order.
+        if not plans:
+            return []
+        chunk_count = min(len(plans), self._workers * 4)
+        size = min(-(-len(plans) // chunk_count), _MAX_CHUNK_PLANS)
+        return [
+            (
+                self._spec,
+                tuple(plans[start : start + size]),
+                tuple(maker_fill_evidence[start : start + size]),
+            )
+            for start in range(0, len(plans), size)
+        ]
+
+    def _map(
+        self,
+        chunks: list[_SweepChunk],
+    ) -> Iterator[_ChunkResult]:
+        if self._workers == 1 or len(chunks) <= 1:
+            if not chunks:
+                return
+            runtime, feed = _open_feed(self._spec)
+            for _spec, plans, evidence in chunks:
+                yield _sweep_chunk(runtime, feed, plans, evidence)
+            return
+        with ProcessPoolExecutor(max_workers=min(self._workers, len(chunks))) as pool:
+            yield from pool.map(_run_worker_chunk, chunks)
+
+
+def _open_feed(
+    spec: _FeedSpec,
+) -> tuple[CanonicalBacktraderRuntime, VerifiedBacktraderFeedAdapter]:
+    (
+        root, stream_index, compression, deduplicate, dataset_id,
+        symbol, timeframe, period_start, period_end, delivery_engine,
+    ) = spec
+    publisher = DatasetPublisher(
+        root,
+        stream_index=stream_index,
+        compression=compression,
+        deduplicate=deduplicate,
+    )
+    with MappedDatasetArtifacts.open(publisher, dataset_id) as mapped:
+        feed = VerifiedBacktraderFeedAdapter(
+            mapped,
+            symbol=symbol,
+            timeframe=timeframe,
+            period_start=period_start,
+            period_end=period_end,
+        )
+    return CanonicalBacktraderRuntime(delivery_engine=delivery_engine), feed
+
+
+def _run_worker_chunk(
+    chunk: _SweepChunk,
+) -> _ChunkResult:
+    global _worker_feed
+    spec, plans, evidence = chunk
+    if _worker_feed is None or _worker_feed[0] != spec:
+        _worker_feed = (spec, *_open_feed(spec))
+    _spec, runtime, feed = _worker_feed
+    return _sweep_chunk(runtime, feed, plans, evidence)
+
+
+def _sweep_chunk(
+    runtime: CanonicalBacktraderRuntime,
+    feed: VerifiedBacktraderFeedAdapter,
+    plans: tuple[CanonicalBacktestOrderPlan, ...],
+    evidence: tuple[VisibleQueueDepletionResult | None, ...],
+) -> _ChunkResult:
+    lines = runtime.run_many(plans, feed, maker_fill_evidence=evidence)
+    statuses: Counter[str] = Counter()
+    reasons: Counter[str] = Counter()
+    with localcontext() as context:
+        context.prec = MAX_PREC
+        net_total = Decimal(0)
+        for line in lines:
+            result = json.loads(line, parse_float=Decimal)
+            statuses[result["status"]] += 1
+            reasons[result["reason_code"]] += 1
+            if result["net_outcome"] is not None:
+                net_total += Decimal(result["net_outcome"]["net_pnl_quote"])
+    return lines, tuple(statuses.items()), tuple(reasons.items()), str(net_total)
@@ -0,0 +1,471 @@
+"""Columnar, array-backed candle streams for verified backtest datasets.
+
+One stream holds the records of a single venue/market/symbol/timeframe in
+canonical order.  Timestamps are int64 epoch microseconds and OHLCV values are
+scaled integers with one exact decimal scale per column, so the canonical
+NDJSON bytes (and therefore every manifest checksum) are reproducible without
+keeping one pydantic model per bar.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetBuildResult,
+    DatasetSerializer,
+    Timeframe,
+    _CANDLE_SCHEMA_VERSION,
+    _sha256,
+)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+_TIME_FIELDS = ("open_at", "close_at", "available_at")
+
+IntegerVector = array | tuple[int, ...]
+
+
+class ColumnarCandleError(ValueError):
+    """Stable fail-closed error for non-canonical columnar input."""
+
+
+def epoch_micros(value: datetime) -> int:
+    """Exact integer microseconds since the Unix epoch for an aware datetime."""
+
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def datetime_from_micros(value: int) -> datetime:
+    """Inverse of ``epoch_micros``, always in UTC."""
+
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _format_micros(value: int) -> str:
+    return datetime_from_micros(value).isoformat(timespec="microseconds").replace(
+        "+00:00", "Z"
+    )
+
+
+def _parse_micros(value: object) -> int:
+    if type(value) is not str or not value.endswith("Z"):
+        raise ColumnarCandleError("columnar_candle_time_invalid")
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + "+00:00")
+    except ValueError as exc:
+        raise ColumnarCandleError("columnar_candle_time_invalid") from exc
+    return epoch_micros(parsed)
+
+
+def _split_decimal(value: object) -> tuple[int, int]:
+    if type(value) is not str:
+        raise ColumnarCandleError("columnar_candle_decimal_invalid")
+    whole, _, fraction = value.partition(".")
+    if not whole.isdigit() or (fraction and not fraction.isdigit()):
+        raise ColumnarCandleError("columnar_candle_decimal_invalid")
+    return int(whole + fraction), len(fraction)
+
+
+def _render_scaled(value: int, scale: int) -> str:
+    if scale == 0:
+        return str(value)
+    digits = str(value).rjust(scale + 1, "0")
+    fraction = digits[-scale:].rstrip("0")
+    return digits[:-scale] + ("." + fraction if fraction else "")
+
+
+def _integer_vector(values: Sequence[int]) -> IntegerVector:
+    try:
+        return array("q", values)
+    except OverflowError:
+        # Exact decimals never lose precision: out-of-range mantissas keep
+        # arbitrary-precision ints instead of an int64 buffer.
+        return tuple(values)
+
+
+@dataclass(frozen=True)
+class ScaledIntegerColumn:
+    """Exact canonical decimals stored as ``mantissa / 10 ** scale``."""
+
+    scale: int
+    values: IntegerVector
+
+    @classmethod
+    def from_decimal_strings(cls, values: Iterable[str]) -> "ScaledIntegerColumn":
+        parsed = [_split_decimal(item) for item in values]
+        scale = max((item_scale for _, item_scale in parsed), default=0)
+        return cls(
+            scale=scale,
+            values=_integer_vector(
+                [mantissa * 10 ** (scale - item_scale) for mantissa, item_scale in parsed]
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def decimal_string(self, index: int) -> str:
+        return _render_scaled(self.values[index], self.scale)
+
+
+@dataclass(frozen=True)
+class ColumnarCandleStream:
+    """One canonical stream with int64 time columns and scaled OHLCV columns."""
+
+    source_network: str
+    market_data_venue: str
+    market_type: MarketType
+    symbol: str
+    timeframe: Timeframe
+    source_record_ids: tuple[str, ...]
+    open_at: IntegerVector
+    close_at: IntegerVector
+    available_at: IntegerVector
+    open: ScaledIntegerColumn
+    high: ScaledIntegerColumn
+    low: ScaledIntegerColumn
+    close: ScaledIntegerColumn
+    volume: ScaledIntegerColumn
+
+    def __post_init__(self) -> None:
+        count = len(self.source_record_ids)
+        if count < 1 or any(
+            len(getattr(self, name)) != count for name in (*_TIME_FIELDS, *_PRICE_FIELDS)
+        ):
+            raise ColumnarCandleError("columnar_candle_stream_shape_invalid")
+
+    def __len__(self) -> int:
+        return len(self.source_record_ids)
+
+    @property
+    def stream_key(self) -> tuple[str, str, str, int]:
+        return (
+            self.market_data_venue,
+            self.market_type.value,
+            self.symbol,
+            self.timeframe.duration_seconds,
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[CandleRecord]) -> "ColumnarCandleStream":
+        if not records or any(not isinstance(item, CandleRecord) for item in records):
+            raise ColumnarCandleError("columnar_candle_stream_shape_invalid")
+        first = records[0]
+        identity = (
+            first.source_network,
+            first.market_data_venue,
+            first.market_type,
+            first.symbol,
+            first.timeframe,
+        )
+        if any(
+            (
+                item.source_network,
+                item.market_data_venue,
+                item.market_type,
+                item.symbol,
+                item.timeframe,
+            )
+            != identity
+            for item in records
+        ):
+            raise ColumnarCandleError("columnar_candle_stream_identity_invalid")
+        return cls(
+            source_network=first.source_network,
+            market_data_venue=first.market_data_venue,
+            market_type=first.market_type,
+            symbol=first.symbol,
+            timeframe=first.timeframe,
+            source_record_ids=tuple(item.source_record_id for item in records),
+            **{
+                name: _integer_vector(
+                    [epoch_micros(getattr(item, name)) for item in records]
+                )
+                for name in _TIME_FIELDS
+            },
+            **{
+                name: ScaledIntegerColumn.from_decimal_strings(
+                    getattr(item, name) for item in records
+                )
+                for name in _PRICE_FIELDS
+            },
+        )
+
+    def datetime_at(self, field: str, index: int) -> datetime:
+        if field not in _TIME_FIELDS:
+            raise KeyError(field)
+        return datetime_from_micros(getattr(self, field)[index])
+
+    def record(self, index: int) -> CandleRecord:
+        return CandleRecord.model_validate_json(self.canonical_line(index))
+
+    def records(self, start: int = 0, stop: int | None = None) -> Iterator[CandleRecord]:
+        for index in range(*slice(start, stop).indices(len(self))):
+            yield self.record(index)
+
+    def canonical_line(self, index: int) -> bytes:
+        """Return the exact canonical JSON bytes, without trailing newline."""
+
+        return json.dumps(
+            {
+                "available_at": _format_micros(self.available_at[index]),
+                "close": self.close.decimal_string(index),
+                "close_at": _format_micros(self.close_at[index]),
+                "complete": True,
+                "high": self.high.decimal_string(index),
+                "low": self.low.decimal_string(index),
+                "market_data_venue": self.market_data_venue,
+                "market_type": self.market_type.value,
+                "open": self.open.decimal_string(index),
+                "open_at": _format_micros(self.open_at[index]),
+                "schema_version": _CANDLE_SCHEMA_VERSION,
+                "source_network": self.source_network,
+                "source_record_id": self.source_record_ids[index],
+                "symbol": self.symbol,
+                "timeframe": self.timeframe.value,
+                "volume": self.volume.decimal_string(index),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode("utf-8")
+
+    def iter_ndjson(self) -> Iterator[bytes]:
+        for index in range(len(self)):
+            yield self.canonical_line(index) + b"\n"
+
+
+_CANONICAL_KEYS = frozenset(
+    {
+        "available_at",
+        "close",
+        "close_at",
+        "complete",
+        "high",
+        "low",
+        "market_data_venue",
+        "market_type",
+        "open",
+        "open_at",
+        "schema_version",
+        "source_network",
+        "source_record_id",
+        "symbol",
+        "timeframe",
+        "volume",
+    }
+)
+
+
+class _StreamColumns:
+    """Mutable accumulator used only while decoding canonical NDJSON."""
+
+    def __init__(self, payload: dict[str, object]) -> None:
+        try:
+            self.market_type = MarketType(payload["market_type"])
+            self.timeframe = Timeframe(payload["timeframe"])
+        except ValueError as exc:
+            raise ColumnarCandleError("columnar_candle_stream_identity_invalid") from exc
+        self.source_network = payload["source_network"]
+        self.market_data_venue = payload["market_data_venue"]
+        self.symbol = payload["symbol"]
+        if any(
+            type(item) is not str or not item
+            for item in (self.source_network, self.market_data_venue, self.symbol)
+        ):
+            raise ColumnarCandleError("columnar_candle_stream_identity_invalid")
+        self.source_record_ids: list[str] = []
+        self.times: dict[str, list[int]] = {name: [] for name in _TIME_FIELDS}
+        self.decimals: dict[str, list[str]] = {name: [] for name in _PRICE_FIELDS}
+
+    @property
+    def stream_key(self) -> tuple[str, str, str, int]:
+        return (
+            self.market_data_venue,
+            self.market_type.value,
+            self.symbol,
+            self.timeframe.duration_seconds,
+        )
+
+    def identity(self) -> tuple[object, ...]:
+        return (
+            self.source_network,
+            self.market_data_venue,
+            self.market_type.value,
+            self.symbol,
+            self.timeframe.value,
+        )
+
+    def append(self, payload: dict[str, object]) -> None:
+        if (
+            payload["source_network"],
+            payload["market_data_venue"],
+            payload["market_type"],
+            payload["symbol"],
+            payload["timeframe"],
+        ) != self.identity():
+            raise ColumnarCandleError("columnar_candle_stream_identity_invalid")
+        source_record_id = payload["source_record_id"]
+        if type(source_record_id) is not str:
+            raise ColumnarCandleError("columnar_candle_identity_invalid")
+        self.source_record_ids.append(source_record_id)
+        for name in _TIME_FIELDS:
+            self.times[name].append(_parse_micros(payload[name]))
+        for name in _PRICE_FIELDS:
+            value = payload[name]
+            if type(value) is not str:
+                raise ColumnarCandleError("columnar_candle_decimal_invalid")
+            self.decimals[name].append(value)
+
+    def freeze(self) -> ColumnarCandleStream:
+        return ColumnarCandleStream(
+            source_network=self.source_network,
+            market_data_venue=self.market_data_venue,
+            market_type=self.market_type,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            source_record_ids=tuple(self.source_record_ids),
+            **{name: _integer_vector(self.times[name]) for name in _TIME_FIELDS},
+            **{
+                name: ScaledIntegerColumn.from_decimal_strings(self.decimals[name])
+                for name in _PRICE_FIELDS
+            },
+        )
+
+
+@dataclass(frozen=True)
+class ColumnarCandleStore:
+    """All streams of one dataset, bound to the exact canonical candle bytes."""
+
+    streams: tuple[ColumnarCandleStream, ...]
+    candles_checksum: str
+
+    def __len__(self) -> int:
+        return sum(len(stream) for stream in self.streams)
+
+    @classmethod
+    def from_records(cls, records: Iterable[CandleRecord]) -> "ColumnarCandleStore":
+        """Build from records already in canonical dataset order."""
+
+        groups: list[list[CandleRecord]] = []
+        seen: set[tuple[str, str, str, int]] = set()
+        previous_key: tuple[str, str, str, int] | None = None
+        for record in records:
+            if not isinstance(record, CandleRecord):
+                raise ColumnarCandleError("columnar_candle_stream_shape_invalid")
+            key = (
+                record.market_data_venue,
+                record.market_type.value,
+                record.symbol,
+                record.timeframe.duration_seconds,
+            )
+            if key != previous_key:
+                if key in seen or (previous_key is not None and key < previous_key):
+                    raise ColumnarCandleError("columnar_candle_order_invalid")
+                seen.add(key)
+                groups.append([])
+                previous_key = key
+            groups[-1].append(record)
+        if not groups:
+            raise ColumnarCandleError("columnar_candle_stream_shape_invalid")
+        streams = tuple(ColumnarCandleStream.from_records(group) for group in groups)
+        return cls(
+            streams=streams,
+            candles_checksum=_sha256(b"".join(_iter_store_ndjson(streams))),
+        )
+
+    @classmethod
+    def from_build_result(cls, result: DatasetBuildResult) -> "ColumnarCandleStore":
+        if not isinstance(result, DatasetBuildResult):
+            raise TypeError("ColumnarCandleStore accepts only DatasetBuildResult")
+        return cls.from_records(result.records)
+
+    @classmethod
+    def from_ndjson(cls, candles_ndjson: bytes) -> "ColumnarCandleStore":
+        """Decode canonical NDJSON once and prove the exact byte round trip."""
+
+        if (
+            not isinstance(candles_ndjson, bytes)
+            or not candles_ndjson.endswith(b"\n")
+            or candles_ndjson.endswith(b"\n\n")
+        ):
+            raise ColumnarCandleError("columnar_candle_ndjson_invalid")
+        accumulators: list[_StreamColumns] = []
+        seen: set[tuple[str, str, str, int]] = set()
+        for line in candles_ndjson[:-1].split(b"\n"):
+            try:
+                payload = json.loads(line)
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise ColumnarCandleError("columnar_candle_ndjson_invalid") from exc
+            if (
+                type(payload) is not dict
+                or set(payload) != _CANONICAL_KEYS
+                or payload["schema_version"] != _CANDLE_SCHEMA_VERSION
+                or payload["complete"] is not True
+            ):
+                raise ColumnarCandleError("columnar_candle_ndjson_invalid")
+            current = accumulators[-1] if accumulators else None
+            if current is None or (
+                payload["market_data_venue"],
+                payload["market_type"],
+                payload["symbol"],
+                payload["timeframe"],
+            ) != current.identity()[1:]:
+                current = _StreamColumns(payload)
+                key = current.stream_key
+                if key in seen or (accumulators and key < accumulators[-1].stream_key):
+                    raise ColumnarCandleError("columnar_candle_order_invalid")
+                seen.add(key)
+                accumulators.append(current)
+            current.append(payload)
+        streams = tuple(accumulator.freeze() for accumulator in accumulators)
+        if b"".join(_iter_store_ndjson(streams)) != candles_ndjson:
+            raise ColumnarCandleError("columnar_candle_round_trip_mismatch")
+        return cls(streams=streams, candles_checksum=_sha256(candles_ndjson))
+
+    @classmethod
+    def from_artifacts(cls, artifacts: DatasetArtifacts) -> "ColumnarCandleStore":
+        """Verify the complete artifact graph, then decode candles once."""
+
+        descriptor = DatasetSerializer.verify(artifacts)
+        store = cls.from_ndjson(artifacts.candles_ndjson)
+        if store.candles_checksum != descriptor.candles_checksum:
+            raise ColumnarCandleError("columnar_candle_round_trip_mismatch")
+        return store
+
+    def find(self, *, symbol: str, timeframe: str) -> ColumnarCandleStream | None:
+        for stream in self.streams:
+            if stream.symbol == symbol and stream.timeframe.value == timeframe:
+                return stream
+        return None
+
+    def iter_ndjson(self) -> Iterator[bytes]:
+        return _iter_store_ndjson(self.streams)
+
+    def to_ndjson(self) -> bytes:
+        return b"".join(self.iter_ndjson())
+
+
+def _iter_store_ndjson(streams: Iterable[ColumnarCandleStream]) -> Iterator[bytes]:
+    for stream in streams:
+        yield from stream.iter_ndjson()
+
+
+__all__ = (
+    "ColumnarCandleError",
+    "ColumnarCandleStore",
+    "ColumnarCandleStream",
+    "ScaledIntegerColumn",
+    "datetime_from_micros",
+    "epoch_micros",
+)
@@ -10,14 +10,24 @@ from __future__ import annotations
 import hashlib
 import json
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from app.backtesting.contracts import (
     DatasetDescriptor,
@@ -311,10 +321,19 @@ class DatasetBuildResult(BaseModel):
         return _require_utc(value)
 
     @model_validator(mode="after")
-    def _validate_derived_facts(self) -> "DatasetBuildResult":
+    def _validate_build_result(self, info: ValidationInfo) -> "DatasetBuildResult":
+        # A parallel builder re-checks its own report with the same pool size.
+        return self._validate_derived_facts(
+            analysis_workers=(info.context or {}).get("analysis_workers", 1)
+        )
+
+    def _validate_derived_facts(self, *, analysis_workers: int = 1) -> "DatasetBuildResult":
         if self.records != tuple(sorted(self.records, key=_record_sort_key)):
             raise ValueError("records must use canonical order")
-        recomputed_report = DatasetBuilder(self.source_identity).analyze(self.records)
+        recomputed_report = DatasetBuilder(
+            self.source_identity,
+            analysis_workers=analysis_workers,
+        ).analyze(self.records)
         if recomputed_report != self.quality_report:
             raise ValueError("quality report must match records and source identity")
         if not recomputed_report.eligible:
@@ -376,23 +395,97 @@ def _record_sort_key(
     return (*_stream_key(record), record.open_at, record.source_record_id)
 
 
-def _identity_key(
-    record: CandleRecord,
-) -> tuple[str, MarketType, str, Timeframe, datetime]:
-    return (
-        record.market_data_venue,
-        record.market_type,
-        record.symbol,
-        record.timeframe,
-        record.open_at,
+_StreamAnalysis = tuple[DatasetStreamQuality, frozenset[str], int, int]
+
+
+def _analyze_stream(records: list[CandleRecord]) -> _StreamAnalysis:
+    """Quality facts of one stream; streams never share identities or gaps."""
+
+    flags: set[str] = set()
+    duplicates_by_open: dict[datetime, list[CandleRecord]] = defaultdict(list)
+    for record in records:
+        duplicates_by_open[record.open_at].append(record)
+
+    exact_duplicate_count = 0
+    conflicting_duplicate_count = 0
+    for duplicates in duplicates_by_open.values():
+        if len(duplicates) < 2:
+            continue
+        variant_counts: dict[bytes, int] = defaultdict(int)
+        for duplicate in duplicates:
+            variant_counts[_canonical_json(duplicate)] += 1
+        exact_duplicate_count += sum(count - 1 for count in variant_counts.values())
+        conflicting_duplicate_count += len(variant_counts) - 1
+    if exact_duplicate_count:
+        flags.add("exact_duplicate")
+    if conflicting_duplicate_count:
+        flags.add("conflicting_duplicate")
+
+    example = records[-1]
+    opens = sorted(duplicates_by_open)
+    duration = example.timeframe.duration
+    missing_ranges: list[MissingRange] = []
+    for previous, current in zip(opens, opens[1:]):
+        delta = current - previous
+        if delta < duration:
+            flags.add("stream_overlap")
+            continue
+        if delta == duration:
+            continue
+        missing_duration = delta - duration
+        if missing_duration % duration != timedelta(0):
+            flags.add("invalid_stream_chronology")
+            continue
+        missing_ranges.append(
+            MissingRange(
+                first_missing_open_at=previous + duration,
+                end_at=current,
+                timeframe=example.timeframe,
+                missing_bar_count=int(missing_duration / duration),
+            )
+        )
+        flags.add("missing_range")
+
+    first_open_at = opens[0]
+    last_close_at = opens[-1] + duration
+    span = last_close_at - first_open_at
+    stream = DatasetStreamQuality(
+        market_data_venue=example.market_data_venue,
+        market_type=example.market_type,
+        symbol=example.symbol,
+        timeframe=example.timeframe,
+        first_open_at=first_open_at,
+        last_close_at=last_close_at,
+        expected_count=max(len(opens), int(span / duration)),
+        observed_count=len(opens),
+        missing_ranges=tuple(missing_ranges),
     )
+    return stream, frozenset(flags), exact_duplicate_count, conflicting_duplicate_count
+
+
+def _analyze_stream_batch(partitions: list[list[CandleRecord]]) -> list[_StreamAnalysis]:
+    return [_analyze_stream(partition) for partition in partitions]
 
 
 class DatasetBuilder:
     """Pure fail-closed quality analyzer and deterministic record builder."""
 
-    def __init__(self, source_identity: DatasetSourceIdentity) -> None:
+    def __init__(
+        self,
+        source_identity: DatasetSourceIdentity,
+        *,
+        analysis_workers: int = 1,
+    ) -> None:
+        """``analysis_workers > 1`` opts into per-stream analysis in a process pool.
+
+        The report is merged in sorted stream order and is identical to the
+        sequential one.
+        """
+
+        if type(analysis_workers) is not int or analysis_workers < 1:
+            raise ValueError("dataset_analysis_workers_invalid")
         self._source_identity = source_identity
+        self._analysis_workers = analysis_workers
 
     def analyze(self, records: Iterable[CandleRecord]) -> DatasetQualityReport:
         materialized = tuple(records)
@@ -406,82 +499,25 @@ class DatasetBuilder:
 
         self._analyze_source_identity(materialized, flags)
 
-        identities: dict[
-            tuple[str, MarketType, str, Timeframe, datetime], list[CandleRecord]
-        ] = defaultdict(list)
-        stream_open_times: dict[
-            tuple[str, str, str, int], set[datetime]
-        ] = defaultdict(set)
-        stream_examples: dict[tuple[str, str, str, int], CandleRecord] = {}
+        partitions: dict[tuple[str, str, str, int], list[CandleRecord]] = defaultdict(list)
         for record in materialized:
-            identities[_identity_key(record)].append(record)
-            key = _stream_key(record)
-            stream_open_times[key].add(record.open_at)
-            stream_examples[key] = record
-
-        exact_duplicate_count = 0
-        conflicting_duplicate_count = 0
-        for duplicates in identities.values():
-            if len(duplicates) < 2:
-                continue
-            variant_counts: dict[bytes, int] = defaultdict(int)
-            for duplicate in duplicates:
-                variant_counts[_canonical_json(duplicate)] += 1
-            exact_duplicate_count += sum(
-                count - 1 for count in variant_counts.values()
-            )
-            conflicting_duplicate_count += len(variant_counts) - 1
-        if exact_duplicate_count:
-            flags.add("exact_duplicate")
-        if conflicting_duplicate_count:
-            flags.add("conflicting_duplicate")
+            partitions[_stream_key(record)].append(record)
+        ordered_partitions = [partitions[key] for key in sorted(partitions)]
+        if self._analysis_workers > 1 and len(ordered_partitions) > 1:
+            analyses = self._analyze_streams_in_pool(ordered_partitions)
+        else:
+            analyses = [_analyze_stream(partition) for partition in ordered_partitions]
 
         streams: list[DatasetStreamQuality] = []
         all_missing_ranges: list[MissingRange] = []
-        for key in sorted(stream_open_times):
-            example = stream_examples[key]
-            opens = sorted(stream_open_times[key])
-            duration = example.timeframe.duration
-            missing_ranges: list[MissingRange] = []
-            for previous, current in zip(opens, opens[1:]):
-                delta = current - previous
-                if delta < duration:
-                    flags.add("stream_overlap")
-                    continue
-                if delta == duration:
-                    continue
-                missing_duration = delta - duration
-                if missing_duration % duration != timedelta(0):
-                    flags.add("invalid_stream_chronology")
-                    continue
-                missing_bar_count = int(missing_duration / duration)
-                missing_range = MissingRange(
-                    first_missing_open_at=previous + duration,
-                    end_at=current,
-                    timeframe=example.timeframe,
-                    missing_bar_count=missing_bar_count,
-                )
-                missing_ranges.append(missing_range)
-                all_missing_ranges.append(missing_range)
-                flags.add("missing_range")
-
-            first_open_at = opens[0]
-            last_close_at = opens[-1] + duration
-            span = last_close_at - first_open_at
-            expected_count = max(len(opens), int(span / duration))
-            streams.append(
-                DatasetStreamQuality(
-                    market_data_venue=example.market_data_venue,
-                    market_type=example.market_type,
-                    symbol=example.symbol,
-                    timeframe=example.timeframe,
-                    first_open_at=first_open_at,
-                    last_close_at=last_close_at,
-                    expected_count=expected_count,
-                    observed_count=len(opens),
-                    missing_ranges=tuple(missing_ranges),
-                )
-            )
+        exact_duplicate_count = 0
+        conflicting_duplicate_count = 0
+        for stream, stream_flags, exact_count, conflicting_count in analyses:
+            streams.append(stream)
+            all_missing_ranges.extend(stream.missing_ranges)
+            flags.update(stream_flags)
+            exact_duplicate_count += exact_count
+            conflicting_duplicate_count += conflicting_count
 
         ordered_flags = tuple(item for item in _QUALITY_FLAG_ORDER if item in flags)
         return DatasetQualityReport(
@@ -508,17 +544,37 @@ class DatasetBuilder:
                 key=lambda item: item.duration_seconds,
             )
         )
-        return DatasetBuildResult(
-            source_identity=self._source_identity,
-            records=ordered_records,
-            quality_report=report,
-            symbols=symbols,
-            timeframes=timeframes,
-            start_at=min(record.open_at for record in ordered_records),
-            end_at=max(record.close_at for record in ordered_records),
-            record_count=len(ordered_records),
+        return DatasetBuildResult.model_validate(
+            {
+                "source_identity": self._source_identity,
+                "records": ordered_records,
+                "quality_report": report,
+                "symbols": symbols,
+                "timeframes": timeframes,
+                "start_at": min(record.open_at for record in ordered_records),
+                "end_at": max(record.close_at for record in ordered_records),
+                "record_count": len(ordered_records),
+            },
+            context={"analysis_workers": self._analysis_workers},
         )
 
+    def _analyze_streams_in_pool(
+        self,
+        partitions: list[list[CandleRecord]],
+    ) -> list[_StreamAnalysis]:
+        # Several streams per task amortize pickling; batches stay contiguous
+        # so concatenating the results keeps sorted stream order.
+        batch_count = min(len(partitions), self._analysis_workers * 4)
+        size = -(-len(partitions) // batch_count)
+        batches = [partitions[start : start + size] for start in range(0, len(partitions), size)]
+        workers = min(self._analysis_workers, len(batches))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [
+                analysis
+                for batch in pool.map(_analyze_stream_batch, batches)
+                for analysis in batch
+            ]
+
     def _analyze_source_identity(
         self,
         records: tuple[CandleRecord, ...],
@@ -572,12 +628,33 @@ class DatasetArtifactVerificationError(Exception):
 
 
 def _manifest_core(result: DatasetBuildResult) -> dict[str, Any]:
+    return _manifest_core_from_facts(
+        result.source_identity,
+        result.quality_report,
+        symbols=result.symbols,
+        timeframes=result.timeframes,
+        start_at=result.start_at,
+        end_at=result.end_at,
+        record_count=result.record_count,
+    )
+
+
+def _manifest_core_from_facts(
+    source_identity: DatasetSourceIdentity,
+    quality_report: DatasetQualityReport,
+    *,
+    symbols: tuple[str, ...],
+    timeframes: tuple[Timeframe, ...],
+    start_at: datetime,
+    end_at: datetime,
+    record_count: int,
+) -> dict[str, Any]:
     return {
         "build_version": _DATASET_BUILD_VERSION,
         "coverage": {
-            "end_at": result.end_at,
-            "record_count": result.record_count,
-            "start_at": result.start_at,
+            "end_at": end_at,
+            "record_count": record_count,
+            "start_at": start_at,
             "streams": tuple(
                 {
                     "first_open_at": stream.first_open_at,
@@ -588,16 +665,16 @@ def _manifest_core(result: DatasetBuildResult) -> dict[str, Any]:
                     "symbol": stream.symbol,
                     "timeframe": stream.timeframe,
                 }
-                for stream in result.quality_report.streams
+                for stream in quality_report.streams
             ),
-            "symbols": result.symbols,
-            "timeframes": tuple(item.value for item in result.timeframes),
+            "symbols": symbols,
+            "timeframes": tuple(item.value for item in timeframes),
         },
-        "quality_flags": result.quality_report.quality_flags,
-        "quality_report_schema_version": result.quality_report.schema_version,
+        "quality_flags": quality_report.quality_flags,
+        "quality_report_schema_version": quality_report.schema_version,
         "record_schema_version": _CANDLE_SCHEMA_VERSION,
         "schema_version": _MANIFEST_SCHEMA_VERSION,
-        "source": result.source_identity,
+        "source": source_identity,
     }
 
 
@@ -606,7 +683,19 @@ def _manifest(
     candles_checksum: str,
     quality_report_checksum: str,
 ) -> dict[str, Any]:
-    core = _json_value(_manifest_core(result))
+    return _manifest_from_core(
+        _manifest_core(result),
+        candles_checksum,
+        quality_report_checksum,
+    )
+
+
+def _manifest_from_core(
+    manifest_core: dict[str, Any],
+    candles_checksum: str,
+    quality_report_checksum: str,
+) -> dict[str, Any]:
+    core = _json_value(manifest_core)
     dataset_checksum = _dataset_checksum_from_manifest_core(
         core,
         candles_checksum,
@@ -633,9 +722,128 @@ def _parse_canonical_json_file(payload: bytes) -> Any:
     return decoded
 
 
+@dataclass(frozen=True)
+class VerifiedDataset:
+    """Descriptor and canonical records of one fully cross-verified artifact."""
+
+    descriptor: DatasetDescriptor
+    records: tuple[CandleRecord, ...]
+
+
+_VerificationKey = tuple[str, str, str]
+# Resident size of a VerifiedDataset per canonical artifact byte: tracemalloc
+# of _verify_uncached over 2000 candles held 3,330,669 bytes for 855,726
+# canonical bytes (~3.9x), rounded up.
+_RESIDENT_BYTES_PER_CANONICAL_BYTE = 4
+
+
+@dataclass(frozen=True)
+class DatasetVerificationCacheStats:
+    hits: int
+    misses: int
+    entries: int
+    cached_bytes: int
+
+
+class DatasetVerificationCache:
+    """Process-wide LRU of verified artifacts, bounded by resident bytes.
+
+    Entries are keyed by the sha256 of the exact manifest, candles and quality
+    report bytes, so any byte difference misses and is fully re-verified. The
+    byte budget counts an estimate of the memory each entry keeps alive: parsed
+    ``CandleRecord`` models take about four times their canonical bytes.
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    DEFAULT_MAX_ENTRIES = 64
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if (
+            type(max_bytes) is not int
+            or max_bytes < 0
+            or type(max_entries) is not int
+            or max_entries < 0
+        ):
+            raise ValueError("dataset_verification_cache_bounds_invalid")
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._entries: OrderedDict[_VerificationKey, tuple[VerifiedDataset, int]] = (
+            OrderedDict()
+        )
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: _VerificationKey) -> VerifiedDataset | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: _VerificationKey, value: VerifiedDataset, size: int) -> None:
+        with self._lock:
+            if size > self._max_bytes or not self._max_entries:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._cached_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._cached_bytes += size
+            while (
+                self._cached_bytes > self._max_bytes
+                or len(self._entries) > self._max_entries
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._cached_bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._cached_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> DatasetVerificationCacheStats:
+        with self._lock:
+            return DatasetVerificationCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                cached_bytes=self._cached_bytes,
+            )
+
+
+def _resident_size(artifacts: DatasetArtifacts) -> int:
+    return _RESIDENT_BYTES_PER_CANONICAL_BYTE * (
+        len(artifacts.manifest_json)
+        + len(artifacts.candles_ndjson)
+        + len(artifacts.quality_report_json)
+    )
+
+
+def _verification_key(artifacts: DatasetArtifacts) -> _VerificationKey:
+    return (
+        _sha256(artifacts.manifest_json),
+        _sha256(artifacts.candles_ndjson),
+        _sha256(artifacts.quality_report_json),
+    )
+
+
 class DatasetSerializer:
     """Serialize and cross-verify deterministic in-memory dataset artifacts."""
 
+    verification_cache = DatasetVerificationCache()
+
     @classmethod
     def serialize(cls, result: DatasetBuildResult) -> DatasetArtifacts:
         if not isinstance(result, DatasetBuildResult):
@@ -664,10 +872,42 @@ class DatasetSerializer:
 
     @classmethod
     def verify(cls, artifacts: DatasetArtifacts) -> DatasetDescriptor:
+        if not isinstance(artifacts, DatasetArtifacts):
+            # Imported lazily: the mapped reader builds on this module.
+            from app.backtesting.dataset_mapped import MappedDatasetArtifacts
+
+            if isinstance(artifacts, MappedDatasetArtifacts):
+                return artifacts.verify()
+        return cls.verified(artifacts).descriptor
+
+    @classmethod
+    def verified(cls, artifacts: DatasetArtifacts) -> VerifiedDataset:
+        """Verify once per exact artifact bytes and return the parsed records."""
+
         try:
             if not isinstance(artifacts, DatasetArtifacts):
                 raise TypeError("DatasetSerializer verifies only DatasetArtifacts")
+            key = _verification_key(artifacts)
+            cached = cls.verification_cache.get(key)
+            if cached is not None:
+                # The manifest is tiny: always re-derive the descriptor so a
+                # forged descriptor paired with cached bytes still fails closed.
+                manifest = _parse_canonical_json_file(artifacts.manifest_json)
+                descriptor = DatasetDescriptor.from_manifest(manifest)
+                if descriptor != artifacts.descriptor or descriptor != cached.descriptor:
+                    raise ValueError("dataset descriptor does not match manifest")
+                return cached
+            verified = cls._verify_uncached(artifacts)
+        except DatasetArtifactVerificationError:
+            raise
+        except Exception as exc:
+            raise DatasetArtifactVerificationError() from exc
+        cls.verification_cache.put(key, verified, _resident_size(artifacts))
+        return verified
 
+    @classmethod
+    def _verify_uncached(cls, artifacts: DatasetArtifacts) -> VerifiedDataset:
+        try:
             manifest = _parse_canonical_json_file(artifacts.manifest_json)
             if not isinstance(manifest, dict):
                 raise ValueError("dataset manifest must be an object")
@@ -724,7 +964,7 @@ class DatasetSerializer:
                 raise ValueError("manifest facts or checksum graph mismatch")
             if _canonical_json(expected_manifest) + b"\n" != artifacts.manifest_json:
                 raise ValueError("manifest bytes are not canonical")
-            return descriptor
+            return VerifiedDataset(descriptor=descriptor, records=result.records)
         except DatasetArtifactVerificationError:
             raise
         except Exception as exc:
@@ -0,0 +1,289 @@
+"""Incremental tail append for published deterministic datasets.
+
+A published dataset is eligible, so each of its streams is gap-free and its
+quality report is fully determined by the per-stream coverage. Extending it by
+records that start exactly at each stream's ``last_close_at`` therefore only
+needs the new tail to be analysed: the base candle bytes are spliced through
+unchanged while both the base and the new ``candles.ndjson`` checksums are
+computed in the same pass, and the report and manifest are derived from the
+merged coverage. The result is byte-identical to a full rebuild under the
+tail's source identity.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+
+from app.backtesting.contracts import DatasetDescriptor, DatasetStreamCoverage
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    DatasetBuilder,
+    DatasetQualityReport,
+    DatasetSourceIdentity,
+    DatasetStreamQuality,
+    Timeframe,
+    _canonical_json,
+    _manifest_core_from_facts,
+    _manifest_from_core,
+    _parse_canonical_json_file,
+    _sha256,
+    _stream_key,
+)
+from app.backtesting.dataset_index import (
+    DatasetStreamIndexError,
+    _coverage_key,
+    _stream_line_ends,
+)
+from app.backtesting.dataset_store import DatasetPublicationResult, DatasetPublisher
+
+
+class DatasetAppendRejected(Exception):
+    """Stable append rejection that never includes artifact contents."""
+
+    def __init__(self, reason_code: str) -> None:
+        super().__init__(reason_code)
+        self.reason_code = reason_code
+
+
+class DatasetAppender:
+    """Extend published datasets by new tails without re-verifying history."""
+
+    def __init__(self, publisher: DatasetPublisher) -> None:
+        if not isinstance(publisher, DatasetPublisher):
+            raise TypeError("DatasetAppender requires a DatasetPublisher")
+        self._publisher = publisher
+
+    def append(
+        self,
+        dataset_id: str,
+        records: Iterable[CandleRecord],
+        *,
+        source: DatasetSourceIdentity,
+        verify_base: bool = False,
+    ) -> DatasetPublicationResult:
+        """Publish ``dataset_id`` extended by ``records`` as a new dataset.
+
+        The base is bound by its manifest checksums only; ``verify_base=True``
+        additionally runs the full artifact verification on it first. The
+        extended artifacts go through ``DatasetPublisher.publish``, which
+        verifies them before anything is written.
+        """
+
+        base = self._publisher.read(dataset_id, verify=verify_base)
+        return self._publisher.publish(self.extend(base, records, source=source))
+
+    def extend(
+        self,
+        base: DatasetArtifacts,
+        records: Iterable[CandleRecord],
+        *,
+        source: DatasetSourceIdentity,
+    ) -> DatasetArtifacts:
+        """Return ``base`` extended by ``records`` exported from ``source``.
+
+        ``source`` identifies the tail export and becomes the extended
+        manifest's source, so ``source_checksum`` always describes the export
+        the newest records came from. It must name the base's network, venue
+        and market type.
+        """
+
+        if not isinstance(base, DatasetArtifacts):
+            raise TypeError("DatasetAppender extends only DatasetArtifacts")
+        if not isinstance(source, DatasetSourceIdentity):
+            raise TypeError("DatasetAppender requires a DatasetSourceIdentity")
+        base_source, descriptor = self._base_facts(base)
+        if (source.source_network, source.market_data_venue, source.market_type) != (
+            base_source.source_network,
+            base_source.market_data_venue,
+            base_source.market_type,
+        ):
+            raise DatasetAppendRejected("dataset_append_source_mismatch")
+
+        tail = tuple(records)
+        if not tail:
+            raise DatasetAppendRejected("dataset_append_empty")
+        tail_result = DatasetBuilder(source).build(tail)
+
+        base_streams = {_coverage_key(item): item for item in descriptor.streams}
+        tail_lines: dict[tuple[str, str, str, int], list[bytes]] = {}
+        for record in tail_result.records:
+            tail_lines.setdefault(_stream_key(record), []).append(
+                _canonical_json(record) + b"\n"
+            )
+        tail_streams = {
+            (
+                item.market_data_venue,
+                item.market_type.value,
+                item.symbol,
+                item.timeframe.duration_seconds,
+            ): item
+            for item in tail_result.quality_report.streams
+        }
+        for key, tail_stream in tail_streams.items():
+            base_stream = base_streams.get(key)
+            if base_stream is None:
+                raise DatasetAppendRejected("dataset_append_stream_unknown")
+            if tail_stream.first_open_at != base_stream.last_close_at:
+                raise DatasetAppendRejected("dataset_append_boundary_invalid")
+
+        candles = base.candles_ndjson
+        try:
+            ends = _stream_line_ends(
+                candles,
+                (item.record_count for item in descriptor.streams),
+            )
+        except DatasetStreamIndexError as exc:
+            raise DatasetAppendRejected("dataset_append_base_invalid") from exc
+        base_digest = hashlib.sha256()
+        appended_digest = hashlib.sha256()
+        appended = bytearray()
+        merged_streams: list[DatasetStreamQuality] = []
+        start = 0
+        for base_stream, end in zip(descriptor.streams, ends, strict=True):
+            key = _coverage_key(base_stream)
+            segment = memoryview(candles)[start:end]
+            base_digest.update(segment)
+            appended_digest.update(segment)
+            appended += segment
+            tail_stream = tail_streams.get(key)
+            if tail_stream is not None:
+                self._assert_boundary_record(candles, start, end, base_stream)
+                for line in tail_lines[key]:
+                    appended_digest.update(line)
+                    appended += line
+            last_close_at = (
+                base_stream.last_close_at
+                if tail_stream is None
+                else tail_stream.last_close_at
+            )
+            count = base_stream.record_count + (
+                0 if tail_stream is None else tail_stream.observed_count
+            )
+            merged_streams.append(
+                DatasetStreamQuality(
+                    market_data_venue=base_stream.market_data_venue,
+                    market_type=base_stream.market_type,
+                    symbol=base_stream.symbol,
+                    timeframe=Timeframe(base_stream.timeframe),
+                    first_open_at=base_stream.first_open_at,
+                    last_close_at=last_close_at,
+                    expected_count=count,
+                    observed_count=count,
+                )
+            )
+            start = end
+        if "sha256:" + base_digest.hexdigest() != descriptor.candles_checksum:
+            raise DatasetAppendRejected("dataset_append_base_invalid")
+
+        record_count = descriptor.record_count + len(tail)
+        report = DatasetQualityReport(
+            input_count=record_count,
+            accepted_count=record_count,
+            streams=tuple(merged_streams),
+            exact_duplicate_count=0,
+            conflicting_duplicate_count=0,
+        )
+        candles_ndjson = bytes(appended)
+        quality_report_json = _canonical_json(report) + b"\n"
+        manifest = _manifest_from_core(
+            _manifest_core_from_facts(
+                source,
+                report,
+                symbols=descriptor.symbols,
+                timeframes=tuple(Timeframe(item) for item in descriptor.timeframes),
+                start_at=descriptor.start_at,
+                end_at=max(item.last_close_at for item in merged_streams),
+                record_count=record_count,
+            ),
+            "sha256:" + appended_digest.hexdigest(),
+            _sha256(quality_report_json),
+        )
+        return DatasetArtifacts(
+            candles_ndjson=candles_ndjson,
+            quality_report_json=quality_report_json,
+            manifest_json=_canonical_json(manifest) + b"\n",
+            descriptor=DatasetDescriptor.from_manifest(manifest),
+        )
+
+    @staticmethod
+    def _base_facts(
+        base: DatasetArtifacts,
+    ) -> tuple[DatasetSourceIdentity, DatasetDescriptor]:
+        """Bind the small base artifacts; candle bytes are hashed while spliced."""
+
+        try:
+            manifest = _parse_canonical_json_file(base.manifest_json)
+            if not isinstance(manifest, dict):
+                raise ValueError("dataset manifest must be an object")
+            descriptor = DatasetDescriptor.from_manifest(manifest)
+            if descriptor != base.descriptor:
+                raise ValueError("dataset descriptor does not match manifest")
+            if _sha256(base.quality_report_json) != descriptor.quality_report_checksum:
+                raise ValueError("quality report checksum mismatch")
+            report = DatasetQualityReport.model_validate_json(
+                _canonical_json(_parse_canonical_json_file(base.quality_report_json))
+            )
+            source = DatasetSourceIdentity.model_validate_json(
+                _canonical_json(manifest["source"])
+            )
+        except Exception as exc:
+            raise DatasetArtifactVerificationError() from exc
+        coverage = tuple(
+            (
+                item.market_data_venue,
+                item.market_type,
+                item.symbol,
+                item.timeframe.value,
+                item.first_open_at,
+                item.last_close_at,
+                item.observed_count,
+            )
+            for item in report.streams
+        )
+        if (
+            not report.eligible
+            or report.missing_ranges
+            or report.exact_duplicate_count
+            or report.conflicting_duplicate_count
+            or report.input_count != descriptor.record_count
+            or report.accepted_count != descriptor.record_count
+            or any(item.expected_count != item.observed_count for item in report.streams)
+            or coverage
+            != tuple(
+                (
+                    item.market_data_venue,
+                    item.market_type,
+                    item.symbol,
+                    item.timeframe,
+                    item.first_open_at,
+                    item.last_close_at,
+                    item.record_count,
+                )
+                for item in descriptor.streams
+            )
+        ):
+            raise DatasetArtifactVerificationError()
+        return source, descriptor
+
+    @staticmethod
+    def _assert_boundary_record(
+        candles: bytes,
+        start: int,
+        end: int,
+        stream: DatasetStreamCoverage,
+    ) -> None:
+        previous = candles.rfind(b"\n", start, end - 1)
+        line = candles[start if previous < 0 else previous + 1 : end - 1]
+        try:
+            record = CandleRecord.model_validate_json(line)
+        except ValueError as exc:
+            raise DatasetAppendRejected("dataset_append_base_invalid") from exc
+        if (
+            _canonical_json(record) != line
+            or _stream_key(record) != _coverage_key(stream)
+            or record.close_at != stream.last_close_at
+        ):
+            raise DatasetAppendRejected("dataset_append_base_invalid")
@@ -0,0 +1,137 @@
+"""Content-addressed per-stream blobs for published ``candles.ndjson``.
+
+Canonical record order keeps every stream contiguous, so a dataset's candles
+are the concatenation of its stream slices. With deduplication the publisher
+stores each slice once under the root's private ``.blobs`` directory, named by
+the slice sha256 that the stream index already records, and the dataset
+directory keeps a ``candles-blobs.json`` record listing the slices in order.
+Datasets sharing historical streams then share their bytes on disk, and
+readers rebuild the canonical candles while checking every blob digest and
+the canonical checksum, so ``dataset_id`` does not depend on the storage mode.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Iterator
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.backtesting.contracts import DatasetDescriptor
+from app.backtesting.dataset import _canonical_json, _parse_canonical_json_file
+from app.backtesting.dataset_index import DatasetStreamIndex
+
+
+_BLOB_MANIFEST_SCHEMA_VERSION = "backtest-dataset-blobs.v1"
+BLOB_DIRECTORY = ".blobs"
+BLOB_MANIFEST_FILENAME = "candles-blobs.json"
+
+
+class DatasetBlobError(ValueError):
+    """Stable blob rejection that never includes artifact contents."""
+
+    def __init__(self, reason_code: str) -> None:
+        super().__init__(reason_code)
+        self.reason_code = reason_code
+
+
+class DatasetBlobRef(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    sha256: str = Field(..., pattern=r"^sha256:[0-9a-f]{64}$")
+    length: int = Field(..., ge=1)
+
+    @property
+    def name(self) -> str:
+        """File name of the blob inside ``BLOB_DIRECTORY``."""
+
+        return self.sha256.removeprefix("sha256:")
+
+
+class DatasetBlobManifest(BaseModel):
+    """Ordered blob list whose concatenation is one dataset's candles."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    schema_version: Literal["backtest-dataset-blobs.v1"] = (
+        _BLOB_MANIFEST_SCHEMA_VERSION
+    )
+    dataset_id: str = Field(..., pattern=r"^backtest-dataset-[0-9a-f]{64}$")
+    candles_checksum: str = Field(..., pattern=r"^sha256:[0-9a-f]{64}$")
+    candles_size: int = Field(..., ge=1)
+    blobs: tuple[DatasetBlobRef, ...] = Field(..., min_length=1)
+
+    @classmethod
+    def parse(
+        cls,
+        payload: bytes,
+        descriptor: DatasetDescriptor | None = None,
+    ) -> "DatasetBlobManifest":
+        """Parse canonical record bytes, bound to ``descriptor`` when given.
+
+        Unbound parsing is only for enumerating references, never for reads.
+        """
+
+        try:
+            manifest = cls.model_validate_json(
+                _canonical_json(_parse_canonical_json_file(payload))
+            )
+            if manifest.to_json() != payload:
+                raise ValueError("blob manifest is not canonical")
+        except Exception as exc:
+            raise DatasetBlobError("dataset_blob_manifest_invalid") from exc
+        if sum(item.length for item in manifest.blobs) != manifest.candles_size or (
+            descriptor is not None
+            and (
+                manifest.dataset_id != descriptor.dataset_id
+                or manifest.candles_checksum != descriptor.candles_checksum
+            )
+        ):
+            raise DatasetBlobError("dataset_blob_manifest_invalid")
+        return manifest
+
+    def to_json(self) -> bytes:
+        return _canonical_json(self) + b"\n"
+
+
+def split_candles(
+    descriptor: DatasetDescriptor,
+    candles_ndjson: bytes,
+) -> tuple[DatasetBlobManifest, tuple[bytes, ...]]:
+    """Cut verified candles into one blob per stream, in canonical order."""
+
+    index = DatasetStreamIndex.from_candles(descriptor, candles_ndjson)
+    view = memoryview(candles_ndjson)
+    return DatasetBlobManifest(
+        dataset_id=descriptor.dataset_id,
+        candles_checksum=descriptor.candles_checksum,
+        candles_size=len(candles_ndjson),
+        blobs=tuple(
+            DatasetBlobRef(sha256=stream.sha256, length=stream.length)
+            for stream in index.streams
+        ),
+    ), tuple(
+        bytes(view[stream.offset : stream.offset + stream.length])
+        for stream in index.streams
+    )
+
+
+def iter_blobs(
+    manifest: DatasetBlobManifest,
+    read_blob: Callable[[DatasetBlobRef], bytes],
+) -> Iterator[bytes]:
+    """Yield each checked blob; the canonical digest is checked after the last."""
+
+    digest = hashlib.sha256()
+    for ref in manifest.blobs:
+        payload = read_blob(ref)
+        if (
+            len(payload) != ref.length
+            or "sha256:" + hashlib.sha256(payload).hexdigest() != ref.sha256
+        ):
+            raise DatasetBlobError("dataset_blob_checksum_mismatch")
+        digest.update(payload)
+        yield payload
+    if "sha256:" + digest.hexdigest() != manifest.candles_checksum:
+        raise DatasetBlobError("dataset_blob_checksum_mismatch")
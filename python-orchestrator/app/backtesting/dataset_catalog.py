@@ -0,0 +1,339 @@
+"""Local SQLite catalog of the datasets published under one store root.
+
+The catalog is an index, not an authority: it stores each published manifest
+with its coverage facts so launchers can resolve a dataset id without scanning
+directories, and callers still read (and verify) the chosen dataset through
+``DatasetPublisher``. It is kept in sync by publishers created with
+``catalog=`` and can always be rebuilt from the published manifests on disk.
+
+It also keeps the last access of each dataset and the pins placed by
+backtests that reference one; retention reads both, and ``rebuild`` keeps them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from app.backtesting.columnar import datetime_from_micros, epoch_micros
+from app.backtesting.contracts import DatasetDescriptor, MarketType
+from app.backtesting.dataset import (
+    DatasetArtifactVerificationError,
+    Timeframe,
+    _parse_canonical_json_file,
+)
+from app.backtesting.dataset_index import DatasetStreamIndexError
+from app.backtesting.dataset_store import (
+    DatasetNotPublished,
+    DatasetPublicationConflict,
+    DatasetPublisher,
+)
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS datasets (
+        dataset_id TEXT PRIMARY KEY,
+        source TEXT NOT NULL,
+        source_checksum TEXT NOT NULL,
+        source_network TEXT NOT NULL,
+        market_data_venue TEXT NOT NULL,
+        market_type TEXT NOT NULL,
+        start_at INTEGER NOT NULL,
+        end_at INTEGER NOT NULL,
+        record_count INTEGER NOT NULL,
+        quality_flags TEXT NOT NULL,
+        manifest_json BLOB NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dataset_streams (
+        dataset_id TEXT NOT NULL REFERENCES datasets(dataset_id) ON DELETE CASCADE,
+        market_data_venue TEXT NOT NULL,
+        market_type TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        timeframe TEXT NOT NULL,
+        first_open_at INTEGER NOT NULL,
+        last_close_at INTEGER NOT NULL,
+        record_count INTEGER NOT NULL,
+        PRIMARY KEY (dataset_id, market_data_venue, market_type, symbol, timeframe)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS dataset_streams_lookup
+    ON dataset_streams (symbol, timeframe, market_data_venue, first_open_at, last_close_at)
+    """,
+    "CREATE INDEX IF NOT EXISTS datasets_source_checksum ON datasets (source_checksum)",
+    """
+    CREATE TABLE IF NOT EXISTS dataset_access (
+        dataset_id TEXT PRIMARY KEY,
+        last_access_at INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dataset_pins (
+        dataset_id TEXT NOT NULL,
+        reference TEXT NOT NULL,
+        pinned_until INTEGER NOT NULL,
+        PRIMARY KEY (dataset_id, reference)
+    )
+    """,
+)
+
+
+class DatasetCatalog:
+    """Query published datasets by stream coverage and source identity."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(os.path.abspath(os.fspath(path)))
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, manifest_json: bytes) -> DatasetDescriptor:
+        """Index one published manifest; recording it again is a no-op."""
+
+        descriptor = self._descriptor(manifest_json)
+        with self._connect() as connection:
+            self._insert(connection, descriptor, manifest_json)
+        return descriptor
+
+    def remove(self, dataset_id: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM datasets WHERE dataset_id = ?", (dataset_id,))
+            connection.execute(
+                "DELETE FROM dataset_access WHERE dataset_id = ?",
+                (dataset_id,),
+            )
+
+    def touch(self, dataset_id: str, at: datetime) -> None:
+        """Record an access; an older timestamp never moves it backwards."""
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO dataset_access VALUES (?, ?) "
+                "ON CONFLICT (dataset_id) DO UPDATE SET "
+                "last_access_at = MAX(last_access_at, excluded.last_access_at)",
+                (dataset_id, epoch_micros(at)),
+            )
+
+    def last_access(self) -> dict[str, datetime]:
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT dataset_id, last_access_at FROM dataset_access"
+            ).fetchall()
+        return {dataset_id: datetime_from_micros(value) for dataset_id, value in rows}
+
+    def pin(self, dataset_id: str, *, reference: str, until: datetime) -> None:
+        """Keep ``dataset_id`` until ``until`` on behalf of ``reference``.
+
+        ``reference`` names the holder, typically a backtest run id; pinning
+        again with the same reference replaces its deadline.
+        """
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO dataset_pins VALUES (?, ?, ?)",
+                (dataset_id, reference, epoch_micros(until)),
+            )
+
+    def unpin(self, dataset_id: str, *, reference: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM dataset_pins WHERE dataset_id = ? AND reference = ?",
+                (dataset_id, reference),
+            )
+
+    def pinned(self, at: datetime) -> frozenset[str]:
+        """Ids with at least one pin still active at ``at``; expired pins are dropped."""
+
+        moment = epoch_micros(at)
+        with self._connect() as connection:
+            connection.execute(
+                "DELETE FROM dataset_pins WHERE pinned_until <= ?",
+                (moment,),
+            )
+            rows = connection.execute(
+                "SELECT DISTINCT dataset_id FROM dataset_pins"
+            ).fetchall()
+        return frozenset(dataset_id for (dataset_id,) in rows)
+
+    def get(self, dataset_id: str) -> DatasetDescriptor | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT manifest_json FROM datasets WHERE dataset_id = ?",
+                (dataset_id,),
+            ).fetchone()
+        return None if row is None else self._descriptor(row[0])
+
+    def query(
+        self,
+        *,
+        symbol: str | None = None,
+        timeframe: Timeframe | str | None = None,
+        market_data_venue: str | None = None,
+        market_type: MarketType | str | None = None,
+        start_at: datetime | None = None,
+        end_at: datetime | None = None,
+        source_checksum: str | None = None,
+    ) -> tuple[DatasetDescriptor, ...]:
+        """Datasets with a stream matching every given filter, by dataset id.
+
+        ``start_at``/``end_at`` select streams covering the whole range:
+        ``first_open_at <= start_at`` and ``last_close_at >= end_at``.
+        """
+
+        clauses: list[str] = []
+        parameters: list[object] = []
+        for column, value in (
+            ("s.symbol", symbol),
+            ("s.timeframe", None if timeframe is None else Timeframe(timeframe).value),
+            ("s.market_data_venue", market_data_venue),
+            ("s.market_type", None if market_type is None else MarketType(market_type).value),
+            ("d.source_checksum", source_checksum),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        if start_at is not None:
+            clauses.append("s.first_open_at <= ?")
+            parameters.append(epoch_micros(start_at))
+        if end_at is not None:
+            clauses.append("s.last_close_at >= ?")
+            parameters.append(epoch_micros(end_at))
+        where = " AND ".join(clauses) or "1 = 1"
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT DISTINCT d.dataset_id, d.manifest_json "
+                "FROM datasets AS d JOIN dataset_streams AS s USING (dataset_id) "
+                f"WHERE {where} ORDER BY d.dataset_id",
+                parameters,
+            ).fetchall()
+        return tuple(self._descriptor(manifest_json) for _, manifest_json in rows)
+
+    def rebuild(self, publisher: DatasetPublisher, *, verify: bool = True) -> int:
+        """Replace the catalog with every readable dataset under ``publisher``.
+
+        Directories that fail to read (or to verify) are left out. Returns the
+        number of indexed datasets.
+        """
+
+        entries: list[tuple[DatasetDescriptor, bytes]] = []
+        for dataset_id in publisher.published_ids():
+            try:
+                artifacts = publisher.read(dataset_id, verify=verify)
+            except (
+                DatasetArtifactVerificationError,
+                DatasetNotPublished,
+                DatasetPublicationConflict,
+                DatasetStreamIndexError,
+            ):
+                continue
+            entries.append((artifacts.descriptor, artifacts.manifest_json))
+        with self._connect() as connection:
+            connection.execute("DELETE FROM dataset_streams")
+            connection.execute("DELETE FROM datasets")
+            for descriptor, manifest_json in entries:
+                self._insert(connection, descriptor, manifest_json)
+        return len(entries)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """One transaction on a short-lived connection."""
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path, timeout=30.0)
+        try:
+            connection.execute("PRAGMA foreign_keys = ON")
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _descriptor(manifest_json: bytes) -> DatasetDescriptor:
+        try:
+            manifest = _parse_canonical_json_file(bytes(manifest_json))
+            if not isinstance(manifest, dict):
+                raise ValueError("dataset manifest must be an object")
+            return DatasetDescriptor.from_manifest(manifest)
+        except Exception as exc:
+            raise DatasetArtifactVerificationError() from exc
+
+    @staticmethod
+    def _insert(
+        connection: sqlite3.Connection,
+        descriptor: DatasetDescriptor,
+        manifest_json: bytes,
+    ) -> None:
+        inserted = connection.execute(
+            "INSERT OR IGNORE INTO datasets VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                descriptor.dataset_id,
+                descriptor.source,
+                descriptor.source_checksum,
+                descriptor.source_network,
+                descriptor.market_data_venue,
+                descriptor.market_type.value,
+                epoch_micros(descriptor.start_at),
+                epoch_micros(descriptor.end_at),
+                descriptor.record_count,
+                json.dumps(list(descriptor.quality_flags)),
+                bytes(manifest_json),
+            ),
+        )
+        if not inserted.rowcount:
+            return
+        connection.executemany(
+            "INSERT INTO dataset_streams VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    descriptor.dataset_id,
+                    stream.market_data_venue,
+                    stream.market_type.value,
+                    stream.symbol,
+                    stream.timeframe,
+                    epoch_micros(stream.first_open_at),
+                    epoch_micros(stream.last_close_at),
+                    stream.record_count,
+                )
+                for stream in descriptor.streams
+            ],
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the dataset catalog from disk.")
+    parser.add_argument("command", choices=("rebuild",))
+    parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--catalog", type=Path, required=True)
+    parser.add_argument("--no-verify", action="store_true")
+    parser.add_argument("--stream-index", action="store_true")
+    parser.add_argument("--compression", choices=("gzip",))
+    parser.add_argument("--deduplicate", action="store_true")
+    arguments = parser.parse_args(argv)
+    publisher = DatasetPublisher(
+        arguments.root,
+        stream_index=arguments.stream_index,
+        compression=arguments.compression,
+        deduplicate=arguments.deduplicate,
+    )
+    count = DatasetCatalog(arguments.catalog).rebuild(
+        publisher,
+        verify=not arguments.no_verify,
+    )
+    print(json.dumps({"catalog": str(arguments.catalog), "datasets": count}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
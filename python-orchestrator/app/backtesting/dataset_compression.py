@@ -0,0 +1,195 @@
+"""Gzip-framed storage for published ``candles.ndjson`` artifacts.
+
+Compression is a storage detail only: the manifest and every descriptor keep
+the checksums of the canonical uncompressed bytes, so ``dataset_id`` does not
+depend on it. A ``compression.json`` record binds the compressed file to the
+dataset with its own sha256 and size, and readers decompress it in bounded
+chunks while checking both the compressed and the canonical digests.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mmap
+import os
+import zlib
+from collections.abc import Iterator
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.backtesting.contracts import DatasetDescriptor
+from app.backtesting.dataset import _canonical_json, _parse_canonical_json_file
+
+
+_COMPRESSION_SCHEMA_VERSION = "backtest-dataset-compression.v1"
+COMPRESSED_CANDLES_FILENAME = "candles.ndjson.gz"
+COMPRESSION_FILENAME = "compression.json"
+DATASET_COMPRESSION_ALGORITHMS = ("gzip",)
+# Fixed level and zero mtime keep the compressed bytes reproducible.
+_GZIP_LEVEL = 6
+_CHUNK_BYTES = 1024 * 1024
+
+
+class DatasetCompressionError(ValueError):
+    """Stable compressed-artifact rejection that never includes contents."""
+
+    def __init__(self, reason_code: str) -> None:
+        super().__init__(reason_code)
+        self.reason_code = reason_code
+
+
+class DatasetCompressionRecord(BaseModel):
+    """Integrity record of one compressed ``candles.ndjson``."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    schema_version: Literal["backtest-dataset-compression.v1"] = (
+        _COMPRESSION_SCHEMA_VERSION
+    )
+    dataset_id: str = Field(..., pattern=r"^backtest-dataset-[0-9a-f]{64}$")
+    algorithm: Literal["gzip"]
+    candles_checksum: str = Field(..., pattern=r"^sha256:[0-9a-f]{64}$")
+    candles_size: int = Field(..., ge=1)
+    compressed_checksum: str = Field(..., pattern=r"^sha256:[0-9a-f]{64}$")
+    compressed_size: int = Field(..., ge=1)
+
+    @classmethod
+    def parse(
+        cls,
+        payload: bytes,
+        descriptor: DatasetDescriptor,
+    ) -> "DatasetCompressionRecord":
+        """Parse canonical record bytes bound to ``descriptor``."""
+
+        try:
+            record = cls.model_validate_json(
+                _canonical_json(_parse_canonical_json_file(payload))
+            )
+            if record.to_json() != payload:
+                raise ValueError("compression record is not canonical")
+        except Exception as exc:
+            raise DatasetCompressionError("dataset_compression_record_invalid") from exc
+        if (
+            record.dataset_id != descriptor.dataset_id
+            or record.candles_checksum != descriptor.candles_checksum
+        ):
+            raise DatasetCompressionError("dataset_compression_record_invalid")
+        return record
+
+    def to_json(self) -> bytes:
+        return _canonical_json(self) + b"\n"
+
+
+def compress_candles(
+    descriptor: DatasetDescriptor,
+    candles_ndjson: bytes,
+) -> tuple[bytes, DatasetCompressionRecord]:
+    """Return reproducible gzip bytes and the record that binds them."""
+
+    compressed = gzip.compress(candles_ndjson, compresslevel=_GZIP_LEVEL, mtime=0)
+    return compressed, DatasetCompressionRecord(
+        dataset_id=descriptor.dataset_id,
+        algorithm="gzip",
+        candles_checksum=descriptor.candles_checksum,
+        candles_size=len(candles_ndjson),
+        compressed_checksum="sha256:" + hashlib.sha256(compressed).hexdigest(),
+        compressed_size=len(compressed),
+    )
+
+
+def iter_decompressed(
+    descriptor: int,
+    record: DatasetCompressionRecord,
+    *,
+    verify: bool = True,
+) -> Iterator[bytes]:
+    """Yield canonical candle bytes in bounded chunks from an open gzip file.
+
+    With ``verify=True`` the compressed and canonical sizes and digests are
+    checked once the last chunk has been yielded; a consumer that stops early
+    owns the integrity of what it has read.
+    """
+
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    compressed_digest = hashlib.sha256()
+    candles_digest = hashlib.sha256()
+    compressed_size = 0
+    candles_size = 0
+    position = 0
+    try:
+        while block := os.pread(descriptor, _CHUNK_BYTES, position):
+            position += len(block)
+            compressed_digest.update(block)
+            compressed_size += len(block)
+            pending = block
+            while pending:
+                chunk = decompressor.decompress(pending, _CHUNK_BYTES)
+                pending = decompressor.unconsumed_tail
+                if decompressor.unused_data:
+                    raise DatasetCompressionError("dataset_compression_frame_invalid")
+                if chunk:
+                    candles_digest.update(chunk)
+                    candles_size += len(chunk)
+                    if candles_size > record.candles_size:
+                        raise DatasetCompressionError("dataset_compression_frame_invalid")
+                    yield chunk
+    except zlib.error as exc:
+        raise DatasetCompressionError("dataset_compression_frame_invalid") from exc
+    if not verify:
+        return
+    if not decompressor.eof:
+        raise DatasetCompressionError("dataset_compression_frame_invalid")
+    if (
+        compressed_size != record.compressed_size
+        or "sha256:" + compressed_digest.hexdigest() != record.compressed_checksum
+        or candles_size != record.candles_size
+        or "sha256:" + candles_digest.hexdigest() != record.candles_checksum
+    ):
+        raise DatasetCompressionError("dataset_compression_checksum_mismatch")
+
+
+def decompress_candles(descriptor: int, record: DatasetCompressionRecord) -> bytes:
+    return b"".join(iter_decompressed(descriptor, record))
+
+
+def decompress_candles_mapping(
+    descriptor: int,
+    record: DatasetCompressionRecord,
+) -> mmap.mmap:
+    """Decompress into an anonymous mapping sized from the record."""
+
+    mapping = mmap.mmap(-1, record.candles_size)
+    try:
+        for chunk in iter_decompressed(descriptor, record):
+            mapping.write(chunk)
+    except Exception:
+        mapping.close()
+        raise
+    mapping.seek(0)
+    return mapping
+
+
+def read_candles_range(
+    descriptor: int,
+    record: DatasetCompressionRecord,
+    offset: int,
+    length: int,
+) -> bytes:
+    """Decompress only up to ``offset + length``; earlier bytes are discarded."""
+
+    if offset < 0 or length < 0 or offset + length > record.candles_size:
+        raise DatasetCompressionError("dataset_compression_range_invalid")
+    selected = bytearray()
+    position = 0
+    for chunk in iter_decompressed(descriptor, record, verify=False):
+        end = position + len(chunk)
+        if end > offset:
+            selected += chunk[max(offset - position, 0) : offset + length - position]
+        position = end
+        if position >= offset + length:
+            break
+    if len(selected) != length:
+        raise DatasetCompressionError("dataset_compression_frame_invalid")
+    return bytes(selected)
@@ -0,0 +1,228 @@
+"""Per-stream byte-range sidecar for canonical ``candles.ndjson`` artifacts.
+
+Canonical record order groups each ``(venue, market_type, symbol, timeframe)``
+stream into one contiguous byte range. The sidecar records that range with its
+own sha256 so readers can seek to one stream and verify only its slice. The v1
+manifest and its checksum graph are frozen, so the sidecar binds itself to the
+dataset through ``dataset_id`` and ``candles_checksum`` instead and is only
+trusted when it is exactly derivable from the verified candle bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.backtesting.contracts import (
+    DatasetDescriptor,
+    DatasetStreamCoverage,
+    MarketType,
+)
+from app.backtesting.dataset import (
+    DatasetArtifacts,
+    Timeframe,
+    _canonical_json,
+    _parse_canonical_json_file,
+    _require_utc,
+)
+
+
+_STREAM_INDEX_SCHEMA_VERSION = "backtest-dataset-stream-index.v1"
+STREAM_INDEX_FILENAME = "stream-index.json"
+
+
+class DatasetStreamIndexError(ValueError):
+    """Stable sidecar rejection that never includes artifact contents."""
+
+    def __init__(self, reason_code: str) -> None:
+        super().__init__(reason_code)
+        self.reason_code = reason_code
+
+
+def _coverage_key(stream: DatasetStreamCoverage) -> tuple[str, str, str, int]:
+    return (
+        stream.market_data_venue,
+        stream.market_type.value,
+        stream.symbol,
+        Timeframe(stream.timeframe).duration_seconds,
+    )
+
+
+def _stream_line_ends(candles: bytes, counts: Iterable[int]) -> tuple[int, ...]:
+    """Return the exclusive byte end of each consecutive stream segment."""
+
+    ends: list[int] = []
+    position = 0
+    for count in counts:
+        for _ in range(count):
+            newline = candles.find(b"\n", position)
+            if newline < 0:
+                raise DatasetStreamIndexError("dataset_stream_index_candles_invalid")
+            position = newline + 1
+        ends.append(position)
+    if position != len(candles):
+        raise DatasetStreamIndexError("dataset_stream_index_candles_invalid")
+    return tuple(ends)
+
+
+class DatasetStreamRange(BaseModel):
+    """Byte range and slice checksum of one canonical candle stream."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    market_data_venue: str = Field(..., min_length=1)
+    market_type: MarketType
+    symbol: str = Field(..., min_length=1)
+    timeframe: Timeframe
+    offset: int = Field(..., ge=0)
+    length: int = Field(..., ge=1)
+    record_count: int = Field(..., ge=1)
+    first_open_at: datetime
+    last_open_at: datetime
+    sha256: str = Field(..., pattern=r"^sha256:[0-9a-f]{64}$")
+
+    @field_validator("first_open_at", "last_open_at")
+    @classmethod
+    def _validate_utc(cls, value: datetime) -> datetime:
+        return _require_utc(value)
+
+
+class DatasetStreamIndex(BaseModel):
+    """Sidecar locating every stream of one dataset's ``candles.ndjson``."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    schema_version: Literal["backtest-dataset-stream-index.v1"] = (
+        _STREAM_INDEX_SCHEMA_VERSION
+    )
+    dataset_id: str = Field(..., pattern=r"^backtest-dataset-[0-9a-f]{64}$")
+    candles_checksum: str = Field(..., pattern=r"^sha256:[0-9a-f]{64}$")
+    streams: tuple[DatasetStreamRange, ...] = Field(..., min_length=1)
+
+    @classmethod
+    def from_candles(
+        cls,
+        descriptor: DatasetDescriptor,
+        candles_ndjson: bytes,
+    ) -> "DatasetStreamIndex":
+        view = memoryview(candles_ndjson)
+        ends = _stream_line_ends(
+            candles_ndjson,
+            (item.record_count for item in descriptor.streams),
+        )
+        ranges: list[DatasetStreamRange] = []
+        start = 0
+        for stream, end in zip(descriptor.streams, ends, strict=True):
+            timeframe = Timeframe(stream.timeframe)
+            ranges.append(
+                DatasetStreamRange(
+                    market_data_venue=stream.market_data_venue,
+                    market_type=stream.market_type,
+                    symbol=stream.symbol,
+                    timeframe=timeframe,
+                    offset=start,
+                    length=end - start,
+                    record_count=stream.record_count,
+                    first_open_at=stream.first_open_at,
+                    last_open_at=stream.last_close_at - timeframe.duration,
+                    sha256="sha256:" + hashlib.sha256(view[start:end]).hexdigest(),
+                )
+            )
+            start = end
+        return cls(
+            dataset_id=descriptor.dataset_id,
+            candles_checksum=descriptor.candles_checksum,
+            streams=tuple(ranges),
+        )
+
+    @classmethod
+    def from_artifacts(cls, artifacts: DatasetArtifacts) -> "DatasetStreamIndex":
+        """Derive the sidecar from artifacts the caller has already verified."""
+
+        if not isinstance(artifacts, DatasetArtifacts):
+            raise TypeError("DatasetStreamIndex accepts only DatasetArtifacts")
+        return cls.from_candles(artifacts.descriptor, artifacts.candles_ndjson)
+
+    @classmethod
+    def parse(
+        cls,
+        payload: bytes,
+        descriptor: DatasetDescriptor,
+    ) -> "DatasetStreamIndex":
+        """Parse canonical sidecar bytes bound to ``descriptor``'s coverage."""
+
+        try:
+            index = cls.model_validate_json(
+                _canonical_json(_parse_canonical_json_file(payload))
+            )
+            if index.to_json() != payload:
+                raise ValueError("stream index is not canonical")
+        except DatasetStreamIndexError:
+            raise
+        except Exception as exc:
+            raise DatasetStreamIndexError("dataset_stream_index_invalid") from exc
+        if (
+            index.dataset_id != descriptor.dataset_id
+            or index.candles_checksum != descriptor.candles_checksum
+            or len(index.streams) != len(descriptor.streams)
+        ):
+            raise DatasetStreamIndexError("dataset_stream_index_invalid")
+        offset = 0
+        for item, stream in zip(index.streams, descriptor.streams, strict=True):
+            if (
+                (
+                    item.market_data_venue,
+                    item.market_type.value,
+                    item.symbol,
+                    item.timeframe.duration_seconds,
+                )
+                != _coverage_key(stream)
+                or item.offset != offset
+                or item.record_count != stream.record_count
+                or item.first_open_at != stream.first_open_at
+                or item.last_open_at + item.timeframe.duration != stream.last_close_at
+            ):
+                raise DatasetStreamIndexError("dataset_stream_index_invalid")
+            offset += item.length
+        return index
+
+    def to_json(self) -> bytes:
+        return _canonical_json(self) + b"\n"
+
+    def verify(self, artifacts: DatasetArtifacts) -> None:
+        """Deep check: the sidecar must equal the one derived from all bytes."""
+
+        if self != type(self).from_artifacts(artifacts):
+            raise DatasetStreamIndexError("dataset_stream_index_invalid")
+
+    def find(
+        self,
+        *,
+        symbol: str,
+        timeframe: Timeframe | str,
+    ) -> DatasetStreamRange | None:
+        expected = Timeframe(timeframe)
+        for item in self.streams:
+            if item.symbol == symbol and item.timeframe is expected:
+                return item
+        return None
+
+    @staticmethod
+    def read_slice(candles: bytes | memoryview, stream: DatasetStreamRange) -> bytes:
+        """Return one stream's bytes after checking them against the sidecar."""
+
+        payload = bytes(memoryview(candles)[stream.offset : stream.offset + stream.length])
+        DatasetStreamIndex.verify_slice(payload, stream)
+        return payload
+
+    @staticmethod
+    def verify_slice(payload: bytes, stream: DatasetStreamRange) -> None:
+        if (
+            len(payload) != stream.length
+            or "sha256:" + hashlib.sha256(payload).hexdigest() != stream.sha256
+        ):
+            raise DatasetStreamIndexError("dataset_stream_slice_checksum_mismatch")
@@ -0,0 +1,291 @@
+"""Memory-mapped, lazily decoded view of one published dataset.
+
+``DatasetArtifacts`` keeps the whole ``candles.ndjson`` as ``bytes``. This view
+instead maps the published file read-only and resolves streams to byte ranges
+(from the stream index sidecar when the store writes one), then builds a
+line-offset index per stream on first access. Because published streams are
+gap-free, a time range maps to record positions arithmetically and only the
+selected lines are decoded into ``CandleRecord`` values. Gzip-framed stores
+are decompressed once, in bounded chunks, into an anonymous mapping.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+from array import array
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from app.backtesting.contracts import DatasetDescriptor
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    DatasetSourceIdentity,
+    Timeframe,
+    _canonical_json,
+    _parse_canonical_json_file,
+    _sha256,
+)
+from app.backtesting.dataset_compression import decompress_candles_mapping
+from app.backtesting.dataset_index import (
+    STREAM_INDEX_FILENAME,
+    DatasetStreamIndex,
+    DatasetStreamRange,
+)
+from app.backtesting.dataset_store import DatasetPublisher
+from app.backtesting.dataset_streaming import StreamingDatasetBuilder
+
+
+class _DiscardSink:
+    def write(self, payload: bytes, /) -> int:
+        return len(payload)
+
+
+class MappedCandleStream:
+    """Random access over one stream's lines inside a mapped candle file."""
+
+    def __init__(self, candles: mmap.mmap, stream: DatasetStreamRange) -> None:
+        self._candles = candles
+        self.range = stream
+        self._offsets: array | None = None
+
+    def __len__(self) -> int:
+        return self.range.record_count
+
+    @property
+    def symbol(self) -> str:
+        return self.range.symbol
+
+    @property
+    def timeframe(self) -> Timeframe:
+        return self.range.timeframe
+
+    def _line_offsets(self) -> array:
+        if self._offsets is None:
+            offsets = array("q", [self.range.offset])
+            end = self.range.offset + self.range.length
+            for _ in range(self.range.record_count):
+                newline = self._candles.find(b"\n", offsets[-1], end)
+                if newline < 0:
+                    raise DatasetArtifactVerificationError()
+                offsets.append(newline + 1)
+            if offsets[-1] != end:
+                raise DatasetArtifactVerificationError()
+            self._offsets = offsets
+        return self._offsets
+
+    def line(self, index: int) -> bytes:
+        if not 0 <= index < len(self):
+            raise IndexError("mapped candle index out of range")
+        offsets = self._line_offsets()
+        return self._candles[offsets[index] : offsets[index + 1] - 1]
+
+    def record(self, index: int) -> CandleRecord:
+        return CandleRecord.model_validate_json(self.line(index))
+
+    def index_range(
+        self,
+        start_at: datetime | None = None,
+        end_at: datetime | None = None,
+    ) -> tuple[int, int]:
+        """Positions of records with ``start_at <= open_at`` and ``close_at <= end_at``."""
+
+        duration = self.range.timeframe.duration
+        first = self.range.first_open_at
+        start = 0
+        stop = len(self)
+        if start_at is not None:
+            start = max(start, -((first - start_at) // duration))
+        if end_at is not None:
+            stop = min(stop, (end_at - first) // duration)
+        return min(start, len(self)), max(stop, 0)
+
+    def records(
+        self,
+        start_at: datetime | None = None,
+        end_at: datetime | None = None,
+    ) -> Iterator[CandleRecord]:
+        start, stop = self.index_range(start_at, end_at)
+        for index in range(start, stop):
+            yield self.record(index)
+
+
+class MappedDatasetArtifacts:
+    """Published artifacts with ``candles.ndjson`` left on disk behind mmap."""
+
+    def __init__(
+        self,
+        *,
+        candles: mmap.mmap,
+        quality_report_json: bytes,
+        manifest_json: bytes,
+        descriptor: DatasetDescriptor,
+        stream_index: DatasetStreamIndex | None = None,
+    ) -> None:
+        self._candles = candles
+        self.quality_report_json = quality_report_json
+        self.manifest_json = manifest_json
+        self.descriptor = descriptor
+        self._stream_index = stream_index
+        self._streams: dict[tuple[str, Timeframe], MappedCandleStream] = {}
+        self._verified: bool | None = None
+
+    @classmethod
+    def open(
+        cls,
+        publisher: DatasetPublisher,
+        dataset_id: str,
+    ) -> "MappedDatasetArtifacts":
+        """Map ``dataset_id`` from ``publisher``'s root through its anchored dirfd."""
+
+        if not isinstance(publisher, DatasetPublisher):
+            raise TypeError("MappedDatasetArtifacts requires a DatasetPublisher")
+
+        def map_candles(payloads: dict[str, Any], descriptor: int, size: int) -> mmap.mmap:
+            record = publisher._compression_record(payloads, dataset_id)
+            if record is not None:
+                return decompress_candles_mapping(descriptor, record)
+            return mmap.mmap(descriptor, size, access=mmap.ACCESS_READ)
+
+        payloads = publisher._open_published(dataset_id, map_candles)
+        candles = payloads["candles.ndjson"]
+        try:
+            descriptor = publisher._published_descriptor(payloads, dataset_id)
+            stream_index = None
+            if STREAM_INDEX_FILENAME in payloads:
+                stream_index = DatasetStreamIndex.parse(
+                    payloads[STREAM_INDEX_FILENAME],
+                    descriptor,
+                )
+        except Exception:
+            candles.close()
+            raise
+        return cls(
+            candles=candles,
+            quality_report_json=payloads["quality-report.json"],
+            manifest_json=payloads["manifest.json"],
+            descriptor=descriptor,
+            stream_index=stream_index,
+        )
+
+    def __enter__(self) -> "MappedDatasetArtifacts":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._streams.clear()
+        self._candles.close()
+
+    @property
+    def candles_size(self) -> int:
+        return len(self._candles)
+
+    def verify(self, *, deep: bool = True) -> DatasetDescriptor:
+        """Verify once per mapping and return the manifest descriptor.
+
+        ``deep=True`` replays the canonical build over the mapped lines in
+        bounded memory, matching ``DatasetSerializer.verify``. ``deep=False``
+        only binds the mapped bytes to the manifest checksums.
+        """
+
+        if self._verified is None or (deep and not self._verified):
+            try:
+                self._verify_checksums()
+                if deep:
+                    self._verify_deep()
+            except DatasetArtifactVerificationError:
+                raise
+            except Exception as exc:
+                raise DatasetArtifactVerificationError() from exc
+            self._verified = deep
+        return self.descriptor
+
+    def find(
+        self,
+        *,
+        symbol: str,
+        timeframe: Timeframe | str,
+    ) -> MappedCandleStream | None:
+        if self._verified is None:
+            raise DatasetArtifactVerificationError()
+        key = (symbol, Timeframe(timeframe))
+        stream = self._streams.get(key)
+        if stream is None:
+            selected = self._index().find(symbol=symbol, timeframe=key[1])
+            if selected is None:
+                return None
+            stream = self._streams[key] = MappedCandleStream(self._candles, selected)
+        return stream
+
+    def to_artifacts(self) -> DatasetArtifacts:
+        """Materialize in-memory artifacts for callers that need raw bytes."""
+
+        return DatasetArtifacts(
+            candles_ndjson=self._candles[:],
+            quality_report_json=self.quality_report_json,
+            manifest_json=self.manifest_json,
+            descriptor=self.descriptor,
+        )
+
+    def _index(self) -> DatasetStreamIndex:
+        if self._stream_index is None:
+            self._stream_index = DatasetStreamIndex.from_candles(
+                self.descriptor,
+                self._candles,
+            )
+        return self._stream_index
+
+    def _verify_checksums(self) -> None:
+        manifest = _parse_canonical_json_file(self.manifest_json)
+        if not isinstance(manifest, dict):
+            raise ValueError("dataset manifest must be an object")
+        if DatasetDescriptor.from_manifest(manifest) != self.descriptor:
+            raise ValueError("dataset descriptor does not match manifest")
+        if _sha256(self.quality_report_json) != self.descriptor.quality_report_checksum:
+            raise ValueError("quality report checksum mismatch")
+        digest = hashlib.sha256()
+        with memoryview(self._candles) as view:
+            digest.update(view)
+        if "sha256:" + digest.hexdigest() != self.descriptor.candles_checksum:
+            raise ValueError("candles checksum mismatch")
+        if self._stream_index is not None and self._stream_index != (
+            DatasetStreamIndex.from_candles(self.descriptor, self._candles)
+        ):
+            raise ValueError("stream index does not match candles")
+
+    def _verify_deep(self) -> None:
+        manifest = _parse_canonical_json_file(self.manifest_json)
+        source = DatasetSourceIdentity.model_validate_json(
+            _canonical_json(manifest["source"])
+        )
+        build = StreamingDatasetBuilder(source).build(
+            self._canonical_records(),
+            _DiscardSink(),
+        )
+        if (
+            build.candles_checksum != self.descriptor.candles_checksum
+            or build.candles_size != len(self._candles)
+            or build.quality_report_json != self.quality_report_json
+            or build.manifest_json != self.manifest_json
+        ):
+            raise ValueError("mapped artifacts do not match their canonical build")
+
+    def _canonical_records(self) -> Iterator[CandleRecord]:
+        candles = self._candles
+        if candles[-1:] != b"\n" or candles[-2:] == b"\n\n":
+            raise ValueError("candles file must have one trailing newline")
+        position = 0
+        size = len(candles)
+        while position < size:
+            newline = candles.find(b"\n", position)
+            line = candles[position:newline]
+            record = CandleRecord.model_validate_json(line)
+            if _canonical_json(record) != line:
+                raise ValueError("candle record is not canonical")
+            yield record
+            position = newline + 1
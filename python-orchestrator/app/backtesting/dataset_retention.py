@@ -0,0 +1,208 @@
+"""Size and idle-age retention for the datasets under one store root.
+
+Retention plans evictions from the catalog's access log and pins plus the
+on-disk usage reported by ``DatasetPublisher``, then deletes through
+``DatasetPublisher.evict`` so every removal keeps the anchored dirfd
+discipline of publication. Datasets never accessed through a cataloged
+publisher fall back to their directory mtime.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections import Counter
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.backtesting.dataset_catalog import DatasetCatalog
+from app.backtesting.dataset_store import DatasetPublisher
+
+
+class DatasetEvictionReason(str, Enum):
+    IDLE = "idle"
+    SIZE = "size"
+
+
+class DatasetRetentionPolicy(BaseModel):
+    """``max_idle`` evicts by age first, then ``max_total_bytes`` by LRU."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    max_total_bytes: int | None = Field(default=None, ge=0)
+    max_idle: timedelta | None = None
+
+
+class DatasetEviction(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    dataset_id: str
+    size_bytes: int
+    last_access_at: datetime
+    reason: DatasetEvictionReason
+
+
+class DatasetRetentionPlan(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    evictions: tuple[DatasetEviction, ...]
+    pinned: tuple[str, ...]
+    retained_bytes: int
+
+
+class DatasetRetention:
+    """Evict least recently used datasets until the policy budgets hold."""
+
+    def __init__(
+        self,
+        publisher: DatasetPublisher,
+        catalog: DatasetCatalog,
+        policy: DatasetRetentionPolicy,
+    ) -> None:
+        self._publisher = publisher
+        self._catalog = catalog
+        self._policy = policy
+
+    def plan(self, now: datetime) -> DatasetRetentionPlan:
+        """Evictions in least-recently-used order; pinned datasets are kept.
+
+        A pinned dataset still counts towards ``retained_bytes``, so a plan
+        can end above ``max_total_bytes`` when pins alone exceed it. Shared
+        stream blobs count once; an eviction is charged only the bytes it
+        frees, a shared blob going with the last planned dataset using it.
+        """
+
+        usage = self._publisher.usage()
+        last_access = self._catalog.last_access()
+        pinned = self._catalog.pinned(now)
+        references = Counter(blob for item in usage for blob, _ in item.blobs)
+        shared = {blob for blob, count in references.items() if count > 1}
+        candidates = sorted(
+            (
+                last_access.get(item.dataset_id, item.modified_at),
+                item.dataset_id,
+                item,
+            )
+            for item in usage
+            if item.dataset_id not in pinned
+        )
+        retained = sum(item.size_bytes for item in usage) + sum(
+            {
+                blob: length
+                for item in usage
+                for blob, length in item.blobs
+                if blob in shared
+            }.values()
+        )
+        idle_before = None if self._policy.max_idle is None else now - self._policy.max_idle
+        evictions: list[DatasetEviction] = []
+        for accessed, dataset_id, item in candidates:
+            if idle_before is not None and accessed < idle_before:
+                reason = DatasetEvictionReason.IDLE
+            elif (
+                self._policy.max_total_bytes is not None
+                and retained > self._policy.max_total_bytes
+            ):
+                reason = DatasetEvictionReason.SIZE
+            else:
+                continue
+            # Exclusive blobs are already in size_bytes; shared ones are freed
+            # by whichever planned eviction drops their last reference.
+            size = item.size_bytes
+            for blob, length in item.blobs:
+                references[blob] -= 1
+                if references[blob] == 0 and blob in shared:
+                    size += length
+            evictions.append(
+                DatasetEviction(
+                    dataset_id=dataset_id,
+                    size_bytes=size,
+                    last_access_at=accessed,
+                    reason=reason,
+                )
+            )
+            retained -= size
+        return DatasetRetentionPlan(
+            evictions=tuple(evictions),
+            pinned=tuple(sorted(pinned & {item.dataset_id for item in usage})),
+            retained_bytes=retained,
+        )
+
+    def collect(self, now: datetime) -> DatasetRetentionPlan:
+        """Apply ``plan(now)``; the catalog entry goes with each dataset.
+
+        Each planned id is checked against the catalog again right before it
+        is evicted; one pinned or read since planning is kept and left out of
+        the returned plan. Stream blobs left unreferenced by the evictions are
+        collected too.
+        """
+
+        plan = self.plan(now)
+        evicted: list[DatasetEviction] = []
+        kept: set[str] = set()
+        for eviction in plan.evictions:
+            if not self._unchanged_since_plan(eviction, now):
+                kept.add(eviction.dataset_id)
+                continue
+            self._publisher.evict(eviction.dataset_id)
+            self._catalog.remove(eviction.dataset_id)
+            evicted.append(eviction)
+        if evicted:
+            self._publisher.collect_blobs()
+        if not kept:
+            return plan
+        return DatasetRetentionPlan(
+            evictions=tuple(evicted),
+            pinned=tuple(sorted(set(plan.pinned) | (kept & self._catalog.pinned(now)))),
+            retained_bytes=plan.retained_bytes
+            + sum(item.size_bytes for item in plan.evictions if item.dataset_id in kept),
+        )
+
+    def _unchanged_since_plan(self, eviction: DatasetEviction, now: datetime) -> bool:
+        if eviction.dataset_id in self._catalog.pinned(now):
+            return False
+        accessed = self._catalog.last_access().get(eviction.dataset_id)
+        return accessed is None or accessed == eviction.last_access_at
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Apply dataset retention budgets.")
+    parser.add_argument("--root", type=Path, required=True)
+    parser.add_argument("--catalog", type=Path, required=True)
+    parser.add_argument("--max-bytes", type=int)
+    parser.add_argument("--max-idle-hours", type=float)
+    parser.add_argument("--dry-run", action="store_true")
+    arguments = parser.parse_args(argv)
+    retention = DatasetRetention(
+        DatasetPublisher(arguments.root),
+        DatasetCatalog(arguments.catalog),
+        DatasetRetentionPolicy(
+            max_total_bytes=arguments.max_bytes,
+            max_idle=(
+                None
+                if arguments.max_idle_hours is None
+                else timedelta(hours=arguments.max_idle_hours)
+            ),
+        ),
+    )
+    now = datetime.now(timezone.utc)
+    plan = retention.plan(now) if arguments.dry_run else retention.collect(now)
+    print(
+        json.dumps(
+            {
+                "dry_run": arguments.dry_run,
+                "evicted": [item.dataset_id for item in plan.evictions],
+                "pinned": list(plan.pinned),
+                "retained_bytes": plan.retained_bytes,
+            }
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,15 +5,60 @@ from __future__ import annotations
 import ctypes
 import errno
 import os
+import re
 import secrets
 import stat
 import sys
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict
 
-from app.backtesting.dataset import DatasetArtifacts, DatasetSerializer
+from app.backtesting.contracts import DatasetDescriptor
+from app.backtesting.dataset import (
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    DatasetSerializer,
+    Timeframe,
+    _canonical_json,
+    _parse_canonical_json_file,
+    _sha256,
+)
+from app.backtesting.dataset_blobs import (
+    BLOB_DIRECTORY,
+    BLOB_MANIFEST_FILENAME,
+    DatasetBlobError,
+    DatasetBlobManifest,
+    DatasetBlobRef,
+    iter_blobs,
+    split_candles,
+)
+from app.backtesting.dataset_compression import (
+    COMPRESSED_CANDLES_FILENAME,
+    COMPRESSION_FILENAME,
+    DATASET_COMPRESSION_ALGORITHMS,
+    DatasetCompressionError,
+    DatasetCompressionRecord,
+    compress_candles,
+    decompress_candles,
+    read_candles_range,
+)
+from app.backtesting.dataset_index import (
+    STREAM_INDEX_FILENAME,
+    DatasetStreamIndex,
+    DatasetStreamIndexError,
+    DatasetStreamRange,
+)
+
+if TYPE_CHECKING:
+    from app.backtesting.dataset_catalog import DatasetCatalog
 
 
 _ARTIFACT_PAYLOADS = (
@@ -27,6 +72,11 @@ _DIRECTORY_FLAGS = (
     | getattr(os, "O_NOFOLLOW", 0)
     | getattr(os, "O_CLOEXEC", 0)
 )
+_DATASET_ID_PATTERN = re.compile(r"^backtest-dataset-[0-9a-f]{64}$")
+_CANDLES_FILENAMES = frozenset(
+    {"candles.ndjson", COMPRESSED_CANDLES_FILENAME, BLOB_MANIFEST_FILENAME}
+)
+_SEAL_SCHEMA_VERSION = "backtest-dataset-seal.v3"
 
 
 class DatasetPublicationStatus(str, Enum):
@@ -42,6 +92,25 @@ class DatasetPublicationResult(BaseModel):
     status: DatasetPublicationStatus
 
 
+class DatasetUsage(BaseModel):
+    """On-disk footprint of one published dataset, seal included.
+
+    ``size_bytes`` is what evicting this dataset alone frees: its own files,
+    its seal and the stream blobs no other dataset references.
+    ``shared_bytes`` counts the blobs other datasets still reference, and
+    ``blobs`` lists every referenced blob as ``(name, length)`` so callers
+    can track what later evictions free.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    dataset_id: str
+    size_bytes: int
+    modified_at: datetime
+    shared_bytes: int = 0
+    blobs: tuple[tuple[str, int], ...] = ()
+
+
 class DatasetPublicationConflict(Exception):
     """Stable conflict that does not expose target or artifact contents."""
 
@@ -51,21 +120,404 @@ class DatasetPublicationConflict(Exception):
         super().__init__(self.reason_code)
 
 
+class DatasetBatchPublicationConflict(DatasetPublicationConflict):
+    """Batch conflict carrying the results of every dataset that did publish.
+
+    ``results`` follows the input order of ``publish_many`` and skips the
+    inputs whose dataset id is in ``conflicting_ids``.
+    """
+
+    def __init__(
+        self,
+        results: tuple[DatasetPublicationResult, ...],
+        conflicting_ids: tuple[str, ...],
+    ) -> None:
+        super().__init__()
+        self.results = results
+        self.conflicting_ids = conflicting_ids
+
+
+class DatasetNotPublished(LookupError):
+    """Stable lookup miss that does not expose the store layout."""
+
+    reason_code = "dataset_not_published"
+
+    def __init__(self) -> None:
+        super().__init__(self.reason_code)
+
+
+class _StoredPayloads:
+    """One dataset's artifacts with their storage-mode files, derived on first use.
+
+    A value lives for a single publication call and is passed down
+    explicitly, so derived candle copies never outlive the call and
+    concurrent staging threads never share one.
+    """
+
+    def __init__(self, publisher: "DatasetPublisher", artifacts: DatasetArtifacts) -> None:
+        self.artifacts = artifacts
+        self._publisher = publisher
+        self._derived: (
+            tuple[
+                tuple[tuple[str, bytes], ...],
+                tuple[tuple[DatasetBlobRef, bytes], ...],
+            ]
+            | None
+        ) = None
+
+    @property
+    def files(self) -> tuple[tuple[str, bytes], ...]:
+        return self._derive()[0]
+
+    @property
+    def blobs(self) -> tuple[tuple[DatasetBlobRef, bytes], ...]:
+        return self._derive()[1]
+
+    def _derive(
+        self,
+    ) -> tuple[
+        tuple[tuple[str, bytes], ...],
+        tuple[tuple[DatasetBlobRef, bytes], ...],
+    ]:
+        if self._derived is None:
+            self._derived = self._publisher._derive_payloads(self.artifacts)
+        return self._derived
+
+
 class DatasetPublisher:
     """Publish verified bytes once through an anchored private root dirfd."""
 
-    def __init__(self, root: Path) -> None:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        stream_index: bool = False,
+        compression: str | None = None,
+        catalog: DatasetCatalog | None = None,
+        sealed: bool = False,
+        deduplicate: bool = False,
+    ) -> None:
+        """``compression="gzip"`` stores ``candles.ndjson`` gzip-framed.
+
+        The manifest keeps the canonical uncompressed checksums, so a dataset
+        has the same id in either storage mode. A ``catalog`` is updated after
+        every successful publication, and records the last access of every
+        dataset this publisher publishes or reads.
+
+        ``sealed=True`` records a completion seal beside each dataset once its
+        bytes have passed the full comparison, and later detects an existing
+        publication from the seal's checksums, sizes and inode identities
+        without re-reading the artifacts or re-deriving their gzip, blob or
+        index forms. Any seal mismatch falls back to the full byte
+        comparison, which remains the default mode.
+
+        ``deduplicate=True`` stores each candle stream once as a
+        content-addressed blob shared by every dataset containing it; the
+        dataset directory keeps only the blob list. It cannot be combined with
+        ``compression``.
+        """
+
+        if compression is not None and compression not in DATASET_COMPRESSION_ALGORITHMS:
+            raise ValueError("dataset_compression_unsupported")
+        if deduplicate and compression is not None:
+            raise ValueError("dataset_deduplication_compression_unsupported")
         self._root = Path(os.path.abspath(os.fspath(root)))
+        self._stream_index = stream_index
+        self._compression = compression
+        self._catalog = catalog
+        self._sealed = sealed
+        self._deduplicate = deduplicate
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def stream_index(self) -> bool:
+        return self._stream_index
+
+    @property
+    def compression(self) -> str | None:
+        return self._compression
+
+    @property
+    def deduplicate(self) -> bool:
+        return self._deduplicate
 
     def publish(self, artifacts: DatasetArtifacts) -> DatasetPublicationResult:
         if not isinstance(artifacts, DatasetArtifacts):
             raise TypeError("DatasetPublisher accepts only DatasetArtifacts")
         DatasetSerializer.verify(artifacts)
+        return self._publish_verified(artifacts)
+
+    def publish_many(
+        self,
+        artifacts: Sequence[DatasetArtifacts],
+        *,
+        max_workers: int = 4,
+    ) -> tuple[DatasetPublicationResult, ...]:
+        """Publish several verified datasets with one root fsync per batch.
+
+        Staging directories are written concurrently, then renamed one by one
+        with the same no-replace semantics and existence checks as
+        ``publish``. Results follow the input order, and a repeated dataset
+        reports ``already_published`` after its first entry. A conflicting
+        dataset never becomes idempotent: once the other datasets of the batch
+        have been made durable, ``DatasetBatchPublicationConflict`` is raised
+        with their results and the conflicting dataset ids.
+        """
+
+        items = tuple(artifacts)
+        if any(not isinstance(item, DatasetArtifacts) for item in items):
+            raise TypeError("DatasetPublisher accepts only DatasetArtifacts")
+        if type(max_workers) is not int or max_workers < 1:
+            raise ValueError("dataset_publication_workers_invalid")
+        unique: dict[str, DatasetArtifacts] = {}
+        for item in items:
+            DatasetSerializer.verify(item)
+            unique.setdefault(item.descriptor.dataset_id, item)
+        statuses, conflict = self._publish_batch_verified(
+            tuple(unique.values()),
+            max_workers,
+        )
+        if self._catalog is not None:
+            for item in unique.values():
+                if item.descriptor.dataset_id in statuses:
+                    self._catalog.record(item.manifest_json)
+                    self._catalog.touch(item.descriptor.dataset_id, _utc_now())
+        results: list[DatasetPublicationResult] = []
+        for item in items:
+            dataset_id = item.descriptor.dataset_id
+            if dataset_id not in statuses:
+                continue
+            results.append(
+                DatasetPublicationResult(
+                    dataset_id=dataset_id,
+                    target=self._root / dataset_id,
+                    status=statuses[dataset_id],
+                )
+            )
+            statuses[dataset_id] = DatasetPublicationStatus.ALREADY_PUBLISHED
+        if conflict is not None:
+            raise DatasetBatchPublicationConflict(
+                tuple(results),
+                tuple(sorted(set(unique) - set(statuses))),
+            ) from conflict
+        return tuple(results)
+
+    def read(self, dataset_id: str, *, verify: bool = True) -> DatasetArtifacts:
+        """Read one published dataset through the anchored root dirfd.
+
+        With ``verify=False`` only the manifest is parsed and bound to the
+        requested id; callers then own the checksum checks they rely on.
+        """
+
+        payloads = self._open_published(dataset_id)
+        descriptor = self._published_descriptor(payloads, dataset_id)
+        try:
+            artifacts = DatasetArtifacts(
+                **{
+                    attribute: payloads[filename]
+                    for filename, attribute in _ARTIFACT_PAYLOADS
+                },
+                descriptor=descriptor,
+            )
+        except Exception as exc:
+            raise DatasetArtifactVerificationError() from exc
+        if verify:
+            DatasetSerializer.verify(artifacts)
+            if self._stream_index:
+                DatasetStreamIndex.parse(
+                    payloads[STREAM_INDEX_FILENAME],
+                    descriptor,
+                ).verify(artifacts)
+        return artifacts
+
+    def read_stream(
+        self,
+        dataset_id: str,
+        *,
+        symbol: str,
+        timeframe: Timeframe | str,
+    ) -> bytes:
+        """Read one stream's canonical lines using the stream index sidecar.
+
+        The sidecar is outside the manifest's checksum graph, so it is only
+        trusted once its sha256 matches the one the dataset's seal recorded
+        after a full verification; datasets published without ``sealed=True``
+        are rejected with ``dataset_stream_index_unsealed``. Only the stream's
+        byte range of ``candles.ndjson`` is then read, and it is checked
+        against the sidecar's slice sha256 before being returned.
+        """
+
+        if not self._stream_index:
+            raise DatasetNotPublished()
+        selected: list[DatasetStreamRange] = []
+        sealed: dict[str, str | None] = {}
+
+        def read_range(
+            payloads: dict[str, Any],
+            descriptor: int,
+            size: int,
+        ) -> bytes:
+            if _sha256(payloads[STREAM_INDEX_FILENAME]) != sealed.get(
+                STREAM_INDEX_FILENAME
+            ):
+                raise DatasetStreamIndexError("dataset_stream_index_checksum_mismatch")
+            index = DatasetStreamIndex.parse(
+                payloads[STREAM_INDEX_FILENAME],
+                self._published_descriptor(payloads, dataset_id),
+            )
+            stream = index.find(symbol=symbol, timeframe=timeframe)
+            if stream is None:
+                raise DatasetNotPublished()
+            record = self._compression_record(payloads, dataset_id)
+            if stream.offset + stream.length > (
+                size if record is None else record.candles_size
+            ):
+                raise DatasetPublicationConflict()
+            selected.append(stream)
+            if record is not None:
+                return read_candles_range(
+                    descriptor,
+                    record,
+                    stream.offset,
+                    stream.length,
+                )
+            return os.pread(descriptor, stream.length, stream.offset)
+
+        payload = self._open_published(
+            dataset_id,
+            read_range,
+            sealed_digests=sealed,
+        )["candles.ndjson"]
+        DatasetStreamIndex.verify_slice(payload, selected[0])
+        return payload
+
+    def _open_published(
+        self,
+        dataset_id: str,
+        candles_reader: Callable[[dict[str, Any], int, int], Any] | None = None,
+        *,
+        sealed_digests: dict[str, str | None] | None = None,
+    ) -> dict[str, Any]:
+        """Read every artifact of ``dataset_id`` in one anchored pass.
+
+        ``candles_reader`` receives the already-read small artifacts, the open
+        candles descriptor and its size, and replaces the full candles read.
+        ``sealed_digests`` is filled from the dataset's seal, through the same
+        root dirfd, before any artifact is read.
+        """
+
+        if type(dataset_id) is not str or not _DATASET_ID_PATTERN.fullmatch(
+            dataset_id
+        ):
+            raise DatasetNotPublished()
+        root_names, root_fds, root_identities = self._prepare_and_open_root()
+        try:
+            if sealed_digests is not None:
+                sealed_digests.update(self._sealed_digests(root_fds[-1], dataset_id))
+            payloads = self._read_published(root_fds[-1], dataset_id, candles_reader)
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+        finally:
+            for descriptor in reversed(root_fds):
+                os.close(descriptor)
+        if self._catalog is not None:
+            self._catalog.touch(dataset_id, _utc_now())
+        return payloads
+
+    @staticmethod
+    def _published_descriptor(
+        payloads: dict[str, Any],
+        dataset_id: str,
+    ) -> DatasetDescriptor:
+        try:
+            manifest = _parse_canonical_json_file(payloads["manifest.json"])
+            if not isinstance(manifest, dict):
+                raise ValueError("dataset manifest must be an object")
+            descriptor = DatasetDescriptor.from_manifest(manifest)
+            if descriptor.dataset_id != dataset_id:
+                raise ValueError("dataset manifest does not match its directory")
+            return descriptor
+        except Exception as exc:
+            raise DatasetArtifactVerificationError() from exc
+
+    @classmethod
+    def _compression_record(
+        cls,
+        payloads: dict[str, Any],
+        dataset_id: str,
+    ) -> DatasetCompressionRecord | None:
+        if COMPRESSION_FILENAME not in payloads:
+            return None
+        return DatasetCompressionRecord.parse(
+            payloads[COMPRESSION_FILENAME],
+            cls._published_descriptor(payloads, dataset_id),
+        )
+
+    def _artifact_names(self) -> tuple[str, ...]:
+        names = tuple(name for name, _ in _ARTIFACT_PAYLOADS)
+        if self._compression is not None:
+            names = (
+                COMPRESSED_CANDLES_FILENAME,
+                *names[1:],
+                COMPRESSION_FILENAME,
+            )
+        if self._deduplicate:
+            names = (BLOB_MANIFEST_FILENAME, *names[1:])
+        return (*names, STREAM_INDEX_FILENAME) if self._stream_index else names
+
+    def _stored_payloads(self, artifacts: DatasetArtifacts) -> "_StoredPayloads":
+        return _StoredPayloads(self, artifacts)
+
+    def _derive_payloads(
+        self,
+        artifacts: DatasetArtifacts,
+    ) -> tuple[
+        tuple[tuple[str, bytes], ...],
+        tuple[tuple[DatasetBlobRef, bytes], ...],
+    ]:
+        payloads = tuple(
+            (filename, getattr(artifacts, attribute))
+            for filename, attribute in _ARTIFACT_PAYLOADS
+        )
+        blobs: tuple[tuple[DatasetBlobRef, bytes], ...] = ()
+        if self._deduplicate:
+            manifest, slices = split_candles(
+                artifacts.descriptor,
+                artifacts.candles_ndjson,
+            )
+            blobs = tuple(zip(manifest.blobs, slices, strict=True))
+            payloads = ((BLOB_MANIFEST_FILENAME, manifest.to_json()), *payloads[1:])
+        if self._compression is not None:
+            compressed, record = compress_candles(
+                artifacts.descriptor,
+                artifacts.candles_ndjson,
+            )
+            payloads = (
+                (COMPRESSED_CANDLES_FILENAME, compressed),
+                *payloads[1:],
+                (COMPRESSION_FILENAME, record.to_json()),
+            )
+        if self._stream_index:
+            payloads += (
+                (
+                    STREAM_INDEX_FILENAME,
+                    DatasetStreamIndex.from_artifacts(artifacts).to_json(),
+                ),
+            )
+        return payloads, blobs
+
+    def _publish_verified(
+        self,
+        artifacts: DatasetArtifacts,
+    ) -> DatasetPublicationResult:
+        """Publish artifacts whose bytes the caller has already verified."""
 
         root_names, root_fds, root_identities = self._prepare_and_open_root()
         root_fd = root_fds[-1]
         try:
-            return self._publish_anchored(
+            result = self._publish_anchored(
                 root_fd,
                 root_names,
                 root_fds,
@@ -75,6 +527,196 @@ class DatasetPublisher:
         finally:
             for descriptor in reversed(root_fds):
                 os.close(descriptor)
+        if self._catalog is not None:
+            self._catalog.record(artifacts.manifest_json)
+            self._catalog.touch(artifacts.descriptor.dataset_id, _utc_now())
+        return result
+
+    def published_ids(self) -> tuple[str, ...]:
+        """Sorted ids of the dataset directories under the anchored root."""
+
+        root_names, root_fds, root_identities = self._prepare_and_open_root()
+        try:
+            names = os.listdir(root_fds[-1])
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+        finally:
+            for descriptor in reversed(root_fds):
+                os.close(descriptor)
+        return tuple(sorted(name for name in names if _DATASET_ID_PATTERN.fullmatch(name)))
+
+    def usage(self) -> tuple[DatasetUsage, ...]:
+        """Size and directory mtime of every published dataset, by id.
+
+        Sizes are taken with ``lstat`` through the anchored root dirfd, so a
+        symlink planted in a dataset directory is counted but never followed.
+        A stream blob counts towards ``size_bytes`` only for the one dataset
+        referencing it, and towards ``shared_bytes`` otherwise.
+        """
+
+        root_names, root_fds, root_identities = self._prepare_and_open_root()
+        root_fd = root_fds[-1]
+        observed: list[tuple[str, int, datetime, tuple[tuple[str, int], ...]]] = []
+        try:
+            for name in sorted(os.listdir(root_fd)):
+                if not _DATASET_ID_PATTERN.fullmatch(name):
+                    continue
+                try:
+                    target_fd = self._open_observed_directory(root_fd, name)
+                except (OSError, DatasetPublicationConflict):
+                    continue
+                try:
+                    directory = os.fstat(target_fd)
+                    size = sum(
+                        os.stat(entry, dir_fd=target_fd, follow_symlinks=False).st_size
+                        for entry in os.listdir(target_fd)
+                    )
+                    blobs = tuple(
+                        sorted(
+                            {
+                                (ref.name, ref.length)
+                                for ref in self._referenced_blobs(target_fd)
+                            }
+                        )
+                    )
+                finally:
+                    os.close(target_fd)
+                try:
+                    size += os.stat(
+                        self._seal_name(name),
+                        dir_fd=root_fd,
+                        follow_symlinks=False,
+                    ).st_size
+                except FileNotFoundError:
+                    pass
+                observed.append(
+                    (
+                        name,
+                        size,
+                        datetime.fromtimestamp(
+                            directory.st_mtime_ns / 1_000_000_000,
+                            timezone.utc,
+                        ),
+                        blobs,
+                    )
+                )
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+        finally:
+            for descriptor in reversed(root_fds):
+                os.close(descriptor)
+        references = Counter(blob for *_, blobs in observed for blob, _ in blobs)
+        return tuple(
+            DatasetUsage(
+                dataset_id=name,
+                size_bytes=size + sum(
+                    length for blob, length in blobs if references[blob] == 1
+                ),
+                modified_at=modified_at,
+                shared_bytes=sum(
+                    length for blob, length in blobs if references[blob] > 1
+                ),
+                blobs=blobs,
+            )
+            for name, size, modified_at, blobs in observed
+        )
+
+    def evict(self, dataset_id: str) -> bool:
+        """Delete one published dataset through the anchored root dirfd.
+
+        The seal goes first, then the dataset directory is renamed without
+        replacement to a private name and made durable, so readers see either
+        the complete dataset or none. Only entries of that renamed directory,
+        held open by fd, are unlinked afterwards. Returns ``False`` when the
+        dataset is not published.
+        """
+
+        if type(dataset_id) is not str or not _DATASET_ID_PATTERN.fullmatch(
+            dataset_id
+        ):
+            raise DatasetNotPublished()
+        root_names, root_fds, root_identities = self._prepare_and_open_root()
+        root_fd = root_fds[-1]
+        try:
+            try:
+                observed = os.stat(dataset_id, dir_fd=root_fd, follow_symlinks=False)
+            except FileNotFoundError:
+                return False
+            if not stat.S_ISDIR(observed.st_mode):
+                raise DatasetPublicationConflict()
+            try:
+                os.unlink(self._seal_name(dataset_id), dir_fd=root_fd)
+            except FileNotFoundError:
+                pass
+            evicted_name = f".{dataset_id}.evicted-{secrets.token_hex(16)}"
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+            self._atomic_rename_no_replace(root_fd, dataset_id, evicted_name)
+            os.fsync(root_fd)
+            evicted_fd = self._open_observed_directory(
+                root_fd,
+                evicted_name,
+                (observed.st_dev, observed.st_ino),
+            )
+            try:
+                for entry in os.listdir(evicted_fd):
+                    os.unlink(entry, dir_fd=evicted_fd)
+                os.fsync(evicted_fd)
+            finally:
+                os.close(evicted_fd)
+            os.rmdir(evicted_name, dir_fd=root_fd)
+            os.fsync(root_fd)
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+        finally:
+            for descriptor in reversed(root_fds):
+                os.close(descriptor)
+        if self._catalog is not None:
+            self._catalog.remove(dataset_id)
+        return True
+
+    def collect_blobs(self, *, grace: timedelta = timedelta(hours=1)) -> int:
+        """Unlink stream blobs no published dataset references; return the count.
+
+        Blobs modified within ``grace`` are kept: publication refreshes the
+        mtime of every blob it relies on before renaming its dataset into
+        place. A dataset whose blob list cannot be read stops collection.
+        """
+
+        root_names, root_fds, root_identities = self._prepare_and_open_root()
+        root_fd = root_fds[-1]
+        removed = 0
+        try:
+            referenced: set[str] = set()
+            for name in os.listdir(root_fd):
+                if not _DATASET_ID_PATTERN.fullmatch(name):
+                    continue
+                target_fd = self._open_observed_directory(root_fd, name)
+                try:
+                    referenced.update(
+                        ref.name for ref in self._referenced_blobs(target_fd)
+                    )
+                finally:
+                    os.close(target_fd)
+            try:
+                blobs_fd = self._open_observed_directory(root_fd, BLOB_DIRECTORY)
+            except FileNotFoundError:
+                return 0
+            try:
+                cutoff = time.time_ns() - int(grace.total_seconds() * 1_000_000_000)
+                for name in os.listdir(blobs_fd):
+                    if name in referenced:
+                        continue
+                    observed = os.stat(name, dir_fd=blobs_fd, follow_symlinks=False)
+                    if observed.st_mtime_ns > cutoff:
+                        continue
+                    os.unlink(name, dir_fd=blobs_fd)
+                    removed += 1
+                if removed:
+                    os.fsync(blobs_fd)
+            finally:
+                os.close(blobs_fd)
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+        finally:
+            for descriptor in reversed(root_fds):
+                os.close(descriptor)
+        return removed
 
     def _publish_anchored(
         self,
@@ -86,7 +728,8 @@ class DatasetPublisher:
     ) -> DatasetPublicationResult:
         dataset_id = artifacts.descriptor.dataset_id
         target = self._root / dataset_id
-        existing = self._existing_status(root_fd, dataset_id, artifacts)
+        stored = self._stored_payloads(artifacts)
+        existing = self._publication_status(root_fd, dataset_id, stored)
         if existing is not None:
             return self._already_published_result(
                 root_fd,
@@ -101,15 +744,11 @@ class DatasetPublisher:
         renamed = False
         cleanup_staging = True
         try:
-            for filename, attribute in _ARTIFACT_PAYLOADS:
-                self._write_private_file(
-                    staging_fd,
-                    filename,
-                    getattr(artifacts, attribute),
-                )
+            for filename, payload in stored.files:
+                self._write_private_file(staging_fd, filename, payload)
             self._fsync_staging(staging_fd)
 
-            existing = self._existing_status(root_fd, dataset_id, artifacts)
+            existing = self._existing_status(root_fd, dataset_id, stored)
             if existing is not None:
                 return self._already_published_result(
                     root_fd,
@@ -134,7 +773,7 @@ class DatasetPublisher:
             except OSError as exc:
                 if exc.errno not in {errno.EEXIST, errno.ENOTEMPTY}:
                     raise
-                existing = self._existing_status(root_fd, dataset_id, artifacts)
+                existing = self._existing_status(root_fd, dataset_id, stored)
                 if existing is None:
                     raise DatasetPublicationConflict() from exc
                 return self._already_published_result(
@@ -146,7 +785,7 @@ class DatasetPublisher:
                     target,
                 )
             os.fsync(root_fd)
-            if self._existing_status(root_fd, dataset_id, artifacts) is not (
+            if self._existing_status(root_fd, dataset_id, stored) is not (
                 DatasetPublicationStatus.ALREADY_PUBLISHED
             ):
                 raise DatasetPublicationConflict()
@@ -164,6 +803,283 @@ class DatasetPublisher:
             finally:
                 os.close(staging_fd)
 
+    def _publish_batch_verified(
+        self,
+        batch: tuple[DatasetArtifacts, ...],
+        max_workers: int,
+    ) -> tuple[dict[str, DatasetPublicationStatus], DatasetPublicationConflict | None]:
+        """Stage concurrently, rename serially, then fsync the root once.
+
+        Per-dataset conflicts are collected so the rest of the batch still
+        becomes durable; any root path instability aborts the whole batch.
+        """
+
+        statuses: dict[str, DatasetPublicationStatus] = {}
+        conflict: DatasetPublicationConflict | None = None
+        root_names, root_fds, root_identities = self._prepare_and_open_root()
+        root_fd = root_fds[-1]
+        try:
+            pending: list[_StoredPayloads] = []
+            for artifacts in batch:
+                dataset_id = artifacts.descriptor.dataset_id
+                item = self._stored_payloads(artifacts)
+                try:
+                    existing = self._publication_status(root_fd, dataset_id, item)
+                except DatasetPublicationConflict as exc:
+                    conflict = conflict or exc
+                    continue
+                if existing is not None:
+                    statuses[dataset_id] = existing
+                else:
+                    pending.append(item)
+
+            staged: list[tuple[_StoredPayloads, str, int]] = []
+            failure: BaseException | None = None
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(pending)))
+            ) as pool:
+                futures = [
+                    (item, pool.submit(self._stage_durably, root_fd, item))
+                    for item in pending
+                ]
+                for item, future in futures:
+                    try:
+                        staging_name, staging_fd = future.result()
+                    except BaseException as exc:
+                        failure = failure or exc
+                        continue
+                    staged.append((item, staging_name, staging_fd))
+
+            renamed: list[_StoredPayloads] = []
+            try:
+                if failure is not None:
+                    raise failure
+                for item, staging_name, staging_fd in staged:
+                    dataset_id = item.artifacts.descriptor.dataset_id
+                    self._before_atomic_rename(
+                        self._root / staging_name,
+                        self._root / dataset_id,
+                    )
+                    self._assert_root_path_stable(
+                        root_names,
+                        root_fds,
+                        root_identities,
+                    )
+                    try:
+                        status = self._rename_staged(
+                            root_fd,
+                            item,
+                            staging_name,
+                            staging_fd,
+                        )
+                    except DatasetPublicationConflict as exc:
+                        conflict = conflict or exc
+                        continue
+                    statuses[dataset_id] = status
+                    if status is DatasetPublicationStatus.PUBLISHED:
+                        renamed.append(item)
+            finally:
+                for _, staging_name, staging_fd in staged:
+                    try:
+                        self._cleanup_staging(root_fd, staging_name, staging_fd)
+                    finally:
+                        os.close(staging_fd)
+
+            os.fsync(root_fd)
+            for item in renamed:
+                dataset_id = item.artifacts.descriptor.dataset_id
+                if self._existing_status(root_fd, dataset_id, item) is not (
+                    DatasetPublicationStatus.ALREADY_PUBLISHED
+                ):
+                    conflict = conflict or DatasetPublicationConflict()
+                    del statuses[dataset_id]
+            if renamed:
+                self._after_atomic_rename()
+            self._assert_root_path_stable(root_names, root_fds, root_identities)
+        finally:
+            for descriptor in reversed(root_fds):
+                os.close(descriptor)
+        return statuses, conflict
+
+    def _stage_durably(
+        self,
+        root_fd: int,
+        stored: _StoredPayloads,
+    ) -> tuple[str, int]:
+        staging_name, staging_fd = self._create_staging(
+            root_fd,
+            stored.artifacts.descriptor.dataset_id,
+        )
+        try:
+            for filename, payload in stored.files:
+                self._write_private_file(staging_fd, filename, payload)
+            self._fsync_staging(staging_fd)
+        except BaseException:
+            try:
+                self._cleanup_staging(root_fd, staging_name, staging_fd)
+            finally:
+                os.close(staging_fd)
+            raise
+        return staging_name, staging_fd
+
+    def _rename_staged(
+        self,
+        root_fd: int,
+        stored: _StoredPayloads,
+        staging_name: str,
+        staging_fd: int,
+    ) -> DatasetPublicationStatus:
+        """Rename one durable staging directory; the caller fsyncs the root."""
+
+        dataset_id = stored.artifacts.descriptor.dataset_id
+        if self._existing_status(root_fd, dataset_id, stored) is not None:
+            return DatasetPublicationStatus.ALREADY_PUBLISHED
+        self._assert_staging_identity(root_fd, staging_name, staging_fd)
+        try:
+            self._atomic_rename_no_replace(root_fd, staging_name, dataset_id)
+        except OSError as exc:
+            if exc.errno not in {errno.EEXIST, errno.ENOTEMPTY}:
+                raise
+            if self._existing_status(root_fd, dataset_id, stored) is None:
+                raise DatasetPublicationConflict() from exc
+            return DatasetPublicationStatus.ALREADY_PUBLISHED
+        return DatasetPublicationStatus.PUBLISHED
+
+    def _publication_status(
+        self,
+        root_fd: int,
+        dataset_id: str,
+        stored: _StoredPayloads,
+    ) -> DatasetPublicationStatus | None:
+        """First observation of a publication: seal, else blobs and bytes.
+
+        A matching seal answers before any storage-mode payload is derived.
+        """
+
+        if self._sealed and self._seal_matches(root_fd, dataset_id, stored):
+            return DatasetPublicationStatus.ALREADY_PUBLISHED
+        self._store_blobs(root_fd, stored)
+        return self._existing_status(root_fd, dataset_id, stored)
+
+    def _store_blobs(self, root_fd: int, stored: _StoredPayloads) -> None:
+        """Make every stream blob of ``stored`` durable before its dataset.
+
+        Present blobs are only checked by size and have their mtime refreshed
+        so ``collect_blobs`` leaves them alone; readers verify digests.
+        """
+
+        if not self._deduplicate:
+            return
+        blobs_fd = self._open_or_create_directory(root_fd, BLOB_DIRECTORY)
+        try:
+            if stat.S_IMODE(os.fstat(blobs_fd).st_mode) != 0o700:
+                raise DatasetPublicationConflict()
+            written = False
+            for ref, payload in stored.blobs:
+                try:
+                    descriptor, metadata = self._open_private_file(blobs_fd, ref.name)
+                except FileNotFoundError:
+                    self._write_blob(blobs_fd, ref.name, payload)
+                    written = True
+                    continue
+                except OSError as exc:
+                    raise DatasetPublicationConflict() from exc
+                try:
+                    if metadata.st_size != ref.length:
+                        raise DatasetPublicationConflict()
+                    os.utime(descriptor)
+                finally:
+                    os.close(descriptor)
+            if written:
+                os.fsync(blobs_fd)
+        finally:
+            os.close(blobs_fd)
+
+    def _refresh_blobs(self, root_fd: int, refs: tuple[DatasetBlobRef, ...]) -> bool:
+        """Refresh the mtime of every referenced blob; ``False`` if one is gone."""
+
+        blobs_fd = self._open_observed_directory(root_fd, BLOB_DIRECTORY)
+        try:
+            if stat.S_IMODE(os.fstat(blobs_fd).st_mode) != 0o700:
+                return False
+            for ref in refs:
+                descriptor, metadata = self._open_private_file(blobs_fd, ref.name)
+                try:
+                    if metadata.st_size != ref.length:
+                        return False
+                    os.utime(descriptor)
+                finally:
+                    os.close(descriptor)
+            return True
+        finally:
+            os.close(blobs_fd)
+
+    def _write_blob(self, blobs_fd: int, name: str, payload: bytes) -> None:
+        temporary = f".{name}.tmp-{secrets.token_hex(16)}"
+        self._write_private_file(blobs_fd, temporary, payload)
+        try:
+            _atomic_rename_no_replace(blobs_fd, temporary, name)
+        except OSError as exc:
+            if exc.errno not in {errno.EEXIST, errno.ENOTEMPTY}:
+                raise
+            # A concurrent writer stored the same content address first.
+            os.unlink(temporary, dir_fd=blobs_fd)
+
+    @staticmethod
+    def _referenced_blobs(target_fd: int) -> tuple[DatasetBlobRef, ...]:
+        try:
+            descriptor, _ = DatasetPublisher._open_private_file(
+                target_fd,
+                BLOB_MANIFEST_FILENAME,
+            )
+        except FileNotFoundError:
+            return ()
+        try:
+            payload = DatasetPublisher._read_open_private_file(descriptor)
+        finally:
+            os.close(descriptor)
+        try:
+            return DatasetBlobManifest.parse(payload).blobs
+        except DatasetBlobError as exc:
+            raise DatasetPublicationConflict() from exc
+
+    def _read_blobs(
+        self,
+        root_fd: int,
+        payloads: dict[str, Any],
+        dataset_id: str,
+        candles_reader: Callable[[dict[str, Any], int, int], Any] | None,
+    ) -> Any:
+        """Rebuild canonical candles from the blob store, checking every digest.
+
+        A ``candles_reader`` gets the rebuilt bytes through an unlinked
+        temporary file so ranged reads and mappings keep working.
+        """
+
+        manifest = DatasetBlobManifest.parse(
+            payloads[BLOB_MANIFEST_FILENAME],
+            self._published_descriptor(payloads, dataset_id),
+        )
+        blobs_fd = self._open_observed_directory(root_fd, BLOB_DIRECTORY)
+
+        def read_blob(ref: DatasetBlobRef) -> bytes:
+            descriptor, _ = self._open_private_file(blobs_fd, ref.name)
+            try:
+                return self._read_open_private_file(descriptor)
+            finally:
+                os.close(descriptor)
+
+        try:
+            if candles_reader is None:
+                return b"".join(iter_blobs(manifest, read_blob))
+            with tempfile.TemporaryFile() as spool:
+                for payload in iter_blobs(manifest, read_blob):
+                    spool.write(payload)
+                spool.flush()
+                return candles_reader(payloads, spool.fileno(), manifest.candles_size)
+        finally:
+            os.close(blobs_fd)
+
     @staticmethod
     def _already_published_result(
         root_fd: int,
@@ -422,8 +1338,10 @@ class DatasetPublisher:
         self,
         root_fd: int,
         target_name: str,
-        artifacts: DatasetArtifacts,
+        stored: _StoredPayloads,
     ) -> DatasetPublicationStatus | None:
+        if self._sealed and self._seal_matches(root_fd, target_name, stored):
+            return DatasetPublicationStatus.ALREADY_PUBLISHED
         try:
             target_fd = os.open(target_name, _DIRECTORY_FLAGS, dir_fd=root_fd)
         except FileNotFoundError:
@@ -437,12 +1355,14 @@ class DatasetPublisher:
                 target_metadata.st_mode
             ) != 0o700:
                 raise DatasetPublicationConflict()
-            if set(os.listdir(target_fd)) != {name for name, _ in _ARTIFACT_PAYLOADS}:
+            payloads = stored.files
+            names = {name for name, _ in payloads}
+            if set(os.listdir(target_fd)) != names:
                 raise DatasetPublicationConflict()
-            for filename, attribute in _ARTIFACT_PAYLOADS:
+            for filename, payload in payloads:
                 descriptor, metadata = self._open_private_file(target_fd, filename)
                 artifact_descriptors.append((filename, descriptor, metadata))
-                if self._read_open_private_file(descriptor) != getattr(artifacts, attribute):
+                if self._read_open_private_file(descriptor) != payload:
                     raise DatasetPublicationConflict()
             for filename, descriptor, metadata in artifact_descriptors:
                 opened_artifact = os.fstat(descriptor)
@@ -464,23 +1384,20 @@ class DatasetPublisher:
                     != (metadata.st_dev, metadata.st_ino)
                 ):
                     raise DatasetPublicationConflict()
-            if set(os.listdir(target_fd)) != {name for name, _ in _ARTIFACT_PAYLOADS}:
+            if set(os.listdir(target_fd)) != names:
                 raise DatasetPublicationConflict()
             target_second_pass_metadata = os.fstat(target_fd)
             second_pass_metadata = tuple(
                 os.fstat(descriptor)
                 for _, descriptor, _ in artifact_descriptors
             )
-            for (_, descriptor, _), (_, attribute) in zip(
+            for (_, descriptor, _), (_, payload) in zip(
                 artifact_descriptors,
-                _ARTIFACT_PAYLOADS,
+                payloads,
                 strict=True,
             ):
                 os.lseek(descriptor, 0, os.SEEK_SET)
-                if self._read_open_private_file(descriptor) != getattr(
-                    artifacts,
-                    attribute,
-                ):
+                if self._read_open_private_file(descriptor) != payload:
                     raise DatasetPublicationConflict()
             for (filename, descriptor, _), metadata in zip(
                 artifact_descriptors,
@@ -512,9 +1429,7 @@ class DatasetPublisher:
                     or final_named.st_ctime_ns != metadata.st_ctime_ns
                 ):
                     raise DatasetPublicationConflict()
-            if set(os.listdir(target_fd)) != {
-                name for name, _ in _ARTIFACT_PAYLOADS
-            }:
+            if set(os.listdir(target_fd)) != names:
                 raise DatasetPublicationConflict()
             current = os.stat(target_name, dir_fd=root_fd, follow_symlinks=False)
             opened_target = os.fstat(target_fd)
@@ -545,6 +1460,23 @@ class DatasetPublisher:
                 != target_second_pass_metadata.st_ctime_ns
             ):
                 raise DatasetPublicationConflict()
+            if self._sealed:
+                self._write_seal(
+                    root_fd,
+                    target_name,
+                    self._seal_payload(
+                        stored,
+                        target_second_pass_metadata,
+                        tuple(
+                            (filename, metadata)
+                            for (filename, _, _), metadata in zip(
+                                artifact_descriptors,
+                                second_pass_metadata,
+                                strict=True,
+                            )
+                        ),
+                    ),
+                )
             return DatasetPublicationStatus.ALREADY_PUBLISHED
         except OSError as exc:
             raise DatasetPublicationConflict() from exc
@@ -553,6 +1485,269 @@ class DatasetPublisher:
                 os.close(descriptor)
             os.close(target_fd)
 
+    @staticmethod
+    def _seal_name(dataset_id: str) -> str:
+        return f".{dataset_id}.seal"
+
+    @staticmethod
+    def _source_digests(artifacts: DatasetArtifacts) -> dict[str, str]:
+        # Candle and report digests are already bound by the verified manifest;
+        # the manifest itself is small. Derived files (gzip frames, blob list,
+        # stream index) are pinned by the storage mode and their inodes.
+        return {
+            "candles.ndjson": artifacts.descriptor.candles_checksum,
+            "quality-report.json": artifacts.descriptor.quality_report_checksum,
+            "manifest.json": _sha256(artifacts.manifest_json),
+        }
+
+    def _storage_mode(self) -> dict[str, Any]:
+        return {
+            "compression": self._compression,
+            "deduplicate": self._deduplicate,
+            "stream_index": self._stream_index,
+        }
+
+    def _seal_payload(
+        self,
+        stored: _StoredPayloads,
+        directory: os.stat_result,
+        files: tuple[tuple[str, os.stat_result], ...],
+    ) -> bytes:
+        digests = self._source_digests(stored.artifacts)
+        if self._stream_index:
+            # read_stream trusts the sidecar's offsets only through this digest.
+            digests[STREAM_INDEX_FILENAME] = _sha256(
+                dict(stored.files)[STREAM_INDEX_FILENAME]
+            )
+        return _canonical_json(
+            {
+                "artifacts": [
+                    {
+                        "ctime_ns": metadata.st_ctime_ns,
+                        "device": metadata.st_dev,
+                        "inode": metadata.st_ino,
+                        "mtime_ns": metadata.st_mtime_ns,
+                        "name": filename,
+                        "sha256": digests.get(filename),
+                        "size": metadata.st_size,
+                    }
+                    for filename, metadata in files
+                ],
+                "dataset_id": stored.artifacts.descriptor.dataset_id,
+                "directory": {
+                    "device": directory.st_dev,
+                    "inode": directory.st_ino,
+                },
+                "schema_version": _SEAL_SCHEMA_VERSION,
+                "storage": self._storage_mode(),
+            }
+        ) + b"\n"
+
+    def _write_seal(self, root_fd: int, dataset_id: str, payload: bytes) -> None:
+        """Atomically replace the completion seal and make it durable."""
+
+        temporary = f"{self._seal_name(dataset_id)}-{secrets.token_hex(16)}"
+        self._write_private_file(root_fd, temporary, payload)
+        os.replace(
+            temporary,
+            self._seal_name(dataset_id),
+            src_dir_fd=root_fd,
+            dst_dir_fd=root_fd,
+        )
+        os.fsync(root_fd)
+
+    def _sealed_digests(self, root_fd: int, dataset_id: str) -> dict[str, str | None]:
+        """Per-file sha256 recorded by the seal of ``dataset_id``."""
+
+        try:
+            seal_fd, _ = self._open_private_file(root_fd, self._seal_name(dataset_id))
+        except (OSError, DatasetPublicationConflict) as exc:
+            raise DatasetStreamIndexError("dataset_stream_index_unsealed") from exc
+        try:
+            seal = _parse_canonical_json_file(self._read_open_private_file(seal_fd))
+            if (
+                not isinstance(seal, dict)
+                or seal.get("schema_version") != _SEAL_SCHEMA_VERSION
+                or seal.get("dataset_id") != dataset_id
+                or seal["storage"] != self._storage_mode()
+            ):
+                raise ValueError("dataset seal does not describe this storage")
+            return {item["name"]: item["sha256"] for item in seal["artifacts"]}
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise DatasetStreamIndexError("dataset_stream_index_unsealed") from exc
+        finally:
+            os.close(seal_fd)
+
+    def _seal_matches(
+        self,
+        root_fd: int,
+        target_name: str,
+        stored: _StoredPayloads,
+    ) -> bool:
+        """Whether the seal and every current inode still describe the artifacts."""
+
+        try:
+            seal_fd, _ = self._open_private_file(root_fd, self._seal_name(target_name))
+        except (OSError, DatasetPublicationConflict):
+            return False
+        descriptors: list[int] = []
+        try:
+            seal = _parse_canonical_json_file(self._read_open_private_file(seal_fd))
+            if not isinstance(seal, dict) or seal.get("schema_version") != (
+                _SEAL_SCHEMA_VERSION
+            ) or seal.get("dataset_id") != target_name:
+                return False
+            entries = seal["artifacts"]
+            digests = self._source_digests(stored.artifacts)
+            # The sidecar digest is not rederived here; the inode checks
+            # below pin the file it was taken from.
+            if seal["storage"] != self._storage_mode() or [
+                (item["name"], item["sha256"])
+                for item in entries
+                if item["name"] != STREAM_INDEX_FILENAME
+                or not isinstance(item["sha256"], str)
+            ] != [
+                (name, digests.get(name))
+                for name in self._artifact_names()
+                if name != STREAM_INDEX_FILENAME
+            ]:
+                return False
+            target_fd = os.open(target_name, _DIRECTORY_FLAGS, dir_fd=root_fd)
+            descriptors.append(target_fd)
+            directory = os.fstat(target_fd)
+            if (
+                not stat.S_ISDIR(directory.st_mode)
+                or stat.S_IMODE(directory.st_mode) != 0o700
+                or (directory.st_dev, directory.st_ino)
+                != (seal["directory"]["device"], seal["directory"]["inode"])
+                or set(os.listdir(target_fd)) != {item["name"] for item in entries}
+            ):
+                return False
+            for item in entries:
+                descriptor, opened = self._open_private_file(target_fd, item["name"])
+                descriptors.append(descriptor)
+                named = os.stat(item["name"], dir_fd=target_fd, follow_symlinks=False)
+                expected = (
+                    item["device"],
+                    item["inode"],
+                    item["size"],
+                    item["mtime_ns"],
+                    item["ctime_ns"],
+                )
+                if any(
+                    (
+                        metadata.st_dev,
+                        metadata.st_ino,
+                        metadata.st_size,
+                        metadata.st_mtime_ns,
+                        metadata.st_ctime_ns,
+                    )
+                    != expected
+                    for metadata in (opened, named)
+                ):
+                    return False
+            if self._deduplicate and not self._refresh_blobs(
+                root_fd,
+                self._referenced_blobs(target_fd),
+            ):
+                return False
+            current = os.stat(target_name, dir_fd=root_fd, follow_symlinks=False)
+            return (current.st_dev, current.st_ino) == (
+                directory.st_dev,
+                directory.st_ino,
+            )
+        except (OSError, DatasetPublicationConflict, ValueError, KeyError, TypeError):
+            return False
+        finally:
+            for descriptor in reversed(descriptors):
+                os.close(descriptor)
+            os.close(seal_fd)
+
+    def _read_published(
+        self,
+        root_fd: int,
+        dataset_id: str,
+        candles_reader: Callable[[dict[str, Any], int, int], Any] | None = None,
+    ) -> dict[str, Any]:
+        try:
+            target_fd = os.open(dataset_id, _DIRECTORY_FLAGS, dir_fd=root_fd)
+        except FileNotFoundError as exc:
+            raise DatasetNotPublished() from exc
+        except OSError as exc:
+            raise DatasetPublicationConflict() from exc
+        artifact_descriptors: list[tuple[str, int, os.stat_result]] = []
+        try:
+            target_metadata = os.fstat(target_fd)
+            if not stat.S_ISDIR(target_metadata.st_mode) or stat.S_IMODE(
+                target_metadata.st_mode
+            ) != 0o700:
+                raise DatasetPublicationConflict()
+            if set(os.listdir(target_fd)) != set(self._artifact_names()):
+                raise DatasetPublicationConflict()
+            payloads: dict[str, Any] = {}
+            # Candles are read last so a ranged read can locate its slice
+            # from the small artifacts opened in the same anchored pass.
+            for filename in sorted(
+                self._artifact_names(),
+                key=lambda name: name in _CANDLES_FILENAMES,
+            ):
+                descriptor, metadata = self._open_private_file(target_fd, filename)
+                artifact_descriptors.append((filename, descriptor, metadata))
+                if filename not in _CANDLES_FILENAMES:
+                    payloads[filename] = self._read_open_private_file(descriptor)
+                    continue
+                # Compressed and deduplicated candles are exposed under the
+                # canonical name.
+                try:
+                    if filename == BLOB_MANIFEST_FILENAME:
+                        payloads[filename] = self._read_open_private_file(descriptor)
+                        payloads["candles.ndjson"] = self._read_blobs(
+                            root_fd,
+                            payloads,
+                            dataset_id,
+                            candles_reader,
+                        )
+                    elif candles_reader is not None:
+                        payloads["candles.ndjson"] = candles_reader(
+                            payloads,
+                            descriptor,
+                            metadata.st_size,
+                        )
+                    elif filename == COMPRESSED_CANDLES_FILENAME:
+                        payloads["candles.ndjson"] = decompress_candles(
+                            descriptor,
+                            self._compression_record(payloads, dataset_id),
+                        )
+                    else:
+                        payloads[filename] = self._read_open_private_file(descriptor)
+                except (DatasetBlobError, DatasetCompressionError) as exc:
+                    raise DatasetArtifactVerificationError() from exc
+            for filename, descriptor, metadata in artifact_descriptors:
+                opened = os.fstat(descriptor)
+                named = os.stat(filename, dir_fd=target_fd, follow_symlinks=False)
+                if (
+                    (opened.st_dev, opened.st_ino) != (metadata.st_dev, metadata.st_ino)
+                    or (named.st_dev, named.st_ino)
+                    != (metadata.st_dev, metadata.st_ino)
+                    or opened.st_nlink != 1
+                    or opened.st_size != metadata.st_size
+                    or opened.st_mtime_ns != metadata.st_mtime_ns
+                ):
+                    raise DatasetPublicationConflict()
+            current = os.stat(dataset_id, dir_fd=root_fd, follow_symlinks=False)
+            if (current.st_dev, current.st_ino) != (
+                target_metadata.st_dev,
+                target_metadata.st_ino,
+            ):
+                raise DatasetPublicationConflict()
+            return payloads
+        except OSError as exc:
+            raise DatasetPublicationConflict() from exc
+        finally:
+            for _, descriptor, _ in artifact_descriptors:
+                os.close(descriptor)
+            os.close(target_fd)
+
     def _create_staging(self, root_fd: int, dataset_id: str) -> tuple[str, int]:
         for _ in range(100):
             name = f".{dataset_id}.staging-{secrets.token_hex(16)}"
@@ -648,6 +1843,10 @@ class DatasetPublisher:
         """
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 def _atomic_rename_no_replace(root_fd: int, source: str, target: str) -> None:
     """Atomically rename a directory without ever replacing the target."""
 
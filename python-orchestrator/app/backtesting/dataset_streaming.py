@@ -0,0 +1,446 @@
+"""Bounded-memory streaming variant of the deterministic dataset builder.
+
+`DatasetBuilder` materialises, sorts and re-analyses the full input.  This
+module computes the exact same quality report incrementally over records in
+canonical order and writes canonical NDJSON chunks with a running sha256, so
+peak memory is bounded by the number of streams rather than the number of
+records.  Unsorted input is first spilled into sorted runs and merged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from app.backtesting.contracts import DatasetDescriptor, MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetBuildRejected,
+    DatasetQualityReport,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    DatasetStreamQuality,
+    MissingRange,
+    Timeframe,
+    _QUALITY_FLAG_ORDER,
+    _canonical_json,
+    _manifest_core_from_facts,
+    _manifest_from_core,
+    _record_sort_key,
+    _sha256,
+    _stream_key,
+)
+
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+DEFAULT_SPILL_RECORDS = 100_000
+
+
+class CandleSink(Protocol):
+    def write(self, payload: bytes, /) -> object: ...
+
+
+class StreamingBuildOrderError(ValueError):
+    """Input announced as canonically ordered is not."""
+
+    reason_code = "streaming_build_input_unsorted"
+
+    def __init__(self) -> None:
+        super().__init__(self.reason_code)
+
+
+@dataclass(frozen=True)
+class StreamingDatasetBuild:
+    """Everything but the candle bytes, which were written to the sink."""
+
+    quality_report: DatasetQualityReport
+    quality_report_json: bytes
+    manifest_json: bytes
+    descriptor: DatasetDescriptor
+    candles_checksum: str
+    candles_size: int
+
+    def to_artifacts(self, candles_ndjson: bytes) -> DatasetArtifacts:
+        """Bind sink bytes collected in memory and cross-verify the graph."""
+
+        artifacts = DatasetArtifacts(
+            candles_ndjson=candles_ndjson,
+            quality_report_json=self.quality_report_json,
+            manifest_json=self.manifest_json,
+            descriptor=self.descriptor,
+        )
+        DatasetSerializer.verify(artifacts)
+        return artifacts
+
+
+class _StreamState:
+    __slots__ = (
+        "example",
+        "first_open_at",
+        "previous_open_at",
+        "observed_count",
+        "missing_ranges",
+    )
+
+    def __init__(self, record: CandleRecord) -> None:
+        self.example = record
+        self.first_open_at = record.open_at
+        self.previous_open_at = record.open_at
+        self.observed_count = 1
+        self.missing_ranges: list[MissingRange] = []
+
+
+class _StreamingQualityAccumulator:
+    """Incremental equivalent of `DatasetBuilder.analyze` for ordered input."""
+
+    def __init__(self, source_identity: DatasetSourceIdentity) -> None:
+        self._source_identity = source_identity
+        self._flags: set[str] = set()
+        self._input_count = 0
+        self._source_networks: set[str] = set()
+        self._venues: set[str] = set()
+        self._market_types: set[MarketType] = set()
+        self._exact_duplicate_count = 0
+        self._conflicting_duplicate_count = 0
+        self._identity: tuple[object, ...] | None = None
+        self._variants: dict[bytes, int] = defaultdict(int)
+        self._stream_key: tuple[str, str, str, int] | None = None
+        self._stream: _StreamState | None = None
+        self._streams: list[DatasetStreamQuality] = []
+        self._missing_ranges: list[MissingRange] = []
+        self._symbols: set[str] = set()
+        self._timeframes: set[Timeframe] = set()
+        self._start_at: datetime | None = None
+        self._end_at: datetime | None = None
+
+    def add(self, record: CandleRecord, canonical_line: bytes) -> None:
+        self._input_count += 1
+        self._source_networks.add(record.source_network)
+        self._venues.add(record.market_data_venue)
+        self._market_types.add(record.market_type)
+
+        stream_key = _stream_key(record)
+        identity = (*stream_key, record.open_at)
+        if identity != self._identity:
+            self._close_identity()
+            self._identity = identity
+        self._variants[canonical_line] += 1
+
+        if stream_key != self._stream_key:
+            self._close_stream()
+            self._stream_key = stream_key
+            self._stream = _StreamState(record)
+            return
+        stream = self._stream
+        assert stream is not None
+        if record.open_at == stream.previous_open_at:
+            return
+        duration = record.timeframe.duration
+        delta = record.open_at - stream.previous_open_at
+        if delta < duration:
+            self._flags.add("stream_overlap")
+        elif delta != duration:
+            missing_duration = delta - duration
+            if missing_duration % duration != timedelta(0):
+                self._flags.add("invalid_stream_chronology")
+            else:
+                missing_range = MissingRange(
+                    first_missing_open_at=stream.previous_open_at + duration,
+                    end_at=record.open_at,
+                    timeframe=record.timeframe,
+                    missing_bar_count=int(missing_duration / duration),
+                )
+                stream.missing_ranges.append(missing_range)
+                self._missing_ranges.append(missing_range)
+                self._flags.add("missing_range")
+        stream.previous_open_at = record.open_at
+        stream.observed_count += 1
+
+    def _close_identity(self) -> None:
+        if self._variants:
+            self._exact_duplicate_count += sum(
+                count - 1 for count in self._variants.values()
+            )
+            self._conflicting_duplicate_count += len(self._variants) - 1
+        self._variants = defaultdict(int)
+
+    def _close_stream(self) -> None:
+        stream = self._stream
+        if stream is None:
+            return
+        example = stream.example
+        duration = example.timeframe.duration
+        last_close_at = stream.previous_open_at + duration
+        span = last_close_at - stream.first_open_at
+        self._streams.append(
+            DatasetStreamQuality(
+                market_data_venue=example.market_data_venue,
+                market_type=example.market_type,
+                symbol=example.symbol,
+                timeframe=example.timeframe,
+                first_open_at=stream.first_open_at,
+                last_close_at=last_close_at,
+                expected_count=max(stream.observed_count, int(span / duration)),
+                observed_count=stream.observed_count,
+                missing_ranges=tuple(stream.missing_ranges),
+            )
+        )
+        self._symbols.add(example.symbol)
+        self._timeframes.add(example.timeframe)
+        if self._start_at is None or stream.first_open_at < self._start_at:
+            self._start_at = stream.first_open_at
+        if self._end_at is None or last_close_at > self._end_at:
+            self._end_at = last_close_at
+        self._stream = None
+
+    def report(self) -> DatasetQualityReport:
+        self._close_identity()
+        self._close_stream()
+        flags = set(self._flags)
+        if not self._input_count:
+            flags.add("empty_input")
+        else:
+            for mixed_flag, expected, observed in (
+                (
+                    "mixed_source_network",
+                    self._source_identity.source_network,
+                    self._source_networks,
+                ),
+                (
+                    "mixed_market_data_venue",
+                    self._source_identity.market_data_venue,
+                    self._venues,
+                ),
+                (
+                    "mixed_market_type",
+                    self._source_identity.market_type,
+                    self._market_types,
+                ),
+            ):
+                if len(observed) > 1:
+                    flags.add(mixed_flag)
+                if observed != {expected}:
+                    flags.add("source_identity_mismatch")
+        if self._exact_duplicate_count:
+            flags.add("exact_duplicate")
+        if self._conflicting_duplicate_count:
+            flags.add("conflicting_duplicate")
+        return DatasetQualityReport(
+            input_count=self._input_count,
+            accepted_count=self._input_count,
+            streams=tuple(self._streams),
+            exact_duplicate_count=self._exact_duplicate_count,
+            conflicting_duplicate_count=self._conflicting_duplicate_count,
+            missing_ranges=tuple(self._missing_ranges),
+            quality_flags=tuple(item for item in _QUALITY_FLAG_ORDER if item in flags),
+        )
+
+    def coverage(self) -> tuple[tuple[str, ...], tuple[Timeframe, ...], datetime, datetime]:
+        assert self._start_at is not None and self._end_at is not None
+        return (
+            tuple(sorted(self._symbols)),
+            tuple(sorted(self._timeframes, key=lambda item: item.duration_seconds)),
+            self._start_at,
+            self._end_at,
+        )
+
+
+class StreamingDatasetBuilder:
+    """Streaming, byte-identical counterpart of `DatasetBuilder` + serializer."""
+
+    def __init__(
+        self,
+        source_identity: DatasetSourceIdentity,
+        *,
+        presorted: bool = True,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        spill_records: int = DEFAULT_SPILL_RECORDS,
+        spill_directory: Path | None = None,
+    ) -> None:
+        if not isinstance(source_identity, DatasetSourceIdentity):
+            raise TypeError("StreamingDatasetBuilder requires DatasetSourceIdentity")
+        if (
+            type(chunk_bytes) is not int
+            or chunk_bytes < 1
+            or type(spill_records) is not int
+            or spill_records < 1
+        ):
+            raise ValueError("streaming_build_bounds_invalid")
+        self._source_identity = source_identity
+        self._presorted = presorted
+        self._chunk_bytes = chunk_bytes
+        self._spill_records = spill_records
+        self._spill_directory = spill_directory
+
+    def analyze(self, records: Iterable[CandleRecord]) -> DatasetQualityReport:
+        accumulator = _StreamingQualityAccumulator(self._source_identity)
+        with self._canonical_lines(records) as ordered:
+            for record, line in ordered:
+                accumulator.add(record, line)
+        return accumulator.report()
+
+    def build(
+        self,
+        records: Iterable[CandleRecord],
+        candles_sink: CandleSink | BinaryIO,
+    ) -> StreamingDatasetBuild:
+        """Write canonical NDJSON to the sink and return the bound manifest.
+
+        On `DatasetBuildRejected` the sink already holds partial output and
+        must be discarded by the caller.
+        """
+
+        accumulator = _StreamingQualityAccumulator(self._source_identity)
+        digest = hashlib.sha256()
+        size = 0
+        pending: list[bytes] = []
+        pending_size = 0
+        with self._canonical_lines(records) as ordered:
+            for record, line in ordered:
+                accumulator.add(record, line)
+                pending.append(line)
+                pending.append(b"\n")
+                pending_size += len(line) + 1
+                if pending_size >= self._chunk_bytes:
+                    chunk = b"".join(pending)
+                    digest.update(chunk)
+                    candles_sink.write(chunk)
+                    size += len(chunk)
+                    pending, pending_size = [], 0
+        if pending:
+            chunk = b"".join(pending)
+            digest.update(chunk)
+            candles_sink.write(chunk)
+            size += len(chunk)
+
+        report = accumulator.report()
+        if not report.eligible:
+            raise DatasetBuildRejected("dataset_quality_rejected", report)
+        symbols, timeframes, start_at, end_at = accumulator.coverage()
+        candles_checksum = "sha256:" + digest.hexdigest()
+        quality_report_json = _canonical_json(report) + b"\n"
+        manifest = _manifest_from_core(
+            _manifest_core_from_facts(
+                self._source_identity,
+                report,
+                symbols=symbols,
+                timeframes=timeframes,
+                start_at=start_at,
+                end_at=end_at,
+                record_count=report.accepted_count,
+            ),
+            candles_checksum,
+            _sha256(quality_report_json),
+        )
+        return StreamingDatasetBuild(
+            quality_report=report,
+            quality_report_json=quality_report_json,
+            manifest_json=_canonical_json(manifest) + b"\n",
+            descriptor=DatasetDescriptor.from_manifest(manifest),
+            candles_checksum=candles_checksum,
+            candles_size=size,
+        )
+
+    def _canonical_lines(
+        self, records: Iterable[CandleRecord]
+    ) -> "_OrderedLines":
+        return _OrderedLines(
+            records,
+            presorted=self._presorted,
+            spill_records=self._spill_records,
+            spill_directory=self._spill_directory,
+        )
+
+
+class _OrderedLines:
+    """Context manager yielding `(record, canonical_line)` in canonical order."""
+
+    def __init__(
+        self,
+        records: Iterable[CandleRecord],
+        *,
+        presorted: bool,
+        spill_records: int,
+        spill_directory: Path | None,
+    ) -> None:
+        self._records = records
+        self._presorted = presorted
+        self._spill_records = spill_records
+        self._spill_directory = spill_directory
+        self._temporary: tempfile.TemporaryDirectory[str] | None = None
+
+    def __enter__(self) -> Iterator[tuple[CandleRecord, bytes]]:
+        if self._presorted:
+            return self._checked(self._records)
+        self._temporary = tempfile.TemporaryDirectory(
+            prefix="backtest-dataset-sort-",
+            dir=self._spill_directory,
+        )
+        return self._merged(Path(self._temporary.name))
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._temporary is not None:
+            self._temporary.cleanup()
+
+    @staticmethod
+    def _checked(
+        records: Iterable[CandleRecord],
+    ) -> Iterator[tuple[CandleRecord, bytes]]:
+        previous: tuple[object, ...] | None = None
+        for record in records:
+            if not isinstance(record, CandleRecord):
+                raise TypeError("DatasetBuilder accepts only CandleRecord values")
+            key = _record_sort_key(record)
+            if previous is not None and key < previous:
+                raise StreamingBuildOrderError()
+            previous = key
+            yield record, _canonical_json(record)
+
+    def _merged(self, directory: Path) -> Iterator[tuple[CandleRecord, bytes]]:
+        runs: list[Path] = []
+        batch: list[CandleRecord] = []
+        for record in self._records:
+            if not isinstance(record, CandleRecord):
+                raise TypeError("DatasetBuilder accepts only CandleRecord values")
+            batch.append(record)
+            if len(batch) >= self._spill_records:
+                runs.append(self._spill(directory, len(runs), batch))
+                batch = []
+        if batch:
+            runs.append(self._spill(directory, len(runs), batch))
+        # heapq.merge is stable across runs, and runs are spilled in input
+        # order, so ties keep DatasetBuilder's stable-sort ordering.
+        yield from heapq.merge(
+            *(self._read_run(path) for path in runs),
+            key=lambda item: _record_sort_key(item[0]),
+        )
+
+    @staticmethod
+    def _spill(directory: Path, index: int, batch: list[CandleRecord]) -> Path:
+        path = directory / f"run-{index:06d}.ndjson"
+        with path.open("wb") as handle:
+            for record in sorted(batch, key=_record_sort_key):
+                handle.write(_canonical_json(record) + b"\n")
+        return path
+
+    @staticmethod
+    def _read_run(path: Path) -> Iterator[tuple[CandleRecord, bytes]]:
+        with path.open("rb") as handle:
+            for raw in handle:
+                line = raw.removesuffix(b"\n")
+                yield CandleRecord.model_validate_json(line), line
+
+
+__all__ = (
+    "StreamingBuildOrderError",
+    "StreamingDatasetBuild",
+    "StreamingDatasetBuilder",
+)
@@ -20,6 +20,7 @@ from app.backtesting.historical_funding import (
     MAX_HISTORICAL_FUNDING_RECORDS,
     MAX_HISTORICAL_FUNDING_TEXT_BYTES,
 )
+from app.backtesting.php_worker_pool import PhpWorkerError, PhpWorkerPool
 
 
 _HASH = r"^sha256:[0-9a-f]{64}$"
@@ -240,7 +241,7 @@ def _decimal_string(value: Any) -> str:
 
 
 class HistoricalFundingBridge:
-    def __init__(self, *, timeout_seconds: float = 15.0, max_output_bytes: int = _MAX_BYTES) -> None:
+    def __init__(self, *, timeout_seconds: float = 15.0, max_output_bytes: int = _MAX_BYTES, worker_pool: PhpWorkerPool | None = None) -> None:
         if type(timeout_seconds) not in (int, float) or not math.isfinite(timeout_seconds) or timeout_seconds <= 0 or type(max_output_bytes) is not int or not 1 <= max_output_bytes <= _MAX_BYTES:
             raise ValueError("historical_funding_bridge_bounds_invalid")
         root = Path(__file__).resolve().parents[3]
@@ -249,6 +250,7 @@ class HistoricalFundingBridge:
             "app:backtest:funding:settle", "--no-interaction", "--no-ansi",
         )
         self._timeout, self._max_output = float(timeout_seconds), max_output_bytes
+        self._worker_pool = worker_pool
 
     def settle(self, request: CanonicalHistoricalFundingRequest) -> CanonicalHistoricalFundingResult:
         if not isinstance(request, CanonicalHistoricalFundingRequest): raise TypeError("canonical_historical_funding_request_required")
@@ -266,6 +268,9 @@ class HistoricalFundingBridge:
         return result
 
     def _run(self, payload: bytes) -> tuple[int, bytes]:
+        if self._worker_pool is not None:
+            try: return self._worker_pool.request(self._argv, payload, timeout_seconds=self._timeout, max_output_bytes=self._max_output)
+            except PhpWorkerError as exc: raise HistoricalFundingBridgeError(f"historical_funding_bridge_{exc.reason}") from exc
         deadline = time.monotonic() + self._timeout
         try: process = subprocess.Popen(self._argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False)
         except (OSError, ValueError) as exc: raise HistoricalFundingBridgeError("historical_funding_bridge_process_unavailable") from exc
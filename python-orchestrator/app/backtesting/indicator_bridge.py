@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
 import math
@@ -15,10 +16,9 @@ import time
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from decimal import Decimal
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import (
     BaseModel,
@@ -30,14 +30,26 @@ from pydantic import (
     model_validator,
 )
 
+from app.backtesting.columnar import (
+    ColumnarCandleStore,
+    ScaledIntegerColumn,
+    epoch_micros,
+)
+from app.backtesting.contracts import DatasetDescriptor
 from app.backtesting.dataset import (
     CandleRecord,
     DatasetArtifacts,
     DatasetArtifactVerificationError,
     DatasetSerializer,
 )
+from app.backtesting.dataset_mapped import MappedDatasetArtifacts
+from app.backtesting.php_worker_pool import PhpWorkerError, PhpWorkerPool
+from app.backtesting.resampling import _bucket_extrema, _bucket_sums
 from app.modern_trading_contracts import FrozenJsonDict, _canonical_json, thaw_json
 
+if TYPE_CHECKING:
+    from app.backtesting.indicator_cache import IndicatorProjectionCache
+
 
 _SHA256_PATTERN = r"^sha256:[0-9a-f]{64}$"
 _UTC_MICRO_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z$")
@@ -45,6 +57,8 @@ _TIMEFRAMES = ("1m", "5m", "15m", "1h", "4h")
 _NATIVE_TIMEFRAMES = ("1m", "5m", "15m", "1h")
 _CERTIFIABLE_SYMBOLS = frozenset({"BTCUSDT", "ETHUSDT"})
 _MAX_BYTES = 8 * 1024 * 1024
+_MAX_BATCH_EVALUATIONS = 1000
+_PHP_ENGINE_VERSION = "php_fallback_v1"
 _CANDLE_KEYS = {
     "schema_version",
     "source_record_id",
@@ -65,6 +79,9 @@ _CANDLE_KEYS = {
 }
 
 
+IndicatorEngineVersion = Literal["php_fallback_v1", "python_native_v1"]
+
+
 class IndicatorBridgeError(RuntimeError):
     """Stable fail-closed bridge error without child-process diagnostics."""
 
@@ -98,18 +115,32 @@ def _paper_hash(value: Mapping[str, Any] | list[Any]) -> str:
     return "sha256:" + hashlib.sha256(_canonical_json(value).encode()).hexdigest()
 
 
-def _canonical_decimal(value: Decimal) -> str:
-    rendered = format(value, "f")
-    if "." in rendered:
-        rendered = rendered.rstrip("0").rstrip(".")
-    return rendered or "0"
+def _source_timeframes(requested: Sequence[str]) -> tuple[str, ...]:
+    return tuple(
+        timeframe
+        for timeframe in _NATIVE_TIMEFRAMES
+        if timeframe in requested or (timeframe == "1h" and "4h" in requested)
+    )
+
+
+def _required_count(timeframe: str, requested: Sequence[str]) -> int:
+    return 1000 if timeframe == "1h" and "4h" in requested else 250
 
 
 def _derived_four_hour_records(source: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
     """Reproduce PHP's derived-window evidence only; no indicators are calculated."""
 
+    starts = range(0, 1000, 4)
+    window = source[:1000]
+    high, low, volume = (
+        ScaledIntegerColumn.from_decimal_strings(item[field] for item in window)
+        for field in ("high", "low", "volume")
+    )
+    highs = _bucket_extrema(high, starts, 4, max)
+    lows = _bucket_extrema(low, starts, 4, min)
+    volumes = _bucket_sums(volume, starts, 4)
     derived: list[dict[str, Any]] = []
-    for offset in range(0, 1000, 4):
+    for bucket, offset in enumerate(starts):
         components = source[offset : offset + 4]
         record = {
             "schema_version": "canonical-derived-indicator-candle.v1",
@@ -125,16 +156,10 @@ def _derived_four_hour_records(source: Sequence[Mapping[str, Any]]) -> list[dict
             "close_at": components[3]["close_at"],
             "available_at": max(item["available_at"] for item in components),
             "open": components[0]["open"],
-            "high": _canonical_decimal(
-                max(Decimal(item["high"]) for item in components)
-            ),
-            "low": _canonical_decimal(
-                min(Decimal(item["low"]) for item in components)
-            ),
+            "high": highs.decimal_string(bucket),
+            "low": lows.decimal_string(bucket),
             "close": components[3]["close"],
-            "volume": _canonical_decimal(
-                sum(Decimal(item["volume"]) for item in components)
-            ),
+            "volume": volumes.decimal_string(bucket),
             "complete": True,
             "origin": "aggregate_1h_utc",
         }
@@ -197,7 +222,7 @@ class CanonicalIndicatorProjectionRequest(BaseModel):
     request_id: str = Field(pattern=r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,95}$")
     evaluated_at: str
     environment: Literal["local", "test"]
-    indicator_engine_version: Literal["php_fallback_v1"]
+    indicator_engine_version: IndicatorEngineVersion
     dataset_binding: CanonicalIndicatorDatasetBinding
     symbol: Literal["BTCUSDT", "ETHUSDT"]
     requested_timeframes: tuple[Literal["1m", "5m", "15m", "1h", "4h"], ...]
@@ -360,7 +385,7 @@ class CanonicalProjectedIndicatorSnapshot(BaseModel):
     snapshot_identity: FrozenJsonDict
     kline_time: str
     window_hash: str = Field(pattern=_SHA256_PATTERN)
-    indicator_engine_version: Literal["php_fallback_v1"]
+    indicator_engine_version: IndicatorEngineVersion
 
     @field_validator(
         "close",
@@ -566,7 +591,7 @@ class CanonicalIndicatorProjectionResult(BaseModel):
     request_id: str = Field(pattern=r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,95}$")
     evaluated_at: str
     environment: Literal["local", "test"]
-    indicator_engine_version: Literal["php_fallback_v1"]
+    indicator_engine_version: IndicatorEngineVersion
     dataset_binding: CanonicalIndicatorDatasetBinding
     symbol: Literal["BTCUSDT", "ETHUSDT"]
     requested_timeframes: tuple[Literal["1m", "5m", "15m", "1h", "4h"], ...]
@@ -640,25 +665,199 @@ class CanonicalIndicatorProjectionResult(BaseModel):
         return self
 
 
+class CanonicalIndicatorBatchProjectionRequest(BaseModel):
+    """One union window per timeframe projected at many evaluation times.
+
+    Each evaluation's window is the freshest admissible ``required``-candle
+    suffix of the union, as ``VerifiedIndicatorWindowBuilder.build`` selects
+    it, so ``requests()`` reproduces the per-timestamp requests and their
+    input hashes. Candle contents are validated by those derived requests.
+    """
+
+    model_config = ConfigDict(
+        frozen=True, extra="forbid", strict=True, arbitrary_types_allowed=True
+    )
+
+    schema_version: Literal["canonical-indicator-batch-projection-request.v1"]
+    request_id: str = Field(pattern=r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,88}$")
+    evaluations: tuple[str, ...]
+    environment: Literal["local", "test"]
+    indicator_engine_version: IndicatorEngineVersion
+    dataset_binding: CanonicalIndicatorDatasetBinding
+    symbol: Literal["BTCUSDT", "ETHUSDT"]
+    requested_timeframes: tuple[Literal["1m", "5m", "15m", "1h", "4h"], ...]
+    candles_by_timeframe: FrozenJsonDict
+
+    @field_validator(
+        "schema_version",
+        "request_id",
+        "environment",
+        "indicator_engine_version",
+        "symbol",
+        mode="before",
+    )
+    @classmethod
+    def _reject_string_coercion(cls, value: Any) -> Any:
+        return CanonicalIndicatorProjectionRequest._reject_string_coercion(value)
+
+    @field_validator("evaluations", mode="before")
+    @classmethod
+    def _validate_evaluations(cls, value: Any) -> tuple[str, ...]:
+        if not isinstance(value, (tuple, list)) or not 1 <= len(value) <= _MAX_BATCH_EVALUATIONS:
+            raise ValueError("canonical_indicator_evaluations_invalid")
+        normalized = tuple(
+            _require_exact_utc(item, "canonical_indicator_evaluations_invalid")
+            for item in value
+        )
+        # The fixed-width UTC form orders lexically exactly as it does in time.
+        if any(current <= previous for previous, current in zip(normalized, normalized[1:])):
+            raise ValueError("canonical_indicator_evaluations_invalid")
+        return normalized
+
+    @field_validator("requested_timeframes", mode="before")
+    @classmethod
+    def _validate_requested_timeframes(cls, value: Any) -> tuple[str, ...]:
+        return CanonicalIndicatorProjectionRequest._validate_requested_timeframes(value)
+
+    @field_validator("candles_by_timeframe", mode="before")
+    @classmethod
+    def _freeze_candles(cls, value: Any) -> FrozenJsonDict:
+        return CanonicalIndicatorProjectionRequest._freeze_candles(value)
+
+    @field_serializer("candles_by_timeframe")
+    def _serialize_candles(self, value: FrozenJsonDict) -> dict[str, Any]:
+        return thaw_json(value)
+
+    @model_validator(mode="after")
+    def _validate_windows(self) -> "CanonicalIndicatorBatchProjectionRequest":
+        self._slices()
+        return self
+
+    def _slices(self) -> tuple[dict[str, tuple[int, int]], ...]:
+        expected = _source_timeframes(self.requested_timeframes)
+        if tuple(self.candles_by_timeframe) != expected:
+            raise ValueError("canonical_indicator_candles_shape_invalid")
+        slices: tuple[dict[str, tuple[int, int]], ...] = tuple(
+            {} for _ in self.evaluations
+        )
+        for timeframe in expected:
+            union = self.candles_by_timeframe[timeframe]
+            if not isinstance(union, tuple) or not union:
+                raise ValueError("canonical_indicator_window_count_invalid")
+            ready: list[str] = []
+            for record in union:
+                if not isinstance(record, Mapping):
+                    raise ValueError("canonical_indicator_candle_shape_invalid")
+                ready.append(
+                    max(
+                        _require_exact_utc(
+                            record.get(field), "canonical_indicator_candle_time_invalid"
+                        )
+                        for field in ("close_at", "available_at")
+                    )
+                )
+            required = _required_count(timeframe, self.requested_timeframes)
+            covered = 0
+            for slot, evaluated in zip(slices, self.evaluations):
+                stop = len(ready)
+                while stop and ready[stop - 1] > evaluated:
+                    stop -= 1
+                start = stop - required
+                if start < 0:
+                    raise ValueError("canonical_indicator_window_count_invalid")
+                if any(item > evaluated for item in ready[start:stop]):
+                    raise ValueError("canonical_indicator_window_chronology_invalid")
+                # Windows only move forward; every union candle must be used.
+                if start > covered:
+                    raise ValueError("canonical_indicator_batch_window_invalid")
+                covered = max(covered, stop)
+                slot[timeframe] = (start, stop)
+            if covered != len(union):
+                raise ValueError("canonical_indicator_batch_window_invalid")
+        return slices
+
+    def requests(self) -> tuple[CanonicalIndicatorProjectionRequest, ...]:
+        """Per-evaluation requests, ids suffixed with the evaluation index."""
+
+        return tuple(
+            CanonicalIndicatorProjectionRequest(
+                schema_version="canonical-indicator-projection-request.v1",
+                request_id=f"{self.request_id}.{index}",
+                evaluated_at=evaluated,
+                environment=self.environment,
+                indicator_engine_version=self.indicator_engine_version,
+                dataset_binding=self.dataset_binding,
+                symbol=self.symbol,
+                requested_timeframes=self.requested_timeframes,
+                candles_by_timeframe={
+                    timeframe: self.candles_by_timeframe[timeframe][start:stop]
+                    for timeframe, (start, stop) in slots.items()
+                },
+            )
+            for index, (evaluated, slots) in enumerate(
+                zip(self.evaluations, self._slices())
+            )
+        )
+
+    def input_hash(self) -> str:
+        return _canonical_hash(self)
+
+
+class CanonicalIndicatorBatchProjectionResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid", strict=True)
+
+    schema_version: Literal["canonical-indicator-batch-projection-result.v1"]
+    request_id: str = Field(pattern=r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,88}$")
+    results: tuple[CanonicalIndicatorProjectionResult, ...]
+    input_hash: str = Field(pattern=_SHA256_PATTERN)
+    result_hash: str = Field(pattern=_SHA256_PATTERN)
+
+    @field_validator(
+        "schema_version", "request_id", "input_hash", "result_hash", mode="before"
+    )
+    @classmethod
+    def _reject_string_coercion(cls, value: Any) -> Any:
+        if type(value) is not str:
+            raise ValueError("canonical_indicator_result_string_type_invalid")
+        return value
+
+    @field_validator("results", mode="before")
+    @classmethod
+    def _validate_results(cls, value: Any) -> tuple[Any, ...]:
+        if not isinstance(value, (tuple, list)) or not value:
+            raise ValueError("canonical_indicator_batch_results_invalid")
+        return tuple(value)
+
+    @model_validator(mode="after")
+    def _validate_hash(self) -> "CanonicalIndicatorBatchProjectionResult":
+        payload = self.model_dump(mode="json", exclude={"result_hash"})
+        if _canonical_hash(payload) != self.result_hash:
+            raise ValueError("canonical_indicator_result_hash_mismatch")
+        return self
+
+
 class VerifiedIndicatorWindowBuilder:
     """Verify complete artifacts, then select exact admissible native suffixes."""
 
     def build(
         self,
-        artifacts: DatasetArtifacts,
+        artifacts: DatasetArtifacts | MappedDatasetArtifacts | VerifiedIndicatorWindowIndex,
         *,
         request_id: str,
         symbol: str,
         requested_timeframes: Sequence[str],
         evaluated_at: str,
         environment: str,
+        columnar: ColumnarCandleStore | None = None,
+        indicator_engine_version: str = _PHP_ENGINE_VERSION,
     ) -> CanonicalIndicatorProjectionRequest:
-        if not isinstance(artifacts, DatasetArtifacts):
-            raise TypeError("indicator_bridge_dataset_artifacts_required")
-        try:
-            descriptor = DatasetSerializer.verify(artifacts)
-        except DatasetArtifactVerificationError as exc:
-            raise IndicatorBridgeError("indicator_bridge_dataset_invalid") from exc
+        """``indicator_engine_version`` selects the projector the request is for.
+
+        Pass a ``VerifiedIndicatorWindowIndex`` instead of the artifacts to
+        build many requests over one dataset without re-verifying it.
+        """
+
+        descriptor, records = self._verify(artifacts, columnar)
 
         # Validate request primitives before materializing any artifact records.
         evaluated = _parse_utc(
@@ -667,63 +866,225 @@ class VerifiedIndicatorWindowBuilder:
         if symbol not in _CERTIFIABLE_SYMBOLS:
             raise IndicatorBridgeError("indicator_bridge_symbol_invalid")
 
-        records = tuple(
-            CandleRecord.model_validate_json(line)
-            for line in artifacts.candles_ndjson.removesuffix(b"\n").split(b"\n")
-        )
         requested = tuple(requested_timeframes)
-        source_timeframes = tuple(
-            timeframe
-            for timeframe in _NATIVE_TIMEFRAMES
-            if timeframe in requested or (timeframe == "1h" and "4h" in requested)
+        candles = {
+            timeframe: [
+                self._canonical_record(record)
+                for record in self._window(
+                    artifacts, records, columnar, symbol, timeframe, evaluated, requested
+                )
+            ]
+            for timeframe in _source_timeframes(requested)
+        }
+        return CanonicalIndicatorProjectionRequest(
+            schema_version="canonical-indicator-projection-request.v1",
+            request_id=request_id,
+            evaluated_at=_format_utc(evaluated),
+            environment=environment,
+            indicator_engine_version=indicator_engine_version,
+            dataset_binding=self._binding(descriptor),
+            symbol=symbol,
+            requested_timeframes=requested,
+            candles_by_timeframe=candles,
         )
+
+    def build_batch(
+        self,
+        artifacts: DatasetArtifacts | MappedDatasetArtifacts | VerifiedIndicatorWindowIndex,
+        *,
+        request_id: str,
+        symbol: str,
+        requested_timeframes: Sequence[str],
+        evaluations: Sequence[str],
+        environment: str,
+        columnar: ColumnarCandleStore | None = None,
+        indicator_engine_version: str = _PHP_ENGINE_VERSION,
+    ) -> CanonicalIndicatorBatchProjectionRequest:
+        """Verify once and ship each timeframe's union window for all evaluations.
+
+        ``evaluations`` must be strictly increasing; the per-evaluation windows
+        are exactly those ``build`` would select.
+        """
+
+        descriptor, records = self._verify(artifacts, columnar)
+        if (
+            not isinstance(evaluations, Sequence)
+            or isinstance(evaluations, str)
+            or not 1 <= len(evaluations) <= _MAX_BATCH_EVALUATIONS
+        ):
+            raise IndicatorBridgeError("indicator_bridge_evaluations_invalid")
+        instants = [
+            _parse_utc(
+                _require_exact_utc(item, "canonical_indicator_evaluations_invalid")
+            )
+            for item in evaluations
+        ]
+        if any(current <= previous for previous, current in zip(instants, instants[1:])):
+            raise IndicatorBridgeError("indicator_bridge_evaluations_invalid")
+        if symbol not in _CERTIFIABLE_SYMBOLS:
+            raise IndicatorBridgeError("indicator_bridge_symbol_invalid")
+
+        requested = tuple(requested_timeframes)
         candles: dict[str, list[dict[str, Any]]] = {}
-        for timeframe in source_timeframes:
-            required = 1000 if timeframe == "1h" and "4h" in requested else 250
-            candidates = [
+        for timeframe in _source_timeframes(requested):
+            stream = tuple(
                 record
                 for record in records
-                if record.symbol == symbol
-                and record.timeframe.value == timeframe
-                and record.close_at <= evaluated
-                and record.available_at <= evaluated
-            ]
-            if len(candidates) < required:
-                raise IndicatorBridgeError("indicator_bridge_window_insufficient")
-            window = candidates[-required:]
-            duration = window[0].timeframe.duration
-            if any(
-                current.open_at != previous.close_at
-                for previous, current in zip(window, window[1:])
-            ) or window[-1].close_at - window[0].open_at != duration * required:
-                raise IndicatorBridgeError("indicator_bridge_window_chronology_invalid")
-            if timeframe == "1h" and "4h" in requested and window[0].open_at.hour % 4:
-                raise IndicatorBridgeError("indicator_bridge_four_hour_alignment_invalid")
+                if record.symbol == symbol and record.timeframe.value == timeframe
+            )
+            union: dict[datetime, CandleRecord] = {}
+            for evaluated in instants:
+                for record in self._window(
+                    artifacts, stream, columnar, symbol, timeframe, evaluated, requested
+                ):
+                    union.setdefault(record.open_at, record)
             candles[timeframe] = [
-                self._canonical_record(record) for record in window
+                self._canonical_record(union[opened]) for opened in sorted(union)
             ]
-
-        return CanonicalIndicatorProjectionRequest(
-            schema_version="canonical-indicator-projection-request.v1",
+        return CanonicalIndicatorBatchProjectionRequest(
+            schema_version="canonical-indicator-batch-projection-request.v1",
             request_id=request_id,
-            evaluated_at=_format_utc(evaluated),
+            evaluations=tuple(_format_utc(item) for item in instants),
             environment=environment,
-            indicator_engine_version="php_fallback_v1",
-            dataset_binding=CanonicalIndicatorDatasetBinding(
-                dataset_id=descriptor.dataset_id,
-                dataset_checksum=descriptor.dataset_checksum,
-                candles_checksum=descriptor.candles_checksum,
-                quality_report_checksum=descriptor.quality_report_checksum,
-                source_checksum=descriptor.source_checksum,
-                source_network=descriptor.source_network,
-                market_data_venue=descriptor.market_data_venue,
-                market_type=descriptor.market_type.value,
-            ),
+            indicator_engine_version=indicator_engine_version,
+            dataset_binding=self._binding(descriptor),
             symbol=symbol,
             requested_timeframes=requested,
             candles_by_timeframe=candles,
         )
 
+    @staticmethod
+    def _verify(
+        artifacts: DatasetArtifacts | MappedDatasetArtifacts | VerifiedIndicatorWindowIndex,
+        columnar: ColumnarCandleStore | None,
+    ) -> tuple[DatasetDescriptor, tuple[CandleRecord, ...]]:
+        if isinstance(artifacts, VerifiedIndicatorWindowIndex):
+            # Verified when the index was built; artifacts are immutable.
+            if columnar is not None:
+                raise IndicatorBridgeError("indicator_bridge_dataset_invalid")
+            return artifacts.descriptor, ()
+        mapped = artifacts if isinstance(artifacts, MappedDatasetArtifacts) else None
+        if mapped is None and not isinstance(artifacts, DatasetArtifacts):
+            raise TypeError("indicator_bridge_dataset_artifacts_required")
+        try:
+            if mapped is not None:
+                descriptor = mapped.verify()
+                verified_records: tuple[CandleRecord, ...] = ()
+            else:
+                verified = DatasetSerializer.verified(artifacts)
+                descriptor = verified.descriptor
+                verified_records = verified.records
+        except DatasetArtifactVerificationError as exc:
+            raise IndicatorBridgeError("indicator_bridge_dataset_invalid") from exc
+        if columnar is not None and (
+            mapped is not None
+            or not isinstance(columnar, ColumnarCandleStore)
+            or columnar.candles_checksum != descriptor.candles_checksum
+        ):
+            raise IndicatorBridgeError("indicator_bridge_dataset_invalid")
+        return descriptor, verified_records if columnar is None else ()
+
+    def _window(
+        self,
+        artifacts: DatasetArtifacts | MappedDatasetArtifacts | VerifiedIndicatorWindowIndex,
+        records: tuple[CandleRecord, ...],
+        columnar: ColumnarCandleStore | None,
+        symbol: str,
+        timeframe: str,
+        evaluated: datetime,
+        requested: tuple[str, ...],
+    ) -> list[CandleRecord]:
+        required = _required_count(timeframe, requested)
+        if isinstance(artifacts, VerifiedIndicatorWindowIndex):
+            candidates = artifacts._candidates(symbol, timeframe, evaluated, required)
+        elif isinstance(artifacts, MappedDatasetArtifacts):
+            candidates = self._mapped_candidates(
+                artifacts, symbol, timeframe, evaluated, required
+            )
+        elif columnar is None:
+            candidates = [
+                record
+                for record in records
+                if record.symbol == symbol
+                and record.timeframe.value == timeframe
+                and record.close_at <= evaluated
+                and record.available_at <= evaluated
+            ]
+        else:
+            candidates = self._columnar_candidates(
+                columnar, symbol, timeframe, evaluated, required
+            )
+        if len(candidates) < required:
+            raise IndicatorBridgeError("indicator_bridge_window_insufficient")
+        window = candidates[-required:]
+        duration = window[0].timeframe.duration
+        if any(
+            current.open_at != previous.close_at
+            for previous, current in zip(window, window[1:])
+        ) or window[-1].close_at - window[0].open_at != duration * required:
+            raise IndicatorBridgeError("indicator_bridge_window_chronology_invalid")
+        if timeframe == "1h" and "4h" in requested and window[0].open_at.hour % 4:
+            raise IndicatorBridgeError("indicator_bridge_four_hour_alignment_invalid")
+        return window
+
+    @staticmethod
+    def _binding(descriptor: DatasetDescriptor) -> CanonicalIndicatorDatasetBinding:
+        return CanonicalIndicatorDatasetBinding(
+            dataset_id=descriptor.dataset_id,
+            dataset_checksum=descriptor.dataset_checksum,
+            candles_checksum=descriptor.candles_checksum,
+            quality_report_checksum=descriptor.quality_report_checksum,
+            source_checksum=descriptor.source_checksum,
+            source_network=descriptor.source_network,
+            market_data_venue=descriptor.market_data_venue,
+            market_type=descriptor.market_type.value,
+        )
+
+    @staticmethod
+    def _columnar_candidates(
+        columnar: ColumnarCandleStore,
+        symbol: str,
+        timeframe: str,
+        evaluated: datetime,
+        required: int,
+    ) -> list[CandleRecord]:
+        # Admissibility is decided on int64 columns; only the freshest
+        # suffix that can reach the request is decoded into records.
+        stream = columnar.find(symbol=symbol, timeframe=timeframe)
+        if stream is None:
+            return []
+        bound = epoch_micros(evaluated)
+        admissible = [
+            index
+            for index in range(len(stream))
+            if stream.close_at[index] <= bound and stream.available_at[index] <= bound
+        ]
+        return [stream.record(index) for index in admissible[-required:]]
+
+    @staticmethod
+    def _mapped_candidates(
+        mapped: MappedDatasetArtifacts,
+        symbol: str,
+        timeframe: str,
+        evaluated: datetime,
+        required: int,
+    ) -> list[CandleRecord]:
+        # Closed bars form a prefix of the gap-free stream; walk it backwards
+        # and decode only until the freshest admissible suffix is complete.
+        stream = mapped.find(symbol=symbol, timeframe=timeframe)
+        if stream is None:
+            return []
+        _, stop = stream.index_range(end_at=evaluated)
+        admissible: list[CandleRecord] = []
+        for index in range(stop - 1, -1, -1):
+            record = stream.record(index)
+            if record.available_at <= evaluated:
+                admissible.append(record)
+                if len(admissible) == required:
+                    break
+        admissible.reverse()
+        return admissible
+
     @staticmethod
     def _canonical_record(record: CandleRecord) -> dict[str, Any]:
         # Reuse the serializer's public model contract; timestamps must use the
@@ -734,6 +1095,74 @@ class VerifiedIndicatorWindowBuilder:
         return payload
 
 
+@dataclass(frozen=True, slots=True)
+class _IndexedStream:
+    records: tuple[CandleRecord, ...]
+    close_at: tuple[datetime, ...]
+    available_at: tuple[datetime, ...]
+    available_ordered: bool
+
+
+class VerifiedIndicatorWindowIndex:
+    """A verified dataset partitioned into streams searchable by instant.
+
+    Verification, parsing and per-stream partitioning are paid once here.
+    ``VerifiedIndicatorWindowBuilder`` then selects each window with a bisect
+    over the sorted ``close_at`` and ``available_at`` instants, so per-bar
+    request construction no longer scans the dataset.
+    """
+
+    __slots__ = ("_descriptor", "_streams")
+
+    def __init__(self, artifacts: DatasetArtifacts) -> None:
+        if not isinstance(artifacts, DatasetArtifacts):
+            raise TypeError("indicator_bridge_dataset_artifacts_required")
+        descriptor, records = VerifiedIndicatorWindowBuilder._verify(artifacts, None)
+        grouped: dict[tuple[str, str], list[CandleRecord]] = {}
+        for record in records:
+            grouped.setdefault((record.symbol, record.timeframe.value), []).append(record)
+        streams: dict[tuple[str, str], _IndexedStream] = {}
+        for key, stream in grouped.items():
+            # Verified records use canonical order, so close_at is increasing.
+            available_at = tuple(record.available_at for record in stream)
+            streams[key] = _IndexedStream(
+                records=tuple(stream),
+                close_at=tuple(record.close_at for record in stream),
+                available_at=available_at,
+                available_ordered=all(
+                    previous <= current
+                    for previous, current in zip(available_at, available_at[1:])
+                ),
+            )
+        self._descriptor = descriptor
+        self._streams = MappingProxyType(streams)
+
+    @property
+    def descriptor(self) -> DatasetDescriptor:
+        return self._descriptor
+
+    def _candidates(
+        self, symbol: str, timeframe: str, evaluated: datetime, required: int
+    ) -> list[CandleRecord]:
+        stream = self._streams.get((symbol, timeframe))
+        if stream is None:
+            return []
+        stop = bisect.bisect_right(stream.close_at, evaluated)
+        if stream.available_ordered:
+            stop = bisect.bisect_right(stream.available_at, evaluated, 0, stop)
+            return list(stream.records[max(0, stop - required) : stop])
+        # A late publication can make availability non-monotone; walk back
+        # from the closed prefix until the admissible suffix is complete.
+        admissible: list[CandleRecord] = []
+        for index in range(stop - 1, -1, -1):
+            if stream.available_at[index] <= evaluated:
+                admissible.append(stream.records[index])
+                if len(admissible) == required:
+                    break
+        admissible.reverse()
+        return admissible
+
+
 @dataclass(frozen=True, slots=True, init=False)
 class BacktestIndicatorBridge:
     DEFAULT_TIMEOUT_SECONDS = 15.0
@@ -742,6 +1171,8 @@ class BacktestIndicatorBridge:
     _timeout: float
     _max_output: int
     _environment: Mapping[str, str]
+    _worker_pool: PhpWorkerPool | None
+    _cache: IndicatorProjectionCache | None
 
     def __init__(
         self,
@@ -749,7 +1180,14 @@ class BacktestIndicatorBridge:
         *,
         timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
         max_output_bytes: int = _MAX_BYTES,
+        worker_pool: PhpWorkerPool | None = None,
+        cache: IndicatorProjectionCache | None = None,
     ) -> None:
+        """``worker_pool`` reuses ``--worker`` processes instead of one per call.
+
+        ``cache`` answers previously verified requests without running PHP.
+        """
+
         if argv is None:
             repository = Path(__file__).resolve().parents[3]
             argv = (
@@ -777,6 +1215,8 @@ class BacktestIndicatorBridge:
         object.__setattr__(self, "_argv", argv)
         object.__setattr__(self, "_timeout", float(timeout_seconds))
         object.__setattr__(self, "_max_output", max_output_bytes)
+        object.__setattr__(self, "_worker_pool", worker_pool)
+        object.__setattr__(self, "_cache", cache)
         object.__setattr__(
             self,
             "_environment",
@@ -800,10 +1240,16 @@ class BacktestIndicatorBridge:
     ) -> CanonicalIndicatorProjectionResult:
         if not isinstance(request, CanonicalIndicatorProjectionRequest):
             raise TypeError("canonical_indicator_projection_request_required")
+        if request.indicator_engine_version != _PHP_ENGINE_VERSION:
+            raise IndicatorBridgeError("indicator_bridge_engine_unsupported")
+        if self._cache is not None:
+            cached = self._cache.get(request)
+            if cached is not None:
+                return cached
         payload = _canonical_json(request.model_dump(mode="json")).encode()
         if len(payload) > _MAX_BYTES:
             raise IndicatorBridgeError("indicator_bridge_input_too_large")
-        returncode, stdout, _stderr = self._run_bounded(payload)
+        returncode, stdout, _stderr = self._run_bounded(self._argv, payload)
         if returncode != 0:
             raise IndicatorBridgeError("indicator_bridge_process_failed")
         decoded = self._decode_result(stdout)
@@ -812,12 +1258,76 @@ class BacktestIndicatorBridge:
         except ValueError as exc:
             raise IndicatorBridgeError("indicator_bridge_result_invalid") from exc
         self._assert_request_binding(request, result)
+        if self._cache is not None:
+            self._cache.put(request, result)
         return result
 
-    def _run_bounded(self, payload: bytes) -> tuple[int, bytes, bytes]:
+    def project_batch(
+        self, batch: CanonicalIndicatorBatchProjectionRequest
+    ) -> tuple[CanonicalIndicatorProjectionResult, ...]:
+        """Project every evaluation in one ``--batch`` round trip.
+
+        Each result is bound to its derived per-timestamp request exactly as
+        ``project`` binds it. Size batches so the results fit the output bound.
+        With a cache, the round trip is skipped only when every evaluation hits.
+        """
+
+        if not isinstance(batch, CanonicalIndicatorBatchProjectionRequest):
+            raise TypeError("canonical_indicator_batch_projection_request_required")
+        if batch.indicator_engine_version != _PHP_ENGINE_VERSION:
+            raise IndicatorBridgeError("indicator_bridge_engine_unsupported")
+        requests = batch.requests()
+        if self._cache is not None:
+            cached: list[CanonicalIndicatorProjectionResult] = []
+            for request in requests:
+                hit = self._cache.get(request)
+                if hit is None:
+                    break
+                cached.append(hit)
+            else:
+                return tuple(cached)
+        payload = _canonical_json(batch.model_dump(mode="json")).encode()
+        if len(payload) > _MAX_BYTES:
+            raise IndicatorBridgeError("indicator_bridge_input_too_large")
+        returncode, stdout, _stderr = self._run_bounded((*self._argv, "--batch"), payload)
+        if returncode != 0:
+            raise IndicatorBridgeError("indicator_bridge_process_failed")
+        decoded = self._decode_result(stdout)
+        try:
+            result = CanonicalIndicatorBatchProjectionResult.model_validate(decoded)
+        except ValueError as exc:
+            raise IndicatorBridgeError("indicator_bridge_result_invalid") from exc
+        if (
+            result.request_id != batch.request_id
+            or result.input_hash != batch.input_hash()
+            or len(result.results) != len(requests)
+        ):
+            raise IndicatorBridgeError("indicator_bridge_result_identity_mismatch")
+        for request, item in zip(requests, result.results):
+            self._assert_request_binding(request, item)
+        if self._cache is not None:
+            for request, item in zip(requests, result.results):
+                self._cache.put(request, item)
+        return result.results
+
+    def _run_bounded(
+        self, argv: tuple[str, ...], payload: bytes
+    ) -> tuple[int, bytes, bytes]:
+        if self._worker_pool is not None:
+            try:
+                returncode, stdout = self._worker_pool.request(
+                    argv,
+                    payload,
+                    timeout_seconds=self._timeout,
+                    max_output_bytes=self._max_output,
+                    environment=self._environment,
+                )
+            except PhpWorkerError as exc:
+                raise IndicatorBridgeError(f"indicator_bridge_{exc.reason}") from exc
+            return returncode, stdout, b""
         try:
             process = subprocess.Popen(
-                list(self._argv),
+                list(argv),
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -965,10 +1475,13 @@ class BacktestIndicatorBridge:
 
 __all__ = (
     "BacktestIndicatorBridge",
+    "CanonicalIndicatorBatchProjectionRequest",
+    "CanonicalIndicatorBatchProjectionResult",
     "CanonicalIndicatorDatasetBinding",
     "CanonicalIndicatorProjectionRequest",
     "CanonicalIndicatorProjectionResult",
     "CanonicalProjectedIndicatorSnapshot",
     "IndicatorBridgeError",
     "VerifiedIndicatorWindowBuilder",
+    "VerifiedIndicatorWindowIndex",
 )
@@ -0,0 +1,291 @@
+"""Content-addressed on-disk cache of verified indicator projection results.
+
+A projection is fully identified by its request's ``input_hash`` and engine
+version, so the cache stores each result once, as its canonical JSON, under
+the dataset root's private ``.indicator-projections`` directory. Entries are
+written through a private temporary file and a no-replace rename, so
+concurrent writers of the same key never expose a partial entry. A read is
+never trusted: the result hash is re-checked by validation and the result is
+re-bound to the request exactly as ``BacktestIndicatorBridge`` binds a PHP
+answer. An entry that fails either check is dropped and reported as a miss.
+
+Reads refresh an entry's mtime; once the cached bytes exceed ``max_bytes``,
+``put`` evicts the least recently used entries.
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import os
+import secrets
+import stat
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.backtesting.dataset_store import (
+    DatasetPublicationConflict,
+    DatasetPublisher,
+    _atomic_rename_no_replace,
+)
+from app.backtesting.indicator_bridge import (
+    BacktestIndicatorBridge,
+    CanonicalIndicatorProjectionRequest,
+    CanonicalIndicatorProjectionResult,
+    IndicatorBridgeError,
+)
+from app.modern_trading_contracts import _canonical_json
+
+
+CACHE_DIRECTORY = ".indicator-projections"
+_DIRECTORY_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, "O_DIRECTORY", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+_TEMPORARY_GRACE_NS = 3_600 * 1_000_000_000
+
+
+class _PrivateEntryStore:
+    """Owner-only directory of immutable entries with an LRU byte budget.
+
+    Entries are written through a private temporary file and a no-replace
+    rename; reads refresh the mtime that eviction orders by. The store only
+    moves bytes: callers validate what they read and drop what fails.
+
+    Writes keep a running byte total, seeded by the first sweep, so the
+    directory is only listed once that total passes the budget. Sweeps
+    recompute it exactly, which also absorbs entries other processes wrote
+    or removed in between.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        directory: str,
+        *,
+        max_bytes: int,
+        unsafe_error: type[RuntimeError],
+        unsafe_reason: str,
+    ) -> None:
+        self._root = Path(os.path.abspath(os.fspath(root)))
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._unsafe_error = unsafe_error
+        self._unsafe_reason = unsafe_reason
+        self._lock = threading.Lock()
+        self._stored_bytes: int | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._root / self._directory
+
+    def read(self, name: str) -> bytes | None:
+        directory_fd = self._open_directory()
+        try:
+            try:
+                descriptor, _ = DatasetPublisher._open_private_file(directory_fd, name)
+            except FileNotFoundError:
+                return None
+            except (OSError, DatasetPublicationConflict):
+                self._discard(directory_fd, name)
+                return None
+            try:
+                payload = DatasetPublisher._read_open_private_file(descriptor)
+                os.utime(descriptor)
+            finally:
+                os.close(descriptor)
+        finally:
+            os.close(directory_fd)
+        return payload
+
+    def discard(self, name: str) -> None:
+        directory_fd = self._open_directory()
+        try:
+            self._discard(directory_fd, name)
+        finally:
+            os.close(directory_fd)
+
+    def write(self, name: str, payload: bytes) -> int | None:
+        """Store ``payload`` unless it exceeds the budget; return evictions."""
+
+        if len(payload) > self._max_bytes:
+            return None
+        directory_fd = self._open_directory()
+        try:
+            temporary = f".{name}.tmp-{secrets.token_hex(16)}"
+            DatasetPublisher._write_private_file(directory_fd, temporary, payload)
+            added = len(payload)
+            try:
+                _atomic_rename_no_replace(directory_fd, temporary, name)
+            except OSError as exc:
+                if exc.errno not in {errno.EEXIST, errno.ENOTEMPTY}:
+                    raise
+                # A concurrent writer stored the same entry first.
+                os.unlink(temporary, dir_fd=directory_fd)
+                added = 0
+            os.fsync(directory_fd)
+            with self._lock:
+                if self._stored_bytes is not None:
+                    self._stored_bytes += added
+                    if self._stored_bytes <= self._max_bytes:
+                        return 0
+            return self._evict(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    def _open_directory(self) -> int:
+        self._root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        root_fd = os.open(self._root, _DIRECTORY_FLAGS)
+        try:
+            try:
+                os.mkdir(self._directory, 0o700, dir_fd=root_fd)
+            except FileExistsError:
+                pass
+            directory_fd = os.open(self._directory, _DIRECTORY_FLAGS, dir_fd=root_fd)
+        finally:
+            os.close(root_fd)
+        if stat.S_IMODE(os.fstat(directory_fd).st_mode) != 0o700:
+            os.close(directory_fd)
+            raise self._unsafe_error(self._unsafe_reason)
+        return directory_fd
+
+    def _evict(self, directory_fd: int) -> int:
+        now = time.time_ns()
+        entries: list[tuple[int, str, int]] = []
+        for name in os.listdir(directory_fd):
+            try:
+                observed = os.stat(name, dir_fd=directory_fd, follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            if name.startswith("."):
+                # Temporaries left by interrupted writers; live ones are fresh.
+                if now - observed.st_mtime_ns > _TEMPORARY_GRACE_NS:
+                    self._discard(directory_fd, name)
+                continue
+            entries.append((observed.st_mtime_ns, name, observed.st_size))
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        for _, name, size in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            self._discard(directory_fd, name)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._stored_bytes = total
+        return evicted
+
+    @staticmethod
+    def _discard(directory_fd: int, name: str) -> None:
+        try:
+            os.unlink(name, dir_fd=directory_fd)
+        except FileNotFoundError:
+            pass
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorProjectionCacheStats:
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+
+
+class IndicatorProjectionCache:
+    """Persistent projection results keyed by ``(input_hash, engine version)``."""
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """``root`` is the dataset root; the cache lives in a private child."""
+
+        if type(max_bytes) is not int or max_bytes < 0:
+            raise ValueError("indicator_projection_cache_bounds_invalid")
+        self._store = _PrivateEntryStore(
+            root,
+            CACHE_DIRECTORY,
+            max_bytes=max_bytes,
+            unsafe_error=IndicatorBridgeError,
+            unsafe_reason="indicator_projection_cache_unsafe",
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._store.directory
+
+    def get(
+        self, request: CanonicalIndicatorProjectionRequest
+    ) -> CanonicalIndicatorProjectionResult | None:
+        """Return the verified cached result for ``request``, or ``None``."""
+
+        name = self._entry_name(request)
+        payload = self._store.read(name)
+        if payload is None:
+            return self._count_miss()
+        try:
+            result = CanonicalIndicatorProjectionResult.model_validate(
+                json.loads(
+                    payload.decode("utf-8"),
+                    object_pairs_hook=BacktestIndicatorBridge._unique_object,
+                    parse_constant=lambda _value: (_ for _ in ()).throw(ValueError()),
+                )
+            )
+            BacktestIndicatorBridge._assert_request_binding(request, result)
+        except (UnicodeDecodeError, ValueError, IndicatorBridgeError):
+            self._store.discard(name)
+            return self._count_miss()
+        with self._lock:
+            self._hits += 1
+        return result
+
+    def put(
+        self,
+        request: CanonicalIndicatorProjectionRequest,
+        result: CanonicalIndicatorProjectionResult,
+    ) -> None:
+        """Store a result already bound to ``request``, then enforce the budget."""
+
+        BacktestIndicatorBridge._assert_request_binding(request, result)
+        payload = _canonical_json(result.model_dump(mode="json")).encode()
+        evicted = self._store.write(self._entry_name(request), payload)
+        if evicted is None:
+            return
+        with self._lock:
+            self._stores += 1
+            self._evictions += evicted
+
+    def stats(self) -> IndicatorProjectionCacheStats:
+        with self._lock:
+            return IndicatorProjectionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+            )
+
+    @staticmethod
+    def _entry_name(request: CanonicalIndicatorProjectionRequest) -> str:
+        if not isinstance(request, CanonicalIndicatorProjectionRequest):
+            raise TypeError("canonical_indicator_projection_request_required")
+        digest = request.input_hash().removeprefix("sha256:")
+        return f"{request.indicator_engine_version}-{digest}.json"
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+        return None
+
+
+__all__ = (
+    "IndicatorProjectionCache",
+    "IndicatorProjectionCacheStats",
+)
@@ -0,0 +1,455 @@
+"""In-process ``python_native_v1`` canonical indicator engine.
+
+The engine reproduces ``CanonicalPhpIndicatorCalculator`` (the
+``php_fallback_v1`` formulas) without a PHP process: each window is read into
+float columns once and every recurrence (EMA, MACD, RSI, ATR, ADX, VWAP)
+advances in the same forward pass. Accumulations keep PHP's left-to-right
+operation order, so every float, and therefore every canonical snapshot apart
+from its engine tag, is byte-identical to the PHP projector's output.
+``indicator_engine_mismatches`` checks that claim against the PHP bridge.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from app.backtesting.indicator_bridge import (
+    BacktestIndicatorBridge,
+    CanonicalIndicatorBatchProjectionRequest,
+    CanonicalIndicatorProjectionRequest,
+    CanonicalIndicatorProjectionResult,
+    IndicatorBridgeError,
+    _canonical_hash,
+    _derived_four_hour_records,
+    _paper_hash,
+    _parse_utc,
+)
+from app.modern_trading_contracts import _canonical_json, thaw_json
+
+
+NATIVE_INDICATOR_ENGINE_VERSION = "python_native_v1"
+_EMA_PERIODS = (9, 20, 21, 50, 200)
+_ADX_PERIODS = (14, 15)
+_RSI_PERIOD = 14
+_ATR_PERIOD = 14
+_MACD_FAST, _MACD_SLOW, _MACD_SIGNAL = 12, 26, 9
+_BOLLINGER_PERIOD = 20
+_SERIES_TAIL = 60
+_PULLBACK_VALIDITY_BARS = 100
+_PULLBACK_VWAP_TOLERANCE = 0.0015
+
+
+def _sequential_sum(values: Iterable[float]) -> float:
+    # PHP's array_sum adds left to right; CPython 3.12+ compensates in sum().
+    total = 0.0
+    for value in values:
+        total += value
+    return total
+
+
+def _finite(value: float) -> float:
+    if not math.isfinite(value):
+        raise IndicatorBridgeError("indicator_engine_calculation_invalid")
+    return value
+
+
+class _SeededEma:
+    """``Macd::emaSeries``: SMA seed over ``period`` values, then smoothing."""
+
+    __slots__ = ("_alpha", "_period", "_seen", "_sum", "value")
+
+    def __init__(self, period: int) -> None:
+        self._period = period
+        self._alpha = 2.0 / (period + 1.0)
+        self._seen = 0
+        self._sum = 0.0
+        self.value: float | None = None
+
+    def push(self, sample: float) -> float | None:
+        self._seen += 1
+        if self._seen < self._period:
+            self._sum += sample
+        elif self._seen == self._period:
+            self._sum += sample
+            self.value = self._sum / self._period
+        else:
+            self.value = self._alpha * sample + (1.0 - self._alpha) * self.value
+        return self.value
+
+
+class _WilderDirectional:
+    """``Adx::calculatePhp`` for one period, fed one true-range step at a time."""
+
+    __slots__ = ("_atr", "_minus", "_period", "_plus", "_seen", "value")
+
+    def __init__(self, period: int) -> None:
+        self._period = period
+        self._seen = 0
+        self._atr = self._plus = self._minus = 0.0
+        self.value: float | None = None
+
+    def push(self, true_range: float, plus_dm: float, minus_dm: float) -> None:
+        period = self._period
+        self._seen += 1
+        if self._seen <= period:
+            self._atr += true_range
+            self._plus += plus_dm
+            self._minus += minus_dm
+            if self._seen < period:
+                return
+            self._atr /= period
+            self._plus /= period
+            self._minus /= period
+        else:
+            self._atr = ((self._atr * (period - 1)) + true_range) / period
+            self._plus = ((self._plus * (period - 1)) + plus_dm) / period
+            self._minus = ((self._minus * (period - 1)) + minus_dm) / period
+        atr = self._atr
+        plus_di = 0.0 if atr == 0.0 else 100.0 * (self._plus / atr)
+        minus_di = 0.0 if atr == 0.0 else 100.0 * (self._minus / atr)
+        total = plus_di + minus_di
+        dx = 0.0 if total == 0.0 else 100.0 * abs(plus_di - minus_di) / total
+        self.value = dx if self.value is None else ((self.value * (period - 1)) + dx) / period
+
+
+def calculate_indicator_context(candles: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    """Return the ``CanonicalPhpIndicatorCalculator::calculate`` context.
+
+    ``candles`` are canonical native or derived records, oldest first, as the
+    projector windows them (250 per snapshot).
+    """
+
+    return _context_from_columns(
+        [float(item["close"]) for item in candles],
+        [float(item["high"]) for item in candles],
+        [float(item["low"]) for item in candles],
+        [float(item["volume"]) for item in candles],
+        [_open_timestamp(item) for item in candles],
+    )
+
+
+def _open_timestamp(candle: Mapping[str, Any]) -> int:
+    return int(_parse_utc(candle["open_at"]).timestamp())
+
+
+def _context_from_columns(
+    closes: list[float],
+    highs: list[float],
+    lows: list[float],
+    volumes: list[float],
+    timestamps: list[int],
+) -> dict[str, Any]:
+    count = len(closes)
+    total_volume = _sequential_sum(volumes)
+    if not math.isfinite(total_volume) or total_volume <= 0.0:
+        raise IndicatorBridgeError("indicator_engine_calculation_invalid")
+
+    multipliers = {period: 2.0 / (period + 1.0) for period in _EMA_PERIODS}
+    ema = dict.fromkeys(_EMA_PERIODS, closes[0])
+    ema_prev = dict(ema)
+    crossing_alphas = (2 / (9 + 1), 2 / (21 + 1))
+    ema9_series: list[float] = []
+    ema21_series: list[float] = []
+    fast, slow = _SeededEma(_MACD_FAST), _SeededEma(_MACD_SLOW)
+    signal = _SeededEma(_MACD_SIGNAL)
+    macd_line: list[float] = []
+    signal_line: list[float] = []
+    hist_line: list[float] = []
+    directional = {period: _WilderDirectional(period) for period in _ADX_PERIODS}
+    atr_sum = atr = 0.0
+    gains = losses = average_gain = average_loss = 0.0
+    vwaps: list[float] = []
+    cumulative_pv = cumulative_volume = 0.0
+
+    for index, (close, high, low, volume) in enumerate(zip(closes, highs, lows, volumes)):
+        if index == count - 1:
+            ema_prev = dict(ema)
+        for period, multiplier in multipliers.items():
+            ema[period] = (close * multiplier) + (ema[period] * (1.0 - multiplier))
+        if index == 0:
+            ema9_series.append(close)
+            ema21_series.append(close)
+        else:
+            ema9_series.append(
+                close * crossing_alphas[0] + ema9_series[-1] * (1 - crossing_alphas[0])
+            )
+            ema21_series.append(
+                close * crossing_alphas[1] + ema21_series[-1] * (1 - crossing_alphas[1])
+            )
+
+        fast_value = fast.push(close)
+        slow_value = slow.push(close)
+        if slow_value is not None:
+            # Both EMAs describe this candle once the slow seed completes.
+            macd = fast_value - slow_value
+            signal_value = signal.push(macd)
+            if signal_value is not None:
+                macd_line.append(macd)
+                signal_line.append(signal_value)
+                hist_line.append(macd - signal_value)
+
+        typical = (high + low + close) / 3.0
+        weight = max(0.0, volume)
+        cumulative_pv += typical * weight
+        cumulative_volume += weight
+        vwaps.append(
+            cumulative_pv / cumulative_volume if cumulative_volume > 0.0 else 0.0
+        )
+
+        if index == 0:
+            continue
+        change = close - closes[index - 1]
+        if index <= _RSI_PERIOD:
+            if change >= 0.0:
+                gains += change
+            else:
+                losses -= change
+            if index == _RSI_PERIOD:
+                average_gain = gains / _RSI_PERIOD
+                average_loss = losses / _RSI_PERIOD
+        else:
+            gain = change if change > 0.0 else 0.0
+            loss = -change if change < 0.0 else 0.0
+            average_gain = ((average_gain * (_RSI_PERIOD - 1)) + gain) / _RSI_PERIOD
+            average_loss = ((average_loss * (_RSI_PERIOD - 1)) + loss) / _RSI_PERIOD
+
+        previous_close = closes[index - 1]
+        true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        if index <= _ATR_PERIOD:
+            atr_sum += true_range
+            if index == _ATR_PERIOD:
+                atr = atr_sum / _ATR_PERIOD
+        else:
+            atr = ((atr * (_ATR_PERIOD - 1)) + true_range) / _ATR_PERIOD
+        up = high - highs[index - 1]
+        down = lows[index - 1] - low
+        plus_dm = up if up > down and up > 0.0 else 0.0
+        minus_dm = down if down > up and down > 0.0 else 0.0
+        for state in directional.values():
+            state.push(true_range, plus_dm, minus_dm)
+
+    for series in (macd_line, signal_line, hist_line):
+        for value in series:
+            _finite(value)
+    strength = math.inf if average_loss == 0.0 else average_gain / average_loss
+    rsi = 100.0 - (100.0 / (1.0 + strength))
+    band = closes[-_BOLLINGER_PERIOD:]
+    middle = _sequential_sum(band) / _BOLLINGER_PERIOD
+    variance = 0.0
+    for close in band:
+        variance += (close - middle) ** 2
+    deviation = math.sqrt(variance / _BOLLINGER_PERIOD)
+    ma9 = _sequential_sum(closes[-9:]) / 9
+    ma21 = _finite(_sequential_sum(closes[-21:]) / 21)
+    atr = _finite(atr)
+    ema = {period: _finite(value) for period, value in ema.items()}
+    ema_prev = {period: _finite(value) for period, value in ema_prev.items()}
+    hist_tail = hist_line[-_SERIES_TAIL:]
+    hist_timestamps = timestamps[-len(hist_tail) :] if hist_tail else []
+    context = {
+        "close": _finite(closes[-1]),
+        "high_series": highs[-_SERIES_TAIL:],
+        "low_series": lows[-_SERIES_TAIL:],
+        "rsi": _finite(rsi),
+        "ema_20": ema[20],
+        "ema_50": ema[50],
+        "ema_200": ema[200],
+        "macd_hist": _finite(macd_line[-1] - signal_line[-1]),
+        "vwap": _finite(vwaps[-1]),
+        "atr": atr,
+        "adx": {
+            str(period): _finite(state.value)  # type: ignore[arg-type]
+            for period, state in directional.items()
+        },
+        "ma9": _finite(ma9),
+        "ma21": ma21,
+        "bb_upper": _finite(middle + (2.0 * deviation)),
+        "bb_middle": _finite(middle),
+        "bb_lower": _finite(middle - (2.0 * deviation)),
+        "ema": {str(period): value for period, value in ema.items()},
+        "ema_prev": {str(period): value for period, value in ema_prev.items()},
+        "ema_200_slope": ema[200] - ema_prev[200],
+        "ema_200_series": [ema_prev[200], ema[200]],
+        "ema_200_series_timestamps": timestamps[-2:],
+        "macd": {
+            "macd": _finite(macd_line[-1]),
+            "signal": _finite(signal_line[-1]),
+            "hist": _finite(macd_line[-1] - signal_line[-1]),
+        },
+        "macd_hist_series": hist_tail,
+        "macd_hist_series_timestamps": hist_timestamps,
+        "macd_line_signal_series": list(hist_tail),
+        "macd_line_signal_series_timestamps": list(hist_timestamps),
+        "macd_hist_last3": hist_tail[-3:],
+        "series_order": "oldest_to_newest",
+        "series_timestamps": timestamps,
+        "pullback_age_bars": _pullback_age(ema9_series, ema21_series, closes, vwaps),
+        "volume_ratio": _volume_ratio(volumes),
+        "ma_21_plus_k_atr": ma21 + (1.3 * atr),
+    }
+    for value in (context["ema_200_slope"], context["ma_21_plus_k_atr"]):
+        _finite(value)
+    return context
+
+
+def _pullback_age(
+    ema9: list[float], ema21: list[float], closes: list[float], vwaps: list[float]
+) -> int | None:
+    count = len(closes)
+    if count < 2 or not all(
+        math.isfinite(value) for series in (ema9, ema21, closes, vwaps) for value in series
+    ):
+        return None
+    age = 0
+    while age <= _PULLBACK_VALIDITY_BARS and count - 1 - age >= 1:
+        index = count - 1 - age
+        crossed_up = ema9[index - 1] <= ema21[index - 1] and ema9[index] > ema21[index]
+        near_vwap = (
+            vwaps[index] > 0.0
+            and abs((closes[index] / vwaps[index]) - 1.0) <= _PULLBACK_VWAP_TOLERANCE
+        )
+        if crossed_up or near_vwap:
+            return age
+        age += 1
+    return None
+
+
+def _volume_ratio(volumes: list[float]) -> float | None:
+    if len(volumes) < 3:
+        return None
+    current = volumes[-1]
+    history = [volume for volume in volumes[-21:][:20] if volume > 0.0]
+    if current <= 0.0 or not history:
+        return None
+    average = _sequential_sum(history) / len(history)
+    return current / average if average > 0.0 else None
+
+
+def _native_snapshot(
+    context: dict[str, Any],
+    *,
+    timeframe: str,
+    symbol: str,
+    environment: str,
+    kline_time: str,
+    window_hash: str,
+) -> dict[str, Any]:
+    return {
+        **context,
+        "snapshot_identity": {
+            "timeframe": timeframe,
+            "symbol": symbol,
+            "exchange": "fake",
+            "environment": environment,
+            "market_type": "perpetual",
+        },
+        "kline_time": kline_time,
+        "window_hash": window_hash,
+        "indicator_engine_version": NATIVE_INDICATOR_ENGINE_VERSION,
+    }
+
+
+class NativeIndicatorProjector:
+    """Project ``python_native_v1`` requests in process.
+
+    Same request and result contracts as ``BacktestIndicatorBridge``; window
+    hashes, identities and result hashes are derived exactly as PHP derives
+    them.
+    """
+
+    def project(
+        self, request: CanonicalIndicatorProjectionRequest
+    ) -> CanonicalIndicatorProjectionResult:
+        if not isinstance(request, CanonicalIndicatorProjectionRequest):
+            raise TypeError("canonical_indicator_projection_request_required")
+        if request.indicator_engine_version != NATIVE_INDICATOR_ENGINE_VERSION:
+            raise IndicatorBridgeError("indicator_engine_version_unsupported")
+        windows = request.candles_by_timeframe
+        snapshots: dict[str, Any] = {}
+        for timeframe in request.requested_timeframes:
+            if timeframe == "4h":
+                candles = _derived_four_hour_records(
+                    [thaw_json(item) for item in windows["1h"]]
+                )
+            else:
+                candles = [thaw_json(item) for item in windows[timeframe][-250:]]
+            snapshots[timeframe] = _native_snapshot(
+                calculate_indicator_context(candles),
+                timeframe=timeframe,
+                symbol=request.symbol,
+                environment=request.environment,
+                kline_time=candles[-1]["open_at"],
+                window_hash=_paper_hash(candles),
+            )
+        payload: dict[str, Any] = {
+            "schema_version": "canonical-indicator-projection-result.v1",
+            "request_id": request.request_id,
+            "evaluated_at": request.evaluated_at,
+            "environment": request.environment,
+            "indicator_engine_version": request.indicator_engine_version,
+            "dataset_binding": request.dataset_binding.model_dump(mode="json"),
+            "symbol": request.symbol,
+            "requested_timeframes": list(request.requested_timeframes),
+            "snapshots_by_timeframe": snapshots,
+            "input_hash": request.input_hash(),
+        }
+        payload["result_hash"] = _canonical_hash(payload)
+        return CanonicalIndicatorProjectionResult.model_validate(payload)
+
+    def project_batch(
+        self, batch: CanonicalIndicatorBatchProjectionRequest
+    ) -> tuple[CanonicalIndicatorProjectionResult, ...]:
+        if not isinstance(batch, CanonicalIndicatorBatchProjectionRequest):
+            raise TypeError("canonical_indicator_batch_projection_request_required")
+        return tuple(self.project(request) for request in batch.requests())
+
+
+def indicator_engine_mismatches(
+    request: CanonicalIndicatorProjectionRequest,
+    *,
+    bridge: BacktestIndicatorBridge,
+    projector: NativeIndicatorProjector | None = None,
+) -> tuple[str, ...]:
+    """Project ``request`` with both engines; return timeframes that differ.
+
+    ``request`` names either engine. Snapshots are compared as canonical JSON
+    with only ``indicator_engine_version`` removed, so an empty result means
+    the native engine is byte-identical to PHP for these windows.
+    """
+
+    engines = {}
+    for version in ("php_fallback_v1", NATIVE_INDICATOR_ENGINE_VERSION):
+        variant = request.model_copy(update={"indicator_engine_version": version})
+        engines[version] = (
+            bridge.project(variant)
+            if version == "php_fallback_v1"
+            else (projector or NativeIndicatorProjector()).project(variant)
+        )
+    reference, candidate = (
+        {
+            timeframe: _canonical_json(
+                {
+                    key: value
+                    for key, value in thaw_json(snapshot).items()
+                    if key != "indicator_engine_version"
+                }
+            )
+            for timeframe, snapshot in result.snapshots_by_timeframe.items()
+        }
+        for result in engines.values()
+    )
+    return tuple(
+        timeframe
+        for timeframe in request.requested_timeframes
+        if reference[timeframe] != candidate[timeframe]
+    )
+
+
+__all__ = (
+    "NATIVE_INDICATOR_ENGINE_VERSION",
+    "NativeIndicatorProjector",
+    "calculate_indicator_context",
+    "indicator_engine_mismatches",
+)
@@ -0,0 +1,169 @@
+"""Per-stream ``python_native_v1`` indicator state for bar-by-bar replay.
+
+A canonical snapshot is a function of its 250-bar window: EMA, MACD, RSI and
+ADX recurrences are all seeded at the window's first bar, so sliding the
+window by one bar changes every seed and no O(1) recurrence update can stay
+byte-identical to a full recomputation. What a replay can avoid is the rest of
+the per-bar cost, which dominates: re-verifying the window, re-encoding every
+record as canonical JSON for ``window_hash``, thawing and re-parsing decimal
+strings. ``IncrementalIndicatorState`` pays those once per candle when it is
+pushed and keeps float columns and canonical record encodings for the current
+window, so a snapshot is one forward pass over prepared columns plus a hash
+of cached bytes.
+
+Every ``checkpoint_interval`` pushes the state recomputes the snapshot from
+its canonical records through ``calculate_indicator_context`` and
+``_paper_hash``, exactly as ``NativeIndicatorProjector`` does, and fails closed
+if the two disagree.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import deque
+from typing import Any
+
+from app.backtesting.dataset import CandleRecord
+from app.backtesting.indicator_bridge import (
+    CanonicalIndicatorProjectionRequest,
+    IndicatorBridgeError,
+    VerifiedIndicatorWindowBuilder,
+    _paper_hash,
+)
+from app.backtesting.indicator_engine import (
+    NATIVE_INDICATOR_ENGINE_VERSION,
+    _context_from_columns,
+    _native_snapshot,
+    _open_timestamp,
+    calculate_indicator_context,
+)
+from app.modern_trading_contracts import _canonical_json, thaw_json
+
+
+_WINDOW = 250
+_IDENTITY_FIELDS = ("source_network", "market_data_venue", "market_type", "symbol", "timeframe")
+
+
+class IncrementalIndicatorState:
+    """Native indicator snapshots for one (symbol, timeframe) stream."""
+
+    DEFAULT_CHECKPOINT_INTERVAL = 250
+
+    __slots__ = (
+        "_checkpoint_interval",
+        "_closes",
+        "_encoded",
+        "_environment",
+        "_highs",
+        "_lows",
+        "_pushed",
+        "_records",
+        "_symbol",
+        "_timeframe",
+        "_timestamps",
+        "_volumes",
+    )
+
+    def __init__(
+        self,
+        request: CanonicalIndicatorProjectionRequest,
+        timeframe: str,
+        *,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        """Seed from the verified window ``request`` carries for ``timeframe``.
+
+        Derived ``4h`` windows are aggregated from 1,000 hourly bars and are
+        not supported; project them with ``NativeIndicatorProjector``.
+        """
+
+        if not isinstance(request, CanonicalIndicatorProjectionRequest):
+            raise TypeError("canonical_indicator_projection_request_required")
+        if request.indicator_engine_version != NATIVE_INDICATOR_ENGINE_VERSION:
+            raise IndicatorBridgeError("indicator_engine_version_unsupported")
+        if timeframe == "4h" or timeframe not in request.requested_timeframes:
+            raise IndicatorBridgeError("indicator_state_timeframe_unsupported")
+        if type(checkpoint_interval) is not int or checkpoint_interval < 1:
+            raise ValueError("indicator_state_checkpoint_interval_invalid")
+        self._symbol = request.symbol
+        self._timeframe = timeframe
+        self._environment = request.environment
+        self._checkpoint_interval = checkpoint_interval
+        self._pushed = 0
+        self._records: deque[dict[str, Any]] = deque(maxlen=_WINDOW)
+        self._encoded: deque[str] = deque(maxlen=_WINDOW)
+        self._closes: deque[float] = deque(maxlen=_WINDOW)
+        self._highs: deque[float] = deque(maxlen=_WINDOW)
+        self._lows: deque[float] = deque(maxlen=_WINDOW)
+        self._volumes: deque[float] = deque(maxlen=_WINDOW)
+        self._timestamps: deque[int] = deque(maxlen=_WINDOW)
+        for record in request.candles_by_timeframe[timeframe][-_WINDOW:]:
+            self._append(thaw_json(record))
+
+    @property
+    def kline_time(self) -> str:
+        return self._records[-1]["open_at"]
+
+    def push(self, record: CandleRecord) -> None:
+        """Slide the window onto the next closed, available candle."""
+
+        if not isinstance(record, CandleRecord):
+            raise TypeError("candle_record_required")
+        candle = VerifiedIndicatorWindowBuilder._canonical_record(record)
+        latest = self._records[-1]
+        if any(candle[field] != latest[field] for field in _IDENTITY_FIELDS):
+            raise IndicatorBridgeError("indicator_state_stream_mismatch")
+        if candle["open_at"] != latest["close_at"]:
+            raise IndicatorBridgeError("indicator_state_chronology_invalid")
+        self._append(candle)
+        self._pushed += 1
+        if self._pushed % self._checkpoint_interval == 0:
+            self._checkpoint()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the snapshot ``NativeIndicatorProjector`` projects for this window."""
+
+        return _native_snapshot(
+            _context_from_columns(
+                list(self._closes),
+                list(self._highs),
+                list(self._lows),
+                list(self._volumes),
+                list(self._timestamps),
+            ),
+            timeframe=self._timeframe,
+            symbol=self._symbol,
+            environment=self._environment,
+            kline_time=self.kline_time,
+            window_hash=self._window_hash(),
+        )
+
+    def _append(self, candle: dict[str, Any]) -> None:
+        self._records.append(candle)
+        self._encoded.append(_canonical_json(candle))
+        self._closes.append(float(candle["close"]))
+        self._highs.append(float(candle["high"]))
+        self._lows.append(float(candle["low"]))
+        self._volumes.append(float(candle["volume"]))
+        self._timestamps.append(_open_timestamp(candle))
+
+    def _window_hash(self) -> str:
+        # Canonical JSON of a list is its items' encodings joined by commas.
+        encoded = "[" + ",".join(self._encoded) + "]"
+        return "sha256:" + hashlib.sha256(encoded.encode()).hexdigest()
+
+    def _checkpoint(self) -> None:
+        candles = list(self._records)
+        recomputed = _native_snapshot(
+            calculate_indicator_context(candles),
+            timeframe=self._timeframe,
+            symbol=self._symbol,
+            environment=self._environment,
+            kline_time=candles[-1]["open_at"],
+            window_hash=_paper_hash(candles),
+        )
+        if _canonical_json(recomputed) != _canonical_json(self.snapshot()):
+            raise IndicatorBridgeError("indicator_state_checkpoint_mismatch")
+
+
+__all__ = ("IncrementalIndicatorState",)
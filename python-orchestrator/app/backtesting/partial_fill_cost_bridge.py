@@ -22,6 +22,7 @@ from app.backtesting.backtrader_contracts import (
     _encode_php_plan_value,
 )
 from app.backtesting.backtrader_execution import BacktestExecutionResult
+from app.backtesting.php_worker_pool import PhpWorkerError, PhpWorkerPool
 from app.backtesting.visible_queue_depletion import VisibleQueueDepletionResult
 
 
@@ -406,6 +407,7 @@ class PartialFillCostBridge:
         *,
         timeout_seconds: float = 15.0,
         max_output_bytes: int = _MAX_BYTES,
+        worker_pool: PhpWorkerPool | None = None,
     ) -> None:
         if (
             type(timeout_seconds) not in (int, float)
@@ -425,6 +427,7 @@ class PartialFillCostBridge:
         )
         self._timeout = float(timeout_seconds)
         self._max_output = max_output_bytes
+        self._worker_pool = worker_pool
 
     def settle(
         self,
@@ -452,6 +455,18 @@ class PartialFillCostBridge:
         return partial_fill_settlement_matches_request(result, request)
 
     def _run(self, payload: bytes) -> tuple[int, bytes]:
+        if self._worker_pool is not None:
+            try:
+                return self._worker_pool.request(
+                    self._argv,
+                    payload,
+                    timeout_seconds=self._timeout,
+                    max_output_bytes=self._max_output,
+                )
+            except PhpWorkerError as exc:
+                raise PartialFillCostBridgeError(
+                    f"partial_fill_cost_bridge_{exc.reason}"
+                ) from exc
         deadline = time.monotonic() + self._timeout
         try:
             process = subprocess.Popen(
@@ -0,0 +1,308 @@
+"""Supervised pool of long-lived PHP console workers for the backtesting bridges.
+
+A one-shot bridge call pays a Symfony kernel boot per request. A worker is the
+same console command started once with ``--worker``; it reads framed requests
+on stdin and answers each with one framed response on stdout:
+
+    request:  u32 big-endian length, then the canonical JSON payload
+    response: u32 big-endian length, u8 exit code, then the command output
+
+Every request keeps its own deadline and output bound. A timeout, an oversized
+or malformed frame, stderr beyond the bound, or an early EOF kills the worker's
+whole process group, and the next request starts a fresh one. Workers are also
+retired after ``max_requests`` answers so PHP-side state never accumulates.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import selectors
+import signal
+import struct
+import subprocess
+import threading
+import time
+from collections.abc import Mapping
+
+
+WORKER_OPTION = "--worker"
+_REQUEST_HEADER = struct.Struct(">I")
+_RESPONSE_HEADER = struct.Struct(">IB")
+_MAX_FRAME_BYTES = 0xFFFFFFFF
+_CHUNK_BYTES = 65_536
+
+_WorkerKey = tuple[tuple[str, ...], tuple[tuple[str, str], ...] | None]
+
+
+class PhpWorkerError(RuntimeError):
+    """Stable worker failure; bridges map ``reason`` onto their own codes.
+
+    ``reason`` is one of ``process_unavailable``, ``timeout``,
+    ``output_too_large`` or ``process_failed``.
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class _PhpWorker:
+    def __init__(
+        self,
+        argv: tuple[str, ...],
+        environment: Mapping[str, str] | None,
+    ) -> None:
+        try:
+            self._process = subprocess.Popen(
+                [*argv, WORKER_OPTION],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                shell=False,
+                env=None if environment is None else dict(environment),
+                start_new_session=True,
+                bufsize=0,
+            )
+        except (OSError, ValueError) as exc:
+            raise PhpWorkerError("process_unavailable") from exc
+        assert self._process.stdin is not None
+        assert self._process.stdout is not None
+        assert self._process.stderr is not None
+        self._stdin_fd = self._process.stdin.fileno()
+        self._stdout_fd = self._process.stdout.fileno()
+        os.set_blocking(self._stdin_fd, False)
+        os.set_blocking(self._stdout_fd, False)
+        self.served = 0
+        self._stderr_bytes = 0
+        self._drain = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._drain.start()
+
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def exchange(
+        self,
+        payload: bytes,
+        deadline: float,
+        max_output_bytes: int,
+    ) -> tuple[int, bytes]:
+        pending = memoryview(_REQUEST_HEADER.pack(len(payload)) + payload)
+        received = bytearray()
+        expected: int | None = None
+        self._stderr_bytes = 0
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._stdin_fd, selectors.EVENT_WRITE)
+            selector.register(self._stdout_fd, selectors.EVENT_READ)
+            while expected is None or len(received) < expected:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PhpWorkerError("timeout")
+                for key, _mask in selector.select(remaining):
+                    if key.fd == self._stdin_fd:
+                        try:
+                            written = os.write(self._stdin_fd, pending[:_CHUNK_BYTES])
+                        except BlockingIOError:
+                            continue
+                        except OSError as exc:
+                            raise PhpWorkerError("process_failed") from exc
+                        pending = pending[written:]
+                        if not pending:
+                            selector.unregister(self._stdin_fd)
+                        continue
+                    try:
+                        chunk = os.read(self._stdout_fd, _CHUNK_BYTES)
+                    except BlockingIOError:
+                        continue
+                    except OSError as exc:
+                        raise PhpWorkerError("process_failed") from exc
+                    if not chunk:
+                        raise PhpWorkerError("process_failed")
+                    received.extend(chunk)
+                    if expected is None and len(received) >= _RESPONSE_HEADER.size:
+                        expected, returncode = _RESPONSE_HEADER.unpack_from(received)
+                        if expected > max_output_bytes:
+                            raise PhpWorkerError("output_too_large")
+                        expected += _RESPONSE_HEADER.size
+                    if expected is not None and len(received) > expected:
+                        raise PhpWorkerError("process_failed")
+                if self._stderr_bytes > max_output_bytes:
+                    raise PhpWorkerError("output_too_large")
+        if pending:
+            raise PhpWorkerError("process_failed")
+        return returncode, bytes(received[_RESPONSE_HEADER.size :])
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        self._process.wait()
+        self._close_streams()
+
+    def retire(self) -> None:
+        """Close stdin so the worker loop ends; kill it if it lingers."""
+
+        try:
+            self._process.stdin.close()  # type: ignore[union-attr]
+        except OSError:
+            pass
+        try:
+            self._process.wait(1.0)
+        except subprocess.TimeoutExpired:
+            self.kill()
+            return
+        self._close_streams()
+
+    def _drain_stderr(self) -> None:
+        stream = self._process.stderr
+        try:
+            while chunk := stream.read(_CHUNK_BYTES):  # type: ignore[union-attr]
+                self._stderr_bytes += len(chunk)
+        except (OSError, ValueError):  # pragma: no cover - stream closed on kill
+            pass
+
+    def _close_streams(self) -> None:
+        for stream in (self._process.stdin, self._process.stdout, self._process.stderr):
+            try:
+                stream.close()  # type: ignore[union-attr]
+            except OSError:
+                pass
+        self._drain.join(1.0)
+
+
+class PhpWorkerPool:
+    """Reuse ``--worker`` processes per command argv across bridge requests.
+
+    One pool can serve every bridge; workers are keyed by argv and
+    environment, with at most ``max_workers`` per key. Thread safe.
+    """
+
+    DEFAULT_MAX_REQUESTS = 500
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 1,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+    ) -> None:
+        if (
+            type(max_workers) is not int
+            or max_workers < 1
+            or type(max_requests) is not int
+            or max_requests < 1
+        ):
+            raise ValueError("php_worker_pool_bounds_invalid")
+        self._max_workers = max_workers
+        self._max_requests = max_requests
+        self._condition = threading.Condition()
+        self._idle: dict[_WorkerKey, list[_PhpWorker]] = {}
+        self._live: dict[_WorkerKey, int] = {}
+        self._closed = False
+
+    def request(
+        self,
+        argv: tuple[str, ...],
+        payload: bytes,
+        *,
+        timeout_seconds: float,
+        max_output_bytes: int,
+        environment: Mapping[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """Send one payload and return the worker's exit code and output.
+
+        The deadline covers waiting for a free worker, starting one and the
+        exchange itself. Any failure discards the worker that served it.
+        """
+
+        if (
+            type(timeout_seconds) not in (int, float)
+            or not math.isfinite(timeout_seconds)
+            or timeout_seconds <= 0
+            or type(max_output_bytes) is not int
+            or max_output_bytes < 1
+        ):
+            raise ValueError("php_worker_pool_bounds_invalid")
+        if len(payload) > _MAX_FRAME_BYTES:
+            raise PhpWorkerError("process_failed")
+        deadline = time.monotonic() + timeout_seconds
+        key: _WorkerKey = (
+            tuple(argv),
+            None if environment is None else tuple(sorted(environment.items())),
+        )
+        worker = self._acquire(key, environment, deadline)
+        try:
+            result = worker.exchange(payload, deadline, max_output_bytes)
+        except BaseException:
+            worker.kill()
+            self._release(key, None)
+            raise
+        worker.served += 1
+        if worker.served >= self._max_requests:
+            worker.retire()
+            self._release(key, None)
+        else:
+            self._release(key, worker)
+        return result
+
+    def close(self) -> None:
+        """Retire idle workers now; busy ones are retired when they return."""
+
+        with self._condition:
+            self._closed = True
+            idle = [worker for workers in self._idle.values() for worker in workers]
+            self._idle.clear()
+            for key in self._live:
+                self._live[key] = 0
+            self._condition.notify_all()
+        for worker in idle:
+            worker.retire()
+
+    def __enter__(self) -> "PhpWorkerPool":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _acquire(
+        self,
+        key: _WorkerKey,
+        environment: Mapping[str, str] | None,
+        deadline: float,
+    ) -> _PhpWorker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise PhpWorkerError("process_unavailable")
+                idle = self._idle.setdefault(key, [])
+                while idle:
+                    worker = idle.pop()
+                    if worker.alive():
+                        return worker
+                    worker.kill()
+                    self._live[key] -= 1
+                if self._live.get(key, 0) < self._max_workers:
+                    self._live[key] = self._live.get(key, 0) + 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PhpWorkerError("timeout")
+                self._condition.wait(remaining)
+        try:
+            return _PhpWorker(key[0], environment)
+        except BaseException:
+            self._release(key, None)
+            raise
+
+    def _release(self, key: _WorkerKey, worker: _PhpWorker | None) -> None:
+        with self._condition:
+            if worker is not None and not self._closed:
+                self._idle.setdefault(key, []).append(worker)
+            elif not self._closed:
+                self._live[key] -= 1
+            self._condition.notify()
+        if worker is not None and self._closed:
+            worker.retire()
+
+
+__all__ = ["PhpWorkerError", "PhpWorkerPool"]
@@ -0,0 +1,234 @@
+"""Whole-stream timeframe resampling over columnar candle data.
+
+A higher timeframe bucket is derived only when every one of its lower
+timeframe components is present: the first component opens on the target grid
+and the last one closes exactly at the bucket end. OHLCV values stay scaled
+integers, so ``high``/``low``/``volume`` are exact integer ``max``/``min``/sum
+over column slices and render to the same canonical decimals a ``Decimal``
+computation would. ``available_at`` is the latest component availability, and
+each derived bar keeps the ordered ``source_record_id`` values it was built
+from as its lineage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import accumulate, compress, repeat
+from operator import mod, not_
+
+from app.backtesting.columnar import (
+    ColumnarCandleStream,
+    IntegerVector,
+    ScaledIntegerColumn,
+    _integer_vector,
+)
+from app.backtesting.dataset import CandleRecord, Timeframe, _record_sort_key, _stream_key
+
+
+_RESAMPLED_RECORD_ID_PREFIX = "resampled:"
+
+
+class ResamplingError(ValueError):
+    """Stable resampling rejection that never includes candle contents."""
+
+    def __init__(self, reason_code: str) -> None:
+        super().__init__(reason_code)
+        self.reason_code = reason_code
+
+
+def _resampled_record_id(timeframe: Timeframe, components: Sequence[str]) -> str:
+    payload = json.dumps(
+        {"component_source_record_ids": list(components), "timeframe": timeframe.value},
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+    return _RESAMPLED_RECORD_ID_PREFIX + hashlib.sha256(payload).hexdigest()
+
+
+def _complete_bucket_starts(
+    open_at: Sequence[int],
+    source_micros: int,
+    target_micros: int,
+) -> list[int]:
+    """Positions of grid-aligned rows followed by a full run of components."""
+
+    width = target_micros // source_micros
+    span = target_micros - source_micros
+    last = len(open_at) - width
+    aligned = compress(range(len(open_at)), map(not_, map(mod, open_at, repeat(target_micros))))
+    return [
+        index
+        for index in aligned
+        if index <= last and open_at[index + width - 1] - open_at[index] == span
+    ]
+
+
+def _bucket_extrema(
+    column: ScaledIntegerColumn,
+    starts: Sequence[int],
+    width: int,
+    reduce: Callable[[Sequence[int]], int],
+) -> ScaledIntegerColumn:
+    values = column.values
+    return ScaledIntegerColumn(
+        scale=column.scale,
+        values=_integer_vector([reduce(values[index : index + width]) for index in starts]),
+    )
+
+
+def _bucket_sums(
+    column: ScaledIntegerColumn,
+    starts: Sequence[int],
+    width: int,
+) -> ScaledIntegerColumn:
+    prefix = list(accumulate(column.values, initial=0))
+    return ScaledIntegerColumn(
+        scale=column.scale,
+        values=_integer_vector([prefix[index + width] - prefix[index] for index in starts]),
+    )
+
+
+def _bucket_edges(values: IntegerVector, starts: Sequence[int], offset: int) -> IntegerVector:
+    return _integer_vector([values[index + offset] for index in starts])
+
+
+def _pick(column: ScaledIntegerColumn, starts: Sequence[int], offset: int) -> ScaledIntegerColumn:
+    return ScaledIntegerColumn(
+        scale=column.scale,
+        values=_bucket_edges(column.values, starts, offset),
+    )
+
+
+@dataclass(frozen=True)
+class ResampledCandleStream:
+    """Derived higher-timeframe stream plus per-bar component lineage."""
+
+    stream: ColumnarCandleStream
+    component_source_record_ids: tuple[tuple[str, ...], ...]
+
+    def __post_init__(self) -> None:
+        if len(self.component_source_record_ids) != len(self.stream):
+            raise ResamplingError("resample_lineage_invalid")
+
+    def __len__(self) -> int:
+        return len(self.stream)
+
+    def records(self) -> Iterator[CandleRecord]:
+        return self.stream.records()
+
+
+class TimeframeResampler:
+    """Derive complete higher-timeframe candles from lower-timeframe streams."""
+
+    def resample(
+        self,
+        stream: ColumnarCandleStream,
+        timeframe: Timeframe | str,
+    ) -> ResampledCandleStream | None:
+        """Aggregate every complete ``timeframe`` bucket of ``stream``.
+
+        Incomplete or misaligned buckets are dropped rather than padded.
+        Returns ``None`` when no bucket is complete.
+        """
+
+        if not isinstance(stream, ColumnarCandleStream):
+            raise TypeError("TimeframeResampler accepts only ColumnarCandleStream")
+        try:
+            target = Timeframe(timeframe)
+        except ValueError as exc:
+            raise ResamplingError("resample_timeframe_invalid") from exc
+        source_seconds = stream.timeframe.duration_seconds
+        target_seconds = target.duration_seconds
+        if target_seconds <= source_seconds or target_seconds % source_seconds:
+            raise ResamplingError("resample_timeframe_invalid")
+        open_at = stream.open_at
+        if any(map(int.__ge__, open_at[:-1], open_at[1:])):
+            raise ResamplingError("resample_stream_unsorted")
+
+        width = target_seconds // source_seconds
+        starts = _complete_bucket_starts(
+            open_at,
+            source_seconds * 1_000_000,
+            target_seconds * 1_000_000,
+        )
+        if not starts:
+            return None
+        available_at = stream.available_at
+        lineage = tuple(
+            tuple(stream.source_record_ids[index : index + width]) for index in starts
+        )
+        derived = ColumnarCandleStream(
+            source_network=stream.source_network,
+            market_data_venue=stream.market_data_venue,
+            market_type=stream.market_type,
+            symbol=stream.symbol,
+            timeframe=target,
+            source_record_ids=tuple(
+                _resampled_record_id(target, components) for components in lineage
+            ),
+            open_at=_bucket_edges(open_at, starts, 0),
+            close_at=_bucket_edges(stream.close_at, starts, width - 1),
+            available_at=_integer_vector(
+                [max(available_at[index : index + width]) for index in starts]
+            ),
+            open=_pick(stream.open, starts, 0),
+            high=_bucket_extrema(stream.high, starts, width, max),
+            low=_bucket_extrema(stream.low, starts, width, min),
+            close=_pick(stream.close, starts, width - 1),
+            volume=_bucket_sums(stream.volume, starts, width),
+        )
+        return ResampledCandleStream(
+            stream=derived,
+            component_source_record_ids=lineage,
+        )
+
+    def derive(
+        self,
+        records: Iterable[CandleRecord],
+        timeframes: Iterable[Timeframe | str],
+        *,
+        include_source: bool = True,
+    ) -> tuple[CandleRecord, ...]:
+        """Return ``DatasetBuilder`` input with each instrument resampled to ``timeframes``.
+
+        Records are grouped per instrument in canonical order. Each target is
+        derived from that instrument's finest stream only, and targets the
+        input already carries natively are left as they are, so no bucket is
+        ever emitted twice.
+        """
+
+        source = tuple(records)
+        if any(not isinstance(item, CandleRecord) for item in source):
+            raise TypeError("TimeframeResampler accepts only CandleRecord values")
+        try:
+            requested = {Timeframe(item) for item in timeframes}
+        except ValueError as exc:
+            raise ResamplingError("resample_timeframe_invalid") from exc
+        targets = tuple(sorted(requested, key=lambda item: item.duration_seconds))
+        instruments: dict[tuple[str, str, str], dict[Timeframe, list[CandleRecord]]] = {}
+        for record in sorted(source, key=_record_sort_key):
+            instrument = instruments.setdefault(_stream_key(record)[:3], {})
+            instrument.setdefault(record.timeframe, []).append(record)
+
+        derived: list[CandleRecord] = list(source) if include_source else []
+        for key in sorted(instruments):
+            streams = instruments[key]
+            finest = min(streams, key=lambda item: item.duration_seconds)
+            pending = [
+                target
+                for target in targets
+                if target not in streams
+                and target.duration_seconds > finest.duration_seconds
+            ]
+            if not pending:
+                continue
+            stream = ColumnarCandleStream.from_records(streams[finest])
+            for target in pending:
+                resampled = self.resample(stream, target)
+                if resampled is not None:
+                    derived.extend(resampled.records())
+        return tuple(derived)
@@ -0,0 +1,204 @@
+"""Bounded memo of verified TradingCore rule results.
+
+A rule result is fully identified by its request's ``input_hash`` (which
+covers the effective config snapshot, the indicator snapshots and the
+evaluation instant) and by the version of the PHP rule engine that produced
+it. Sweeps that only vary execution parameters downstream of the rules
+therefore repeat byte-identical requests, and the memo answers them without
+a Symfony round trip.
+
+Results are kept in an in-memory LRU and, when a root is given, as canonical
+JSON under its private ``.rule-results`` directory with the same private-file
+and eviction discipline as ``IndicatorProjectionCache``. No hit is trusted:
+memory and disk hits alike are re-bound to the request exactly as
+``BacktestTradingCoreBridge`` binds a PHP answer, and disk entries are
+re-validated, result hash included. An entry that fails is dropped and
+reported as a miss.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.backtesting.indicator_cache import _PrivateEntryStore
+from app.backtesting.tradingcore_bridge import (
+    BacktestTradingCoreBridge,
+    CanonicalBacktestRuleRequest,
+    CanonicalBacktestRuleResult,
+    TradingCoreBridgeError,
+)
+from app.modern_trading_contracts import _canonical_json
+
+
+MEMO_DIRECTORY = ".rule-results"
+_ENGINE_VERSION_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_.]{0,63}$")
+
+
+@dataclass(frozen=True, slots=True)
+class RuleResultMemoStats:
+    hits: int
+    disk_hits: int
+    misses: int
+    stores: int
+    memory_evictions: int
+    disk_evictions: int
+
+
+class RuleResultMemo:
+    """Rule results keyed by ``(input_hash, rule engine version)``."""
+
+    DEFAULT_RULE_ENGINE_VERSION = "symfony_canonical_rules_v1"
+    DEFAULT_MAX_ENTRIES = 4096
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        rule_engine_version: str = DEFAULT_RULE_ENGINE_VERSION,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Memory-only without ``root``; bump ``rule_engine_version`` with PHP rule code."""
+
+        if (
+            type(rule_engine_version) is not str
+            or _ENGINE_VERSION_PATTERN.fullmatch(rule_engine_version) is None
+        ):
+            raise ValueError("rule_result_memo_engine_version_invalid")
+        if (
+            type(max_entries) is not int
+            or max_entries < 0
+            or type(max_bytes) is not int
+            or max_bytes < 0
+        ):
+            raise ValueError("rule_result_memo_bounds_invalid")
+        self._engine_version = rule_engine_version
+        self._max_entries = max_entries
+        self._store = (
+            None
+            if root is None
+            else _PrivateEntryStore(
+                root,
+                MEMO_DIRECTORY,
+                max_bytes=max_bytes,
+                unsafe_error=TradingCoreBridgeError,
+                unsafe_reason="rule_result_memo_unsafe",
+            )
+        )
+        self._entries: OrderedDict[str, CanonicalBacktestRuleResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._memory_evictions = 0
+        self._disk_evictions = 0
+
+    @property
+    def rule_engine_version(self) -> str:
+        return self._engine_version
+
+    @property
+    def directory(self) -> Path | None:
+        return None if self._store is None else self._store.directory
+
+    def get(self, request: CanonicalBacktestRuleRequest) -> CanonicalBacktestRuleResult | None:
+        """Return the verified result for ``request``, or ``None``."""
+
+        name = self._entry_name(request)
+        with self._lock:
+            result = self._entries.get(name)
+            if result is not None:
+                self._entries.move_to_end(name)
+        if result is not None:
+            try:
+                BacktestTradingCoreBridge._assert_request_binding(request, result)
+            except TradingCoreBridgeError:
+                with self._lock:
+                    self._entries.pop(name, None)
+                return self._count_miss()
+            with self._lock:
+                self._hits += 1
+            return result
+        if self._store is None:
+            return self._count_miss()
+        payload = self._store.read(name)
+        if payload is None:
+            return self._count_miss()
+        try:
+            result = CanonicalBacktestRuleResult.model_validate(
+                json.loads(
+                    payload.decode("utf-8"),
+                    object_pairs_hook=BacktestTradingCoreBridge._unique_object,
+                    parse_constant=lambda _value: (_ for _ in ()).throw(ValueError()),
+                )
+            )
+            BacktestTradingCoreBridge._assert_request_binding(request, result)
+        except (UnicodeDecodeError, ValueError, TradingCoreBridgeError):
+            self._store.discard(name)
+            return self._count_miss()
+        self._remember(name, result)
+        with self._lock:
+            self._hits += 1
+            self._disk_hits += 1
+        return result
+
+    def put(
+        self,
+        request: CanonicalBacktestRuleRequest,
+        result: CanonicalBacktestRuleResult,
+    ) -> None:
+        """Store a result already bound to ``request`` in memory and on disk."""
+
+        BacktestTradingCoreBridge._assert_request_binding(request, result)
+        name = self._entry_name(request)
+        self._remember(name, result)
+        evicted = 0
+        if self._store is not None:
+            payload = _canonical_json(result.model_dump(mode="json")).encode()
+            evicted = self._store.write(name, payload) or 0
+        with self._lock:
+            self._stores += 1
+            self._disk_evictions += evicted
+
+    def stats(self) -> RuleResultMemoStats:
+        with self._lock:
+            return RuleResultMemoStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                stores=self._stores,
+                memory_evictions=self._memory_evictions,
+                disk_evictions=self._disk_evictions,
+            )
+
+    def _entry_name(self, request: CanonicalBacktestRuleRequest) -> str:
+        if not isinstance(request, CanonicalBacktestRuleRequest):
+            raise TypeError("canonical_rule_request_required")
+        digest = request.input_hash().removeprefix("sha256:")
+        return f"{self._engine_version}-{digest}.json"
+
+    def _remember(self, name: str, result: CanonicalBacktestRuleResult) -> None:
+        with self._lock:
+            self._entries[name] = result
+            self._entries.move_to_end(name)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._memory_evictions += 1
+
+    def _count_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+        return None
+
+
+__all__ = (
+    "RuleResultMemo",
+    "RuleResultMemoStats",
+)
@@ -9,12 +9,14 @@ import re
 import subprocess
 import threading
 import time
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator, model_validator
 
+from app.backtesting.php_worker_pool import PhpWorkerError, PhpWorkerPool
 from app.modern_trading_contracts import (
     CanonicalEffectiveConfigSnapshot,
     FrozenJsonDict,
@@ -22,11 +24,24 @@ from app.modern_trading_contracts import (
     thaw_json,
 )
 
+if TYPE_CHECKING:
+    from app.backtesting.rule_memo import RuleResultMemo
+
 
 _SHA256_PATTERN = r"^sha256:[0-9a-f]{64}$"
 _UTC_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?Z$")
 _TIMEFRAMES = frozenset({"1m", "5m", "15m", "1h", "4h"})
 _MAX_BYTES = 8 * 1024 * 1024
+_MAX_BATCH_EVALUATIONS = 1000
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,95}$")
+_REJECTION_PATTERN = re.compile(r"^(?:canonical_[a-z0-9_:.\-]{1,160}|evaluation_failed)$")
+_BATCH_EVALUATION_FIELDS = (
+    "request_id",
+    "symbol",
+    "market_type",
+    "evaluated_at",
+    "indicators_by_timeframe",
+)
 
 
 def _canonical_hash(value: Mapping[str, Any] | BaseModel) -> str:
@@ -225,6 +240,15 @@ class TradingCoreBridgeError(RuntimeError):
     """Stable fail-closed bridge error; child diagnostics are never embedded."""
 
 
+@dataclass(frozen=True, slots=True)
+class CanonicalBacktestRuleOutcome:
+    """One batch slot: a bound result, or the stable reason it has none."""
+
+    request_id: str
+    result: CanonicalBacktestRuleResult | None
+    reason_code: str | None
+
+
 class BacktestTradingCoreBridge:
     DEFAULT_TIMEOUT_SECONDS = 15.0
 
@@ -234,7 +258,14 @@ class BacktestTradingCoreBridge:
         *,
         timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
         max_output_bytes: int = _MAX_BYTES,
+        worker_pool: PhpWorkerPool | None = None,
+        memo: RuleResultMemo | None = None,
     ) -> None:
+        """``worker_pool`` reuses ``--worker`` processes instead of one per call.
+
+        ``memo`` answers previously verified requests without running PHP.
+        """
+
         if argv is None:
             repository = Path(__file__).resolve().parents[3]
             argv = (
@@ -257,6 +288,8 @@ class BacktestTradingCoreBridge:
         self._argv = argv
         self._timeout = float(timeout_seconds)
         self._max_output = max_output_bytes
+        self._worker_pool = worker_pool
+        self._memo = memo
 
     @property
     def argv(self) -> tuple[str, ...]:
@@ -265,10 +298,14 @@ class BacktestTradingCoreBridge:
     def evaluate(self, request: CanonicalBacktestRuleRequest) -> CanonicalBacktestRuleResult:
         if not isinstance(request, CanonicalBacktestRuleRequest):
             raise TypeError("canonical_rule_request_required")
+        if self._memo is not None:
+            cached = self._memo.get(request)
+            if cached is not None:
+                return cached
         payload = _canonical_json(request.model_dump(mode="json")).encode()
         if len(payload) > _MAX_BYTES:
             raise TradingCoreBridgeError("tradingcore_bridge_input_too_large")
-        returncode, stdout, _stderr = self._run_bounded(payload)
+        returncode, stdout, _stderr = self._run_bounded(self._argv, payload)
         if returncode != 0:
             raise TradingCoreBridgeError("tradingcore_bridge_process_failed")
         result_payload = self._decode_result(stdout)
@@ -277,12 +314,145 @@ class BacktestTradingCoreBridge:
         except ValueError as exc:
             raise TradingCoreBridgeError("tradingcore_bridge_result_invalid") from exc
         self._assert_request_binding(request, result)
+        if self._memo is not None:
+            self._memo.put(request, result)
         return result
 
-    def _run_bounded(self, payload: bytes) -> tuple[int, bytes, bytes]:
+    def evaluate_batch(
+        self,
+        requests: Sequence[CanonicalBacktestRuleRequest],
+        *,
+        request_id: str,
+    ) -> tuple[CanonicalBacktestRuleOutcome, ...]:
+        """Evaluate requests sharing one config snapshot in one ``--batch`` round trip.
+
+        Outcomes follow request order. Each result is bound to its request as
+        ``evaluate`` binds it; a request the rule engine rejects, or whose
+        result fails validation or binding, gets a ``reason_code`` in its own
+        slot. Only a failure of the batch envelope itself raises. With a memo,
+        only requests it cannot answer travel, and none when all of them hit.
+        """
+
+        if (
+            not isinstance(requests, Sequence)
+            or not 1 <= len(requests) <= _MAX_BATCH_EVALUATIONS
+        ):
+            raise ValueError("tradingcore_bridge_batch_requests_invalid")
+        if any(not isinstance(request, CanonicalBacktestRuleRequest) for request in requests):
+            raise TypeError("canonical_rule_request_required")
+        if type(request_id) is not str or _REQUEST_ID_PATTERN.fullmatch(request_id) is None:
+            raise ValueError("tradingcore_bridge_batch_request_id_invalid")
+        snapshot = requests[0].effective_config_snapshot
+        if any(request.effective_config_snapshot != snapshot for request in requests):
+            raise TradingCoreBridgeError("tradingcore_bridge_batch_config_mismatch")
+        if self._memo is None:
+            return self._evaluate_batch(requests, request_id)
+        outcomes: list[CanonicalBacktestRuleOutcome | None] = []
+        for request in requests:
+            cached = self._memo.get(request)
+            outcomes.append(
+                None
+                if cached is None
+                else CanonicalBacktestRuleOutcome(request.request_id, cached, None)
+            )
+        missing = [request for request, outcome in zip(requests, outcomes) if outcome is None]
+        evaluated = iter(self._evaluate_batch(missing, request_id) if missing else ())
+        for position, (request, outcome) in enumerate(zip(requests, outcomes)):
+            if outcome is not None:
+                continue
+            outcome = next(evaluated)
+            if outcome.result is not None:
+                self._memo.put(request, outcome.result)
+            outcomes[position] = outcome
+        return tuple(outcome for outcome in outcomes if outcome is not None)
+
+    def _evaluate_batch(
+        self, requests: Sequence[CanonicalBacktestRuleRequest], request_id: str
+    ) -> tuple[CanonicalBacktestRuleOutcome, ...]:
+        dumped = [request.model_dump(mode="json") for request in requests]
+        batch = {
+            "schema_version": "canonical-backtest-rule-batch-request.v1",
+            "request_id": request_id,
+            "effective_config_snapshot": dumped[0]["effective_config_snapshot"],
+            "evaluations": [
+                {field: item[field] for field in _BATCH_EVALUATION_FIELDS} for item in dumped
+            ],
+        }
+        payload = _canonical_json(batch).encode()
+        if len(payload) > _MAX_BYTES:
+            raise TradingCoreBridgeError("tradingcore_bridge_input_too_large")
+        returncode, stdout, _stderr = self._run_bounded((*self._argv, "--batch"), payload)
+        if returncode != 0:
+            raise TradingCoreBridgeError("tradingcore_bridge_process_failed")
+        envelope = self._decode_result(stdout)
+        outcomes = envelope.get("outcomes")
+        if (
+            set(envelope)
+            != {"schema_version", "request_id", "outcomes", "input_hash", "result_hash"}
+            or envelope["schema_version"] != "canonical-backtest-rule-batch-result.v1"
+            or not isinstance(outcomes, list)
+        ):
+            raise TradingCoreBridgeError("tradingcore_bridge_result_invalid")
+        unhashed = {key: value for key, value in envelope.items() if key != "result_hash"}
+        try:
+            recomputed = _canonical_hash(unhashed)
+        except ValueError as exc:
+            raise TradingCoreBridgeError("tradingcore_bridge_result_invalid") from exc
+        if envelope["result_hash"] != recomputed:
+            raise TradingCoreBridgeError("tradingcore_bridge_result_invalid")
+        if (
+            envelope["request_id"] != request_id
+            or envelope["input_hash"] != _canonical_hash(batch)
+            or len(outcomes) != len(requests)
+        ):
+            raise TradingCoreBridgeError("tradingcore_bridge_result_identity_mismatch")
+        return tuple(
+            self._batch_outcome(request, outcome)
+            for request, outcome in zip(requests, outcomes)
+        )
+
+    def _batch_outcome(
+        self, request: CanonicalBacktestRuleRequest, outcome: Any
+    ) -> CanonicalBacktestRuleOutcome:
+        def rejected(reason_code: str) -> CanonicalBacktestRuleOutcome:
+            return CanonicalBacktestRuleOutcome(request.request_id, None, reason_code)
+
+        if not isinstance(outcome, Mapping):
+            return rejected("tradingcore_bridge_result_invalid")
+        if set(outcome) == {"status", "reason_code"} and outcome["status"] == "rejected":
+            reason_code = outcome["reason_code"]
+            if type(reason_code) is not str or _REJECTION_PATTERN.fullmatch(reason_code) is None:
+                return rejected("tradingcore_bridge_result_invalid")
+            return rejected(reason_code)
+        if set(outcome) != {"status", "result"} or outcome["status"] != "evaluated":
+            return rejected("tradingcore_bridge_result_invalid")
+        try:
+            result = CanonicalBacktestRuleResult.model_validate(outcome["result"])
+        except ValueError:
+            return rejected("tradingcore_bridge_result_invalid")
+        try:
+            self._assert_request_binding(request, result)
+        except TradingCoreBridgeError as exc:
+            return rejected(str(exc))
+        return CanonicalBacktestRuleOutcome(request.request_id, result, None)
+
+    def _run_bounded(
+        self, argv: tuple[str, ...], payload: bytes
+    ) -> tuple[int, bytes, bytes]:
+        if self._worker_pool is not None:
+            try:
+                returncode, stdout = self._worker_pool.request(
+                    argv,
+                    payload,
+                    timeout_seconds=self._timeout,
+                    max_output_bytes=self._max_output,
+                )
+            except PhpWorkerError as exc:
+                raise TradingCoreBridgeError(f"tradingcore_bridge_{exc.reason}") from exc
+            return returncode, stdout, b""
         try:
             process = subprocess.Popen(
-                list(self._argv),
+                list(argv),
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -416,6 +586,7 @@ class BacktestTradingCoreBridge:
 
 __all__ = [
     "BacktestTradingCoreBridge",
+    "CanonicalBacktestRuleOutcome",
     "CanonicalBacktestRuleRequest",
     "CanonicalBacktestRuleResult",
     "CanonicalIndicatorSnapshot",
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.backtesting.backtrader_feed import VerifiedBacktraderFeedAdapter
+from app.backtesting.backtrader_runtime import (
+    BACKTRADER_DELIVERY_ENGINE,
+    NATIVE_DELIVERY_ENGINE,
+    CanonicalBacktraderRuntime,
+    _backtrader_delivery,
+    _native_delivery,
+)
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetBuilder,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
+from tests.funding_support import trusted_bridge_for
+from tests.test_backtesting_backtrader_runtime import (
+    _feed,
+    _funding_schedule,
+    _partial_cost_bridge,
+    _plan,
+    _queue_evidence,
+    _v2_plan,
+)
+
+
+UTC = timezone.utc
+_ENGINE_BOUND = ("engine_version", "input_hash", "result_hash")
+
+
+def _v1(feed, _tmp_path):
+    plan = _plan().model_copy(
+        update={"dataset_id": feed.dataset_id, "dataset_checksum": feed.dataset_checksum}
+    )
+    return plan, {}
+
+
+def _v1_historical_funding(feed, _tmp_path):
+    plan, _ = _v1(feed, _tmp_path)
+    return plan, {
+        "funding_schedule": _funding_schedule(feed),
+        "funding_bridge": trusted_bridge_for(applied_ids=("runtime-funding-2",)),
+    }
+
+
+def _v2(status: str):
+    def arguments(feed, _tmp_path):
+        plan = _v2_plan(feed)
+        return plan, {"maker_fill_evidence": _queue_evidence(plan, status=status)}
+
+    return arguments
+
+
+def _v3(**evidence_options):
+    def arguments(feed, tmp_path):
+        plan = _v2_plan(feed)
+        return plan, {
+            "maker_fill_evidence": _queue_evidence(plan, **evidence_options),
+            "partial_fill_cost_bridge": _partial_cost_bridge(tmp_path),
+        }
+
+    return arguments
+
+
+@pytest.mark.parametrize(
+    ("feed_options", "scenario"),
+    [
+        ({}, _v1),
+        ({"same_candle": True}, _v1),
+        ({"unfilled": True}, _v1),
+        ({"fill_bar_stop": True}, _v1),
+        ({}, _v1_historical_funding),
+        ({"fill_bar_target": True}, _v2("filled")),
+        ({"fill_bar_stop": True}, _v2("filled")),
+        ({"unfilled": True}, _v2("unfilled")),
+        ({}, _v3(status="partially_filled")),
+        ({}, _v3(staged=True)),
+    ],
+)
+def test_native_delivery_matches_cerebro_outside_the_engine_version(
+    feed_options: dict, scenario, tmp_path: Path
+) -> None:
+    feed = _feed(**feed_options)
+    plan, arguments = scenario(feed, tmp_path)
+
+    cerebro = json.loads(CanonicalBacktraderRuntime().run(plan, feed, **arguments))
+    native_text = CanonicalBacktraderRuntime(delivery_engine=NATIVE_DELIVERY_ENGINE).run(
+        plan, feed, **arguments
+    )
+    native = json.loads(native_text)
+
+    assert native["engine_version"] == cerebro["engine_version"].replace(
+        BACKTRADER_DELIVERY_ENGINE, NATIVE_DELIVERY_ENGINE
+    )
+    assert native["engine_version"].startswith(NATIVE_DELIVERY_ENGINE + "+canonical-runtime.v")
+    assert native["input_hash"] != cerebro["input_hash"]
+    assert {key: value for key, value in native.items() if key not in _ENGINE_BOUND} == {
+        key: value for key, value in cerebro.items() if key not in _ENGINE_BOUND
+    }
+    assert native_text == CanonicalBacktraderRuntime(
+        delivery_engine=NATIVE_DELIVERY_ENGINE
+    ).run(plan, feed, **arguments)
+
+
+def test_native_delivery_returns_the_cerebro_sequence_for_a_long_feed() -> None:
+    opened = datetime(2026, 8, 10, tzinfo=UTC)
+    records = []
+    for index in range(600):
+        open_at = opened + timedelta(minutes=index)
+        price = Decimal(100) + Decimal(index % 17) / 10
+        records.append(
+            CandleRecord(
+                source_record_id=f"delivery-bar-{index}",
+                source_network="mainnet",
+                market_data_venue="okx",
+                market_type=MarketType.PERPETUAL,
+                symbol="BTCUSDT",
+                timeframe=Timeframe.ONE_MINUTE,
+                open_at=open_at,
+                close_at=open_at + timedelta(minutes=1),
+                available_at=open_at + timedelta(minutes=1, seconds=index % 5),
+                open=str(price),
+                high=str(price + 1),
+                low=str(price - 1),
+                close=str(price),
+                volume=str(index + 1),
+                complete=True,
+            )
+        )
+    source = DatasetSourceIdentity(
+        source="paper-okx",
+        source_schema_version="paper.v2",
+        source_build_version="fixture.v1",
+        source_checksum="sha256:" + "d" * 64,
+        source_network="mainnet",
+        market_data_venue="okx",
+        market_type=MarketType.PERPETUAL,
+    )
+    feed = VerifiedBacktraderFeedAdapter(
+        DatasetSerializer.serialize(DatasetBuilder(source).build(records)),
+        symbol="BTCUSDT",
+        timeframe="1m",
+        period_start=opened,
+        period_end=opened + timedelta(minutes=601),
+    )
+
+    assert _native_delivery(feed) == _backtrader_delivery(feed)
+    assert len(_native_delivery(feed)) == 600
+
+
+def test_native_delivery_rejects_values_cerebro_cannot_carry() -> None:
+    (bar, *_rest) = _feed().bars
+    overflow = SimpleNamespace(bars=(replace(bar, high=Decimal("1e400")),))
+
+    for deliver in (_native_delivery, _backtrader_delivery):
+        with pytest.raises(ValueError, match="backtrader_runtime_number_out_of_range$"):
+            deliver(overflow)
+
+
+def test_runtime_rejects_unknown_delivery_engines() -> None:
+    assert CanonicalBacktraderRuntime().delivery_engine == BACKTRADER_DELIVERY_ENGINE
+    for engine in ("native", "backtrader-1.9.78.124", None):
+        with pytest.raises(ValueError, match="delivery_engine_unsupported$"):
+            CanonicalBacktraderRuntime(delivery_engine=engine)  # type: ignore[arg-type]
@@ -780,3 +780,68 @@ def test_net_outcome_enforces_visible_fill_version_boundary_directly() -> None:
             feed,
             maker_fill_evidence=_queue_evidence(v2, staged=True),
         )
+
+
+def test_run_many_matches_individual_runs_with_one_delivery(monkeypatch) -> None:
+    import app.backtesting.backtrader_runtime as runtime_module
+
+    feed = _feed()
+    v1 = _plan().model_copy(update={"dataset_id": feed.dataset_id, "dataset_checksum": feed.dataset_checksum})
+    v2 = _v2_plan(feed)
+    evidence = _queue_evidence(v2)
+    plans = (v1, v2, v1, v2)
+    evidences = (None, evidence, None, _queue_evidence(v2, status="unfilled"))
+    expected = tuple(
+        CanonicalBacktraderRuntime().run(plan, feed, maker_fill_evidence=item)
+        for plan, item in zip(plans, evidences)
+    )
+    deliveries = []
+    delivery = runtime_module._backtrader_delivery
+    monkeypatch.setattr(
+        runtime_module,
+        "_backtrader_delivery",
+        lambda feed: deliveries.append(feed) or delivery(feed),
+    )
+
+    results = CanonicalBacktraderRuntime().run_many(plans, feed, maker_fill_evidence=evidences)
+
+    assert results == expected
+    assert len(deliveries) == 1
+    assert CanonicalBacktraderRuntime().run_many((), feed) == ()
+
+
+def test_run_many_shares_historical_funding_and_native_delivery() -> None:
+    feed = _feed()
+    plan = _plan().model_copy(update={"dataset_id": feed.dataset_id, "dataset_checksum": feed.dataset_checksum})
+    schedule = _funding_schedule(feed)
+    bridge = trusted_bridge_for(applied_ids=("runtime-funding-2",))
+    runtime = CanonicalBacktraderRuntime(delivery_engine="native-sequential.v1")
+
+    results = runtime.run_many(
+        (plan, plan, plan), feed, funding_schedule=schedule, funding_bridge=bridge
+    )
+
+    assert results == (
+        runtime.run(plan, feed, funding_schedule=schedule, funding_bridge=bridge),
+    ) * 3
+    assert json.loads(results[0])["funding_schedule_checksum"] == schedule.schedule_checksum
+
+
+def test_run_many_validates_every_plan_before_delivering(monkeypatch) -> None:
+    import app.backtesting.backtrader_runtime as runtime_module
+
+    feed = _feed()
+    plan = _plan().model_copy(update={"dataset_id": feed.dataset_id, "dataset_checksum": feed.dataset_checksum})
+    foreign = _plan()
+    monkeypatch.setattr(
+        runtime_module,
+        "_backtrader_delivery",
+        lambda feed: pytest.fail("delivered before validation"),
+    )
+
+    with pytest.raises(ValueError, match="backtrader_runtime_identity_mismatch"):
+        CanonicalBacktraderRuntime().run_many((plan, foreign), feed)
+    with pytest.raises(ValueError, match="backtrader_runtime_visible_fill_evidence_invalid"):
+        CanonicalBacktraderRuntime().run_many((plan, plan), feed, maker_fill_evidence=(None,))
+    with pytest.raises(ValueError, match="backtrader_runtime_plans_invalid"):
+        CanonicalBacktraderRuntime().run_many(iter((plan,)), feed)  # type: ignore[arg-type]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.backtrader_feed import VerifiedBacktraderFeedAdapter
+from app.backtesting.backtrader_runtime import (
+    NATIVE_DELIVERY_ENGINE,
+    CanonicalBacktraderRuntime,
+)
+from app.backtesting.backtrader_sweep import BacktraderPlanSweep, BacktraderPlanSweepSummary
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import DatasetBuilder, DatasetSerializer, DatasetSourceIdentity
+from app.backtesting.dataset_store import DatasetPublisher
+from tests.test_backtesting_backtrader_runtime import _plan, _record
+
+
+UTC = timezone.utc
+_SCOPE = {
+    "symbol": "BTCUSDT",
+    "timeframe": "1m",
+    "period_start": datetime(2026, 8, 10, 12, 0, tzinfo=UTC),
+    "period_end": datetime(2026, 8, 10, 12, 2, tzinfo=UTC),
+}
+
+
+def _published(root: Path, **options) -> tuple[DatasetPublisher, VerifiedBacktraderFeedAdapter]:
+    source = DatasetSourceIdentity(
+        source="paper-okx", source_schema_version="paper.v2",
+        source_build_version="fixture.v1", source_checksum="sha256:" + "d" * 64,
+        source_network="mainnet", market_data_venue="okx",
+        market_type=MarketType.PERPETUAL,
+    )
+    artifacts = DatasetSerializer.serialize(
+        DatasetBuilder(source).build((_record(0, "101", "99"), _record(1, "103", "99")))
+    )
+    publisher = DatasetPublisher(root, **options)
+    publisher.publish(artifacts)
+    return publisher, VerifiedBacktraderFeedAdapter(artifacts, **_SCOPE)
+
+
+def _plans(feed: VerifiedBacktraderFeedAdapter, count: int) -> list:
+    plan = _plan().model_copy(
+        update={"dataset_id": feed.dataset_id, "dataset_checksum": feed.dataset_checksum}
+    )
+    return [plan] * count
+
+
+@pytest.mark.parametrize("options", [{}, {"stream_index": True, "compression": "gzip"}])
+def test_sweep_streams_run_many_lines_in_plan_order_for_any_worker_count(
+    options: dict, tmp_path: Path
+) -> None:
+    publisher, feed = _published(tmp_path / "store", **options)
+    assert publisher.root == tmp_path / "store"
+    assert publisher.stream_index is options.get("stream_index", False)
+    assert publisher.compression == options.get("compression")
+    assert publisher.deduplicate is False
+    plans = _plans(feed, 9)
+    expected = "".join(CanonicalBacktraderRuntime().run_many(plans, feed)).encode()
+
+    outputs = []
+    for workers in (1, 2):
+        output = io.BytesIO()
+        summary = BacktraderPlanSweep(
+            publisher, feed.dataset_id, workers=workers, **_SCOPE
+        ).run(plans, output)
+        outputs.append(output.getvalue())
+
+    assert outputs == [expected, expected]
+    (line, *_rest) = expected.decode().splitlines()
+    net = Decimal(str(json.loads(line)["net_outcome"]["net_pnl_quote"]))
+    assert summary == BacktraderPlanSweepSummary(
+        plan_count=9,
+        status_counts=(("closed", 9),),
+        reason_counts=(("target_filled", 9),),
+        net_pnl_quote_total=str(net * 9),
+        results_hash="sha256:" + hashlib.sha256(expected).hexdigest(),
+    )
+
+
+def test_sweep_uses_the_requested_delivery_engine_and_accepts_no_plans(
+    tmp_path: Path,
+) -> None:
+    publisher, feed = _published(tmp_path)
+    sweep = BacktraderPlanSweep(
+        publisher, feed.dataset_id, delivery_engine=NATIVE_DELIVERY_ENGINE, **_SCOPE
+    )
+    output = io.BytesIO()
+    sweep.run(_plans(feed, 2), output)
+
+    assert output.getvalue().decode() == "".join(
+        CanonicalBacktraderRuntime(delivery_engine=NATIVE_DELIVERY_ENGINE).run_many(
+            _plans(feed, 2), feed
+        )
+    )
+    empty = io.BytesIO()
+    assert sweep.run([], empty) == BacktraderPlanSweepSummary(
+        plan_count=0,
+        status_counts=(),
+        reason_counts=(),
+        net_pnl_quote_total="0",
+        results_hash="sha256:" + hashlib.sha256(b"").hexdigest(),
+    )
+    assert empty.getvalue() == b""
+
+
+def test_sweep_rejects_invalid_configuration_before_running(tmp_path: Path) -> None:
+    publisher, feed = _published(tmp_path)
+    for workers in (0, True, 1.5):
+        with pytest.raises(ValueError, match="backtrader_sweep_workers_invalid$"):
+            BacktraderPlanSweep(publisher, feed.dataset_id, workers=workers, **_SCOPE)
+    with pytest.raises(ValueError, match="delivery_engine_unsupported$"):
+        BacktraderPlanSweep(publisher, feed.dataset_id, delivery_engine="native", **_SCOPE)
+    with pytest.raises(TypeError):
+        BacktraderPlanSweep(tmp_path, feed.dataset_id, **_SCOPE)  # type: ignore[arg-type]
+
+    sweep = BacktraderPlanSweep(publisher, feed.dataset_id, **_SCOPE)
+    with pytest.raises(ValueError, match="backtrader_runtime_plans_invalid$"):
+        sweep.run(iter(_plans(feed, 1)), io.BytesIO())  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="visible_fill_evidence_invalid$"):
+        sweep.run(_plans(feed, 2), io.BytesIO(), maker_fill_evidence=(None,))
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+from array import array
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.backtrader_feed import BacktraderFeedError, VerifiedBacktraderFeedAdapter
+from app.backtesting.columnar import (
+    ColumnarCandleError,
+    ColumnarCandleStore,
+    ColumnarCandleStream,
+    ScaledIntegerColumn,
+)
+from app.backtesting.contracts import DatasetDescriptor, MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetBuilder,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
+
+
+UTC = timezone.utc
+_FIXTURES = Path(__file__).parent / "fixtures" / "backtesting"
+
+
+def _fixture_artifacts() -> DatasetArtifacts:
+    manifest_json = (_FIXTURES / "manifest-v1.json").read_bytes()
+    return DatasetArtifacts(
+        candles_ndjson=(_FIXTURES / "candles-v1.ndjson").read_bytes(),
+        quality_report_json=(_FIXTURES / "quality-report-v1.json").read_bytes(),
+        manifest_json=manifest_json,
+        descriptor=DatasetDescriptor.from_manifest(json.loads(manifest_json)),
+    )
+
+
+def _candle(index: int, *, symbol: str = "BTCUSDT", **overrides: object) -> CandleRecord:
+    opened = datetime(2026, 1, 1, tzinfo=UTC) + index * timedelta(minutes=5)
+    payload: dict[str, object] = {
+        "source_record_id": f"{symbol}-{index}",
+        "source_network": "mainnet",
+        "market_data_venue": "okx",
+        "market_type": MarketType.PERPETUAL,
+        "symbol": symbol,
+        "timeframe": Timeframe.FIVE_MINUTES,
+        "open_at": opened,
+        "close_at": opened + timedelta(minutes=5),
+        "available_at": opened + timedelta(minutes=5, microseconds=index),
+        "open": "100",
+        "high": "102.125",
+        "low": "0.0001",
+        "close": "101.5",
+        "volume": "0",
+    }
+    payload.update(overrides)
+    return CandleRecord(**payload)
+
+
+def _artifacts(records) -> DatasetArtifacts:
+    source = DatasetSourceIdentity(
+        source="paper-okx",
+        source_schema_version="paper.v2",
+        source_build_version="fixture.v1",
+        source_checksum="sha256:" + "d" * 64,
+        source_network="mainnet",
+        market_data_venue="okx",
+        market_type=MarketType.PERPETUAL,
+    )
+    return DatasetSerializer.serialize(DatasetBuilder(source).build(records))
+
+
+def test_fixture_round_trips_byte_for_byte_with_manifest_checksum() -> None:
+    artifacts = _fixture_artifacts()
+
+    store = ColumnarCandleStore.from_artifacts(artifacts)
+
+    assert store.to_ndjson() == artifacts.candles_ndjson
+    assert store.candles_checksum == artifacts.descriptor.candles_checksum
+    assert [(item.symbol, item.timeframe.value, len(item)) for item in store.streams] == [
+        ("BTCUSDT", "1m", 2),
+        ("ETHUSDT", "5m", 1),
+    ]
+    assert len(store) == artifacts.descriptor.record_count
+
+
+def test_stream_columns_are_int64_micros_and_exact_scaled_integers() -> None:
+    stream = ColumnarCandleStore.from_ndjson(_fixture_artifacts().candles_ndjson).streams[0]
+
+    assert isinstance(stream.open_at, array) and stream.open_at.typecode == "q"
+    assert stream.open_at[0] == int(datetime(2026, 1, 1, tzinfo=UTC).timestamp()) * 1_000_000
+    assert stream.close_at[0] - stream.open_at[0] == 60_000_000
+    assert stream.high == ScaledIntegerColumn(scale=1, values=array("q", [1025, 1030]))
+    assert stream.low.scale == 2
+    assert [stream.volume.decimal_string(index) for index in range(2)] == ["0", "2.5"]
+    assert stream.datetime_at("open_at", 1) == datetime(2026, 1, 1, 0, 1, tzinfo=UTC)
+
+
+def test_records_decode_on_demand_to_the_verified_models() -> None:
+    records = tuple(_candle(index) for index in range(4)) + (_candle(0, symbol="ETHUSDT"),)
+    artifacts = _artifacts(records)
+    built = DatasetBuilder(
+        DatasetSourceIdentity.model_validate_json(
+            json.dumps(json.loads(artifacts.manifest_json)["source"])
+        )
+    ).build(records)
+
+    store = ColumnarCandleStore.from_build_result(built)
+
+    assert store.to_ndjson() == artifacts.candles_ndjson
+    assert store.candles_checksum == artifacts.descriptor.candles_checksum
+    stream = store.find(symbol="BTCUSDT", timeframe="5m")
+    assert stream is not None
+    assert tuple(stream.records()) == built.records[:4]
+    assert tuple(stream.records(2)) == built.records[2:4]
+    assert store.find(symbol="BTCUSDT", timeframe="1m") is None
+
+
+def test_out_of_int64_range_mantissas_keep_exact_integers() -> None:
+    column = ScaledIntegerColumn.from_decimal_strings(("1", "12345678901234567890.5"))
+
+    assert isinstance(column.values, tuple)
+    assert column.decimal_string(0) == "1"
+    assert column.decimal_string(1) == "12345678901234567890.5"
+
+
+@pytest.mark.parametrize(
+    "candles",
+    (
+        b"",
+        b"{}\n",
+        b"not-json\n",
+        b"\n",
+    ),
+)
+def test_ndjson_decoder_rejects_malformed_input(candles: bytes) -> None:
+    with pytest.raises(ColumnarCandleError):
+        ColumnarCandleStore.from_ndjson(candles)
+
+
+def test_ndjson_decoder_rejects_noncanonical_bytes_and_stream_order() -> None:
+    candles = _fixture_artifacts().candles_ndjson
+    lines = candles.rstrip(b"\n").split(b"\n")
+
+    with pytest.raises(ColumnarCandleError, match="round_trip"):
+        ColumnarCandleStore.from_ndjson(candles.replace(b'"close":"101"', b'"close":"101.0"'))
+    with pytest.raises(ColumnarCandleError, match="order"):
+        ColumnarCandleStore.from_ndjson(b"\n".join((lines[2], lines[0], lines[1])) + b"\n")
+    with pytest.raises(ColumnarCandleError, match="order"):
+        ColumnarCandleStore.from_ndjson(b"\n".join((lines[0], lines[2], lines[1])) + b"\n")
+
+
+def test_stream_rejects_mixed_identity_and_ragged_columns() -> None:
+    with pytest.raises(ColumnarCandleError, match="identity"):
+        ColumnarCandleStream.from_records((_candle(0), _candle(1, symbol="ETHUSDT")))
+    stream = ColumnarCandleStream.from_records((_candle(0), _candle(1)))
+    with pytest.raises(ColumnarCandleError, match="shape"):
+        ColumnarCandleStream(
+            **{**stream.__dict__, "open_at": array("q", [stream.open_at[0]])}
+        )
+
+
+def _with_line(index: int, **updates: object) -> bytes:
+    lines = _fixture_artifacts().candles_ndjson.rstrip(b"\n").split(b"\n")
+    payload = {**json.loads(lines[index]), **updates}
+    lines[index] = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return b"\n".join(lines) + b"\n"
+
+
+@pytest.mark.parametrize(
+    ("candles", "reason"),
+    (
+        (_with_line(0, open_at=1), "columnar_candle_time_invalid"),
+        (_with_line(0, open_at="2026-01-01T00:00:00"), "columnar_candle_time_invalid"),
+        (_with_line(0, close_at="2026-13-01T00:00:00Z"), "columnar_candle_time_invalid"),
+        (_with_line(0, open=100), "columnar_candle_decimal_invalid"),
+        (_with_line(0, low="-1"), "columnar_candle_decimal_invalid"),
+        (_with_line(0, volume="1.2.3"), "columnar_candle_decimal_invalid"),
+        (_with_line(0, source_record_id=7), "columnar_candle_identity_invalid"),
+        (_with_line(0, market_type="options"), "columnar_candle_stream_identity_invalid"),
+        (_with_line(0, timeframe="7m"), "columnar_candle_stream_identity_invalid"),
+        (_with_line(0, symbol=""), "columnar_candle_stream_identity_invalid"),
+        (_with_line(1, source_network="testnet"), "columnar_candle_stream_identity_invalid"),
+    ),
+)
+def test_ndjson_decoder_rejects_invalid_fields(candles: bytes, reason: str) -> None:
+    with pytest.raises(ColumnarCandleError, match=f"^{reason}$"):
+        ColumnarCandleStore.from_ndjson(candles)
+
+
+def test_record_builders_reject_empty_foreign_and_unordered_input() -> None:
+    btc, eth = _candle(0), _candle(0, symbol="ETHUSDT")
+    for records in ((), ("not-a-record",)):
+        with pytest.raises(ColumnarCandleError, match="shape"):
+            ColumnarCandleStore.from_records(records)  # type: ignore[arg-type]
+        with pytest.raises(ColumnarCandleError, match="shape"):
+            ColumnarCandleStream.from_records(records)  # type: ignore[arg-type]
+    for records in ((eth, btc), (btc, eth, _candle(1))):
+        with pytest.raises(ColumnarCandleError, match="order"):
+            ColumnarCandleStore.from_records(records)
+    with pytest.raises(ColumnarCandleError, match="decimal"):
+        ScaledIntegerColumn.from_decimal_strings((1,))  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        ColumnarCandleStore.from_build_result(records)  # type: ignore[arg-type]
+
+    stream = ColumnarCandleStream.from_records((btc,))
+    assert stream.stream_key == ("okx", "perpetual", "BTCUSDT", 300)
+    with pytest.raises(KeyError):
+        stream.datetime_at("close", 0)
+
+
+def test_feed_adapter_uses_bound_columnar_store() -> None:
+    records = tuple(_candle(index) for index in range(3)) + (_candle(0, symbol="ETHUSDT"),)
+    artifacts = _artifacts(records)
+    store = ColumnarCandleStore.from_ndjson(artifacts.candles_ndjson)
+    scope = {
+        "symbol": "BTCUSDT",
+        "timeframe": "5m",
+        "period_start": datetime(2026, 1, 1, tzinfo=UTC),
+        "period_end": datetime(2026, 1, 2, tzinfo=UTC),
+    }
+
+    columnar = VerifiedBacktraderFeedAdapter(artifacts, columnar=store, **scope)
+
+    assert columnar == VerifiedBacktraderFeedAdapter(artifacts, **scope)
+    assert columnar.bars[0].high == Decimal("102.125")
+    other = ColumnarCandleStore.from_ndjson(_fixture_artifacts().candles_ndjson)
+    with pytest.raises(BacktraderFeedError, match="artifacts_invalid"):
+        VerifiedBacktraderFeedAdapter(artifacts, columnar=other, **scope)
@@ -20,6 +20,8 @@ from app.backtesting.dataset import (
     DatasetSourceIdentity,
     DatasetStreamQuality,
     DatasetSerializer,
+    DatasetVerificationCache,
+    DatasetVerificationCacheStats,
     MissingRange,
     Timeframe,
 )
@@ -1142,3 +1144,123 @@ def test_verifier_preserves_stable_verification_error(
 
     with pytest.raises(DatasetArtifactVerificationError):
         DatasetSerializer.verify(artifacts)
+
+
+def test_verification_cache_returns_verified_records_without_rebuilding(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = DatasetVerificationCache()
+    monkeypatch.setattr(DatasetSerializer, "verification_cache", cache)
+    artifacts = _fixture_artifacts()
+
+    first = DatasetSerializer.verified(artifacts)
+
+    def forbid_rebuild(self: DatasetBuilder, records: object) -> DatasetBuildResult:
+        raise AssertionError("verified bytes must not be rebuilt")
+
+    monkeypatch.setattr(DatasetBuilder, "build", forbid_rebuild)
+    second = DatasetSerializer.verified(_fixture_artifacts())
+
+    assert second is first
+    assert DatasetSerializer.verify(artifacts) == artifacts.descriptor
+    assert first.records == tuple(
+        CandleRecord.model_validate_json(line)
+        for line in artifacts.candles_ndjson.splitlines()
+    )
+    assert cache.stats() == DatasetVerificationCacheStats(
+        hits=2,
+        misses=1,
+        entries=1,
+        cached_bytes=4
+        * (
+            len(artifacts.manifest_json)
+            + len(artifacts.candles_ndjson)
+            + len(artifacts.quality_report_json)
+        ),
+    )
+
+
+def test_verification_cache_stays_fail_closed_for_different_bytes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(DatasetSerializer, "verification_cache", DatasetVerificationCache())
+    artifacts = _fixture_artifacts()
+    DatasetSerializer.verify(artifacts)
+
+    tampered = artifacts.model_copy(
+        update={"candles_ndjson": artifacts.candles_ndjson.replace(b'"101"', b'"102"', 1)}
+    )
+    other = DatasetSerializer.serialize(
+        DatasetBuilder(_source()).build((_candle_at(0),))
+    )
+    forged_descriptor = artifacts.model_copy(update={"descriptor": other.descriptor})
+
+    for forged in (tampered, forged_descriptor):
+        with pytest.raises(DatasetArtifactVerificationError):
+            DatasetSerializer.verify(forged)
+    assert DatasetSerializer.verification_cache.stats().entries == 2
+
+
+def test_verification_cache_evicts_least_recently_used_within_byte_budget() -> None:
+    artifacts = _fixture_artifacts()
+    size = (
+        len(artifacts.manifest_json)
+        + len(artifacts.candles_ndjson)
+        + len(artifacts.quality_report_json)
+    )
+    verified = DatasetSerializer.verified(artifacts)
+    cache = DatasetVerificationCache(max_bytes=2 * size, max_entries=8)
+
+    for key in ("a", "b"):
+        cache.put((key, key, key), verified, size)
+    assert cache.get(("a", "a", "a")) is verified
+    cache.put(("c", "c", "c"), verified, size)
+    cache.put(("too-large",) * 3, verified, 2 * size + 1)
+
+    assert cache.get(("b", "b", "b")) is None
+    assert cache.get(("a", "a", "a")) is verified
+    assert cache.get(("too-large",) * 3) is None
+    assert cache.stats().entries == 2
+    assert cache.stats().cached_bytes == 2 * size
+    cache.clear()
+    assert cache.stats() == DatasetVerificationCacheStats(0, 0, 0, 0)
+    with pytest.raises(ValueError, match="dataset_verification_cache_bounds_invalid"):
+        DatasetVerificationCache(max_bytes=-1)
+
+
+def test_parallel_analysis_report_and_build_are_identical_to_sequential() -> None:
+    eligible = (
+        *(
+            _candle_at(minute, symbol=symbol)
+            for symbol in ("BTCUSDT", "ETHUSDT", "SOLUSDT")
+            for minute in range(6)
+        ),
+        *(_candle_at(minute, timeframe="5m") for minute in range(0, 30, 5)),
+    )
+    ineligible = (
+        *eligible,
+        _candle_at(2, symbol="ETHUSDT"),
+        _candle_at(3, symbol="SOLUSDT", close="100"),
+        _candle_at(9, symbol="BTCUSDT"),
+        _candle_at(0, symbol="XRPUSDT", market_data_venue="other"),
+    )
+    sequential = DatasetBuilder(_source())
+    parallel = DatasetBuilder(_source(), analysis_workers=2)
+
+    report = parallel.analyze(reversed(ineligible))
+    assert report == sequential.analyze(ineligible)
+    assert _canonical_json(report.model_dump(mode="json")) == _canonical_json(
+        sequential.analyze(ineligible).model_dump(mode="json")
+    )
+    assert report.quality_flags == (
+        "mixed_market_data_venue",
+        "source_identity_mismatch",
+        "exact_duplicate",
+        "conflicting_duplicate",
+        "missing_range",
+    )
+    assert DatasetSerializer.serialize(parallel.build(eligible)) == (
+        DatasetSerializer.serialize(sequential.build(eligible))
+    )
+    with pytest.raises(ValueError, match="dataset_analysis_workers_invalid"):
+        DatasetBuilder(_source(), analysis_workers=0)
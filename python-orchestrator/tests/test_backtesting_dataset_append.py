@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    DatasetBuildRejected,
+    DatasetSerializer,
+    Timeframe,
+)
+from app.backtesting.dataset_append import DatasetAppender, DatasetAppendRejected
+from app.backtesting.dataset_store import (
+    DatasetNotPublished,
+    DatasetPublicationStatus,
+    DatasetPublisher,
+)
+from tests.test_backtesting_dataset_streaming import _candle, _serialize, _source
+
+
+def _base_records() -> tuple[CandleRecord, ...]:
+    return (
+        *(_candle(index) for index in range(30)),
+        *(_candle(index, symbol="ETHUSDT") for index in range(20)),
+        *(_candle(index, timeframe=Timeframe.FIVE_MINUTES) for index in range(6)),
+    )
+
+
+def _tail_records() -> tuple[CandleRecord, ...]:
+    return (
+        *(_candle(index, symbol="ETHUSDT") for index in range(23, 19, -1)),
+        *(_candle(index) for index in range(30, 33)),
+    )
+
+
+def test_extend_is_byte_identical_to_full_rebuild() -> None:
+    base = _serialize(_base_records())
+    expected = _serialize(_base_records() + _tail_records())
+
+    extended = DatasetAppender(DatasetPublisher(Path("/unused"))).extend(
+        base, _tail_records(), source=_source()
+    )
+
+    assert extended == expected
+    assert DatasetSerializer.verify(extended) == expected.descriptor
+
+
+def test_extend_never_parses_untouched_base_records(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base = _serialize(_base_records())
+    parsed: list[bytes] = []
+    original = CandleRecord.model_validate_json
+
+    def counting(payload: bytes, *args: object, **kwargs: object) -> CandleRecord:
+        parsed.append(payload)
+        return original(payload, *args, **kwargs)
+
+    monkeypatch.setattr(CandleRecord, "model_validate_json", counting)
+    DatasetAppender(DatasetPublisher(Path("/unused"))).extend(
+        base, _tail_records(), source=_source()
+    )
+
+    assert len(parsed) == 2
+
+
+def test_append_publishes_new_dataset_from_published_base(tmp_path: Path) -> None:
+    publisher = DatasetPublisher(tmp_path / "datasets")
+    base = _serialize(_base_records())
+    publisher.publish(base)
+    expected = _serialize(_base_records() + _tail_records())
+
+    result = DatasetAppender(publisher).append(
+        base.descriptor.dataset_id, _tail_records(), source=_source()
+    )
+
+    assert result.status is DatasetPublicationStatus.PUBLISHED
+    assert result.dataset_id == expected.descriptor.dataset_id
+    assert publisher.read(result.dataset_id) == expected
+    assert publisher.read(base.descriptor.dataset_id) == base
+    with pytest.raises(DatasetNotPublished):
+        DatasetAppender(publisher).append(
+            "backtest-dataset-" + "0" * 64, _tail_records(), source=_source()
+        )
+    with pytest.raises(DatasetNotPublished):
+        publisher.read("../" + base.descriptor.dataset_id)
+
+
+def test_append_stamps_tail_source_and_verifies_before_publishing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    publisher = DatasetPublisher(tmp_path / "datasets")
+    base = _serialize(_base_records())
+    publisher.publish(base)
+    tail_source = _source(
+        source_build_version="paper-exporter.v4",
+        source_checksum="sha256:" + "b" * 64,
+    )
+    expected = _serialize(
+        _base_records() + _tail_records(),
+        source_build_version="paper-exporter.v4",
+        source_checksum="sha256:" + "b" * 64,
+    )
+
+    result = DatasetAppender(publisher).append(
+        base.descriptor.dataset_id, _tail_records(), source=tail_source
+    )
+
+    assert publisher.read(result.dataset_id) == expected
+    with pytest.raises(DatasetAppendRejected, match="dataset_append_source_mismatch"):
+        DatasetAppender(publisher).extend(
+            base, _tail_records(), source=_source(market_data_venue="other")
+        )
+    with pytest.raises(TypeError):
+        DatasetAppender(publisher).extend(
+            base, _tail_records(), source=base.descriptor  # type: ignore[arg-type]
+        )
+
+    def forged(self: DatasetAppender, *args: object, **kwargs: object) -> DatasetArtifacts:
+        return expected.model_copy(
+            update={
+                "candles_ndjson": expected.candles_ndjson.replace(b'"99.5"', b'"99.4"', 1)
+            }
+        )
+
+    monkeypatch.setattr(DatasetAppender, "extend", forged)
+    published = publisher.published_ids()
+    with pytest.raises(DatasetArtifactVerificationError):
+        DatasetAppender(publisher).append(
+            expected.descriptor.dataset_id, _tail_records(), source=tail_source
+        )
+    assert publisher.published_ids() == published
+
+
+@pytest.mark.parametrize(
+    ("tail", "reason_code"),
+    (
+        ((), "dataset_append_empty"),
+        ((_candle(31),), "dataset_append_boundary_invalid"),
+        ((_candle(29, close="101"), _candle(30)), "dataset_append_boundary_invalid"),
+        ((_candle(0, symbol="SOLUSDT"),), "dataset_append_stream_unknown"),
+    ),
+)
+def test_extend_rejects_tails_that_do_not_continue_each_stream(
+    tail: tuple[CandleRecord, ...],
+    reason_code: str,
+) -> None:
+    with pytest.raises(DatasetAppendRejected) as rejected:
+        DatasetAppender(DatasetPublisher(Path("/unused"))).extend(
+            _serialize(_base_records()), tail, source=_source()
+        )
+
+    assert rejected.value.reason_code == reason_code
+
+
+def test_extend_rejects_ineligible_tail_and_tampered_base() -> None:
+    appender = DatasetAppender(DatasetPublisher(Path("/unused")))
+    base = _serialize(_base_records())
+
+    with pytest.raises(DatasetBuildRejected):
+        appender.extend(base, (_candle(30), _candle(32)), source=_source())
+    with pytest.raises(DatasetBuildRejected):
+        appender.extend(base, (_candle(30, source_network="other"),), source=_source())
+    tampered = base.model_copy(
+        update={"candles_ndjson": base.candles_ndjson.replace(b'"99.5"', b'"99.4"', 1)}
+    )
+    with pytest.raises(DatasetAppendRejected, match="dataset_append_base_invalid"):
+        appender.extend(tampered, _tail_records(), source=_source())
+    forged_report = base.model_copy(
+        update={"quality_report_json": base.quality_report_json.replace(b"56", b"57")}
+    )
+    with pytest.raises(DatasetArtifactVerificationError):
+        appender.extend(forged_report, _tail_records(), source=_source())
+
+
+def _with_line(base, source_record_id: str, replace):
+    lines = base.candles_ndjson.splitlines(keepends=True)
+    (position,) = (
+        index
+        for index, line in enumerate(lines)
+        if f'"source_record_id":"{source_record_id}"'.encode() in line
+    )
+    lines[position] = replace(lines[position])
+    return base.model_copy(update={"candles_ndjson": b"".join(lines)})
+
+
+def test_extend_rejects_unparsable_boundaries_and_unbound_base_facts() -> None:
+    appender = DatasetAppender(DatasetPublisher(Path("/unused")))
+    base = _serialize(_base_records())
+
+    for tampered in (
+        base.model_copy(update={"candles_ndjson": base.candles_ndjson.replace(b"\n", b" ")}),
+        _with_line(base, "fake:BTCUSDT:1m:29", lambda line: b"{" + line),
+        _with_line(base, "fake:ETHUSDT:1m:19", lambda line: line.replace(b"{", b"{ ", 1)),
+    ):
+        with pytest.raises(DatasetAppendRejected, match="dataset_append_base_invalid"):
+            appender.extend(tampered, _tail_records(), source=_source())
+
+    other = _serialize(_base_records()[:-1])
+    for forged in (
+        base.model_copy(update={"manifest_json": b"[]\n"}),
+        base.model_copy(update={"descriptor": other.descriptor}),
+    ):
+        with pytest.raises(DatasetArtifactVerificationError):
+            appender.extend(forged, _tail_records(), source=_source())
+    with pytest.raises(TypeError):
+        appender.extend(
+            base.candles_ndjson, _tail_records(), source=_source()  # type: ignore[arg-type]
+        )
+    with pytest.raises(TypeError):
+        DatasetAppender(Path("/unused"))  # type: ignore[arg-type]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.dataset import DatasetArtifacts, DatasetArtifactVerificationError
+from app.backtesting.dataset_blobs import (
+    BLOB_DIRECTORY,
+    BLOB_MANIFEST_FILENAME,
+    DatasetBlobError,
+    DatasetBlobManifest,
+    split_candles,
+)
+from app.backtesting.dataset_index import DatasetStreamIndex
+from app.backtesting.dataset_mapped import MappedDatasetArtifacts
+from app.backtesting.dataset_store import (
+    DatasetPublicationConflict,
+    DatasetPublicationStatus,
+    DatasetPublisher,
+)
+from tests.test_backtesting_dataset_streaming import _candle, _serialize
+
+
+def _artifacts(eth_candles: int, checksum: str) -> DatasetArtifacts:
+    return _serialize(
+        (
+            *(_candle(index) for index in range(400)),
+            *(_candle(index, symbol="ETHUSDT") for index in range(eth_candles)),
+        ),
+        source_checksum="sha256:" + checksum * 64,
+    )
+
+
+def _blob_names(root: Path) -> set[str]:
+    return set(os.listdir(root / BLOB_DIRECTORY))
+
+
+def test_overlapping_datasets_share_stream_blobs_and_round_trip(tmp_path: Path) -> None:
+    first, second = _artifacts(90, "a"), _artifacts(120, "b")
+    root = tmp_path / "datasets"
+    publisher = DatasetPublisher(root, deduplicate=True, stream_index=True, sealed=True)
+
+    result = publisher.publish(first)
+    assert sorted(os.listdir(result.target)) == [
+        BLOB_MANIFEST_FILENAME,
+        "manifest.json",
+        "quality-report.json",
+        "stream-index.json",
+    ]
+    assert len(_blob_names(root)) == 2
+    publisher.publish(second)
+
+    # The shared BTCUSDT stream is stored once; only the new ETHUSDT tail is added.
+    assert len(_blob_names(root)) == 3
+    for artifacts in (first, second):
+        dataset_id = artifacts.descriptor.dataset_id
+        assert publisher.read(dataset_id) == artifacts
+        stream = DatasetStreamIndex.from_artifacts(artifacts).find(
+            symbol="ETHUSDT",
+            timeframe="1m",
+        )
+        assert stream is not None
+        assert publisher.read_stream(dataset_id, symbol="ETHUSDT", timeframe="1m") == (
+            artifacts.candles_ndjson[stream.offset : stream.offset + stream.length]
+        )
+        with MappedDatasetArtifacts.open(publisher, dataset_id) as mapped:
+            assert mapped.to_artifacts() == artifacts
+    assert publisher.publish(first).status is DatasetPublicationStatus.ALREADY_PUBLISHED
+    assert publisher.publish_many((first, second))[1].status is (
+        DatasetPublicationStatus.ALREADY_PUBLISHED
+    )
+
+
+def test_blob_tampering_fails_closed(tmp_path: Path) -> None:
+    artifacts = _artifacts(90, "a")
+    root = tmp_path / "datasets"
+    publisher = DatasetPublisher(root, deduplicate=True)
+    publisher.publish(artifacts)
+    manifest, _ = split_candles(artifacts.descriptor, artifacts.candles_ndjson)
+    blob = root / BLOB_DIRECTORY / manifest.blobs[0].name
+    original = blob.read_bytes()
+
+    blob.write_bytes(original.replace(b'"100.75"', b'"100.76"', 1))
+    with pytest.raises(DatasetArtifactVerificationError):
+        publisher.read(artifacts.descriptor.dataset_id, verify=False)
+
+    blob.write_bytes(original + b"\n")
+    with pytest.raises(DatasetPublicationConflict):
+        publisher.publish(artifacts)
+
+    blob.unlink()
+    with pytest.raises(DatasetPublicationConflict):
+        publisher.read(artifacts.descriptor.dataset_id)
+    assert publisher.publish(artifacts).status is DatasetPublicationStatus.ALREADY_PUBLISHED
+    assert publisher.read(artifacts.descriptor.dataset_id) == artifacts
+
+
+def test_sealed_store_rejects_open_blob_directories_and_foreign_blobs(
+    tmp_path: Path,
+) -> None:
+    artifacts = _artifacts(90, "a")
+    root = tmp_path / "datasets"
+    publisher = DatasetPublisher(root, deduplicate=True, sealed=True)
+    target = publisher.publish(artifacts).target
+    manifest, _ = split_candles(artifacts.descriptor, artifacts.candles_ndjson)
+    blob = root / BLOB_DIRECTORY / manifest.blobs[0].name
+    original = blob.read_bytes()
+
+    (root / BLOB_DIRECTORY).chmod(0o755)
+    with pytest.raises(DatasetPublicationConflict):
+        publisher.publish(artifacts)
+    (root / BLOB_DIRECTORY).chmod(0o700)
+
+    blob.write_bytes(original + b"\n")
+    with pytest.raises(DatasetPublicationConflict):
+        publisher.publish(artifacts)
+    blob.write_bytes(original)
+    assert publisher.publish(artifacts).status is DatasetPublicationStatus.ALREADY_PUBLISHED
+
+    blob_manifest = target / BLOB_MANIFEST_FILENAME
+    blob_manifest.chmod(0o600)
+    blob_manifest.write_bytes(b"{}\n")
+    with pytest.raises(DatasetPublicationConflict):
+        publisher.publish(artifacts)
+
+
+def test_collect_blobs_keeps_referenced_and_recent_blobs(tmp_path: Path) -> None:
+    first, second = _artifacts(90, "a"), _artifacts(120, "b")
+    root = tmp_path / "datasets"
+    publisher = DatasetPublisher(root, deduplicate=True)
+    publisher.publish(first)
+    publisher.publish(second)
+    publisher.evict(first.descriptor.dataset_id)
+
+    assert publisher.collect_blobs() == 0
+    assert publisher.collect_blobs(grace=timedelta(0)) == 1
+    kept = {ref.name for ref in split_candles(second.descriptor, second.candles_ndjson)[0].blobs}
+    assert _blob_names(root) == kept
+    assert publisher.read(second.descriptor.dataset_id) == second
+
+
+def test_blob_manifest_is_canonical_and_bound_to_descriptor() -> None:
+    first, second = _artifacts(90, "a"), _artifacts(120, "b")
+    manifest, blobs = split_candles(first.descriptor, first.candles_ndjson)
+
+    assert b"".join(blobs) == first.candles_ndjson
+    assert DatasetBlobManifest.parse(manifest.to_json(), first.descriptor) == manifest
+    for payload, descriptor in (
+        (manifest.to_json(), second.descriptor),
+        (manifest.to_json().replace(b",", b", ", 1), first.descriptor),
+    ):
+        with pytest.raises(DatasetBlobError, match="dataset_blob_manifest_invalid"):
+            DatasetBlobManifest.parse(payload, descriptor)
+    with pytest.raises(ValueError, match="dataset_deduplication_compression_unsupported"):
+        DatasetPublisher(Path("/unused"), compression="gzip", deduplicate=True)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    Timeframe,
+)
+from app.backtesting.dataset_catalog import DatasetCatalog, main
+from app.backtesting.dataset_store import DatasetPublisher
+from tests.test_backtesting_dataset_streaming import _candle, _serialize
+
+
+UTC = timezone.utc
+START = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _catalog_candle(
+    index: int,
+    *,
+    timeframe: Timeframe = Timeframe.ONE_HOUR,
+    **overrides: object,
+) -> CandleRecord:
+    return _candle(index, timeframe=timeframe, start=START, **overrides)
+
+
+def _fixtures() -> tuple[DatasetArtifacts, DatasetArtifacts, DatasetArtifacts]:
+    spring = _serialize(
+        (
+            *(_catalog_candle(index) for index in range(24 * 120)),
+            *(
+                _catalog_candle(index, symbol="ETHUSDT", timeframe=Timeframe.FOUR_HOURS)
+                for index in range(30)
+            ),
+        )
+    )
+    march = _serialize(
+        (_catalog_candle(index) for index in range(24 * 31)),
+        source_checksum="sha256:" + "b" * 64,
+    )
+    other_venue = _serialize(
+        (_catalog_candle(index, market_data_venue="okx") for index in range(24 * 120)),
+        market_data_venue="okx",
+    )
+    return spring, march, other_venue
+
+
+def test_publish_keeps_catalog_in_sync_and_queries_by_coverage(tmp_path: Path) -> None:
+    spring, march, other_venue = _fixtures()
+    catalog = DatasetCatalog(tmp_path / "catalog.sqlite3")
+    publisher = DatasetPublisher(tmp_path / "datasets", catalog=catalog)
+    for artifacts in (spring, march, other_venue, spring):
+        publisher.publish(artifacts)
+
+    def ids(**filters: object) -> list[str]:
+        return [item.dataset_id for item in catalog.query(**filters)]
+
+    assert ids() == sorted(
+        item.descriptor.dataset_id for item in (spring, march, other_venue)
+    )
+    assert ids(
+        symbol="BTCUSDT",
+        timeframe="1h",
+        market_data_venue="fake",
+        start_at=datetime(2026, 3, 1, tzinfo=UTC),
+        end_at=datetime(2026, 6, 1, tzinfo=UTC),
+    ) == [spring.descriptor.dataset_id]
+    assert ids(
+        symbol="BTCUSDT",
+        start_at=datetime(2026, 3, 2, tzinfo=UTC),
+        end_at=datetime(2026, 3, 30, tzinfo=UTC),
+        market_data_venue="fake",
+    ) == sorted((spring.descriptor.dataset_id, march.descriptor.dataset_id))
+    assert ids(source_checksum="sha256:" + "b" * 64) == [march.descriptor.dataset_id]
+    assert ids(symbol="ETHUSDT", timeframe=Timeframe.FOUR_HOURS) == [
+        spring.descriptor.dataset_id
+    ]
+    assert ids(symbol="ETHUSDT", timeframe="1h") == []
+    assert catalog.get(march.descriptor.dataset_id) == march.descriptor
+    catalog.remove(march.descriptor.dataset_id)
+    assert catalog.get(march.descriptor.dataset_id) is None
+
+    publisher.publish_many((march, spring))
+    assert catalog.get(march.descriptor.dataset_id) == march.descriptor
+    with pytest.raises(TypeError):
+        publisher.publish_many((march.manifest_json,))  # type: ignore[arg-type]
+
+
+def test_rebuild_from_disk_skips_unreadable_directories(tmp_path: Path) -> None:
+    spring, march, other_venue = _fixtures()
+    root = tmp_path / "datasets"
+    publisher = DatasetPublisher(root)
+    for artifacts in (spring, march, other_venue):
+        publisher.publish(artifacts)
+    tampered = root / other_venue.descriptor.dataset_id / "candles.ndjson"
+    tampered.write_bytes(tampered.read_bytes().replace(b'"100.75"', b'"100.85"', 1))
+    os.mkdir(root / "not-a-dataset", 0o700)
+    catalog_path = tmp_path / "catalog.sqlite3"
+    catalog = DatasetCatalog(catalog_path)
+    catalog.record(other_venue.manifest_json)
+
+    assert catalog.rebuild(publisher) == 2
+    assert [item.dataset_id for item in catalog.query()] == sorted(
+        (spring.descriptor.dataset_id, march.descriptor.dataset_id)
+    )
+    shutil.rmtree(root / march.descriptor.dataset_id)
+    assert main(["rebuild", "--root", str(root), "--catalog", str(catalog_path)]) == 0
+    assert [item.dataset_id for item in catalog.query()] == [spring.descriptor.dataset_id]
+    with pytest.raises(DatasetArtifactVerificationError):
+        catalog.record(json.dumps({"dataset_id": "x"}).encode())
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+
+from app.backtesting import dataset_compression
+from app.backtesting.dataset import DatasetArtifacts, DatasetArtifactVerificationError, Timeframe
+from app.backtesting.dataset_compression import (
+    COMPRESSED_CANDLES_FILENAME,
+    COMPRESSION_FILENAME,
+    DatasetCompressionError,
+    DatasetCompressionRecord,
+    compress_candles,
+    decompress_candles,
+    decompress_candles_mapping,
+    read_candles_range,
+)
+from app.backtesting.dataset_index import DatasetStreamIndex
+from app.backtesting.dataset_mapped import MappedDatasetArtifacts
+from app.backtesting.dataset_store import DatasetPublicationStatus, DatasetPublisher
+from tests.test_backtesting_dataset_streaming import _candle, _serialize
+
+
+def _artifacts() -> DatasetArtifacts:
+    return _serialize(
+        (
+            *(_candle(index) for index in range(400)),
+            *(_candle(index, symbol="ETHUSDT") for index in range(90)),
+            *(_candle(index, timeframe=Timeframe.FIVE_MINUTES) for index in range(80)),
+        )
+    )
+
+
+def test_gzip_store_keeps_dataset_identity_and_round_trips(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    dataset_id = artifacts.descriptor.dataset_id
+    plain = DatasetPublisher(tmp_path / "plain")
+    compressed = DatasetPublisher(
+        tmp_path / "gzip",
+        compression="gzip",
+        stream_index=True,
+        sealed=True,
+    )
+
+    assert plain.publish(artifacts).dataset_id == dataset_id
+    result = compressed.publish(artifacts)
+
+    assert result.dataset_id == dataset_id
+    assert sorted(os.listdir(result.target)) == [
+        COMPRESSED_CANDLES_FILENAME,
+        COMPRESSION_FILENAME,
+        "manifest.json",
+        "quality-report.json",
+        "stream-index.json",
+    ]
+    stored = (result.target / COMPRESSED_CANDLES_FILENAME).stat().st_size
+    assert stored * 4 < len(artifacts.candles_ndjson)
+    assert (result.target / "manifest.json").read_bytes() == artifacts.manifest_json
+    assert compressed.read(dataset_id) == artifacts == plain.read(dataset_id)
+    assert compressed.publish(artifacts).status is DatasetPublicationStatus.ALREADY_PUBLISHED
+
+    index = DatasetStreamIndex.from_artifacts(artifacts)
+    stream = index.find(symbol="ETHUSDT", timeframe="1m")
+    assert stream is not None
+    assert compressed.read_stream(dataset_id, symbol="ETHUSDT", timeframe="1m") == (
+        artifacts.candles_ndjson[stream.offset : stream.offset + stream.length]
+    )
+    with MappedDatasetArtifacts.open(compressed, dataset_id) as mapped:
+        assert mapped.verify() == artifacts.descriptor
+        assert mapped.to_artifacts() == artifacts
+
+
+def test_compressed_candles_are_bound_to_their_own_checksum(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "gzip", compression="gzip")
+    target = publisher.publish(artifacts).target
+    candles = target / COMPRESSED_CANDLES_FILENAME
+
+    # Same canonical content, different compressed bytes.
+    candles.write_bytes(gzip.compress(artifacts.candles_ndjson, compresslevel=9, mtime=1))
+    with pytest.raises(DatasetArtifactVerificationError):
+        publisher.read(artifacts.descriptor.dataset_id, verify=False)
+
+    candles.write_bytes(gzip.compress(artifacts.candles_ndjson, compresslevel=6, mtime=0)[:-9])
+    with pytest.raises(DatasetArtifactVerificationError):
+        publisher.read(artifacts.descriptor.dataset_id)
+
+
+def test_compression_record_is_canonical_and_bound_to_descriptor() -> None:
+    artifacts = _artifacts()
+    other = _serialize((_candle(0),))
+    compressed, record = compress_candles(artifacts.descriptor, artifacts.candles_ndjson)
+
+    assert compress_candles(artifacts.descriptor, artifacts.candles_ndjson)[0] == compressed
+    assert gzip.decompress(compressed) == artifacts.candles_ndjson
+    assert DatasetCompressionRecord.parse(record.to_json(), artifacts.descriptor) == record
+    for payload, descriptor in (
+        (record.to_json(), other.descriptor),
+        (record.to_json().replace(b",", b", ", 1), artifacts.descriptor),
+    ):
+        with pytest.raises(DatasetCompressionError, match="dataset_compression_record_invalid"):
+            DatasetCompressionRecord.parse(payload, descriptor)
+    with pytest.raises(ValueError, match="dataset_compression_unsupported"):
+        DatasetPublisher(Path("/unused"), compression="zstd")
+
+
+def _gzip_fd(path: Path, payload: bytes) -> int:
+    path.write_bytes(payload)
+    return os.open(path, os.O_RDONLY)
+
+
+def test_corrupt_truncated_and_padded_frames_are_rejected(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    compressed, record = compress_candles(artifacts.descriptor, artifacts.candles_ndjson)
+    frames = {
+        "padded": compressed + b"trailing",
+        "truncated": compressed[: len(compressed) // 2],
+        "corrupt": compressed[:10] + bytes(b ^ 0xFF for b in compressed[10:40]) + compressed[40:],
+    }
+    for name, payload in frames.items():
+        descriptor = _gzip_fd(tmp_path / name, payload)
+        try:
+            with pytest.raises(DatasetCompressionError, match="dataset_compression_frame_invalid"):
+                decompress_candles(descriptor, record)
+            with pytest.raises(DatasetCompressionError, match="dataset_compression_frame_invalid"):
+                decompress_candles_mapping(descriptor, record)
+        finally:
+            os.close(descriptor)
+
+    descriptor = _gzip_fd(tmp_path / "empty", b"")
+    try:
+        with pytest.raises(DatasetCompressionError, match="dataset_compression_frame_invalid"):
+            read_candles_range(descriptor, record, 0, 1)
+    finally:
+        os.close(descriptor)
+
+
+def test_mismatched_compression_records_are_rejected(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    compressed, record = compress_candles(artifacts.descriptor, artifacts.candles_ndjson)
+    descriptor = _gzip_fd(tmp_path / COMPRESSED_CANDLES_FILENAME, compressed)
+    try:
+        shorter = record.model_copy(update={"candles_size": record.candles_size - 1})
+        with pytest.raises(DatasetCompressionError, match="dataset_compression_frame_invalid"):
+            decompress_candles(descriptor, shorter)
+        for update in (
+            {"compressed_size": record.compressed_size + 1},
+            {"compressed_checksum": "sha256:" + "0" * 64},
+        ):
+            with pytest.raises(
+                DatasetCompressionError, match="dataset_compression_checksum_mismatch"
+            ):
+                decompress_candles(descriptor, record.model_copy(update=update))
+        for offset, length in ((-1, 1), (0, -1), (record.candles_size, 1)):
+            with pytest.raises(DatasetCompressionError, match="dataset_compression_range_invalid"):
+                read_candles_range(descriptor, record, offset, length)
+    finally:
+        os.close(descriptor)
+
+    # A record missing its defaulted schema version is valid JSON but not canonical.
+    payload = record.to_json().replace(b',"schema_version":"backtest-dataset-compression.v1"', b"")
+    with pytest.raises(DatasetCompressionError, match="dataset_compression_record_invalid"):
+        DatasetCompressionRecord.parse(payload, artifacts.descriptor)
+
+
+def test_candle_ranges_span_decompressed_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    artifacts = _artifacts()
+    compressed, record = compress_candles(artifacts.descriptor, artifacts.candles_ndjson)
+    monkeypatch.setattr(dataset_compression, "_CHUNK_BYTES", 4096)
+    descriptor = _gzip_fd(tmp_path / COMPRESSED_CANDLES_FILENAME, compressed)
+    try:
+        for offset, length in ((0, 10), (5000, 9000), (record.candles_size - 7, 7), (100, 0)):
+            assert read_candles_range(descriptor, record, offset, length) == (
+                artifacts.candles_ndjson[offset : offset + length]
+            )
+        assert decompress_candles(descriptor, record) == artifacts.candles_ndjson
+    finally:
+        os.close(descriptor)
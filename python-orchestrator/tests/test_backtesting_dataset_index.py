@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.dataset import CandleRecord, DatasetArtifacts, Timeframe
+from app.backtesting.dataset_index import (
+    STREAM_INDEX_FILENAME,
+    DatasetStreamIndex,
+    DatasetStreamIndexError,
+)
+from app.backtesting.dataset_store import (
+    DatasetNotPublished,
+    DatasetPublicationConflict,
+    DatasetPublicationStatus,
+    DatasetPublisher,
+)
+from tests.test_backtesting_dataset_streaming import _candle, _serialize
+
+
+UTC = timezone.utc
+
+
+def _artifacts() -> DatasetArtifacts:
+    return _serialize(
+        (
+            *(_candle(index) for index in range(12)),
+            *(_candle(index, symbol="ETHUSDT") for index in range(7)),
+            *(_candle(index, timeframe=Timeframe.ONE_HOUR) for index in range(3)),
+        )
+    )
+
+
+def test_index_locates_each_contiguous_stream_with_its_slice_checksum() -> None:
+    artifacts = _artifacts()
+
+    index = DatasetStreamIndex.from_artifacts(artifacts)
+
+    assert index.dataset_id == artifacts.descriptor.dataset_id
+    assert index.candles_checksum == artifacts.descriptor.candles_checksum
+    assert b"".join(
+        DatasetStreamIndex.read_slice(artifacts.candles_ndjson, item)
+        for item in index.streams
+    ) == artifacts.candles_ndjson
+    stream = index.find(symbol="BTCUSDT", timeframe="1h")
+    assert stream is not None
+    assert stream.record_count == 3
+    assert stream.last_open_at == datetime(2026, 1, 1, 2, tzinfo=UTC)
+    lines = DatasetStreamIndex.read_slice(artifacts.candles_ndjson, stream).splitlines()
+    assert [CandleRecord.model_validate_json(line) for line in lines] == [
+        _candle(index, timeframe=Timeframe.ONE_HOUR) for index in range(3)
+    ]
+    assert index.find(symbol="ETHUSDT", timeframe=Timeframe.ONE_HOUR) is None
+    assert DatasetStreamIndex.parse(index.to_json(), artifacts.descriptor) == index
+    index.verify(artifacts)
+
+
+def test_index_parse_and_slice_reads_fail_closed() -> None:
+    artifacts = _artifacts()
+    index = DatasetStreamIndex.from_artifacts(artifacts)
+    payload = json.loads(index.to_json())
+    payload["streams"][1]["offset"] += 1
+    shifted = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode() + b"\n"
+    other = _serialize((_candle(0),))
+
+    for forged, descriptor in (
+        (shifted, artifacts.descriptor),
+        (index.to_json(), other.descriptor),
+        (index.to_json().replace(b"}\n", b"} \n"), artifacts.descriptor),
+    ):
+        with pytest.raises(DatasetStreamIndexError, match="dataset_stream_index_invalid"):
+            DatasetStreamIndex.parse(forged, descriptor)
+    tampered = artifacts.candles_ndjson.replace(b'"99.5"', b'"99.4"', 1)
+    with pytest.raises(DatasetStreamIndexError, match="slice_checksum_mismatch"):
+        DatasetStreamIndex.read_slice(tampered, index.streams[0])
+    with pytest.raises(DatasetStreamIndexError, match="dataset_stream_index_invalid"):
+        index.verify(other)
+
+
+def test_publisher_writes_sidecar_atomically_and_reads_one_stream(
+    tmp_path: Path,
+) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets", stream_index=True, sealed=True)
+
+    first = publisher.publish(artifacts)
+    second = publisher.publish(artifacts)
+
+    target = first.target
+    assert first.status is DatasetPublicationStatus.PUBLISHED
+    assert second.status is DatasetPublicationStatus.ALREADY_PUBLISHED
+    assert {item.name for item in target.iterdir()} == {
+        "candles.ndjson",
+        "quality-report.json",
+        "manifest.json",
+        STREAM_INDEX_FILENAME,
+    }
+    assert (target / STREAM_INDEX_FILENAME).read_bytes() == (
+        DatasetStreamIndex.from_artifacts(artifacts).to_json()
+    )
+    assert publisher.read(first.dataset_id) == artifacts
+    eth = publisher.read_stream(first.dataset_id, symbol="ETHUSDT", timeframe="1m")
+    assert len(eth.splitlines()) == 7
+    assert eth in artifacts.candles_ndjson
+    with pytest.raises(DatasetNotPublished):
+        publisher.read_stream(first.dataset_id, symbol="SOLUSDT", timeframe="1m")
+    with pytest.raises(DatasetNotPublished):
+        DatasetPublisher(tmp_path / "datasets").read_stream(
+            first.dataset_id, symbol="ETHUSDT", timeframe="1m"
+        )
+    with pytest.raises(DatasetPublicationConflict):
+        DatasetPublisher(tmp_path / "datasets").publish(artifacts)
+
+    candles = target / "candles.ndjson"
+    descriptor = os.open(candles, os.O_WRONLY)
+    try:
+        offset = artifacts.candles_ndjson.index(eth) + eth.index(b'"99.5"')
+        os.pwrite(descriptor, b'"99.4"', offset)
+    finally:
+        os.close(descriptor)
+    assert publisher.read_stream(first.dataset_id, symbol="BTCUSDT", timeframe="1h")
+    with pytest.raises(DatasetStreamIndexError, match="slice_checksum_mismatch"):
+        publisher.read_stream(first.dataset_id, symbol="ETHUSDT", timeframe="1m")
+
+    # A sidecar forged to match the forged candles is caught by the seal.
+    forged = eth.replace(b'"99.5"', b'"99.4"', 1)
+    index = DatasetStreamIndex.from_artifacts(artifacts)
+    (target / STREAM_INDEX_FILENAME).write_bytes(
+        index.model_copy(
+            update={
+                "streams": tuple(
+                    item.model_copy(
+                        update={"sha256": "sha256:" + hashlib.sha256(forged).hexdigest()}
+                    )
+                    if item.symbol == "ETHUSDT"
+                    else item
+                    for item in index.streams
+                )
+            }
+        ).to_json()
+    )
+    with pytest.raises(DatasetStreamIndexError, match="stream_index_checksum_mismatch"):
+        publisher.read_stream(first.dataset_id, symbol="ETHUSDT", timeframe="1m")
+
+
+def test_read_stream_requires_a_seal(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets", stream_index=True)
+    dataset_id = publisher.publish(artifacts).dataset_id
+
+    with pytest.raises(DatasetStreamIndexError, match="dataset_stream_index_unsealed"):
+        publisher.read_stream(dataset_id, symbol="ETHUSDT", timeframe="1m")
+    seal = tmp_path / "datasets" / f".{dataset_id}.seal"
+    seal.write_bytes(b"{}\n")
+    seal.chmod(0o600)
+    with pytest.raises(DatasetStreamIndexError, match="dataset_stream_index_unsealed"):
+        publisher.read_stream(dataset_id, symbol="ETHUSDT", timeframe="1m")
+    sealed = DatasetPublisher(tmp_path / "datasets", stream_index=True, sealed=True)
+    assert sealed.publish(artifacts).status is DatasetPublicationStatus.ALREADY_PUBLISHED
+    assert sealed.read_stream(dataset_id, symbol="ETHUSDT", timeframe="1m") in (
+        artifacts.candles_ndjson
+    )
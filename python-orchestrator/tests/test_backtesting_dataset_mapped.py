@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.backtrader_feed import BacktraderFeedError, VerifiedBacktraderFeedAdapter
+from app.backtesting.contracts import DatasetDescriptor
+from app.backtesting.dataset import (
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    DatasetSerializer,
+    Timeframe,
+    _canonical_json,
+    _manifest_from_core,
+    _sha256,
+)
+from app.backtesting.dataset_index import (
+    STREAM_INDEX_FILENAME,
+    DatasetStreamIndex,
+    DatasetStreamIndexError,
+)
+from app.backtesting.dataset_mapped import MappedCandleStream, MappedDatasetArtifacts
+from app.backtesting.dataset_store import DatasetNotPublished, DatasetPublisher
+from tests.test_backtesting_dataset_streaming import START, _candle, _serialize
+
+
+def _artifacts() -> DatasetArtifacts:
+    return _serialize(
+        (
+            *(_candle(index) for index in range(40)),
+            *(_candle(index, symbol="ETHUSDT") for index in range(9)),
+            *(_candle(index, timeframe=Timeframe.FIVE_MINUTES) for index in range(8)),
+        )
+    )
+
+
+@pytest.mark.parametrize("stream_index", (False, True))
+def test_mapped_artifacts_decode_streams_and_time_ranges_on_demand(
+    tmp_path: Path,
+    stream_index: bool,
+) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets", stream_index=stream_index)
+    publisher.publish(artifacts)
+
+    with MappedDatasetArtifacts.open(publisher, artifacts.descriptor.dataset_id) as mapped:
+        assert DatasetSerializer.verify(mapped) == artifacts.descriptor
+        assert mapped.candles_size == len(artifacts.candles_ndjson)
+        assert mapped.to_artifacts() == artifacts
+        stream = mapped.find(symbol="BTCUSDT", timeframe="5m")
+        assert stream is not None and len(stream) == 8
+        assert list(stream.records()) == [
+            _candle(index, timeframe=Timeframe.FIVE_MINUTES) for index in range(8)
+        ]
+        assert stream.index_range(
+            START + timedelta(minutes=7), START + timedelta(minutes=26)
+        ) == (2, 5)
+        assert list(stream.records(end_at=START)) == []
+        assert stream.record(7) == _candle(7, timeframe=Timeframe.FIVE_MINUTES)
+        assert mapped.find(symbol="ETHUSDT", timeframe="5m") is None
+        with pytest.raises(IndexError):
+            stream.line(8)
+
+
+def test_mapped_artifacts_plug_into_feed_adapter(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets")
+    publisher.publish(artifacts)
+    scope = {
+        "symbol": "ETHUSDT",
+        "timeframe": "1m",
+        "period_start": START,
+        "period_end": START + timedelta(days=1),
+    }
+
+    with MappedDatasetArtifacts.open(publisher, artifacts.descriptor.dataset_id) as mapped:
+        assert VerifiedBacktraderFeedAdapter(mapped, **scope) == (
+            VerifiedBacktraderFeedAdapter(artifacts, **scope)
+        )
+
+
+def test_mapped_artifacts_fail_closed(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets")
+    result = publisher.publish(artifacts)
+
+    with pytest.raises(DatasetNotPublished):
+        MappedDatasetArtifacts.open(publisher, "backtest-dataset-" + "0" * 64)
+    with MappedDatasetArtifacts.open(publisher, result.dataset_id) as mapped:
+        with pytest.raises(DatasetArtifactVerificationError):
+            mapped.find(symbol="BTCUSDT", timeframe="1m")
+
+    candles = result.target / "candles.ndjson"
+    descriptor = os.open(candles, os.O_WRONLY)
+    try:
+        os.pwrite(descriptor, b"4", artifacts.candles_ndjson.index(b'"99.5"') + 4)
+    finally:
+        os.close(descriptor)
+    with MappedDatasetArtifacts.open(publisher, result.dataset_id) as mapped:
+        for deep in (False, True):
+            with pytest.raises(DatasetArtifactVerificationError):
+                mapped.verify(deep=deep)
+        with pytest.raises(BacktraderFeedError, match="artifacts_invalid"):
+            VerifiedBacktraderFeedAdapter(
+                mapped,
+                symbol="BTCUSDT",
+                timeframe="1m",
+                period_start=START,
+                period_end=START + timedelta(days=1),
+            )
+
+
+def _anonymous(payload: bytes) -> mmap.mmap:
+    mapping = mmap.mmap(-1, len(payload))
+    mapping.write(payload)
+    mapping.seek(0)
+    return mapping
+
+
+def _rebound(artifacts: DatasetArtifacts, candles: bytes) -> MappedDatasetArtifacts:
+    """Map ``candles`` under a manifest whose checksums were recomputed for them."""
+
+    manifest = json.loads(artifacts.manifest_json)
+    core = {
+        key: value
+        for key, value in manifest.items()
+        if key not in ("artifacts", "dataset_checksum", "dataset_id")
+    }
+    rebound = _manifest_from_core(
+        core, _sha256(candles), artifacts.descriptor.quality_report_checksum
+    )
+    return MappedDatasetArtifacts(
+        candles=_anonymous(candles),
+        quality_report_json=artifacts.quality_report_json,
+        manifest_json=_canonical_json(rebound) + b"\n",
+        descriptor=DatasetDescriptor.from_manifest(rebound),
+    )
+
+
+def test_mapped_artifacts_reject_mismatched_sidecars_and_noncanonical_candles() -> None:
+    artifacts = _artifacts()
+    fields = {
+        "quality_report_json": artifacts.quality_report_json,
+        "manifest_json": artifacts.manifest_json,
+        "descriptor": artifacts.descriptor,
+    }
+    index = DatasetStreamIndex.from_artifacts(artifacts)
+    with _rebound(artifacts, artifacts.candles_ndjson[:-1]) as other:
+        forged = (
+            {**fields, "manifest_json": b"[]\n"},
+            {**fields, "descriptor": other.descriptor},
+            {**fields, "quality_report_json": b"{}\n"},
+            {**fields, "stream_index": index.model_copy(update={"streams": index.streams[1:]})},
+        )
+    for overrides in forged:
+        mapped = MappedDatasetArtifacts(candles=_anonymous(artifacts.candles_ndjson), **overrides)
+        with mapped, pytest.raises(DatasetArtifactVerificationError):
+            mapped.verify(deep=False)
+
+    lines = artifacts.candles_ndjson.splitlines(keepends=True)
+    for candles in (
+        b"".join(lines[:-1]),
+        artifacts.candles_ndjson[:-1],
+        lines[0].replace(b"{", b"{ ", 1) + b"".join(lines[1:]),
+    ):
+        with _rebound(artifacts, candles) as mapped:
+            assert mapped.verify(deep=False) == mapped.descriptor
+            with pytest.raises(DatasetArtifactVerificationError):
+                mapped.verify()
+
+
+def test_mapped_streams_reject_ranges_that_do_not_match_their_lines(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets")
+    publisher.publish(artifacts)
+    with pytest.raises(TypeError):
+        MappedDatasetArtifacts.open(tmp_path, artifacts.descriptor.dataset_id)  # type: ignore[arg-type]
+
+    with MappedDatasetArtifacts.open(publisher, artifacts.descriptor.dataset_id) as mapped:
+        mapped.verify(deep=False)
+        assert mapped.verify() == mapped.verify(deep=False) == artifacts.descriptor
+        stream = mapped.find(symbol="ETHUSDT", timeframe="1m")
+        assert stream is not None
+        assert mapped.find(symbol="ETHUSDT", timeframe=Timeframe.ONE_MINUTE) is stream
+        assert (stream.symbol, stream.timeframe) == ("ETHUSDT", Timeframe.ONE_MINUTE)
+        for update in (
+            {"record_count": stream.range.record_count + 1},
+            {"record_count": stream.range.record_count - 1},
+        ):
+            forged = MappedCandleStream(mapped._candles, stream.range.model_copy(update=update))
+            with pytest.raises(DatasetArtifactVerificationError):
+                forged.line(0)
+
+
+def test_mapped_open_rejects_an_invalid_stream_index(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets", stream_index=True)
+    target = publisher.publish(artifacts).target
+    (target / STREAM_INDEX_FILENAME).write_bytes(b"{}\n")
+
+    with pytest.raises(DatasetStreamIndexError, match="dataset_stream_index_invalid"):
+        MappedDatasetArtifacts.open(publisher, artifacts.descriptor.dataset_id)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.dataset import DatasetArtifacts, Timeframe
+from app.backtesting.dataset_catalog import DatasetCatalog
+from app.backtesting.dataset_retention import (
+    DatasetEvictionReason,
+    DatasetRetention,
+    DatasetRetentionPlan,
+    DatasetRetentionPolicy,
+    main,
+)
+from app.backtesting.dataset_store import (
+    DatasetNotPublished,
+    DatasetPublicationConflict,
+    DatasetPublisher,
+)
+from tests.test_backtesting_dataset_streaming import _candle, _serialize
+
+
+UTC = timezone.utc
+START = datetime(2026, 3, 1, tzinfo=UTC)
+NOW = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+def _artifacts(checksum: str, hours: int) -> DatasetArtifacts:
+    return _serialize(
+        (
+            _candle(index, timeframe=Timeframe.ONE_HOUR, start=START)
+            for index in range(hours)
+        ),
+        source_checksum="sha256:" + checksum * 64,
+    )
+
+
+def _published(tmp_path: Path) -> tuple[
+    DatasetPublisher,
+    DatasetCatalog,
+    tuple[DatasetArtifacts, DatasetArtifacts, DatasetArtifacts],
+]:
+    catalog = DatasetCatalog(tmp_path / "catalog.sqlite3")
+    datasets = (_artifacts("a", 48), _artifacts("b", 24), _artifacts("c", 24))
+    for offset, artifacts in enumerate(datasets):
+        DatasetPublisher(tmp_path / "datasets", sealed=True).publish(artifacts)
+        catalog.record(artifacts.manifest_json)
+        catalog.touch(artifacts.descriptor.dataset_id, NOW - timedelta(days=30 - offset))
+    publisher = DatasetPublisher(tmp_path / "datasets", catalog=catalog, sealed=True)
+    return publisher, catalog, datasets
+
+
+def test_size_budget_evicts_least_recently_used_and_skips_pins(tmp_path: Path) -> None:
+    publisher, catalog, (oldest, middle, newest) = _published(tmp_path)
+    publisher.read(middle.descriptor.dataset_id)
+    catalog.pin(oldest.descriptor.dataset_id, reference="run-7", until=NOW + timedelta(hours=1))
+    usage = {item.dataset_id: item.size_bytes for item in publisher.usage()}
+    budget = usage[oldest.descriptor.dataset_id] + usage[middle.descriptor.dataset_id]
+    retention = DatasetRetention(
+        publisher,
+        catalog,
+        DatasetRetentionPolicy(max_total_bytes=budget),
+    )
+
+    plan = retention.collect(NOW)
+
+    assert [(item.dataset_id, item.reason) for item in plan.evictions] == [
+        (newest.descriptor.dataset_id, DatasetEvictionReason.SIZE)
+    ]
+    assert plan.pinned == (oldest.descriptor.dataset_id,)
+    assert plan.retained_bytes == budget
+    assert publisher.published_ids() == tuple(
+        sorted((oldest.descriptor.dataset_id, middle.descriptor.dataset_id))
+    )
+    assert catalog.get(newest.descriptor.dataset_id) is None
+    assert newest.descriptor.dataset_id not in catalog.last_access()
+    assert not tuple((tmp_path / "datasets").glob(".*.evicted-*"))
+    with pytest.raises(DatasetNotPublished):
+        publisher.read(newest.descriptor.dataset_id)
+    assert retention.collect(NOW).evictions == ()
+
+
+def test_collect_keeps_datasets_pinned_or_read_after_planning(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    publisher, catalog, (oldest, middle, newest) = _published(tmp_path)
+    retention = DatasetRetention(
+        publisher,
+        catalog,
+        DatasetRetentionPolicy(max_idle=timedelta(days=1)),
+    )
+    planned = retention.plan
+
+    def plan_then_race(now: datetime) -> DatasetRetentionPlan:
+        plan = planned(now)
+        catalog.pin(oldest.descriptor.dataset_id, reference="run-9", until=NOW + timedelta(hours=1))
+        publisher.read(middle.descriptor.dataset_id)
+        return plan
+
+    monkeypatch.setattr(retention, "plan", plan_then_race)
+    usage = {item.dataset_id: item.size_bytes for item in publisher.usage()}
+
+    plan = retention.collect(NOW)
+
+    assert [item.dataset_id for item in plan.evictions] == [newest.descriptor.dataset_id]
+    assert plan.pinned == (oldest.descriptor.dataset_id,)
+    assert plan.retained_bytes == (
+        usage[oldest.descriptor.dataset_id] + usage[middle.descriptor.dataset_id]
+    )
+    assert publisher.published_ids() == tuple(
+        sorted((oldest.descriptor.dataset_id, middle.descriptor.dataset_id))
+    )
+    assert catalog.get(middle.descriptor.dataset_id) is not None
+
+
+def _disk_bytes(root: Path) -> int:
+    return sum(
+        path.lstat().st_size for path in root.rglob("*") if not path.is_dir()
+    )
+
+
+def test_shared_blobs_count_once_and_free_only_with_their_last_dataset(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "datasets"
+    catalog = DatasetCatalog(tmp_path / "catalog.sqlite3")
+    publisher = DatasetPublisher(root, catalog=catalog, sealed=True, deduplicate=True)
+    # "b" and "c" hold the same candles, so they share one stream blob.
+    shared_first, shared_second, kept = (
+        _artifacts("b", 24), _artifacts("c", 24), _artifacts("a", 48)
+    )
+    for offset, artifacts in enumerate((shared_first, shared_second, kept)):
+        publisher.publish(artifacts)
+        catalog.touch(artifacts.descriptor.dataset_id, NOW - timedelta(days=30 - offset))
+    usage = {item.dataset_id: item for item in publisher.usage()}
+    first = usage[shared_first.descriptor.dataset_id]
+    second = usage[shared_second.descriptor.dataset_id]
+    (blob,) = first.blobs
+
+    assert first.blobs == second.blobs
+    assert first.shared_bytes == second.shared_bytes == blob[1]
+    assert usage[kept.descriptor.dataset_id].shared_bytes == 0
+    total = _disk_bytes(root)
+    assert sum(item.size_bytes for item in usage.values()) + blob[1] == total
+
+    retention = DatasetRetention(
+        publisher,
+        catalog,
+        DatasetRetentionPolicy(max_total_bytes=usage[kept.descriptor.dataset_id].size_bytes),
+    )
+    plan = retention.plan(NOW)
+
+    assert [(item.dataset_id, item.size_bytes) for item in plan.evictions] == [
+        (first.dataset_id, first.size_bytes),
+        (second.dataset_id, second.size_bytes + blob[1]),
+    ]
+    assert plan.retained_bytes == usage[kept.descriptor.dataset_id].size_bytes
+
+    for path in (root / ".blobs").iterdir():
+        os.utime(path, (0, 0))
+    retention.collect(NOW)
+    assert _disk_bytes(root) == plan.retained_bytes
+
+
+def test_idle_budget_and_expired_pins(tmp_path: Path) -> None:
+    publisher, catalog, (oldest, middle, newest) = _published(tmp_path)
+    catalog.pin(oldest.descriptor.dataset_id, reference="run-1", until=NOW)
+    catalog.pin(middle.descriptor.dataset_id, reference="run-2", until=NOW + timedelta(days=1))
+    retention = DatasetRetention(
+        publisher,
+        catalog,
+        DatasetRetentionPolicy(max_idle=timedelta(days=10)),
+    )
+
+    plan = retention.plan(NOW)
+
+    assert [(item.dataset_id, item.reason) for item in plan.evictions] == [
+        (oldest.descriptor.dataset_id, DatasetEvictionReason.IDLE),
+        (newest.descriptor.dataset_id, DatasetEvictionReason.IDLE),
+    ]
+    assert plan.pinned == (middle.descriptor.dataset_id,)
+    assert len(publisher.published_ids()) == 3
+    catalog.unpin(middle.descriptor.dataset_id, reference="run-2")
+    assert catalog.pinned(NOW) == frozenset()
+
+
+def test_evict_is_idempotent_and_republish_restores_dataset(tmp_path: Path) -> None:
+    publisher, catalog, (oldest, _, _) = _published(tmp_path)
+    dataset_id = oldest.descriptor.dataset_id
+
+    assert publisher.evict(dataset_id) is True
+    assert publisher.evict(dataset_id) is False
+    assert catalog.get(dataset_id) is None
+    assert not (tmp_path / "datasets" / f".{dataset_id}.seal").exists()
+
+    publisher.publish(oldest)
+    assert publisher.read(dataset_id) == oldest
+
+    with pytest.raises(DatasetNotPublished):
+        publisher.evict("../" + dataset_id)
+    stray = "backtest-dataset-" + "0" * 64
+    (tmp_path / "datasets" / stray).write_bytes(b"")
+    with pytest.raises(DatasetPublicationConflict):
+        publisher.evict(stray)
+
+
+def test_cli_dry_run_reports_without_deleting(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    publisher, _, _ = _published(tmp_path)
+
+    assert main(
+        [
+            "--root",
+            str(tmp_path / "datasets"),
+            "--catalog",
+            str(tmp_path / "catalog.sqlite3"),
+            "--max-bytes",
+            "0",
+            "--dry-run",
+        ]
+    ) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["dry_run"] is True
+    assert len(report["evicted"]) == 3
+    assert report["retained_bytes"] == 0
+    assert len(publisher.published_ids()) == 3
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
 import errno
+import gc
 import json
 import os
 import stat
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
 import app.backtesting.dataset_store as dataset_store
-from app.backtesting.contracts import DatasetDescriptor
-from app.backtesting.dataset import DatasetArtifacts, DatasetArtifactVerificationError
+from app.backtesting.contracts import DatasetDescriptor, MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetArtifactVerificationError,
+    DatasetBuilder,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
 from app.backtesting.dataset_store import (
+    DatasetBatchPublicationConflict,
     DatasetPublicationConflict,
     DatasetPublicationStatus,
     DatasetPublisher,
+    _StoredPayloads,
 )
 
 
@@ -65,6 +78,22 @@ def test_publisher_writes_private_exact_artifacts_atomically(tmp_path: Path) ->
     assert not tuple(root.glob(".*.staging-*"))
 
 
+@pytest.mark.parametrize("options", ({}, {"compression": "gzip"}, {"deduplicate": True}))
+def test_publisher_keeps_no_artifacts_or_derived_payloads_after_publishing(
+    tmp_path: Path,
+    options: dict,
+) -> None:
+    publisher = DatasetPublisher(tmp_path / "datasets", sealed=True, **options)
+    artifacts = _artifacts()
+    published = weakref.ref(artifacts)
+    publisher.publish(artifacts)
+    publisher.publish_many((artifacts,))
+    del artifacts
+    gc.collect()
+
+    assert published() is None
+
+
 def test_publisher_is_idempotent_only_for_three_exact_bytes(tmp_path: Path) -> None:
     root = tmp_path / "datasets"
     publisher = DatasetPublisher(root)
@@ -88,12 +117,12 @@ class _DelayExistingObservationPublisher(DatasetPublisher):
         self,
         root_fd: int,
         target_name: str,
-        artifacts: DatasetArtifacts,
+        stored: _StoredPayloads,
     ) -> DatasetPublicationStatus | None:
         self._observation_count += 1
         if self._observation_count <= self._suppressed_observations:
             return None
-        status = super()._existing_status(root_fd, target_name, artifacts)
+        status = super()._existing_status(root_fd, target_name, stored)
         self.exact_existing_observed = status is not None
         return status
 
@@ -1054,3 +1083,253 @@ def test_atomic_no_replace_propagates_native_errno(
 
     assert rejected.value.errno == errno.EEXIST
     assert rejected.value.filename == "target"
+
+
+class _CountingReadsPublisher(DatasetPublisher):
+    def __init__(self, root: Path) -> None:
+        super().__init__(root, sealed=True)
+        self.artifact_reads = 0
+
+    def _read_open_private_file(self, descriptor: int) -> bytes:
+        payload = super()._read_open_private_file(descriptor)
+        if payload in (
+            _artifacts().candles_ndjson,
+            _artifacts().quality_report_json,
+            _artifacts().manifest_json,
+        ):
+            self.artifact_reads += 1
+        return payload
+
+
+def test_sealed_republish_detects_existing_dataset_without_reading_artifacts(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "datasets"
+    first = _CountingReadsPublisher(root)
+    assert first.publish(_artifacts()).status is DatasetPublicationStatus.PUBLISHED
+    seal = root / f".{_artifacts().descriptor.dataset_id}.seal"
+    assert stat.S_IMODE(seal.stat().st_mode) == 0o600
+    assert {item.name for item in _target(root).iterdir()} == _ARTIFACT_NAMES
+
+    again = _CountingReadsPublisher(root)
+    result = again.publish(_artifacts())
+
+    assert result.status is DatasetPublicationStatus.ALREADY_PUBLISHED
+    assert again.artifact_reads == 0
+    assert DatasetPublisher(root).publish(_artifacts()).status is (
+        DatasetPublicationStatus.ALREADY_PUBLISHED
+    )
+
+
+def test_stale_seal_falls_back_to_full_comparison(tmp_path: Path) -> None:
+    root = tmp_path / "datasets"
+    artifacts = _artifacts()
+    DatasetPublisher(root, sealed=True).publish(artifacts)
+    candles = _target(root) / "candles.ndjson"
+    seal = root / f".{artifacts.descriptor.dataset_id}.seal"
+    stale_seal = seal.read_bytes()
+
+    # Same bytes rewritten in place: the seal no longer matches, bytes do.
+    candles.write_bytes(artifacts.candles_ndjson)
+    republished = _CountingReadsPublisher(root)
+    assert republished.publish(artifacts).status is (
+        DatasetPublicationStatus.ALREADY_PUBLISHED
+    )
+    assert republished.artifact_reads == 6
+    assert seal.read_bytes() != stale_seal
+
+    changed = bytearray(artifacts.candles_ndjson)
+    changed[-2] = ord(" ")
+    candles.write_bytes(bytes(changed))
+    with pytest.raises(DatasetPublicationConflict):
+        DatasetPublisher(root, sealed=True).publish(artifacts)
+
+
+@pytest.mark.parametrize(
+    "options",
+    ({"compression": "gzip", "stream_index": True}, {"deduplicate": True}),
+)
+def test_sealed_republish_never_rederives_stored_payloads(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    options: dict,
+) -> None:
+    root = tmp_path / "datasets"
+    artifacts = _artifacts()
+    DatasetPublisher(root, sealed=True, **options).publish(artifacts)
+
+    def underived(*_args: object) -> None:
+        raise AssertionError("stored payloads re-derived")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(dataset_store, "compress_candles", underived)
+        patched.setattr(dataset_store, "split_candles", underived)
+        patched.setattr(dataset_store.DatasetStreamIndex, "from_artifacts", underived)
+        publisher = DatasetPublisher(root, sealed=True, **options)
+        assert publisher.publish(artifacts).status is (
+            DatasetPublicationStatus.ALREADY_PUBLISHED
+        )
+        (result,) = publisher.publish_many((artifacts,))
+        assert result.status is DatasetPublicationStatus.ALREADY_PUBLISHED
+        # A seal written for another storage mode is never trusted.
+        with pytest.raises(DatasetPublicationConflict):
+            DatasetPublisher(root, sealed=True).publish(artifacts)
+
+
+def test_sealed_deduplicated_republish_restores_a_missing_blob(tmp_path: Path) -> None:
+    root = tmp_path / "datasets"
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(root, sealed=True, deduplicate=True)
+    publisher.publish(artifacts)
+    (blob, *_rest) = sorted((root / ".blobs").iterdir())
+    payload = blob.read_bytes()
+    blob.unlink()
+
+    assert publisher.publish(artifacts).status is (
+        DatasetPublicationStatus.ALREADY_PUBLISHED
+    )
+    assert blob.read_bytes() == payload
+    assert publisher.read(artifacts.descriptor.dataset_id) == artifacts
+
+
+def _batch_artifacts(count: int) -> tuple[DatasetArtifacts, ...]:
+    opened = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    batch = []
+    for index in range(count):
+        source = DatasetSourceIdentity(
+            source="paper-fixture",
+            source_schema_version="paper-market-events.v1",
+            source_build_version="paper-exporter.v3",
+            source_checksum="sha256:" + f"{index:x}" * 64,
+            source_network="fake",
+            market_data_venue="fake",
+            market_type=MarketType.PERPETUAL,
+        )
+        record = CandleRecord(
+            source_record_id=f"fake:BTCUSDT:1h:{index}",
+            source_network="fake",
+            market_data_venue="fake",
+            market_type=MarketType.PERPETUAL,
+            symbol="BTCUSDT",
+            timeframe=Timeframe.ONE_HOUR,
+            open_at=opened,
+            close_at=opened + Timeframe.ONE_HOUR.duration,
+            available_at=opened + Timeframe.ONE_HOUR.duration,
+            open="100",
+            high="101",
+            low="99",
+            close="100.5",
+            volume="3",
+        )
+        batch.append(DatasetSerializer.serialize(DatasetBuilder(source).build([record])))
+    return tuple(batch)
+
+
+class _CountingRootFsyncPublisher(DatasetPublisher):
+    def __init__(self, root: Path) -> None:
+        super().__init__(root)
+        self.renames = 0
+
+    def _atomic_rename_no_replace(
+        self,
+        root_fd: int,
+        staging_name: str,
+        target_name: str,
+    ) -> None:
+        self.renames += 1
+        super()._atomic_rename_no_replace(root_fd, staging_name, target_name)
+
+
+def test_publish_many_renames_each_dataset_and_fsyncs_root_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / "datasets"
+    batch = _batch_artifacts(3)
+    DatasetPublisher(root).publish(batch[1])
+    publisher = _CountingRootFsyncPublisher(root)
+    root.mkdir(exist_ok=True)
+    root_identity = (root.stat().st_dev, root.stat().st_ino)
+    root_fsyncs = 0
+    real_fsync = os.fsync
+
+    def counting_fsync(descriptor: int) -> None:
+        nonlocal root_fsyncs
+        metadata = os.fstat(descriptor)
+        if (metadata.st_dev, metadata.st_ino) == root_identity:
+            root_fsyncs += 1
+        real_fsync(descriptor)
+
+    monkeypatch.setattr(dataset_store.os, "fsync", counting_fsync)
+
+    results = publisher.publish_many((*batch, batch[0]))
+
+    assert [result.status for result in results] == [
+        DatasetPublicationStatus.PUBLISHED,
+        DatasetPublicationStatus.ALREADY_PUBLISHED,
+        DatasetPublicationStatus.PUBLISHED,
+        DatasetPublicationStatus.ALREADY_PUBLISHED,
+    ]
+    assert [result.dataset_id for result in results] == [
+        item.descriptor.dataset_id for item in (*batch, batch[0])
+    ]
+    assert publisher.renames == 2
+    assert root_fsyncs == 1
+    assert not tuple(root.glob(".*.staging-*"))
+    for item in batch:
+        target = root / item.descriptor.dataset_id
+        assert (target / "candles.ndjson").read_bytes() == item.candles_ndjson
+
+
+def test_publish_many_raises_conflict_after_publishing_the_rest(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "datasets"
+    batch = _batch_artifacts(3)
+    publisher = DatasetPublisher(root)
+    publisher.publish(batch[1])
+    candles = root / batch[1].descriptor.dataset_id / "candles.ndjson"
+    candles.write_bytes(candles.read_bytes() + b"\n")
+
+    with pytest.raises(DatasetBatchPublicationConflict) as raised:
+        publisher.publish_many((*batch, batch[0]))
+
+    assert isinstance(raised.value, DatasetPublicationConflict)
+    assert raised.value.conflicting_ids == (batch[1].descriptor.dataset_id,)
+    assert [(item.dataset_id, item.status) for item in raised.value.results] == [
+        (batch[0].descriptor.dataset_id, DatasetPublicationStatus.PUBLISHED),
+        (batch[2].descriptor.dataset_id, DatasetPublicationStatus.PUBLISHED),
+        (batch[0].descriptor.dataset_id, DatasetPublicationStatus.ALREADY_PUBLISHED),
+    ]
+    assert candles.read_bytes() == batch[1].candles_ndjson + b"\n"
+    for item in (batch[0], batch[2]):
+        assert publisher.publish(item).status is (
+            DatasetPublicationStatus.ALREADY_PUBLISHED
+        )
+
+
+def test_publish_many_staging_failure_publishes_nothing(tmp_path: Path) -> None:
+    root = tmp_path / "datasets"
+
+    with pytest.raises(OSError):
+        _FailStagingFsyncPublisher(root).publish_many(_batch_artifacts(2))
+
+    assert DatasetPublisher(root).published_ids() == ()
+    assert len(tuple(root.glob(".*.staging-*"))) == 2
+
+
+def test_publish_many_verifies_every_dataset_before_touching_root(
+    tmp_path: Path,
+) -> None:
+    root = tmp_path / "datasets"
+    valid, other = _batch_artifacts(2)
+    corrupt = other.model_copy(
+        update={"candles_ndjson": other.candles_ndjson.replace(b"100.5", b"100.6")}
+    )
+
+    with pytest.raises(DatasetArtifactVerificationError):
+        DatasetPublisher(root).publish_many((valid, corrupt))
+    with pytest.raises(ValueError, match="dataset_publication_workers_invalid"):
+        DatasetPublisher(root).publish_many((valid,), max_workers=0)
+
+    assert not root.exists()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import io
+import itertools
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetBuilder,
+    DatasetBuildRejected,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
+from app.backtesting.dataset_streaming import (
+    StreamingBuildOrderError,
+    StreamingDatasetBuilder,
+)
+
+
+UTC = timezone.utc
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _source(**overrides: object) -> DatasetSourceIdentity:
+    payload: dict[str, object] = {
+        "source": "paper-fixture",
+        "source_schema_version": "paper-market-events.v1",
+        "source_build_version": "paper-exporter.v3",
+        "source_checksum": "sha256:" + "a" * 64,
+        "source_network": "fake",
+        "market_data_venue": "fake",
+        "market_type": MarketType.PERPETUAL,
+    }
+    payload.update(overrides)
+    return DatasetSourceIdentity(**payload)
+
+
+def _candle(
+    index: int,
+    *,
+    symbol: str = "BTCUSDT",
+    timeframe: Timeframe = Timeframe.ONE_MINUTE,
+    start: datetime = START,
+    **overrides: object,
+) -> CandleRecord:
+    opened = start + index * timeframe.duration
+    payload: dict[str, object] = {
+        "source_record_id": f"fake:{symbol}:{timeframe.value}:{index}",
+        "source_network": "fake",
+        "market_data_venue": "fake",
+        "market_type": MarketType.PERPETUAL,
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "open_at": opened,
+        "close_at": opened + timeframe.duration,
+        "available_at": opened + timeframe.duration + timedelta(seconds=index % 3),
+        "open": "100",
+        "high": f"{101 + index % 5}.25",
+        "low": "99.5",
+        "close": "100.75",
+        "volume": str(index % 7),
+    }
+    payload.update(overrides)
+    return CandleRecord(**payload)
+
+
+def _serialize(records: Iterable[CandleRecord], **source: object) -> DatasetArtifacts:
+    """Build and serialize ``records`` under ``_source(**source)``."""
+
+    return DatasetSerializer.serialize(DatasetBuilder(_source(**source)).build(tuple(records)))
+
+
+def _records() -> tuple[CandleRecord, ...]:
+    return (
+        *(_candle(index) for index in range(40)),
+        *(_candle(index, symbol="ETHUSDT") for index in range(25)),
+        *(_candle(index, timeframe=Timeframe.FIVE_MINUTES) for index in range(12)),
+        *(_candle(index, timeframe=Timeframe.ONE_HOUR, symbol="ETHUSDT") for index in range(3)),
+    )
+
+
+def _canonical_order(records: tuple[CandleRecord, ...]) -> tuple[CandleRecord, ...]:
+    return DatasetBuilder(_source()).build(records).records
+
+
+def test_presorted_stream_matches_in_memory_serializer_byte_for_byte() -> None:
+    records = _records()
+    expected = _serialize(records)
+    sink = io.BytesIO()
+
+    build = StreamingDatasetBuilder(_source(), chunk_bytes=512).build(
+        iter(_canonical_order(records)), sink
+    )
+
+    assert sink.getvalue() == expected.candles_ndjson
+    assert build.candles_size == len(expected.candles_ndjson)
+    assert build.candles_checksum == expected.descriptor.candles_checksum
+    assert build.quality_report_json == expected.quality_report_json
+    assert build.manifest_json == expected.manifest_json
+    assert build.descriptor == expected.descriptor
+    assert build.to_artifacts(sink.getvalue()) == expected
+
+
+def test_sink_receives_bounded_chunks() -> None:
+    writes: list[int] = []
+
+    class _Sink:
+        def write(self, payload: bytes) -> int:
+            writes.append(len(payload))
+            return len(payload)
+
+    StreamingDatasetBuilder(_source(), chunk_bytes=1024).build(
+        iter(_canonical_order(_records())), _Sink()
+    )
+
+    assert len(writes) > 5
+    assert max(writes) < 1024 + 1024
+
+
+def test_external_merge_sort_fallback_is_permutation_invariant(tmp_path: Path) -> None:
+    records = _records()
+    expected = _serialize(records)
+    shuffled = tuple(reversed(records[::2])) + records[1::2]
+    sink = io.BytesIO()
+
+    build = StreamingDatasetBuilder(
+        _source(), presorted=False, spill_records=7, spill_directory=tmp_path
+    ).build(iter(shuffled), sink)
+
+    assert sink.getvalue() == expected.candles_ndjson
+    assert build.manifest_json == expected.manifest_json
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_presorted_mode_fails_closed_on_out_of_order_input() -> None:
+    records = _canonical_order(_records())
+    with pytest.raises(StreamingBuildOrderError, match="streaming_build_input_unsorted"):
+        StreamingDatasetBuilder(_source()).build(
+            iter((records[1], records[0], *records[2:])), io.BytesIO()
+        )
+
+
+@pytest.mark.parametrize(
+    "records",
+    (
+        (),
+        (_candle(0), _candle(1), _candle(1)),
+        (_candle(0), _candle(1), _candle(1, close="101")),
+        (_candle(0), _candle(1), _candle(1), _candle(1, close="101")),
+        (_candle(0), _candle(3), _candle(4), _candle(9)),
+        (_candle(0), _candle(1, source_network="other")),
+        (_candle(0, market_data_venue="other"),),
+    ),
+)
+def test_incremental_report_equals_in_memory_analysis(
+    records: tuple[CandleRecord, ...],
+) -> None:
+    expected = DatasetBuilder(_source()).analyze(records)
+    for permutation in itertools.islice(itertools.permutations(records), 6):
+        builder = StreamingDatasetBuilder(_source(), presorted=False, spill_records=2)
+        assert builder.analyze(iter(permutation)) == expected
+        if not expected.eligible:
+            with pytest.raises(DatasetBuildRejected) as rejected:
+                builder.build(iter(permutation), io.BytesIO())
+            assert rejected.value.report == expected
+
+
+def test_builder_rejects_non_records_and_invalid_bounds() -> None:
+    with pytest.raises(TypeError):
+        StreamingDatasetBuilder(_source()).analyze([object()])  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        StreamingDatasetBuilder(_source(), presorted=False).analyze([object()])  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        StreamingDatasetBuilder(object())  # type: ignore[arg-type]
+    for bounds in ({"chunk_bytes": 0}, {"spill_records": 0}, {"chunk_bytes": True}):
+        with pytest.raises(ValueError, match="streaming_build_bounds_invalid"):
+            StreamingDatasetBuilder(_source(), **bounds)  # type: ignore[arg-type]
@@ -16,6 +16,7 @@ from typing import Literal
 import pytest
 from pydantic import ValidationError
 
+from app.backtesting.columnar import ColumnarCandleStore
 from app.backtesting.dataset import (
     CandleRecord,
     DatasetArtifacts,
@@ -25,14 +26,18 @@ from app.backtesting.dataset import (
     Timeframe,
 )
 from app.backtesting.contracts import MarketType
+from app.backtesting.dataset_mapped import MappedDatasetArtifacts
+from app.backtesting.dataset_store import DatasetPublisher
 from app.backtesting.indicator_bridge import (
     BacktestIndicatorBridge,
+    CanonicalIndicatorBatchProjectionRequest,
     CanonicalIndicatorDatasetBinding,
     CanonicalIndicatorProjectionRequest,
     CanonicalIndicatorProjectionResult,
     CanonicalProjectedIndicatorSnapshot,
     IndicatorBridgeError,
     VerifiedIndicatorWindowBuilder,
+    VerifiedIndicatorWindowIndex,
 )
 from app.backtesting.tradingcore_bridge import (
     CanonicalBacktestRuleRequest,
@@ -237,6 +242,139 @@ def test_verified_builder_binds_descriptor_and_selects_exact_freshest_windows(
     assert "4h" not in windows
 
 
+def test_builder_columnar_store_selects_identical_windows() -> None:
+    artifacts = _artifacts()
+    store = ColumnarCandleStore.from_ndjson(artifacts.candles_ndjson)
+    arguments = {
+        "request_id": "projection-columnar",
+        "symbol": "BTCUSDT",
+        "requested_timeframes": ("1m", "5m", "15m", "1h", "4h"),
+        "evaluated_at": EVALUATED_AT,
+        "environment": "test",
+    }
+
+    columnar = VerifiedIndicatorWindowBuilder().build(
+        artifacts, columnar=store, **arguments
+    )
+
+    assert columnar == VerifiedIndicatorWindowBuilder().build(artifacts, **arguments)
+    assert columnar.input_hash() == VerifiedIndicatorWindowBuilder().build(
+        artifacts, **arguments
+    ).input_hash()
+    unbound = ColumnarCandleStore.from_ndjson(_artifacts("hyperliquid", "testnet").candles_ndjson)
+    with pytest.raises(IndicatorBridgeError, match="indicator_bridge_dataset_invalid$"):
+        VerifiedIndicatorWindowBuilder().build(artifacts, columnar=unbound, **arguments)
+
+
+def test_builder_mapped_artifacts_select_identical_windows(tmp_path: Path) -> None:
+    artifacts = _artifacts()
+    publisher = DatasetPublisher(tmp_path / "datasets")
+    publisher.publish(artifacts)
+    arguments = {
+        "request_id": "projection-mapped",
+        "symbol": "BTCUSDT",
+        "requested_timeframes": ("1m", "5m", "15m", "1h", "4h"),
+        "evaluated_at": EVALUATED_AT,
+        "environment": "test",
+    }
+
+    with MappedDatasetArtifacts.open(publisher, artifacts.descriptor.dataset_id) as mapped:
+        request = VerifiedIndicatorWindowBuilder().build(mapped, **arguments)
+        with pytest.raises(IndicatorBridgeError, match="indicator_bridge_dataset_invalid$"):
+            VerifiedIndicatorWindowBuilder().build(
+                mapped,
+                columnar=ColumnarCandleStore.from_ndjson(artifacts.candles_ndjson),
+                **arguments,
+            )
+
+    assert request == VerifiedIndicatorWindowBuilder().build(artifacts, **arguments)
+
+
+def test_builder_window_index_selects_identical_windows_without_reverification(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    artifacts = _artifacts()
+    index = VerifiedIndicatorWindowIndex(artifacts)
+    builder = VerifiedIndicatorWindowBuilder()
+    verified = DatasetSerializer.verified
+    calls: list[DatasetArtifacts] = []
+
+    def counting(cls: type[DatasetSerializer], value: DatasetArtifacts):
+        calls.append(value)
+        return verified(value)
+
+    arguments = {
+        "request_id": "projection-indexed",
+        "symbol": "BTCUSDT",
+        "requested_timeframes": ("1m", "5m", "15m", "1h", "4h"),
+        "environment": "test",
+    }
+    instants = ("2026-02-12T19:59:59.999999Z", EVALUATED_AT, "2026-03-01T00:00:00.000000Z")
+    expected = [builder.build(artifacts, evaluated_at=item, **arguments) for item in instants]
+    monkeypatch.setattr(DatasetSerializer, "verified", classmethod(counting))
+
+    assert [builder.build(index, evaluated_at=item, **arguments) for item in instants] == expected
+    assert builder.build_batch(index, evaluations=instants, **arguments) == builder.build_batch(
+        artifacts, evaluations=instants, **arguments
+    )
+    assert calls == [artifacts]
+    assert index.descriptor == artifacts.descriptor
+    with pytest.raises(IndicatorBridgeError, match="indicator_bridge_window_insufficient$"):
+        builder.build(index, evaluated_at="2026-01-20T00:00:00.000000Z", **arguments)
+    with pytest.raises(IndicatorBridgeError, match="indicator_bridge_dataset_invalid$"):
+        builder.build(
+            index,
+            evaluated_at=EVALUATED_AT,
+            columnar=ColumnarCandleStore.from_ndjson(artifacts.candles_ndjson),
+            **arguments,
+        )
+    with pytest.raises(TypeError, match="indicator_bridge_dataset_artifacts_required$"):
+        VerifiedIndicatorWindowIndex(object())
+
+
+def test_builder_window_index_matches_scan_when_availability_is_not_monotone() -> None:
+    source = DatasetSourceIdentity(
+        source="paper-okx",
+        source_schema_version="paper-public-candles.v2",
+        source_build_version="fixture.v1",
+        source_checksum="sha256:" + "d" * 64,
+        source_network="mainnet",
+        market_data_venue="okx",
+        market_type=MarketType.PERPETUAL,
+    )
+    late = {252: timedelta(minutes=5), 260: timedelta(minutes=1)}
+    records = [
+        _record(
+            "okx",
+            "mainnet",
+            Timeframe.ONE_MINUTE,
+            index,
+            count=270,
+            available_delay=late.get(index, timedelta(0)),
+        )
+        for index in range(270)
+    ]
+    artifacts = DatasetSerializer.serialize(DatasetBuilder(source).build(records))
+    index = VerifiedIndicatorWindowIndex(artifacts)
+    builder = VerifiedIndicatorWindowBuilder()
+    arguments = {
+        "request_id": "projection-late",
+        "symbol": "BTCUSDT",
+        "requested_timeframes": ("1m",),
+        "environment": "test",
+    }
+    start = datetime(2026, 2, 1, tzinfo=UTC)
+    for minute in range(250, 271):
+        evaluated_at = (start + timedelta(minutes=minute)).strftime("%Y-%m-%dT%H:%M:%S.000000Z")
+        try:
+            expected = builder.build(artifacts, evaluated_at=evaluated_at, **arguments)
+        except IndicatorBridgeError as exc:
+            with pytest.raises(IndicatorBridgeError, match=f"{exc}$"):
+                builder.build(index, evaluated_at=evaluated_at, **arguments)
+        else:
+            assert builder.build(index, evaluated_at=evaluated_at, **arguments) == expected
+
+
 def test_builder_verifies_artifacts_before_parsing_or_slicing(monkeypatch: pytest.MonkeyPatch) -> None:
     artifacts = _artifacts()
     observed: list[DatasetArtifacts] = []
@@ -245,7 +383,7 @@ def test_builder_verifies_artifacts_before_parsing_or_slicing(monkeypatch: pytes
         observed.append(value)
         raise RuntimeError("verification-sentinel")
 
-    monkeypatch.setattr(DatasetSerializer, "verify", classmethod(reject_first))
+    monkeypatch.setattr(DatasetSerializer, "verified", classmethod(reject_first))
     with pytest.raises(RuntimeError, match="verification-sentinel"):
         VerifiedIndicatorWindowBuilder().build(
             artifacts,
@@ -906,6 +1044,111 @@ def test_bridge_rejects_well_formed_forged_window_hash(
         BacktestIndicatorBridge((sys.executable, script)).project(request)
 
 
+WALK_FORWARD = (
+    "2026-02-01T04:10:00.000000Z",
+    "2026-02-01T04:12:30.000000Z",
+    "2026-02-01T04:15:00.000000Z",
+)
+
+
+def _batch(**overrides) -> CanonicalIndicatorBatchProjectionRequest:
+    arguments = {
+        "request_id": "walk",
+        "symbol": "BTCUSDT",
+        "requested_timeframes": ("1m",),
+        "evaluations": WALK_FORWARD,
+        "environment": "test",
+        **overrides,
+    }
+    return VerifiedIndicatorWindowBuilder().build_batch(_artifacts(), **arguments)
+
+
+def _batch_result_payload(batch: CanonicalIndicatorBatchProjectionRequest) -> dict:
+    payload = {
+        "schema_version": "canonical-indicator-batch-projection-result.v1",
+        "request_id": batch.request_id,
+        "results": [_result_payload(request) for request in batch.requests()],
+        "input_hash": batch.input_hash(),
+    }
+    payload["result_hash"] = _hash(payload)
+    return payload
+
+
+def test_batch_ships_union_window_once_and_derives_per_timestamp_requests() -> None:
+    artifacts = _artifacts()
+    batch = _batch()
+
+    union = batch.model_dump(mode="json")["candles_by_timeframe"]["1m"]
+    assert len(union) == 255
+    requests = batch.requests()
+    assert [request.request_id for request in requests] == ["walk.0", "walk.1", "walk.2"]
+    for index, (request, evaluated_at) in enumerate(zip(requests, WALK_FORWARD)):
+        single = VerifiedIndicatorWindowBuilder().build(
+            artifacts,
+            request_id=f"walk.{index}",
+            symbol="BTCUSDT",
+            requested_timeframes=("1m",),
+            evaluated_at=evaluated_at,
+            environment="test",
+        )
+        assert request == single
+        assert request.input_hash() == single.input_hash()
+    store = ColumnarCandleStore.from_ndjson(artifacts.candles_ndjson)
+    assert _batch(columnar=store) == batch
+
+
+def test_batch_rejects_unordered_evaluations_and_forged_union_windows() -> None:
+    with pytest.raises(IndicatorBridgeError, match="evaluations_invalid"):
+        _batch(evaluations=WALK_FORWARD[::-1])
+    with pytest.raises(IndicatorBridgeError, match="window_insufficient"):
+        _batch(evaluations=("2026-02-01T04:09:00.000000Z",))
+
+    payload = _batch().model_dump(mode="json")
+    for mutate, reason in (
+        (lambda value: value["evaluations"].reverse(), "evaluations_invalid"),
+        (lambda value: value["evaluations"].append(value["evaluations"][-1]), "evaluations_invalid"),
+        (lambda value: value["candles_by_timeframe"]["1m"].pop(0), "window_count_invalid"),
+        (lambda value: value["evaluations"].pop(0), "batch_window_invalid"),
+        (
+            lambda value: value["candles_by_timeframe"]["1m"][-1].update(
+                available_at="2026-02-01T05:00:00.000000Z"
+            ),
+            "batch_window_invalid",
+        ),
+    ):
+        forged = deepcopy(payload)
+        mutate(forged)
+        with pytest.raises(ValidationError, match=reason):
+            CanonicalIndicatorBatchProjectionRequest.model_validate(forged)
+
+
+def test_bridge_projects_batch_in_one_round_trip_and_binds_each_result(
+    tmp_path: Path,
+) -> None:
+    batch = _batch()
+    payload = _batch_result_payload(batch)
+    script = _script(
+        tmp_path,
+        f"""
+        import json, sys
+        assert sys.argv[-1] == "--batch"
+        json.loads(sys.stdin.buffer.read())
+        print({_canonical_json(payload)!r})
+        """,
+    )
+    results = BacktestIndicatorBridge((sys.executable, script)).project_batch(batch)
+    assert [result.input_hash for result in results] == [
+        request.input_hash() for request in batch.requests()
+    ]
+
+    payload["results"].reverse()
+    payload.pop("result_hash")
+    payload["result_hash"] = _hash(payload)
+    script = _script(tmp_path, f"print({_canonical_json(payload)!r})", name="swapped.py")
+    with pytest.raises(IndicatorBridgeError, match="result_identity_mismatch"):
+        BacktestIndicatorBridge((sys.executable, script)).project_batch(batch)
+
+
 @pytest.mark.parametrize(
     ("venue", "network"),
     [("okx", "mainnet"), ("hyperliquid", "testnet")],
@@ -921,8 +1164,8 @@ def test_real_symfony_projection_is_byte_deterministic_and_rule_compatible(
     request = _golden_request(venue, network)
     bridge = BacktestIndicatorBridge()
     request_bytes = _canonical_json(request.model_dump(mode="json")).encode()
-    first = bridge._run_bounded(request_bytes)
-    second = bridge._run_bounded(request_bytes)
+    first = bridge._run_bounded(bridge.argv, request_bytes)
+    second = bridge._run_bounded(bridge.argv, request_bytes)
     assert first == second
     assert first[0] == 0
     assert first[2] == b""
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import os
+import re
+import stat
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.backtesting import (
+    BacktestIndicatorBridge,
+    IndicatorBridgeError,
+    IndicatorProjectionCache,
+    IndicatorProjectionCacheStats,
+)
+from app.backtesting.indicator_cache import CACHE_DIRECTORY
+from app.backtesting.indicator_bridge import CanonicalIndicatorProjectionResult
+from app.modern_trading_contracts import _canonical_json
+from tests.test_backtesting_indicator_bridge import (
+    _batch,
+    _batch_result_payload,
+    _request,
+    _result_payload,
+    _script,
+)
+
+
+def _counting_script(tmp_path: Path, response: str) -> tuple[str, Path]:
+    counter = tmp_path / "invocations"
+    script = _script(
+        tmp_path,
+        f"""
+        import sys
+        sys.stdin.buffer.read()
+        with open({str(counter)!r}, "a") as handle:
+            handle.write("x")
+        sys.stdout.write({response!r} + "\\n")
+        """,
+    )
+    return script, counter
+
+
+def _invocations(counter: Path) -> int:
+    return len(counter.read_text()) if counter.exists() else 0
+
+
+def _entries(cache: IndicatorProjectionCache) -> list[str]:
+    return sorted(name for name in os.listdir(cache.directory) if not name.startswith("."))
+
+
+def test_rerun_is_answered_from_the_cache_without_a_subprocess(tmp_path: Path) -> None:
+    request = _request()
+    script, counter = _counting_script(tmp_path, _canonical_json(_result_payload(request)))
+    cache = IndicatorProjectionCache(tmp_path / "datasets")
+    bridge = BacktestIndicatorBridge((sys.executable, script), cache=cache)
+
+    first = bridge.project(request)
+    second = bridge.project(request)
+    rebuilt = BacktestIndicatorBridge((sys.executable, script), cache=cache).project(request)
+
+    assert first == second == rebuilt
+    assert _invocations(counter) == 1
+    assert cache.stats() == IndicatorProjectionCacheStats(hits=2, misses=1, stores=1, evictions=0)
+    assert stat.S_IMODE(cache.directory.stat().st_mode) == 0o700
+    (entry,) = _entries(cache)
+    assert entry == f"php_fallback_v1-{request.input_hash().removeprefix('sha256:')}.json"
+    assert stat.S_IMODE((cache.directory / entry).stat().st_mode) == 0o600
+
+
+def test_batch_rerun_skips_the_round_trip_only_when_every_evaluation_hits(
+    tmp_path: Path,
+) -> None:
+    batch = _batch()
+    script, counter = _counting_script(tmp_path, _canonical_json(_batch_result_payload(batch)))
+    cache = IndicatorProjectionCache(tmp_path)
+    bridge = BacktestIndicatorBridge((sys.executable, script), cache=cache)
+
+    results = bridge.project_batch(batch)
+    assert bridge.project_batch(batch) == results
+    assert _invocations(counter) == 1
+    assert len(_entries(cache)) == len(batch.requests())
+
+    os.unlink(cache.directory / _entries(cache)[0])
+    assert bridge.project_batch(batch) == results
+    assert _invocations(counter) == 2
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda path, _request: path.write_bytes(b"{not json"),
+        lambda path, _request: path.write_bytes(
+            re.sub(
+                rb'"result_hash":"sha256:[0-9a-f]{64}"',
+                b'"result_hash":"sha256:' + b"0" * 64 + b'"',
+                path.read_bytes(),
+            )
+        ),
+        lambda path, request: path.write_text(
+            _canonical_json(
+                {**_result_payload(request), "request_id": "projection-forged"}
+            )
+        ),
+        lambda path, _request: path.chmod(0o644),
+    ],
+)
+def test_corrupt_or_rebound_entries_are_discarded_and_recomputed(
+    tmp_path: Path, corrupt
+) -> None:
+    request = _request()
+    script, counter = _counting_script(tmp_path, _canonical_json(_result_payload(request)))
+    cache = IndicatorProjectionCache(tmp_path)
+    bridge = BacktestIndicatorBridge((sys.executable, script), cache=cache)
+    expected = bridge.project(request)
+    (entry,) = _entries(cache)
+    corrupt(cache.directory / entry, request)
+
+    assert cache.get(request) is None
+    assert _entries(cache) == []
+    assert bridge.project(request) == expected
+    assert _invocations(counter) == 2
+
+
+def test_forged_rehashed_result_is_rejected_by_the_request_binding(tmp_path: Path) -> None:
+    request = _request()
+    other = _request(venue="hyperliquid")
+    cache = IndicatorProjectionCache(tmp_path)
+    forged = CanonicalIndicatorProjectionResult.model_validate(_result_payload(other))
+
+    with pytest.raises(IndicatorBridgeError, match="identity_mismatch"):
+        cache.put(request, forged)
+    cache.put(other, forged)
+    name = f"php_fallback_v1-{other.input_hash().removeprefix('sha256:')}.json"
+    os.rename(
+        cache.directory / name,
+        cache.directory / f"php_fallback_v1-{request.input_hash().removeprefix('sha256:')}.json",
+    )
+    assert cache.get(request) is None
+    assert cache.stats().misses == 1
+
+
+def test_least_recently_read_entries_are_evicted_past_the_byte_budget(
+    tmp_path: Path,
+) -> None:
+    requests = _batch().requests()
+    payloads = [
+        CanonicalIndicatorProjectionResult.model_validate(_result_payload(request))
+        for request in requests
+    ]
+    size = len(_canonical_json(payloads[0].model_dump(mode="json")).encode())
+    cache = IndicatorProjectionCache(tmp_path, max_bytes=size * 2 + size // 2)
+    cache.put(requests[0], payloads[0])
+    cache.put(requests[1], payloads[1])
+    entries = {
+        request.request_id: cache.directory / IndicatorProjectionCache._entry_name(request)
+        for request in requests
+    }
+    os.utime(entries[requests[0].request_id], ns=(1, 1))
+    os.utime(entries[requests[1].request_id], ns=(2, 2))
+    assert cache.get(requests[0]) == payloads[0]
+
+    cache.put(requests[2], payloads[2])
+
+    assert entries[requests[0].request_id].exists()
+    assert not entries[requests[1].request_id].exists()
+    assert entries[requests[2].request_id].exists()
+    assert cache.stats().evictions == 1
+    assert IndicatorProjectionCache(tmp_path, max_bytes=0).put(requests[1], payloads[1]) is None
+    assert not entries[requests[1].request_id].exists()
+
+
+def test_puts_under_the_budget_do_not_rescan_the_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requests = _batch().requests()
+    payloads = [
+        CanonicalIndicatorProjectionResult.model_validate(_result_payload(request))
+        for request in requests
+    ]
+    size = len(_canonical_json(payloads[0].model_dump(mode="json")).encode())
+    listed: list[object] = []
+    listdir = os.listdir
+
+    def counting_listdir(path: object) -> list[str]:
+        listed.append(path)
+        return listdir(path)
+
+    monkeypatch.setattr(os, "listdir", counting_listdir)
+    cache = IndicatorProjectionCache(tmp_path, max_bytes=size * 2 + size // 2)
+    cache.put(requests[0], payloads[0])
+    cache.put(requests[1], payloads[1])
+    cache.put(requests[1], payloads[1])
+    assert len(listed) == 1
+
+    cache.put(requests[2], payloads[2])
+    assert len(listed) == 2
+    assert cache.stats().evictions == 1
+    assert len(_entries(cache)) == 2
+
+
+def test_concurrent_writers_of_one_key_leave_a_single_complete_entry(
+    tmp_path: Path,
+) -> None:
+    request = _request()
+    result = CanonicalIndicatorProjectionResult.model_validate(_result_payload(request))
+    barrier = threading.Barrier(8)
+    errors: list[BaseException] = []
+
+    def write() -> None:
+        cache = IndicatorProjectionCache(tmp_path)
+        barrier.wait()
+        try:
+            cache.put(request, result)
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert os.listdir(tmp_path / CACHE_DIRECTORY) == [IndicatorProjectionCache._entry_name(request)]
+    assert IndicatorProjectionCache(tmp_path).get(request) == result
+
+
+def test_cache_rejects_invalid_bounds_unsafe_directories_and_request_types(
+    tmp_path: Path,
+) -> None:
+    for bound in (-1, 1.5, True, "1"):
+        with pytest.raises(ValueError, match="indicator_projection_cache_bounds_invalid"):
+            IndicatorProjectionCache(tmp_path, max_bytes=bound)
+    cache = IndicatorProjectionCache(tmp_path)
+    with pytest.raises(TypeError, match="canonical_indicator_projection_request_required"):
+        cache.get(object())
+    assert cache.get(_request()) is None
+    (tmp_path / CACHE_DIRECTORY).chmod(0o755)
+    with pytest.raises(IndicatorBridgeError, match="indicator_projection_cache_unsafe"):
+        cache.get(_request())
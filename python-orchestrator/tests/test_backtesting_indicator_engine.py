@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetArtifacts,
+    DatasetBuilder,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
+from app.backtesting.indicator_bridge import (
+    BacktestIndicatorBridge,
+    CanonicalIndicatorProjectionRequest,
+    IndicatorBridgeError,
+    VerifiedIndicatorWindowBuilder,
+    _derived_four_hour_records,
+)
+from app.backtesting.indicator_engine import (
+    NATIVE_INDICATOR_ENGINE_VERSION,
+    NativeIndicatorProjector,
+    calculate_indicator_context,
+    indicator_engine_mismatches,
+)
+from app.modern_trading_contracts import _canonical_json, thaw_json
+from tests.test_backtesting_indicator_bridge import (
+    EVALUATED_AT,
+    REPOSITORY,
+    _artifacts,
+    _batch,
+    _decimal,
+    _script,
+)
+
+
+UTC = timezone.utc
+ALL_TIMEFRAMES = ("1m", "5m", "15m", "1h", "4h")
+RANDOM_SEEDS = (7, 191, 2026)
+
+
+# Literal transcription of the php_fallback_v1 methods, one function per PHP
+# method and in PHP's array style, used as the parity oracle when PHP is absent.
+def _php_array_sum(values: list[float]) -> float:
+    total = 0.0
+    for value in values:
+        total += value
+    return total
+
+
+def _php_ema(prices: list[float], period: int) -> float:
+    multiplier = 2.0 / (period + 1.0)
+    ema = prices[0]
+    for price in prices:
+        ema = (price * multiplier) + (ema * (1.0 - multiplier))
+    return ema
+
+
+def _php_ema_series(prices: list[float], period: int) -> list[float]:
+    k = 2 / (period + 1)
+    current = prices[0]
+    series = [current]
+    for price in prices[1:]:
+        current = price * k + current * (1 - k)
+        series.append(current)
+    return series
+
+
+def _php_macd_ema_series(values: list[float], period: int) -> list[float]:
+    if len(values) < period:
+        return []
+    total = 0.0
+    for value in values[:period]:
+        total += value
+    ema = [total / period]
+    alpha = 2.0 / (period + 1.0)
+    for value in values[period:]:
+        ema.append(alpha * value + (1.0 - alpha) * ema[-1])
+    return ema
+
+
+def _php_macd_full(closes: list[float]) -> dict[str, list[float]]:
+    fast = _php_macd_ema_series(closes, 12)[25 - 11 :]
+    slow = _php_macd_ema_series(closes, 26)
+    macd = [fast[index] - slow[index] for index in range(min(len(fast), len(slow)))]
+    signal = _php_macd_ema_series(macd, 9)
+    macd = macd[len(macd) - len(signal) :]
+    return {
+        "macd": macd,
+        "signal": signal,
+        "hist": [macd[index] - signal[index] for index in range(len(macd))],
+    }
+
+
+def _php_rsi(closes: list[float], period: int) -> float:
+    gains = losses = 0.0
+    for index in range(1, period + 1):
+        change = closes[index] - closes[index - 1]
+        if change >= 0.0:
+            gains += change
+        else:
+            losses -= change
+    gain_average, loss_average = gains / period, losses / period
+    for index in range(period + 1, len(closes)):
+        change = closes[index] - closes[index - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        gain_average = ((gain_average * (period - 1)) + gain) / period
+        loss_average = ((loss_average * (period - 1)) + loss) / period
+    strength = math.inf if loss_average == 0.0 else gain_average / loss_average
+    return 100.0 - (100.0 / (1.0 + strength))
+
+
+def _php_true_ranges(highs: list[float], lows: list[float], closes: list[float]) -> list[float]:
+    return [
+        max(
+            highs[index] - lows[index],
+            abs(highs[index] - closes[index - 1]),
+            abs(lows[index] - closes[index - 1]),
+        )
+        for index in range(1, len(closes))
+    ]
+
+
+def _php_atr(highs: list[float], lows: list[float], closes: list[float], period: int) -> float:
+    ranges = _php_true_ranges(highs, lows, closes)
+    atr = _php_array_sum(ranges[:period]) / period
+    for true_range in ranges[period:]:
+        atr = ((atr * (period - 1)) + true_range) / period
+    return atr
+
+
+def _php_adx(highs: list[float], lows: list[float], closes: list[float], period: int) -> float:
+    ranges = _php_true_ranges(highs, lows, closes)
+    plus_dm, minus_dm = [], []
+    for index in range(1, len(closes)):
+        up = highs[index] - highs[index - 1]
+        down = lows[index - 1] - lows[index]
+        plus_dm.append(up if up > down and up > 0.0 else 0.0)
+        minus_dm.append(down if down > up and down > 0.0 else 0.0)
+    atr = _php_array_sum(ranges[:period]) / period
+    plus = _php_array_sum(plus_dm[:period]) / period
+    minus = _php_array_sum(minus_dm[:period]) / period
+    adx = None
+    for index in range(period - 1, len(ranges)):
+        if index >= period:
+            atr = ((atr * (period - 1)) + ranges[index]) / period
+            plus = ((plus * (period - 1)) + plus_dm[index]) / period
+            minus = ((minus * (period - 1)) + minus_dm[index]) / period
+        plus_di = 0.0 if atr == 0.0 else 100.0 * (plus / atr)
+        minus_di = 0.0 if atr == 0.0 else 100.0 * (minus / atr)
+        total = plus_di + minus_di
+        dx = 0.0 if total == 0.0 else 100.0 * abs(plus_di - minus_di) / total
+        adx = dx if adx is None else ((adx * (period - 1)) + dx) / period
+    assert adx is not None
+    return adx
+
+
+def _php_vwap_full(
+    highs: list[float], lows: list[float], closes: list[float], volumes: list[float]
+) -> list[float]:
+    cumulative_pv = cumulative_volume = 0.0
+    vwaps = []
+    for high, low, close, volume in zip(highs, lows, closes, volumes):
+        typical = (high + low + close) / 3.0
+        weight = max(0.0, volume)
+        cumulative_pv += typical * weight
+        cumulative_volume += weight
+        vwaps.append(cumulative_pv / cumulative_volume if cumulative_volume > 0.0 else 0.0)
+    return vwaps
+
+
+def _php_pullback_age(
+    ema9: list[float], ema21: list[float], closes: list[float], vwaps: list[float]
+) -> int | None:
+    count = len(closes)
+    age = 0
+    while age <= 100 and count - 1 - age >= 1:
+        index = count - 1 - age
+        if (ema9[index - 1] <= ema21[index - 1] and ema9[index] > ema21[index]) or (
+            vwaps[index] > 0.0 and abs((closes[index] / vwaps[index]) - 1.0) <= 0.0015
+        ):
+            return age
+        age += 1
+    return None
+
+
+def _php_volume_ratio(volumes: list[float]) -> float | None:
+    history = [volume for volume in volumes[-21:-1] if volume > 0.0]
+    if volumes[-1] <= 0.0 or not history:
+        return None
+    average = _php_array_sum(history) / len(history)
+    return volumes[-1] / average if average > 0.0 else None
+
+
+def _php_reference_context(candles: list[dict]) -> dict:
+    closes = [float(item["close"]) for item in candles]
+    highs = [float(item["high"]) for item in candles]
+    lows = [float(item["low"]) for item in candles]
+    volumes = [float(item["volume"]) for item in candles]
+    timestamps = [
+        int(datetime.fromisoformat(item["open_at"].replace("Z", "+00:00")).timestamp())
+        for item in candles
+    ]
+    window = closes[-20:]
+    middle = _php_array_sum(window) / 20
+    variance = 0.0
+    for close in window:
+        variance += (close - middle) ** 2
+    deviation = math.sqrt(variance / 20)
+    full = _php_macd_full(closes)
+    macd = {
+        "macd": full["macd"][-1],
+        "signal": full["signal"][-1],
+        "hist": full["macd"][-1] - full["signal"][-1],
+    }
+    ema = {str(period): _php_ema(closes, period) for period in (9, 20, 21, 50, 200)}
+    ema_prev = {str(period): _php_ema(closes[:-1], period) for period in (9, 20, 21, 50, 200)}
+    hist = full["hist"][-60:]
+    atr = _php_atr(highs, lows, closes, 14)
+    ma21 = _php_array_sum(closes[-21:]) / 21
+    return {
+        "close": closes[-1],
+        "high_series": highs[-60:],
+        "low_series": lows[-60:],
+        "rsi": _php_rsi(closes, 14),
+        "ema_20": ema["20"],
+        "ema_50": ema["50"],
+        "ema_200": ema["200"],
+        "macd_hist": macd["hist"],
+        "vwap": _php_vwap_full(highs, lows, closes, volumes)[-1],
+        "atr": atr,
+        "adx": {str(period): _php_adx(highs, lows, closes, period) for period in (14, 15)},
+        "ma9": _php_array_sum(closes[-9:]) / 9,
+        "ma21": ma21,
+        "bb_upper": middle + (2.0 * deviation),
+        "bb_middle": middle,
+        "bb_lower": middle - (2.0 * deviation),
+        "ema": ema,
+        "ema_prev": ema_prev,
+        "ema_200_slope": ema["200"] - ema_prev["200"],
+        "ema_200_series": [ema_prev["200"], ema["200"]],
+        "ema_200_series_timestamps": timestamps[-2:],
+        "macd": macd,
+        "macd_hist_series": hist,
+        "macd_hist_series_timestamps": timestamps[-len(hist) :],
+        "macd_line_signal_series": hist,
+        "macd_line_signal_series_timestamps": timestamps[-len(hist) :],
+        "macd_hist_last3": hist[-3:],
+        "series_order": "oldest_to_newest",
+        "series_timestamps": timestamps,
+        "pullback_age_bars": _php_pullback_age(
+            _php_ema_series(closes, 9),
+            _php_ema_series(closes, 21),
+            closes,
+            _php_vwap_full(highs, lows, closes, volumes),
+        ),
+        "volume_ratio": _php_volume_ratio(volumes),
+        "ma_21_plus_k_atr": ma21 + (1.3 * atr),
+    }
+
+
+def _random_artifacts(seed: int) -> DatasetArtifacts:
+    """Random-walk OHLCV with flat runs, zero volumes and sub-cent steps."""
+
+    rng = random.Random(seed)
+    source = DatasetSourceIdentity(
+        source="paper-okx",
+        source_schema_version="paper-public-candles.v2",
+        source_build_version="fixture.v1",
+        source_checksum="sha256:" + "d" * 64,
+        source_network="mainnet",
+        market_data_venue="okx",
+        market_type=MarketType.PERPETUAL,
+    )
+    records: list[CandleRecord] = []
+    for timeframe, count, start in (
+        (Timeframe.ONE_MINUTE, 255, datetime(2026, 2, 12, 15, 0, tzinfo=UTC)),
+        (Timeframe.FIVE_MINUTES, 255, datetime(2026, 2, 11, 22, 45, tzinfo=UTC)),
+        (Timeframe.FIFTEEN_MINUTES, 255, datetime(2026, 2, 10, 0, 15, tzinfo=UTC)),
+        (Timeframe.ONE_HOUR, 1004, datetime(2026, 1, 1, 4, tzinfo=UTC)),
+    ):
+        close = Decimal(rng.choice(("0.0731", "1843.27", "30111.5")))
+        for index in range(count):
+            open_price = close
+            if rng.random() < 0.1:
+                step = Decimal(0)
+            else:
+                step = open_price * Decimal(rng.randint(-300, 300)) / Decimal(100_000)
+            close = max(open_price + step, Decimal("0.0001")).quantize(Decimal("0.0001"))
+            high = max(open_price, close) + Decimal(rng.randint(0, 40)) * close / 10_000
+            low = min(open_price, close) - Decimal(rng.randint(0, 40)) * close / 10_000
+            volume = Decimal(0) if rng.random() < 0.05 else Decimal(rng.randint(1, 90_000)) / 100
+            open_at = start + index * timeframe.duration
+            records.append(
+                CandleRecord(
+                    source_record_id=hashlib.sha256(
+                        f"random-{seed}-{timeframe.value}-{index:05d}".encode()
+                    ).hexdigest(),
+                    source_network="mainnet",
+                    market_data_venue="okx",
+                    market_type=MarketType.PERPETUAL,
+                    symbol="BTCUSDT",
+                    timeframe=timeframe,
+                    open_at=open_at,
+                    close_at=open_at + timeframe.duration,
+                    available_at=open_at + timeframe.duration,
+                    open=_decimal(open_price),
+                    high=_decimal(high.quantize(Decimal("0.00000001"))),
+                    low=_decimal(max(low, Decimal("0.00000001")).quantize(Decimal("0.00000001"))),
+                    close=_decimal(close),
+                    volume=_decimal(volume),
+                    complete=True,
+                )
+            )
+    return DatasetSerializer.serialize(DatasetBuilder(source).build(records))
+
+
+def _native_request(
+    artifacts: DatasetArtifacts | None = None,
+    *,
+    engine: str = NATIVE_INDICATOR_ENGINE_VERSION,
+) -> CanonicalIndicatorProjectionRequest:
+    return VerifiedIndicatorWindowBuilder().build(
+        artifacts if artifacts is not None else _artifacts(),
+        request_id="native-projection",
+        symbol="BTCUSDT",
+        requested_timeframes=ALL_TIMEFRAMES,
+        evaluated_at=EVALUATED_AT,
+        environment="test",
+        indicator_engine_version=engine,
+    )
+
+
+def _windows(request: CanonicalIndicatorProjectionRequest) -> dict[str, list[dict]]:
+    candles = thaw_json(request.candles_by_timeframe)
+    windows = {timeframe: candles[timeframe][-250:] for timeframe in candles}
+    windows["4h"] = _derived_four_hour_records(candles["1h"])
+    return windows
+
+
+@pytest.mark.parametrize("seed", (None, *RANDOM_SEEDS))
+def test_single_pass_engine_matches_the_php_formula_transcription(seed: int | None) -> None:
+    request = _native_request(None if seed is None else _random_artifacts(seed))
+    for timeframe, candles in _windows(request).items():
+        native = calculate_indicator_context(candles)
+        assert _canonical_json(native) == _canonical_json(_php_reference_context(candles)), (
+            timeframe
+        )
+
+
+def test_native_projector_returns_bridge_bound_tagged_results() -> None:
+    request = _native_request()
+    result = NativeIndicatorProjector().project(request)
+
+    assert result.indicator_engine_version == NATIVE_INDICATOR_ENGINE_VERSION
+    assert result.input_hash == request.input_hash()
+    assert tuple(result.snapshots_by_timeframe) == ALL_TIMEFRAMES
+    assert {
+        snapshot["indicator_engine_version"]
+        for snapshot in result.snapshots_by_timeframe.values()
+    } == {NATIVE_INDICATOR_ENGINE_VERSION}
+    BacktestIndicatorBridge._assert_request_binding(request, result)
+    assert NativeIndicatorProjector().project(request) == result
+
+
+def test_engines_only_accept_their_own_requests() -> None:
+    php_request = _native_request(engine="php_fallback_v1")
+    with pytest.raises(IndicatorBridgeError, match="indicator_engine_version_unsupported"):
+        NativeIndicatorProjector().project(php_request)
+    with pytest.raises(IndicatorBridgeError, match="indicator_bridge_engine_unsupported"):
+        BacktestIndicatorBridge(("php",)).project(_native_request())
+    with pytest.raises(TypeError, match="request_required"):
+        NativeIndicatorProjector().project(php_request.model_dump())  # type: ignore[arg-type]
+
+
+def test_native_batch_matches_single_timestamp_projections() -> None:
+    batch = _batch(indicator_engine_version=NATIVE_INDICATOR_ENGINE_VERSION)
+    projector = NativeIndicatorProjector()
+
+    assert projector.project_batch(batch) == tuple(
+        projector.project(request) for request in batch.requests()
+    )
+    with pytest.raises(IndicatorBridgeError, match="engine_unsupported"):
+        BacktestIndicatorBridge(("php",)).project_batch(batch)
+
+
+def test_parity_harness_reports_diverging_timeframes(tmp_path) -> None:
+    request = _native_request(engine="php_fallback_v1")
+    native = NativeIndicatorProjector().project(
+        request.model_copy(update={"indicator_engine_version": NATIVE_INDICATOR_ENGINE_VERSION})
+    )
+
+    def php_stub(name: str, drift: str | None = None) -> BacktestIndicatorBridge:
+        payload = native.model_dump(mode="json")
+        payload["indicator_engine_version"] = "php_fallback_v1"
+        for timeframe, snapshot in payload["snapshots_by_timeframe"].items():
+            snapshot["indicator_engine_version"] = "php_fallback_v1"
+            if timeframe == drift:
+                snapshot["ma9"] = math.nextafter(snapshot["ma9"], math.inf)
+        payload.pop("result_hash")
+        payload["input_hash"] = request.input_hash()
+        payload["result_hash"] = "sha256:" + hashlib.sha256(
+            _canonical_json(payload).encode()
+        ).hexdigest()
+        script = _script(tmp_path, f"print({_canonical_json(payload)!r})", name=name)
+        return BacktestIndicatorBridge((sys.executable, script))
+
+    assert indicator_engine_mismatches(request, bridge=php_stub("same.py")) == ()
+    assert indicator_engine_mismatches(request, bridge=php_stub("drift.py", "15m")) == (
+        "15m",
+    )
+
+
+@pytest.mark.skipif(
+    not (REPOSITORY / "trading-app/vendor/autoload.php").exists(),
+    reason="Symfony dependencies unavailable",
+)
+@pytest.mark.parametrize("seed", (None, *RANDOM_SEEDS))
+def test_native_engine_is_byte_identical_to_real_symfony_projection(seed: int | None) -> None:
+    request = _native_request(
+        None if seed is None else _random_artifacts(seed), engine="php_fallback_v1"
+    )
+    assert indicator_engine_mismatches(request, bridge=BacktestIndicatorBridge()) == ()
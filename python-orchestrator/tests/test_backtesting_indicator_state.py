@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import pytest
+
+from app.backtesting import (
+    IncrementalIndicatorState,
+    IndicatorBridgeError,
+    NativeIndicatorProjector,
+    VerifiedIndicatorWindowBuilder,
+    VerifiedIndicatorWindowIndex,
+)
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import (
+    DatasetBuilder,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
+from app.modern_trading_contracts import _canonical_json, thaw_json
+from tests.test_backtesting_indicator_bridge import _artifacts, _record
+
+
+STREAM_LENGTH = 320
+
+
+def _stream():
+    source = DatasetSourceIdentity(
+        source="paper-okx",
+        source_schema_version="paper-public-candles.v2",
+        source_build_version="fixture.v1",
+        source_checksum="sha256:" + "d" * 64,
+        source_network="mainnet",
+        market_data_venue="okx",
+        market_type=MarketType.PERPETUAL,
+    )
+    records = [
+        _record("okx", "mainnet", Timeframe.ONE_MINUTE, index, count=STREAM_LENGTH)
+        for index in range(STREAM_LENGTH)
+    ]
+    artifacts = DatasetSerializer.serialize(DatasetBuilder(source).build(records))
+    return VerifiedIndicatorWindowIndex(artifacts), records
+
+
+def _request(index: VerifiedIndicatorWindowIndex, evaluated_at, **overrides):
+    arguments = {
+        "request_id": "replay",
+        "symbol": "BTCUSDT",
+        "requested_timeframes": ("1m",),
+        "evaluated_at": evaluated_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "environment": "test",
+        "indicator_engine_version": "python_native_v1",
+        **overrides,
+    }
+    return VerifiedIndicatorWindowBuilder().build(index, **arguments)
+
+
+def _projected(request) -> str:
+    result = NativeIndicatorProjector().project(request)
+    return _canonical_json(thaw_json(result.snapshots_by_timeframe["1m"]))
+
+
+def test_pushed_candles_match_full_window_projection_at_every_bar() -> None:
+    index, records = _stream()
+    state = IncrementalIndicatorState(
+        _request(index, records[249].close_at), "1m", checkpoint_interval=7
+    )
+    assert _canonical_json(state.snapshot()) == _projected(_request(index, records[249].close_at))
+
+    for record in records[250:]:
+        state.push(record)
+        assert state.kline_time == VerifiedIndicatorWindowBuilder._canonical_record(record)[
+            "open_at"
+        ]
+        assert _canonical_json(state.snapshot()) == _projected(_request(index, record.close_at))
+
+
+def test_push_rejects_gaps_foreign_streams_and_non_records() -> None:
+    index, records = _stream()
+    state = IncrementalIndicatorState(_request(index, records[260].close_at), "1m")
+
+    with pytest.raises(IndicatorBridgeError, match="indicator_state_chronology_invalid$"):
+        state.push(records[262])
+    with pytest.raises(IndicatorBridgeError, match="indicator_state_chronology_invalid$"):
+        state.push(records[260])
+    foreign = _record(
+        "hyperliquid", "mainnet", Timeframe.ONE_MINUTE, 261, count=STREAM_LENGTH
+    )
+    with pytest.raises(IndicatorBridgeError, match="indicator_state_stream_mismatch$"):
+        state.push(foreign)
+    with pytest.raises(TypeError, match="candle_record_required$"):
+        state.push(records[261].model_dump())
+    state.push(records[261])
+    assert state.kline_time == IncrementalIndicatorState(
+        _request(index, records[261].close_at), "1m"
+    ).kline_time
+
+
+def test_checkpoint_fails_closed_when_prepared_columns_drift() -> None:
+    index, records = _stream()
+    state = IncrementalIndicatorState(
+        _request(index, records[249].close_at), "1m", checkpoint_interval=2
+    )
+    state.push(records[250])
+    state._closes[-1] += 1e-9
+
+    with pytest.raises(IndicatorBridgeError, match="indicator_state_checkpoint_mismatch$"):
+        state.push(records[251])
+
+
+def test_state_requires_a_native_request_for_a_native_requested_timeframe() -> None:
+    index, records = _stream()
+    evaluated_at = records[260].close_at
+
+    with pytest.raises(IndicatorBridgeError, match="indicator_engine_version_unsupported$"):
+        IncrementalIndicatorState(
+            _request(index, evaluated_at, indicator_engine_version="php_fallback_v1"), "1m"
+        )
+    with pytest.raises(IndicatorBridgeError, match="indicator_state_timeframe_unsupported$"):
+        IncrementalIndicatorState(_request(index, evaluated_at), "5m")
+    hourly = VerifiedIndicatorWindowBuilder().build(
+        _artifacts(),
+        request_id="replay",
+        symbol="BTCUSDT",
+        requested_timeframes=("4h",),
+        evaluated_at="2026-02-12T20:00:00.000000Z",
+        environment="test",
+        indicator_engine_version="python_native_v1",
+    )
+    with pytest.raises(IndicatorBridgeError, match="indicator_state_timeframe_unsupported$"):
+        IncrementalIndicatorState(hourly, "4h")
+    for interval in (0, -1, 1.5, True):
+        with pytest.raises(ValueError, match="indicator_state_checkpoint_interval_invalid$"):
+            IncrementalIndicatorState(
+                _request(index, evaluated_at), "1m", checkpoint_interval=interval
+            )
+    with pytest.raises(TypeError, match="canonical_indicator_projection_request_required$"):
+        IncrementalIndicatorState(object(), "1m")
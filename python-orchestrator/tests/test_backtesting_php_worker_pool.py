@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.backtesting import php_worker_pool
+from app.backtesting.php_worker_pool import PhpWorkerError, PhpWorkerPool
+from app.backtesting.tradingcore_bridge import (
+    BacktestTradingCoreBridge,
+    CanonicalBacktestRuleRequest,
+    TradingCoreBridgeError,
+)
+from app.modern_trading_contracts import _canonical_json
+from tests.test_backtesting_tradingcore_bridge import request_payload, result_payload
+
+
+FAKE_WORKER = """
+import os, struct, sys, time
+assert sys.argv[-1] == "--worker"
+stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+while header := stdin.read(4):
+    payload = stdin.read(struct.unpack(">I", header)[0])
+    if payload == b"sleep":
+        time.sleep(5)
+    if payload == b"nap":
+        time.sleep(0.3)
+    if payload == b"exit":
+        sys.exit(3)
+    if payload == b"noisy":
+        sys.stderr.buffer.write(b"e" * 2000)
+        sys.stderr.flush()
+        time.sleep(0.2)
+    body = b"x" * 10000 if payload == b"big" else str(os.getpid()).encode() + b":" + payload
+    frame = struct.pack(">IB", len(body), 7 if payload == b"fail" else 0) + body
+    if payload == b"split":
+        stdout.write(frame[:2])
+        stdout.flush()
+        time.sleep(0.05)
+        frame = frame[2:]
+    if payload == b"trailing":
+        frame += b"garbage"
+    stdout.write(frame)
+    stdout.flush()
+    if payload == b"bye":
+        sys.exit(0)
+"""
+
+
+def worker_script(tmp_path: Path, source: str = FAKE_WORKER) -> tuple[str, ...]:
+    path = tmp_path / "worker.py"
+    path.write_text("#!/usr/bin/env python3\n" + textwrap.dedent(source))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return (sys.executable, str(path))
+
+
+def _request(pool: PhpWorkerPool, argv: tuple[str, ...], payload: bytes) -> tuple[int, bytes]:
+    return pool.request(argv, payload, timeout_seconds=2, max_output_bytes=1000)
+
+
+def test_pool_reuses_one_worker_and_keeps_exit_codes(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    with PhpWorkerPool() as pool:
+        first = _request(pool, argv, b"a")
+        second = _request(pool, argv, b"b")
+        failed = _request(pool, argv, b"fail")
+
+    assert first[0] == 0 and first[1].endswith(b":a")
+    pid = first[1].split(b":")[0]
+    assert second == (0, pid + b":b")
+    assert failed == (7, pid + b":fail")
+
+
+def test_pool_kills_failed_workers_and_respawns(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    with PhpWorkerPool() as pool:
+        pid = _request(pool, argv, b"a")[1].split(b":")[0]
+        with pytest.raises(PhpWorkerError, match="timeout"):
+            pool.request(argv, b"sleep", timeout_seconds=0.1, max_output_bytes=1000)
+        with pytest.raises(PhpWorkerError, match="output_too_large"):
+            _request(pool, argv, b"big")
+        with pytest.raises(PhpWorkerError, match="process_failed"):
+            _request(pool, argv, b"exit")
+        respawned = _request(pool, argv, b"a")[1].split(b":")[0]
+
+    assert respawned != pid
+
+
+def test_pool_rejects_garbled_frames_and_stderr_floods(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    with PhpWorkerPool() as pool:
+        assert _request(pool, argv, b"split")[1].endswith(b":split")
+        with pytest.raises(PhpWorkerError, match="process_failed"):
+            _request(pool, argv, b"trailing")
+        with pytest.raises(PhpWorkerError, match="output_too_large"):
+            _request(pool, argv, b"noisy")
+        assert _request(pool, argv, b"a")[1].endswith(b":a")
+
+    class _Oversized(bytes):
+        def __len__(self) -> int:
+            return 0x1_0000_0000
+
+    with pytest.raises(PhpWorkerError, match="process_failed"):
+        _request(PhpWorkerPool(), argv, _Oversized(b"a"))
+
+
+def test_pool_answers_before_reading_the_whole_request_fails(tmp_path: Path) -> None:
+    argv = worker_script(
+        tmp_path,
+        """
+        import struct, sys
+        stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+        stdin.read(4)
+        stdout.write(struct.pack(">IB", 2, 0) + b"ok")
+        stdout.flush()
+        stdin.read()
+        """,
+    )
+    with PhpWorkerPool() as pool, pytest.raises(PhpWorkerError, match="process_failed"):
+        _request(pool, argv, b"a" * 1_000_000)
+
+
+def test_pool_retries_would_block_pipes_and_fails_broken_ones(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    argv = worker_script(tmp_path)
+    real_read, real_write = os.read, os.write
+    failures: dict[str, list[type[OSError]]] = {"read": [], "write": []}
+
+    def flaky(name: str, call):
+        def wrapper(fd: int, *args):
+            # Only the pool's exchange loop fails; Popen's own pipes stay real.
+            if failures[name] and sys._getframe(1).f_code.co_name == "exchange":
+                raise failures[name].pop(0)()
+            return call(fd, *args)
+
+        return wrapper
+
+    monkeypatch.setattr(php_worker_pool.os, "read", flaky("read", real_read))
+    monkeypatch.setattr(php_worker_pool.os, "write", flaky("write", real_write))
+    with PhpWorkerPool() as pool:
+        failures.update(read=[BlockingIOError], write=[BlockingIOError])
+        pid = _request(pool, argv, b"a")[1].split(b":")[0]
+        failures["write"] = [BrokenPipeError]
+        with pytest.raises(PhpWorkerError, match="process_failed"):
+            _request(pool, argv, b"a")
+        failures["read"] = [ConnectionResetError]
+        with pytest.raises(PhpWorkerError, match="process_failed"):
+            _request(pool, argv, b"a")
+        respawned = _request(pool, argv, b"a")[1].split(b":")[0]
+
+    assert respawned != pid
+
+
+def test_pool_replaces_idle_workers_that_died(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    with PhpWorkerPool() as pool:
+        pid = _request(pool, argv, b"bye")[1].split(b":")[0]
+        time.sleep(0.2)
+        respawned = _request(pool, argv, b"a")[1].split(b":")[0]
+
+    assert respawned != pid
+
+
+def test_pool_waits_for_a_busy_worker_within_the_deadline(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    with PhpWorkerPool(max_workers=1) as pool:
+        busy = threading.Thread(target=_request, args=(pool, argv, b"nap"))
+        busy.start()
+        time.sleep(0.1)
+        with pytest.raises(PhpWorkerError, match="timeout"):
+            pool.request(argv, b"a", timeout_seconds=0.05, max_output_bytes=1000)
+        assert _request(pool, argv, b"a")[1].endswith(b":a")
+        busy.join()
+
+
+def test_pool_retires_busy_workers_once_closed(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    pool = PhpWorkerPool(max_workers=2)
+    outcomes: list[object] = []
+
+    def run(payload: bytes, timeout: float) -> None:
+        try:
+            outcomes.append(
+                pool.request(argv, payload, timeout_seconds=timeout, max_output_bytes=1000)
+            )
+        except PhpWorkerError as exc:
+            outcomes.append(exc.reason)
+
+    threads = [
+        threading.Thread(target=run, args=(b"nap", 2)),
+        threading.Thread(target=run, args=(b"sleep", 0.4)),
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    pool.close()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(map(type, outcomes), key=str) == [str, tuple]
+    assert "timeout" in outcomes
+    with pytest.raises(PhpWorkerError, match="process_unavailable"):
+        _request(pool, argv, b"a")
+
+
+def test_pool_kills_workers_that_outlive_retirement(tmp_path: Path) -> None:
+    argv = worker_script(
+        tmp_path,
+        """
+        import os, signal, struct, sys, time
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+        stdin.read(struct.unpack(">I", stdin.read(4))[0])
+        stdout.write(struct.pack(">IB", 2, 0) + b"ok")
+        stdout.flush()
+        time.sleep(30)
+        """,
+    )
+    started = time.monotonic()
+    with PhpWorkerPool(max_requests=1) as pool:
+        assert _request(pool, argv, b"a") == (0, b"ok")
+
+    assert time.monotonic() - started < 10
+
+
+def test_pool_retires_workers_whose_streams_fail_to_close(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+
+    class _Unclosable:
+        def close(self) -> None:
+            raise OSError("close failed")
+
+    pool = PhpWorkerPool()
+    _request(pool, argv, b"a")
+    (worker,) = [worker for workers in pool._idle.values() for worker in workers]
+    stdin = worker._process.stdin
+    worker._process.stdin = _Unclosable()
+    pool.close()
+
+    assert worker.alive() is False
+    stdin.close()
+
+
+def test_pool_recycles_workers_after_max_requests(tmp_path: Path) -> None:
+    argv = worker_script(tmp_path)
+    with PhpWorkerPool(max_requests=2) as pool:
+        pids = [_request(pool, argv, b"a")[1].split(b":")[0] for _ in range(4)]
+
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+
+
+def test_pool_rejects_missing_executable_unbounded_limits_and_closed_use(
+    tmp_path: Path,
+) -> None:
+    pool = PhpWorkerPool()
+    with pytest.raises(PhpWorkerError, match="process_unavailable"):
+        _request(pool, (str(tmp_path / "missing"),), b"a")
+    for timeout, limit in ((float("nan"), 10), (True, 10), (1.0, 0), (1.0, 1.5)):
+        with pytest.raises(ValueError, match="bounds_invalid"):
+            pool.request(("php",), b"a", timeout_seconds=timeout, max_output_bytes=limit)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="bounds_invalid"):
+        PhpWorkerPool(max_workers=0)
+    pool.close()
+    with pytest.raises(PhpWorkerError, match="process_unavailable"):
+        _request(pool, worker_script(tmp_path), b"a")
+
+
+def test_bridge_evaluates_through_the_pool_and_maps_failures(tmp_path: Path) -> None:
+    request = CanonicalBacktestRuleRequest.model_validate(request_payload())
+    response = (_canonical_json(result_payload(request)) + "\n").encode()
+    argv = worker_script(
+        tmp_path,
+        f"""
+        import struct, sys
+        stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+        while header := stdin.read(4):
+            stdin.read(struct.unpack(">I", header)[0])
+            stdout.write(struct.pack(">IB", {len(response)}, 0) + {response!r})
+            stdout.flush()
+        """,
+    )
+    with PhpWorkerPool() as pool:
+        bridge = BacktestTradingCoreBridge(argv, worker_pool=pool)
+        assert bridge.evaluate(request).input_hash == request.input_hash()
+        assert bridge.evaluate(request).input_hash == request.input_hash()
+        with pytest.raises(TradingCoreBridgeError, match="tradingcore_bridge_output_too_large"):
+            BacktestTradingCoreBridge(argv, max_output_bytes=100, worker_pool=pool).evaluate(
+                request
+            )
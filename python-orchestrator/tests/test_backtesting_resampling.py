@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.backtesting.columnar import ColumnarCandleStream
+from app.backtesting.contracts import MarketType
+from app.backtesting.dataset import (
+    CandleRecord,
+    DatasetBuilder,
+    DatasetSerializer,
+    DatasetSourceIdentity,
+    Timeframe,
+)
+from app.backtesting.resampling import ResamplingError, TimeframeResampler
+
+
+UTC = timezone.utc
+
+
+def _source() -> DatasetSourceIdentity:
+    return DatasetSourceIdentity(
+        source="paper-fixture",
+        source_schema_version="paper-market-events.v1",
+        source_build_version="paper-exporter.v3",
+        source_checksum="sha256:" + "a" * 64,
+        source_network="fake",
+        market_data_venue="fake",
+        market_type=MarketType.PERPETUAL,
+    )
+
+
+def _minute(index: int, *, symbol: str = "BTCUSDT", **overrides: object) -> CandleRecord:
+    opened = datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=index)
+    payload: dict[str, object] = {
+        "source_record_id": f"fake:{symbol}:1m:{index}",
+        "source_network": "fake",
+        "market_data_venue": "fake",
+        "market_type": MarketType.PERPETUAL,
+        "symbol": symbol,
+        "timeframe": Timeframe.ONE_MINUTE,
+        "open_at": opened,
+        "close_at": opened + timedelta(minutes=1),
+        "available_at": opened + timedelta(minutes=1, seconds=(index * 7) % 5),
+        "open": f"{100 + index % 3}.5",
+        "high": f"{103 + index % 11}.125",
+        "low": f"9{index % 10}.05",
+        "close": f"{101 + index % 2}",
+        "volume": f"{index % 13}.{index % 4 + 1}",
+    }
+    payload.update(overrides)
+    return CandleRecord(**payload)
+
+
+def _reference(components: list[CandleRecord]) -> dict[str, object]:
+    def render(value: Decimal) -> str:
+        rendered = format(value, "f")
+        if "." in rendered:
+            rendered = rendered.rstrip("0").rstrip(".")
+        return rendered or "0"
+
+    return {
+        "open_at": components[0].open_at,
+        "close_at": components[-1].close_at,
+        "available_at": max(item.available_at for item in components),
+        "open": components[0].open,
+        "high": render(max(Decimal(item.high) for item in components)),
+        "low": render(min(Decimal(item.low) for item in components)),
+        "close": components[-1].close,
+        "volume": render(sum(Decimal(item.volume) for item in components)),
+    }
+
+
+@pytest.mark.parametrize(
+    "timeframe",
+    (
+        Timeframe.FIVE_MINUTES,
+        Timeframe.FIFTEEN_MINUTES,
+        Timeframe.ONE_HOUR,
+        Timeframe.FOUR_HOURS,
+    ),
+)
+def test_resample_matches_decimal_reference_with_lineage(timeframe: Timeframe) -> None:
+    minutes = [_minute(index) for index in range(480)]
+    stream = ColumnarCandleStream.from_records(minutes)
+
+    resampled = TimeframeResampler().resample(stream, timeframe)
+
+    width = timeframe.duration_seconds // 60
+    assert resampled is not None
+    assert len(resampled) == 480 // width
+    for bucket, record in enumerate(resampled.records()):
+        components = minutes[bucket * width : (bucket + 1) * width]
+        assert record.timeframe is timeframe
+        assert {
+            name: getattr(record, name) for name in _reference(components)
+        } == _reference(components)
+        assert resampled.component_source_record_ids[bucket] == tuple(
+            item.source_record_id for item in components
+        )
+
+
+def test_incomplete_and_misaligned_buckets_are_dropped() -> None:
+    minutes = [_minute(index) for index in (*range(3, 15), *range(16, 27))]
+
+    resampled = TimeframeResampler().resample(
+        ColumnarCandleStream.from_records(minutes), Timeframe.FIVE_MINUTES
+    )
+
+    assert resampled is not None
+    assert [record.open_at.minute for record in resampled.records()] == [5, 10, 20]
+    assert TimeframeResampler().resample(
+        ColumnarCandleStream.from_records(minutes[:2]), Timeframe.FIVE_MINUTES
+    ) is None
+
+
+def test_derived_records_are_dataset_builder_input() -> None:
+    minutes = tuple(
+        [_minute(index) for index in range(60)]
+        + [_minute(index, symbol="ETHUSDT") for index in range(30)]
+    )
+
+    derived = TimeframeResampler().derive(
+        reversed(minutes), (Timeframe.FIVE_MINUTES, Timeframe.FIFTEEN_MINUTES, "1h")
+    )
+    artifacts = DatasetSerializer.serialize(DatasetBuilder(_source()).build(derived))
+
+    assert [
+        (item.symbol, item.timeframe, item.record_count)
+        for item in artifacts.descriptor.streams
+    ] == [
+        ("BTCUSDT", "1m", 60),
+        ("BTCUSDT", "5m", 12),
+        ("BTCUSDT", "15m", 4),
+        ("BTCUSDT", "1h", 1),
+        ("ETHUSDT", "1m", 30),
+        ("ETHUSDT", "5m", 6),
+        ("ETHUSDT", "15m", 2),
+    ]
+    assert artifacts == DatasetSerializer.serialize(
+        DatasetBuilder(_source()).build(
+            TimeframeResampler().derive(
+                minutes,
+                (Timeframe.ONE_HOUR, Timeframe.FIFTEEN_MINUTES, Timeframe.FIVE_MINUTES),
+            )
+        )
+    )
+    assert len({item.source_record_id for item in derived}) == len(derived)
+
+
+def test_derive_uses_finest_stream_and_keeps_native_targets() -> None:
+    minutes = [_minute(index) for index in range(60)]
+    resampler = TimeframeResampler()
+    five = resampler.resample(
+        ColumnarCandleStream.from_records(minutes), Timeframe.FIVE_MINUTES
+    )
+    hour = resampler.resample(
+        ColumnarCandleStream.from_records(minutes), Timeframe.ONE_HOUR
+    )
+    assert five is not None and hour is not None
+    native_five = tuple(five.records())
+    native_hour = tuple(hour.records())
+
+    derived = resampler.derive(
+        (*native_hour, *native_five, *minutes),
+        (Timeframe.FIFTEEN_MINUTES, Timeframe.ONE_HOUR),
+    )
+    extra = derived[len(minutes) + len(native_five) + len(native_hour) :]
+
+    assert [item.timeframe for item in extra] == [Timeframe.FIFTEEN_MINUTES] * 4
+    fifteen = resampler.resample(
+        ColumnarCandleStream.from_records(minutes), Timeframe.FIFTEEN_MINUTES
+    )
+    assert fifteen is not None
+    assert extra == tuple(fifteen.records())
+    assert [item.timeframe for item in derived].count(Timeframe.ONE_HOUR) == 1
+    assert resampler.derive(
+        (*native_five, *native_hour), ("15m", "1h"), include_source=False
+    ) == tuple(
+        resampler.resample(
+            ColumnarCandleStream.from_records(native_five), Timeframe.FIFTEEN_MINUTES
+        ).records()  # type: ignore[union-attr]
+    )
+    DatasetBuilder(_source()).build(derived)
+
+
+def test_derive_rejects_invalid_targets() -> None:
+    with pytest.raises(ResamplingError) as rejected:
+        TimeframeResampler().derive([_minute(0)], ("5m", "2m"))
+    assert rejected.value.reason_code == "resample_timeframe_invalid"
+    with pytest.raises(TypeError):
+        TimeframeResampler().derive([object()], ("5m",))  # type: ignore[list-item]
+
+
+def test_resampler_rejects_invalid_targets_and_unordered_streams() -> None:
+    stream = ColumnarCandleStream.from_records(
+        [_minute(index) for index in range(10)]
+    )
+    for timeframe in ("1m", "2m"):
+        with pytest.raises(ResamplingError) as rejected:
+            TimeframeResampler().resample(stream, timeframe)
+        assert rejected.value.reason_code == "resample_timeframe_invalid"
+    with pytest.raises(ResamplingError, match="resample_stream_unsorted"):
+        TimeframeResampler().resample(
+            ColumnarCandleStream.from_records([_minute(1), _minute(0)]),
+            Timeframe.FIVE_MINUTES,
+        )
+    with pytest.raises(TypeError):
+        TimeframeResampler().resample(object(), Timeframe.FIVE_MINUTES)  # type: ignore[arg-type]
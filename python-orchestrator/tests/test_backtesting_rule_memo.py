@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.backtesting import (
+    BacktestTradingCoreBridge,
+    CanonicalBacktestRuleResult,
+    RuleResultMemo,
+    RuleResultMemoStats,
+    TradingCoreBridgeError,
+)
+from app.backtesting.rule_memo import MEMO_DIRECTORY
+from app.modern_trading_contracts import _canonical_json
+from tests.test_backtesting_tradingcore_bridge import (
+    batch_requests,
+    executable_script,
+    result_payload,
+)
+
+
+def _counting_script(tmp_path: Path, response: str) -> tuple[str, Path]:
+    counter = tmp_path / "invocations"
+    script = executable_script(
+        f"""
+        import sys
+        sys.stdin.buffer.read()
+        with open({str(counter)!r}, "a") as handle:
+            handle.write("x")
+        sys.stdout.write({response!r} + "\\n")
+        """,
+        tmp_path,
+    )
+    return script, counter
+
+
+def _batch_counting_script(tmp_path: Path, results: dict[str, dict]) -> tuple[str, Path]:
+    """Answer ``--batch`` calls from ``results`` and log each shipped request id."""
+
+    shipped = tmp_path / "shipped"
+    script = executable_script(
+        f"""
+        import hashlib, json, sys
+        sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})
+        from app.modern_trading_contracts import _canonical_json
+        payload = sys.stdin.buffer.read()
+        request = json.loads(payload)
+        results = json.loads({json.dumps(results)!r})
+        ids = [item["request_id"] for item in request["evaluations"]]
+        with open({str(shipped)!r}, "a") as handle:
+            handle.write(",".join(ids) + "\\n")
+        result = {{
+            "schema_version": "canonical-backtest-rule-batch-result.v1",
+            "request_id": request["request_id"],
+            "outcomes": [{{"status": "evaluated", "result": results[id]}} for id in ids],
+            "input_hash": "sha256:" + hashlib.sha256(payload).hexdigest(),
+        }}
+        result["result_hash"] = "sha256:" + hashlib.sha256(
+            _canonical_json(result).encode()
+        ).hexdigest()
+        print(_canonical_json(result))
+        """,
+        tmp_path,
+    )
+    return script, shipped
+
+
+def _invocations(counter: Path) -> int:
+    return len(counter.read_text()) if counter.exists() else 0
+
+
+def test_repeated_requests_are_answered_without_a_subprocess(tmp_path: Path) -> None:
+    (request,) = batch_requests("BTCUSDT")
+    script, counter = _counting_script(tmp_path, _canonical_json(result_payload(request)))
+    memo = RuleResultMemo()
+    bridge = BacktestTradingCoreBridge((sys.executable, script), memo=memo)
+
+    first = bridge.evaluate(request)
+    for _ in range(3):
+        assert bridge.evaluate(request) == first
+
+    assert _invocations(counter) == 1
+    assert memo.stats() == RuleResultMemoStats(
+        hits=3, disk_hits=0, misses=1, stores=1, memory_evictions=0, disk_evictions=0
+    )
+    assert memo.directory is None
+
+
+def test_disk_entries_survive_the_process_and_are_keyed_by_engine_version(
+    tmp_path: Path,
+) -> None:
+    (request,) = batch_requests("BTCUSDT")
+    script, _ = _counting_script(tmp_path, _canonical_json(result_payload(request)))
+    root = tmp_path / "memo"
+    expected = BacktestTradingCoreBridge(
+        (sys.executable, script), memo=RuleResultMemo(root)
+    ).evaluate(request)
+    (entry,) = os.listdir(root / MEMO_DIRECTORY)
+    assert entry == (
+        f"{RuleResultMemo.DEFAULT_RULE_ENGINE_VERSION}-"
+        f"{request.input_hash().removeprefix('sha256:')}.json"
+    )
+    assert (root / MEMO_DIRECTORY / entry).stat().st_mode & 0o777 == 0o600
+
+    (tmp_path / "failing").mkdir()
+    failing = executable_script("import sys; sys.exit(2)", tmp_path / "failing")
+    reopened = RuleResultMemo(root)
+    assert (
+        BacktestTradingCoreBridge((sys.executable, failing), memo=reopened).evaluate(request)
+        == expected
+    )
+    assert reopened.stats().disk_hits == 1
+
+    upgraded = RuleResultMemo(root, rule_engine_version="symfony_canonical_rules_v2")
+    with pytest.raises(TradingCoreBridgeError, match="process_failed"):
+        BacktestTradingCoreBridge((sys.executable, failing), memo=upgraded).evaluate(request)
+    assert upgraded.stats().misses == 1
+
+
+def test_forged_or_foreign_entries_are_dropped_as_misses(tmp_path: Path) -> None:
+    btc, eth = batch_requests("BTCUSDT", "ETHUSDT")
+    memo = RuleResultMemo(tmp_path)
+    memo.put(btc, CanonicalBacktestRuleResult.model_validate(result_payload(btc)))
+    entry = memo.directory / os.listdir(memo.directory)[0]
+    entry.write_bytes(entry.read_bytes().replace(b'"passed":false', b'"passed":true'))
+
+    assert RuleResultMemo(tmp_path).get(btc) is None
+    assert not entry.exists()
+
+    foreign = _canonical_json(result_payload(btc))
+    eth_entry = memo.directory / (
+        f"{memo.rule_engine_version}-{eth.input_hash().removeprefix('sha256:')}.json"
+    )
+    eth_entry.write_text(foreign)
+    eth_entry.chmod(0o600)
+    reopened = RuleResultMemo(tmp_path)
+    assert reopened.get(eth) is None
+    assert not eth_entry.exists()
+    assert reopened.stats().misses == 1
+
+    with pytest.raises(TradingCoreBridgeError, match="result_identity_mismatch"):
+        memo.put(eth, CanonicalBacktestRuleResult.model_validate(result_payload(btc)))
+
+
+def test_memory_is_bounded_lru_and_the_directory_must_stay_private(tmp_path: Path) -> None:
+    btc, eth = batch_requests("BTCUSDT", "ETHUSDT")
+    memo = RuleResultMemo(max_entries=1)
+    memo.put(btc, CanonicalBacktestRuleResult.model_validate(result_payload(btc)))
+    memo.put(eth, CanonicalBacktestRuleResult.model_validate(result_payload(eth)))
+
+    assert memo.get(btc) is None
+    assert memo.get(eth) is not None
+    assert memo.stats().memory_evictions == 1
+    assert memo.stats().disk_evictions == 0
+
+    btc_result = CanonicalBacktestRuleResult.model_validate(result_payload(btc))
+    entry_bytes = len(_canonical_json(btc_result.model_dump(mode="json")).encode())
+    bounded = RuleResultMemo(tmp_path / "bounded", max_entries=1, max_bytes=entry_bytes + 8)
+    bounded.put(btc, btc_result)
+    bounded.put(eth, CanonicalBacktestRuleResult.model_validate(result_payload(eth)))
+    assert (bounded.stats().memory_evictions, bounded.stats().disk_evictions) == (1, 1)
+    assert len(os.listdir(bounded.directory)) == 1
+
+    guarded = RuleResultMemo(tmp_path)
+    assert guarded.get(btc) is None
+    guarded.directory.chmod(0o755)
+    with pytest.raises(TradingCoreBridgeError, match="rule_result_memo_unsafe$"):
+        guarded.get(btc)
+
+
+def test_batches_only_ship_requests_the_memo_cannot_answer(tmp_path: Path) -> None:
+    requests = batch_requests("BTCUSDT", "ETHUSDT", "SOLUSDT")
+    script, shipped = _batch_counting_script(
+        tmp_path, {request.request_id: result_payload(request) for request in requests}
+    )
+    memo = RuleResultMemo()
+    bridge = BacktestTradingCoreBridge((sys.executable, script), memo=memo)
+
+    first = bridge.evaluate_batch(requests[:2], request_id="sweep.0")
+    mixed = bridge.evaluate_batch(requests, request_id="sweep.1")
+    rerun = bridge.evaluate_batch(requests, request_id="sweep.2")
+
+    assert shipped.read_text().splitlines() == ["screen.0,screen.1", "screen.2"]
+    assert mixed[:2] == first
+    assert mixed == rerun
+    assert [outcome.result.input_hash for outcome in rerun] == [
+        request.input_hash() for request in requests
+    ]
+    assert memo.stats() == RuleResultMemoStats(
+        hits=5, disk_hits=0, misses=3, stores=3, memory_evictions=0, disk_evictions=0
+    )
+
+
+@pytest.mark.parametrize(
+    ("arguments", "reason"),
+    [
+        ({"rule_engine_version": "V1"}, "engine_version_invalid"),
+        ({"rule_engine_version": "../v1"}, "engine_version_invalid"),
+        ({"max_entries": -1}, "bounds_invalid"),
+        ({"max_entries": True}, "bounds_invalid"),
+        ({"max_bytes": 1.5}, "bounds_invalid"),
+    ],
+)
+def test_memo_rejects_invalid_configuration(arguments: dict, reason: str) -> None:
+    with pytest.raises(ValueError, match=re.escape(reason)):
+        RuleResultMemo(**arguments)
@@ -237,8 +237,8 @@ def test_real_symfony_invocation_is_byte_deterministic() -> None:
     request = CanonicalBacktestRuleRequest.model_validate(payload)
     bridge = BacktestTradingCoreBridge()
     request_bytes = _canonical_json(request.model_dump(mode="json")).encode()
-    first_code, first_stdout, first_stderr = bridge._run_bounded(request_bytes)
-    second_code, second_stdout, second_stderr = bridge._run_bounded(request_bytes)
+    first_code, first_stdout, first_stderr = bridge._run_bounded(bridge.argv, request_bytes)
+    second_code, second_stdout, second_stderr = bridge._run_bounded(bridge.argv, request_bytes)
     assert (first_code, first_stdout, first_stderr) == (
         second_code,
         second_stdout,
@@ -250,3 +250,146 @@ def test_real_symfony_invocation_is_byte_deterministic() -> None:
     second = bridge.evaluate(request)
     assert first == second
     assert first.result_hash == second.result_hash
+
+
+def batch_requests(*symbols: str) -> list[CanonicalBacktestRuleRequest]:
+    requests = []
+    for position, symbol in enumerate(symbols):
+        payload = request_payload()
+        payload["request_id"] = f"screen.{position}"
+        payload["symbol"] = symbol
+        for indicator in payload["indicators_by_timeframe"].values():
+            indicator["snapshot_identity"]["symbol"] = symbol
+        requests.append(CanonicalBacktestRuleRequest.model_validate(payload))
+    return requests
+
+
+def batch_script(outcomes: list[dict], tmp_path: Path, **envelope: object) -> str:
+    """Child answering any ``--batch`` call with ``outcomes`` in a sealed envelope."""
+
+    return executable_script(
+        f"""
+        import hashlib, json, sys
+        sys.path.insert(0, {str(Path(__file__).resolve().parents[1])!r})
+        from app.modern_trading_contracts import _canonical_json
+        assert sys.argv[-1] == "--batch"
+        payload = sys.stdin.buffer.read()
+        request = json.loads(payload)
+        result = {{
+            "schema_version": "canonical-backtest-rule-batch-result.v1",
+            "request_id": request["request_id"],
+            "outcomes": json.loads({json.dumps(outcomes)!r}),
+            "input_hash": "sha256:" + hashlib.sha256(payload).hexdigest(),
+            **json.loads({json.dumps(envelope)!r}),
+        }}
+        result["result_hash"] = "sha256:" + hashlib.sha256(
+            _canonical_json(result).encode()
+        ).hexdigest()
+        print(_canonical_json(result))
+        """,
+        tmp_path,
+    )
+
+
+def test_batch_ships_one_snapshot_and_binds_outcomes_in_order(tmp_path: Path) -> None:
+    requests = batch_requests("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT")
+    foreign = result_payload(requests[0])
+    stdin_copy = tmp_path / "stdin.json"
+    script = batch_script(
+        [
+            {"status": "evaluated", "result": result_payload(requests[0])},
+            {"status": "rejected", "reason_code": "canonical_backtest_rule_indicator_identity_mismatch"},
+            {"status": "evaluated", "result": foreign},
+            {"status": "rejected", "reason_code": "/var/secret exploded"},
+            {"status": "evaluated", "result": result_payload(requests[4])},
+        ],
+        tmp_path,
+    )
+    Path(script).write_text(
+        Path(script).read_text().replace(
+            "request = json.loads(payload)",
+            f"request = json.loads(payload); open({str(stdin_copy)!r}, 'wb').write(payload)",
+        )
+    )
+
+    outcomes = BacktestTradingCoreBridge((sys.executable, script)).evaluate_batch(
+        requests, request_id="screen"
+    )
+
+    assert [outcome.request_id for outcome in outcomes] == [
+        request.request_id for request in requests
+    ]
+    assert outcomes[0].result == CanonicalBacktestRuleResult.model_validate(
+        result_payload(requests[0])
+    )
+    assert outcomes[0].reason_code is None
+    assert outcomes[4].result is not None
+    assert outcomes[4].result.input_hash == requests[4].input_hash()
+    assert [outcome.reason_code for outcome in outcomes[1:4]] == [
+        "canonical_backtest_rule_indicator_identity_mismatch",
+        "tradingcore_bridge_result_identity_mismatch",
+        "tradingcore_bridge_result_invalid",
+    ]
+    assert all(outcome.result is None for outcome in outcomes[1:4])
+    shipped = json.loads(stdin_copy.read_bytes())
+    assert set(shipped) == {
+        "schema_version",
+        "request_id",
+        "effective_config_snapshot",
+        "evaluations",
+    }
+    assert shipped["effective_config_snapshot"] == request_payload()["effective_config_snapshot"]
+    assert shipped["evaluations"][2] == {
+        key: value
+        for key, value in requests[2].model_dump(mode="json").items()
+        if key not in {"schema_version", "effective_config_snapshot"}
+    }
+
+
+@pytest.mark.parametrize(
+    ("envelope", "reason"),
+    [
+        ({"request_id": "other"}, "result_identity_mismatch"),
+        ({"input_hash": "sha256:" + "0" * 64}, "result_identity_mismatch"),
+        ({"schema_version": "canonical-backtest-rule-result.v1"}, "result_invalid"),
+        ({"profile": "scalper"}, "result_invalid"),
+    ],
+)
+def test_batch_envelope_forgery_fails_the_whole_batch(
+    envelope: dict, reason: str, tmp_path: Path
+) -> None:
+    requests = batch_requests("BTCUSDT")
+    script = batch_script(
+        [{"status": "evaluated", "result": result_payload(requests[0])}], tmp_path, **envelope
+    )
+    with pytest.raises(TradingCoreBridgeError, match=reason):
+        BacktestTradingCoreBridge((sys.executable, script)).evaluate_batch(
+            requests, request_id="screen"
+        )
+
+
+def test_batch_rejects_missing_outcomes_and_mixed_config_snapshots(tmp_path: Path) -> None:
+    requests = batch_requests("BTCUSDT", "ETHUSDT")
+    short = batch_script(
+        [{"status": "evaluated", "result": result_payload(requests[0])}], tmp_path
+    )
+    with pytest.raises(TradingCoreBridgeError, match="result_identity_mismatch"):
+        BacktestTradingCoreBridge((sys.executable, short)).evaluate_batch(
+            requests, request_id="screen"
+        )
+
+    bridge = BacktestTradingCoreBridge(("php",))
+    drifted = requests[1].effective_config_snapshot.model_copy(
+        update={"snapshot_hash": "sha256:" + "9" * 64}
+    )
+    mixed = requests[1].model_copy(update={"effective_config_snapshot": drifted})
+    with pytest.raises(TradingCoreBridgeError, match="batch_config_mismatch"):
+        bridge.evaluate_batch([requests[0], mixed], request_id="screen")
+    with pytest.raises(ValueError, match="batch_requests_invalid"):
+        bridge.evaluate_batch([], request_id="screen")
+    with pytest.raises(ValueError, match="batch_requests_invalid"):
+        bridge.evaluate_batch(requests * 501, request_id="screen")
+    with pytest.raises(TypeError, match="canonical_rule_request_required"):
+        bridge.evaluate_batch([requests[0].model_dump()], request_id="screen")
+    with pytest.raises(ValueError, match="batch_request_id_invalid"):
+        bridge.evaluate_batch(requests, request_id=".screen")
@@ -4,17 +4,29 @@ declare(strict_types=1);
 
 namespace App\Command;
 
+use App\TradingCore\Backtesting\CanonicalBacktestRuleBatchEvaluator;
+use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluator;
 use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluatorInterface;
 use App\TradingCore\Backtesting\Json\StrictJsonObjectDecoder;
+use App\TradingCore\Backtesting\Worker\FramedCommandWorker;
 use Symfony\Component\Console\Attribute\AsCommand;
 use Symfony\Component\Console\Command\Command;
 use Symfony\Component\Console\Input\InputInterface;
+use Symfony\Component\Console\Input\InputOption;
+use Symfony\Component\Console\Output\BufferedOutput;
 use Symfony\Component\Console\Output\ConsoleOutputInterface;
 use Symfony\Component\Console\Output\OutputInterface;
 
 #[AsCommand(name: 'app:backtest:rules:evaluate')]
 final class BacktestEvaluateCanonicalRulesCommand extends Command
 {
+    // A batch carries one config snapshot plus up to 1,000 indicator mappings
+    // bounded by the 8 MiB input limit; numeric series dominate at about a
+    // dozen bytes per structural token.
+    private const MAX_BATCH_STRUCTURE_TOKENS = 1_000_000;
+
+    private ?string $framedPayload = null;
+
     public function __construct(
         private readonly CanonicalBacktestRuleEvaluatorInterface $evaluator,
         private readonly StrictJsonObjectDecoder $decoder,
@@ -23,7 +35,49 @@ final class BacktestEvaluateCanonicalRulesCommand extends Command
         parent::__construct();
     }
 
+    protected function configure(): void
+    {
+        $this->addOption(
+            'worker',
+            null,
+            InputOption::VALUE_NONE,
+            'Serve length-prefixed requests on stdin until EOF.',
+        );
+        $this->addOption(
+            'batch',
+            null,
+            InputOption::VALUE_NONE,
+            'Evaluate many requests sharing one effective config snapshot.',
+        );
+    }
+
     protected function execute(InputInterface $input, OutputInterface $output): int
+    {
+        $batch = (bool) $input->getOption('batch');
+        if ($input->getOption('worker')) {
+            return (new FramedCommandWorker())->run(
+                fn (string $payload): array => $this->handleFramed($payload, $batch),
+            );
+        }
+
+        return $this->handle($output, $batch);
+    }
+
+    /** @return array{int, string} */
+    private function handleFramed(string $payload, bool $batch): array
+    {
+        $this->framedPayload = $payload;
+        $buffer = new BufferedOutput();
+        try {
+            $code = $this->handle($buffer, $batch);
+        } finally {
+            $this->framedPayload = null;
+        }
+
+        return [$code, $buffer->fetch()];
+    }
+
+    private function handle(OutputInterface $output, bool $batch): int
     {
         try {
             $payload = $this->readInput();
@@ -31,17 +85,22 @@ final class BacktestEvaluateCanonicalRulesCommand extends Command
             return $this->invalid($output, 'input_read_failed');
         }
         try {
-            $request = $this->decoder->decode($payload);
+            $request = $batch
+                ? $this->decoder->decode($payload, self::MAX_BATCH_STRUCTURE_TOKENS)
+                : $this->decoder->decode($payload);
         } catch (\InvalidArgumentException $exception) {
             return $this->invalid($output, $exception->getMessage());
         }
 
         try {
-            $evaluation = $this->evaluator->evaluate($request);
-            $encoded = json_encode(
-                $evaluation->toArray(),
-                JSON_THROW_ON_ERROR | JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE,
-            );
+            $encoded = $batch
+                ? CanonicalBacktestRuleEvaluator::canonicalJson(
+                    (new CanonicalBacktestRuleBatchEvaluator($this->evaluator))->evaluate($request),
+                )
+                : json_encode(
+                    $this->evaluator->evaluate($request)->toArray(),
+                    JSON_THROW_ON_ERROR | JSON_UNESCAPED_SLASHES | JSON_UNESCAPED_UNICODE,
+                );
         } catch (\Throwable $exception) {
             $reason = $exception->getMessage();
             if (preg_match('/\Acanonical_[a-z0-9_:.\-]{1,160}\z/D', $reason) !== 1) {
@@ -58,6 +117,9 @@ final class BacktestEvaluateCanonicalRulesCommand extends Command
 
     private function readInput(): string
     {
+        if ($this->framedPayload !== null) {
+            return $this->framedPayload;
+        }
         if ($this->stdinReader !== null) {
             return ($this->stdinReader)();
         }
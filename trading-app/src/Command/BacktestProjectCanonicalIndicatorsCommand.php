@@ -5,17 +5,27 @@ declare(strict_types=1);
 namespace App\Command;
 
 use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluator;
+use App\TradingCore\Backtesting\Indicator\CanonicalIndicatorBatchProjector;
 use App\TradingCore\Backtesting\Indicator\CanonicalIndicatorProjectorInterface;
 use App\TradingCore\Backtesting\Json\StrictJsonObjectDecoder;
+use App\TradingCore\Backtesting\Worker\FramedCommandWorker;
 use Symfony\Component\Console\Attribute\AsCommand;
 use Symfony\Component\Console\Command\Command;
 use Symfony\Component\Console\Input\InputInterface;
+use Symfony\Component\Console\Input\InputOption;
+use Symfony\Component\Console\Output\BufferedOutput;
 use Symfony\Component\Console\Output\ConsoleOutputInterface;
 use Symfony\Component\Console\Output\OutputInterface;
 
 #[AsCommand(name: 'app:backtest:indicators:project')]
 final class BacktestProjectCanonicalIndicatorsCommand extends Command
 {
+    // A batch request carries union windows bounded by the 8 MiB input limit;
+    // each candle record costs about 33 structural tokens in roughly 450 bytes.
+    private const MAX_BATCH_STRUCTURE_TOKENS = 700_000;
+
+    private ?string $framedPayload = null;
+
     public function __construct(
         private readonly CanonicalIndicatorProjectorInterface $projector,
         private readonly StrictJsonObjectDecoder $decoder,
@@ -24,7 +34,49 @@ final class BacktestProjectCanonicalIndicatorsCommand extends Command
         parent::__construct();
     }
 
+    protected function configure(): void
+    {
+        $this->addOption(
+            'worker',
+            null,
+            InputOption::VALUE_NONE,
+            'Serve length-prefixed requests on stdin until EOF.',
+        );
+        $this->addOption(
+            'batch',
+            null,
+            InputOption::VALUE_NONE,
+            'Project a union window at every listed evaluation time.',
+        );
+    }
+
     protected function execute(InputInterface $input, OutputInterface $output): int
+    {
+        $batch = (bool) $input->getOption('batch');
+        if ($input->getOption('worker')) {
+            return (new FramedCommandWorker())->run(
+                fn (string $payload): array => $this->handleFramed($payload, $batch),
+            );
+        }
+
+        return $this->handle($output, $batch);
+    }
+
+    /** @return array{int, string} */
+    private function handleFramed(string $payload, bool $batch): array
+    {
+        $this->framedPayload = $payload;
+        $buffer = new BufferedOutput();
+        try {
+            $code = $this->handle($buffer, $batch);
+        } finally {
+            $this->framedPayload = null;
+        }
+
+        return [$code, $buffer->fetch()];
+    }
+
+    private function handle(OutputInterface $output, bool $batch): int
     {
         try {
             $payload = $this->readInput();
@@ -33,14 +85,18 @@ final class BacktestProjectCanonicalIndicatorsCommand extends Command
         }
 
         try {
-            $request = $this->decoder->decode($payload);
+            $request = $batch
+                ? $this->decoder->decode($payload, self::MAX_BATCH_STRUCTURE_TOKENS)
+                : $this->decoder->decode($payload);
         } catch (\InvalidArgumentException $exception) {
             return $this->invalid($output, $exception->getMessage());
         }
 
         try {
-            $projection = $this->projector->project($request);
-            $encoded = CanonicalBacktestRuleEvaluator::canonicalJson($projection->toArray());
+            $projection = $batch
+                ? (new CanonicalIndicatorBatchProjector($this->projector))->project($request)
+                : $this->projector->project($request)->toArray();
+            $encoded = CanonicalBacktestRuleEvaluator::canonicalJson($projection);
         } catch (\Throwable $exception) {
             $reason = $exception->getMessage();
             if (preg_match('/\Acanonical_indicator_[a-z0-9_:.\-]{1,160}\z/D', $reason) !== 1) {
@@ -57,6 +113,9 @@ final class BacktestProjectCanonicalIndicatorsCommand extends Command
 
     private function readInput(): string
     {
+        if ($this->framedPayload !== null) {
+            return $this->framedPayload;
+        }
         if ($this->stdinReader !== null) {
             return ($this->stdinReader)();
         }
@@ -6,10 +6,13 @@ namespace App\Command;
 
 use App\TradingCore\Backtesting\Funding\CanonicalHistoricalFundingSettlement;
 use App\TradingCore\Backtesting\Json\StrictJsonObjectDecoder;
+use App\TradingCore\Backtesting\Worker\FramedCommandWorker;
 use App\TradingCore\OrderPlan\Canonical\CanonicalOrderPlanDecimal;
 use Symfony\Component\Console\Attribute\AsCommand;
 use Symfony\Component\Console\Command\Command;
 use Symfony\Component\Console\Input\InputInterface;
+use Symfony\Component\Console\Input\InputOption;
+use Symfony\Component\Console\Output\BufferedOutput;
 use Symfony\Component\Console\Output\ConsoleOutputInterface;
 use Symfony\Component\Console\Output\OutputInterface;
 
@@ -18,13 +21,48 @@ final class BacktestSettleHistoricalFundingCommand extends Command
 {
     private const MAX_FUNDING_STRUCTURE_TOKENS = 70_018;
 
+    private ?string $framedPayload = null;
+
     public function __construct(
         private readonly CanonicalHistoricalFundingSettlement $settlement,
         private readonly StrictJsonObjectDecoder $decoder,
         private readonly ?\Closure $stdinReader = null,
     ) { parent::__construct(); }
 
+    protected function configure(): void
+    {
+        $this->addOption(
+            'worker',
+            null,
+            InputOption::VALUE_NONE,
+            'Serve length-prefixed requests on stdin until EOF.',
+        );
+    }
+
     protected function execute(InputInterface $input, OutputInterface $output): int
+    {
+        if ($input->getOption('worker')) {
+            return (new FramedCommandWorker())->run($this->handleFramed(...));
+        }
+
+        return $this->handle($output);
+    }
+
+    /** @return array{int, string} */
+    private function handleFramed(string $payload): array
+    {
+        $this->framedPayload = $payload;
+        $buffer = new BufferedOutput();
+        try {
+            $code = $this->handle($buffer);
+        } finally {
+            $this->framedPayload = null;
+        }
+
+        return [$code, $buffer->fetch()];
+    }
+
+    private function handle(OutputInterface $output): int
     {
         try {
             // Envelope: 18 tokens; each of the at most 10,000 records adds 7.
@@ -51,6 +89,9 @@ final class BacktestSettleHistoricalFundingCommand extends Command
 
     private function readInput(): string
     {
+        if ($this->framedPayload !== null) {
+            return $this->framedPayload;
+        }
         if ($this->stdinReader !== null) { return ($this->stdinReader)(); }
         $stream = fopen('php://stdin', 'rb');
         if (!\is_resource($stream)) { throw new \RuntimeException('input_read_failed'); }
@@ -0,0 +1,121 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\TradingCore\Backtesting;
+
+/**
+ * Evaluates many rule requests that share one effective config snapshot.
+ *
+ * The snapshot travels once; each evaluation is rebuilt into the exact
+ * single-request payload the evaluator receives, so its input and result
+ * hashes are those of a standalone evaluation. A rejected evaluation is
+ * reported in its own slot instead of failing the batch.
+ */
+final readonly class CanonicalBacktestRuleBatchEvaluator
+{
+    public const MAX_EVALUATIONS = 1000;
+
+    private const REQUEST_KEYS = [
+        'schema_version',
+        'request_id',
+        'effective_config_snapshot',
+        'evaluations',
+    ];
+
+    private const EVALUATION_KEYS = [
+        'request_id',
+        'symbol',
+        'market_type',
+        'evaluated_at',
+        'indicators_by_timeframe',
+    ];
+
+    public function __construct(private CanonicalBacktestRuleEvaluatorInterface $evaluator)
+    {
+    }
+
+    /**
+     * @param array<string, mixed> $request
+     *
+     * @return array<string, mixed>
+     */
+    public function evaluate(#[\SensitiveParameter] array $request): array
+    {
+        if (!$this->hasExactKeys($request, self::REQUEST_KEYS)) {
+            throw new \InvalidArgumentException('canonical_backtest_rule_batch_shape_invalid');
+        }
+        if ($request['schema_version'] !== 'canonical-backtest-rule-batch-request.v1') {
+            throw new \InvalidArgumentException('canonical_backtest_rule_batch_schema_invalid');
+        }
+        $requestId = $request['request_id'];
+        if (!\is_string($requestId)
+            || preg_match('/\A[A-Za-z0-9][A-Za-z0-9._:-]{0,95}\z/D', $requestId) !== 1
+        ) {
+            throw new \InvalidArgumentException('canonical_backtest_rule_batch_request_id_invalid');
+        }
+        $evaluations = $request['evaluations'];
+        if (!\is_array($evaluations) || !array_is_list($evaluations)
+            || $evaluations === [] || \count($evaluations) > self::MAX_EVALUATIONS
+        ) {
+            throw new \InvalidArgumentException('canonical_backtest_rule_batch_evaluations_invalid');
+        }
+
+        $outcomes = [];
+        foreach ($evaluations as $evaluation) {
+            if (!\is_array($evaluation) || !$this->hasExactKeys($evaluation, self::EVALUATION_KEYS)) {
+                $outcomes[] = $this->rejected('canonical_backtest_rule_request_shape_invalid');
+                continue;
+            }
+            try {
+                $outcomes[] = [
+                    'status' => 'evaluated',
+                    'result' => $this->evaluator->evaluate([
+                        'schema_version' => 'canonical-backtest-rule-request.v1',
+                        'request_id' => $evaluation['request_id'],
+                        'effective_config_snapshot' => $request['effective_config_snapshot'],
+                        'symbol' => $evaluation['symbol'],
+                        'market_type' => $evaluation['market_type'],
+                        'evaluated_at' => $evaluation['evaluated_at'],
+                        'indicators_by_timeframe' => $evaluation['indicators_by_timeframe'],
+                    ])->toArray(),
+                ];
+            } catch (\Throwable $exception) {
+                $reason = $exception->getMessage();
+                if (preg_match('/\Acanonical_[a-z0-9_:.\-]{1,160}\z/D', $reason) !== 1) {
+                    $reason = 'evaluation_failed';
+                }
+                $outcomes[] = $this->rejected($reason);
+            }
+        }
+
+        $result = [
+            'schema_version' => 'canonical-backtest-rule-batch-result.v1',
+            'request_id' => $requestId,
+            'outcomes' => $outcomes,
+            'input_hash' => CanonicalBacktestRuleEvaluator::canonicalHash($request),
+        ];
+        $result['result_hash'] = CanonicalBacktestRuleEvaluator::canonicalHash($result);
+
+        return $result;
+    }
+
+    /**
+     * @param array<mixed> $value
+     * @param list<string> $expected
+     */
+    private function hasExactKeys(array $value, array $expected): bool
+    {
+        $keys = array_keys($value);
+        sort($keys, SORT_STRING);
+        sort($expected, SORT_STRING);
+
+        return $keys === $expected;
+    }
+
+    /** @return array{status: string, reason_code: string} */
+    private function rejected(string $reason): array
+    {
+        return ['status' => 'rejected', 'reason_code' => $reason];
+    }
+}
@@ -0,0 +1,162 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\TradingCore\Backtesting\Indicator;
+
+use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluator;
+
+/**
+ * Projects one union window per timeframe at many evaluation instants.
+ *
+ * Each evaluation's window is the freshest admissible suffix of the union, so
+ * every derived request, and therefore its input and window hashes, is the one
+ * the single-timestamp projector would receive for that instant.
+ */
+final readonly class CanonicalIndicatorBatchProjector
+{
+    public const MAX_EVALUATIONS = 1000;
+
+    private const REQUEST_KEYS = [
+        'schema_version',
+        'request_id',
+        'evaluations',
+        'environment',
+        'indicator_engine_version',
+        'dataset_binding',
+        'symbol',
+        'requested_timeframes',
+        'candles_by_timeframe',
+    ];
+
+    public function __construct(private CanonicalIndicatorProjectorInterface $projector)
+    {
+    }
+
+    /**
+     * @param array<string, mixed> $request
+     *
+     * @return array<string, mixed>
+     */
+    public function project(#[\SensitiveParameter] array $request): array
+    {
+        $keys = array_keys($request);
+        $expected = self::REQUEST_KEYS;
+        sort($keys, SORT_STRING);
+        sort($expected, SORT_STRING);
+        if ($keys !== $expected) {
+            throw new CanonicalIndicatorProjectionException('canonical_indicator_request_shape_invalid');
+        }
+        if ($request['schema_version'] !== 'canonical-indicator-batch-projection-request.v1') {
+            throw new CanonicalIndicatorProjectionException('canonical_indicator_request_schema_invalid');
+        }
+        $requestId = $request['request_id'];
+        if (!\is_string($requestId)
+            || preg_match('/\A[A-Za-z0-9][A-Za-z0-9._:-]{0,88}\z/D', $requestId) !== 1
+        ) {
+            throw new CanonicalIndicatorProjectionException('canonical_indicator_request_id_invalid');
+        }
+        $evaluations = $this->evaluations($request['evaluations']);
+        $requested = $request['requested_timeframes'];
+        $unions = $request['candles_by_timeframe'];
+        if (!\is_array($requested) || !array_is_list($requested)
+            || !\is_array($unions) || $unions === [] || array_is_list($unions)
+        ) {
+            throw new CanonicalIndicatorProjectionException('canonical_indicator_candles_shape_invalid');
+        }
+
+        $slices = array_fill(0, \count($evaluations), []);
+        foreach ($unions as $timeframe => $union) {
+            if (!\is_array($union) || $union === [] || !array_is_list($union)) {
+                throw new CanonicalIndicatorProjectionException('canonical_indicator_window_count_invalid');
+            }
+            $ready = [];
+            foreach ($union as $record) {
+                if (!\is_array($record)
+                    || !\is_string($record['close_at'] ?? null)
+                    || !\is_string($record['available_at'] ?? null)
+                ) {
+                    throw new CanonicalIndicatorProjectionException('canonical_indicator_candle_shape_invalid');
+                }
+                // Fixed-width microsecond UTC strings order lexically as in time;
+                // the derived requests validate their exact format.
+                $ready[] = strcmp($record['close_at'], $record['available_at']) >= 0
+                    ? $record['close_at']
+                    : $record['available_at'];
+            }
+            $required = $timeframe === '1h' && \in_array('4h', $requested, true) ? 1000 : 250;
+            $covered = 0;
+            foreach ($evaluations as $index => $evaluatedAt) {
+                $stop = \count($ready);
+                while ($stop > 0 && strcmp($ready[$stop - 1], $evaluatedAt) > 0) {
+                    --$stop;
+                }
+                $start = $stop - $required;
+                if ($start < 0) {
+                    throw new CanonicalIndicatorProjectionException('canonical_indicator_window_count_invalid');
+                }
+                for ($offset = $start; $offset < $stop; ++$offset) {
+                    if (strcmp($ready[$offset], $evaluatedAt) > 0) {
+                        throw new CanonicalIndicatorProjectionException('canonical_indicator_window_chronology_invalid');
+                    }
+                }
+                if ($start > $covered) {
+                    throw new CanonicalIndicatorProjectionException('canonical_indicator_batch_window_invalid');
+                }
+                $covered = max($covered, $stop);
+                $slices[$index][$timeframe] = \array_slice($union, $start, $required);
+            }
+            if ($covered !== \count($union)) {
+                throw new CanonicalIndicatorProjectionException('canonical_indicator_batch_window_invalid');
+            }
+        }
+
+        $results = [];
+        foreach ($evaluations as $index => $evaluatedAt) {
+            $results[] = $this->projector->project([
+                'schema_version' => 'canonical-indicator-projection-request.v1',
+                'request_id' => $requestId . '.' . $index,
+                'evaluated_at' => $evaluatedAt,
+                'environment' => $request['environment'],
+                'indicator_engine_version' => $request['indicator_engine_version'],
+                'dataset_binding' => $request['dataset_binding'],
+                'symbol' => $request['symbol'],
+                'requested_timeframes' => $requested,
+                'candles_by_timeframe' => $slices[$index],
+            ])->toArray();
+        }
+
+        $result = [
+            'schema_version' => 'canonical-indicator-batch-projection-result.v1',
+            'request_id' => $requestId,
+            'results' => $results,
+            'input_hash' => CanonicalBacktestRuleEvaluator::canonicalHash($request),
+        ];
+        $result['result_hash'] = CanonicalBacktestRuleEvaluator::canonicalHash($result);
+
+        return $result;
+    }
+
+    /** @return list<string> */
+    private function evaluations(mixed $value): array
+    {
+        if (!\is_array($value) || !array_is_list($value)
+            || $value === [] || \count($value) > self::MAX_EVALUATIONS
+        ) {
+            throw new CanonicalIndicatorProjectionException('canonical_indicator_evaluations_invalid');
+        }
+        $previous = null;
+        foreach ($value as $evaluatedAt) {
+            if (!\is_string($evaluatedAt)
+                || preg_match('/\A\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z\z/D', $evaluatedAt) !== 1
+                || ($previous !== null && strcmp($evaluatedAt, $previous) <= 0)
+            ) {
+                throw new CanonicalIndicatorProjectionException('canonical_indicator_evaluations_invalid');
+            }
+            $previous = $evaluatedAt;
+        }
+
+        /** @var list<string> $value */
+        return $value;
+    }
+}
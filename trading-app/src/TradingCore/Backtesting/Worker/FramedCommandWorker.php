@@ -0,0 +1,88 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\TradingCore\Backtesting\Worker;
+
+use App\TradingCore\Backtesting\Json\StrictJsonObjectDecoder;
+use Symfony\Component\Console\Command\Command;
+
+/**
+ * Long-lived request loop behind the backtesting commands' --worker mode.
+ *
+ * Request frame: u32 big-endian length, then the JSON payload.
+ * Response frame: u32 big-endian length, u8 exit code, then the command output.
+ * A clean EOF before a header ends the loop; any other framing error exits
+ * non-zero so the Python pool discards this worker.
+ */
+final class FramedCommandWorker
+{
+    public const MAX_FRAME_BYTES = StrictJsonObjectDecoder::MAX_INPUT_BYTES;
+
+    /**
+     * @param \Closure(string): array{int, string} $handle
+     * @param resource|null $input
+     * @param resource|null $output
+     */
+    public function run(\Closure $handle, $input = null, $output = null): int
+    {
+        $input ??= fopen('php://stdin', 'rb');
+        $output ??= fopen('php://stdout', 'wb');
+        if (!\is_resource($input) || !\is_resource($output)) {
+            return Command::FAILURE;
+        }
+
+        while (true) {
+            $header = $this->readExactly($input, 4);
+            if ($header === '') {
+                return Command::SUCCESS;
+            }
+            if (\strlen($header) !== 4) {
+                return Command::FAILURE;
+            }
+            $length = unpack('N', $header)[1];
+            if ($length > self::MAX_FRAME_BYTES) {
+                return Command::FAILURE;
+            }
+            $payload = $this->readExactly($input, $length);
+            if (\strlen($payload) !== $length) {
+                return Command::FAILURE;
+            }
+
+            [$code, $body] = $handle($payload);
+            if (!$this->writeAll($output, pack('NC', \strlen($body), $code & 0xFF) . $body)) {
+                return Command::FAILURE;
+            }
+        }
+    }
+
+    /** @param resource $stream */
+    private function readExactly($stream, int $length): string
+    {
+        $buffer = '';
+        while (\strlen($buffer) < $length) {
+            $chunk = fread($stream, min($length - \strlen($buffer), 65_536));
+            if ($chunk === false || $chunk === '') {
+                break;
+            }
+            $buffer .= $chunk;
+        }
+
+        return $buffer;
+    }
+
+    /** @param resource $stream */
+    private function writeAll($stream, string $payload): bool
+    {
+        $offset = 0;
+        while ($offset < \strlen($payload)) {
+            $written = fwrite($stream, substr($payload, $offset, 65_536));
+            if ($written === false || $written === 0) {
+                return false;
+            }
+            $offset += $written;
+        }
+
+        return fflush($stream);
+    }
+}
@@ -210,14 +210,63 @@ final class BacktestEvaluateCanonicalRulesCommandTest extends TestCase
         self::assertSame("canonical_backtest_rule_command_invalid:input_read_failed\n", $tester->getErrorOutput());
     }
 
-    private function runCommand(string $payload, CanonicalBacktestRuleEvaluatorInterface $evaluator): CommandTester
+    public function testBatchOptionRoutesThroughTheBatchEvaluatorAndWritesCanonicalJson(): void
     {
+        $observed = [];
+        $tester = $this->runCommand(
+            '{"schema_version":"canonical-backtest-rule-batch-request.v1","request_id":"screen",'
+            . '"effective_config_snapshot":{"snapshot_hash":"x"},"evaluations":[{"request_id":"screen.0",'
+            . '"symbol":"BTCUSDT","market_type":"perpetual","evaluated_at":"2026-08-10T12:00:00Z",'
+            . '"indicators_by_timeframe":{"15m":{"rsi":50}}},{"request_id":"screen.1"}]}',
+            $this->evaluator(static function (array $request) use (&$observed): CanonicalBacktestRuleEvaluation {
+                $observed[] = $request['request_id'];
+
+                return self::evaluation(true, 'setup_rules_passed');
+            }),
+            ['--batch' => true],
+        );
+
+        self::assertSame(Command::SUCCESS, $tester->getStatusCode());
+        self::assertSame('', $tester->getErrorOutput());
+        self::assertSame(['screen.0'], $observed);
+        $decoded = json_decode($tester->getDisplay(), true, 512, JSON_THROW_ON_ERROR);
+        self::assertSame('canonical-backtest-rule-batch-result.v1', $decoded['schema_version']);
+        self::assertSame('evaluated', $decoded['outcomes'][0]['status']);
+        self::assertSame(
+            ['status' => 'rejected', 'reason_code' => 'canonical_backtest_rule_request_shape_invalid'],
+            $decoded['outcomes'][1],
+        );
+        self::assertStringStartsWith('{"input_hash":"sha256:', $tester->getDisplay());
+    }
+
+    public function testBatchEnvelopeFailureIsInvalid(): void
+    {
+        $tester = $this->runCommand(
+            '{"schema_version":"canonical-backtest-rule-request.v1"}',
+            $this->evaluator(static fn (array $request): CanonicalBacktestRuleEvaluation => self::evaluation(true, 'unexpected')),
+            ['--batch' => true],
+        );
+
+        self::assertSame(Command::INVALID, $tester->getStatusCode());
+        self::assertSame('', $tester->getDisplay());
+        self::assertSame(
+            "canonical_backtest_rule_command_invalid:canonical_backtest_rule_batch_shape_invalid\n",
+            $tester->getErrorOutput(),
+        );
+    }
+
+    /** @param array<string, mixed> $options */
+    private function runCommand(
+        string $payload,
+        CanonicalBacktestRuleEvaluatorInterface $evaluator,
+        array $options = [],
+    ): CommandTester {
         $tester = new CommandTester(new BacktestEvaluateCanonicalRulesCommand(
             $evaluator,
             new StrictJsonObjectDecoder(),
             static fn (): string => $payload,
         ));
-        $tester->execute([], ['capture_stderr_separately' => true]);
+        $tester->execute($options, ['capture_stderr_separately' => true]);
 
         return $tester;
     }
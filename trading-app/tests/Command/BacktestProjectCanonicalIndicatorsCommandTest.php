@@ -187,14 +187,40 @@ final class BacktestProjectCanonicalIndicatorsCommandTest extends TestCase
         );
     }
 
-    private function runCommand(string $payload, CanonicalIndicatorProjectorInterface $projector): CommandTester
+    public function testBatchOptionRoutesThroughTheBatchProjector(): void
     {
+        $calls = 0;
+        $tester = $this->runCommand(
+            '{"schema_version":"canonical-indicator-projection-request.v1"}',
+            $this->projector(static function (array $request) use (&$calls): CanonicalIndicatorProjection {
+                ++$calls;
+
+                return self::projection();
+            }),
+            ['--batch' => true],
+        );
+
+        self::assertSame(Command::INVALID, $tester->getStatusCode());
+        self::assertSame('', $tester->getDisplay());
+        self::assertSame(
+            "canonical_indicator_projection_command_invalid:canonical_indicator_request_shape_invalid\n",
+            $tester->getErrorOutput(),
+        );
+        self::assertSame(0, $calls);
+    }
+
+    /** @param array<string, mixed> $options */
+    private function runCommand(
+        string $payload,
+        CanonicalIndicatorProjectorInterface $projector,
+        array $options = [],
+    ): CommandTester {
         $tester = new CommandTester(new BacktestProjectCanonicalIndicatorsCommand(
             $projector,
             new StrictJsonObjectDecoder(),
             static fn (): string => $payload,
         ));
-        $tester->execute([], ['capture_stderr_separately' => true]);
+        $tester->execute($options, ['capture_stderr_separately' => true]);
 
         return $tester;
     }
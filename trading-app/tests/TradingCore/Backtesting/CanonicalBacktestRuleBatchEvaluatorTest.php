@@ -0,0 +1,167 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\Tests\TradingCore\Backtesting;
+
+use App\TradingCore\Backtesting\CanonicalBacktestRuleBatchEvaluator;
+use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluation;
+use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluator;
+use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluatorInterface;
+use PHPUnit\Framework\Attributes\CoversClass;
+use PHPUnit\Framework\Attributes\DataProvider;
+use PHPUnit\Framework\TestCase;
+
+#[CoversClass(CanonicalBacktestRuleBatchEvaluator::class)]
+final class CanonicalBacktestRuleBatchEvaluatorTest extends TestCase
+{
+    public function testEveryEvaluationIsTheStandaloneRequestInOrderWithIsolatedFailures(): void
+    {
+        $observed = [];
+        $evaluator = $this->evaluator(static function (array $request) use (&$observed): CanonicalBacktestRuleEvaluation {
+            $observed[] = $request;
+            if ($request['symbol'] === 'BADUSDT') {
+                throw new \InvalidArgumentException('canonical_backtest_rule_indicator_identity_mismatch');
+            }
+            if ($request['symbol'] === 'BUGUSDT') {
+                throw new \RuntimeException('/var/secret/path exploded');
+            }
+
+            return self::result($request['request_id']);
+        });
+        $batch = $this->batch();
+        $batch['evaluations'][] = self::evaluation('screen.2', 'BADUSDT');
+        $batch['evaluations'][] = ['request_id' => 'screen.3'];
+        $batch['evaluations'][] = self::evaluation('screen.4', 'BUGUSDT');
+        $batch['evaluations'][] = self::evaluation('screen.5', 'SOLUSDT');
+
+        $result = (new CanonicalBacktestRuleBatchEvaluator($evaluator))->evaluate($batch);
+
+        self::assertSame('canonical-backtest-rule-batch-result.v1', $result['schema_version']);
+        self::assertSame('screen', $result['request_id']);
+        self::assertSame(CanonicalBacktestRuleEvaluator::canonicalHash($batch), $result['input_hash']);
+        self::assertSame([
+            ['status' => 'evaluated', 'result' => self::result('screen.0')->toArray()],
+            ['status' => 'evaluated', 'result' => self::result('screen.1')->toArray()],
+            ['status' => 'rejected', 'reason_code' => 'canonical_backtest_rule_indicator_identity_mismatch'],
+            ['status' => 'rejected', 'reason_code' => 'canonical_backtest_rule_request_shape_invalid'],
+            ['status' => 'rejected', 'reason_code' => 'evaluation_failed'],
+            ['status' => 'evaluated', 'result' => self::result('screen.5')->toArray()],
+        ], $result['outcomes']);
+        self::assertCount(5, $observed);
+        self::assertSame([
+            'schema_version' => 'canonical-backtest-rule-request.v1',
+            'request_id' => 'screen.0',
+            'effective_config_snapshot' => $batch['effective_config_snapshot'],
+            'symbol' => 'BTCUSDT',
+            'market_type' => 'perpetual',
+            'evaluated_at' => '2026-08-10T12:00:00Z',
+            'indicators_by_timeframe' => $batch['evaluations'][0]['indicators_by_timeframe'],
+        ], $observed[0]);
+
+        $withoutResultHash = $result;
+        unset($withoutResultHash['result_hash']);
+        self::assertSame(CanonicalBacktestRuleEvaluator::canonicalHash($withoutResultHash), $result['result_hash']);
+    }
+
+    /** @param callable(array<string, mixed>): void $mutate */
+    #[DataProvider('invalidBatchProvider')]
+    public function testRejectsMalformedBatchEnvelopesBeforeEvaluating(callable $mutate, string $reason): void
+    {
+        $calls = 0;
+        $batch = $this->batch();
+        $mutate($batch);
+        try {
+            (new CanonicalBacktestRuleBatchEvaluator($this->evaluator(
+                static function (array $request) use (&$calls): CanonicalBacktestRuleEvaluation {
+                    ++$calls;
+
+                    return self::result($request['request_id']);
+                },
+            )))->evaluate($batch);
+            self::fail('Expected batch rejection.');
+        } catch (\InvalidArgumentException $exception) {
+            self::assertSame($reason, $exception->getMessage());
+        }
+        self::assertSame(0, $calls);
+    }
+
+    /** @return iterable<string, array{callable, string}> */
+    public static function invalidBatchProvider(): iterable
+    {
+        yield 'extra field' => [static function (array &$batch): void { $batch['symbol'] = 'BTCUSDT'; }, 'canonical_backtest_rule_batch_shape_invalid'];
+        yield 'single request schema' => [static function (array &$batch): void { $batch['schema_version'] = 'canonical-backtest-rule-request.v1'; }, 'canonical_backtest_rule_batch_schema_invalid'];
+        yield 'invalid request id' => [static function (array &$batch): void { $batch['request_id'] = '.screen'; }, 'canonical_backtest_rule_batch_request_id_invalid'];
+        yield 'no evaluations' => [static function (array &$batch): void { $batch['evaluations'] = []; }, 'canonical_backtest_rule_batch_evaluations_invalid'];
+        yield 'mapping evaluations' => [static function (array &$batch): void { $batch['evaluations'] = ['a' => $batch['evaluations'][0]]; }, 'canonical_backtest_rule_batch_evaluations_invalid'];
+        yield 'too many evaluations' => [static function (array &$batch): void { $batch['evaluations'] = array_fill(0, 1001, $batch['evaluations'][0]); }, 'canonical_backtest_rule_batch_evaluations_invalid'];
+    }
+
+    /** @return array<string, mixed> */
+    private function batch(): array
+    {
+        return [
+            'schema_version' => 'canonical-backtest-rule-batch-request.v1',
+            'request_id' => 'screen',
+            'effective_config_snapshot' => ['snapshot_hash' => 'sha256:' . str_repeat('c', 64)],
+            'evaluations' => [
+                self::evaluation('screen.0', 'BTCUSDT'),
+                self::evaluation('screen.1', 'ETHUSDT'),
+            ],
+        ];
+    }
+
+    /** @return array<string, mixed> */
+    private static function evaluation(string $requestId, string $symbol): array
+    {
+        return [
+            'request_id' => $requestId,
+            'symbol' => $symbol,
+            'market_type' => 'perpetual',
+            'evaluated_at' => '2026-08-10T12:00:00Z',
+            'indicators_by_timeframe' => [
+                '15m' => ['kline_time' => '2026-08-10T11:45:00Z', 'rsi' => 51.5],
+            ],
+        ];
+    }
+
+    private static function result(string $requestId): CanonicalBacktestRuleEvaluation
+    {
+        return new CanonicalBacktestRuleEvaluation([
+            'schema_version' => 'canonical-backtest-rule-result.v1',
+            'request_id' => $requestId,
+            'mode_id' => 'scalping',
+            'mode_version' => '1.1.0',
+            'setup_id' => 'scalping.pullback.long',
+            'setup_version' => '1.1.0',
+            'side' => 'long',
+            'exchange' => 'fake',
+            'environment' => 'test',
+            'market_type' => 'perpetual',
+            'symbol' => 'BTCUSDT',
+            'config_hash' => 'sha256:' . str_repeat('a', 64),
+            'condition_catalog_hash' => 'sha256:' . str_repeat('b', 64),
+            'snapshot_hash' => 'sha256:' . str_repeat('c', 64),
+            'evaluated_at' => '2026-08-10T12:00:00Z',
+            'passed' => false,
+            'reason_code' => 'no_trade_rule_matched',
+            'trace' => ['plan_cache_key' => str_repeat('d', 64)],
+            'input_hash' => 'sha256:' . str_repeat('e', 64),
+            'result_hash' => 'sha256:' . str_repeat('f', 64),
+        ]);
+    }
+
+    /** @param \Closure(array<string,mixed>):CanonicalBacktestRuleEvaluation $callback */
+    private function evaluator(\Closure $callback): CanonicalBacktestRuleEvaluatorInterface
+    {
+        return new class($callback) implements CanonicalBacktestRuleEvaluatorInterface {
+            /** @param \Closure(array<string,mixed>):CanonicalBacktestRuleEvaluation $callback */
+            public function __construct(private readonly \Closure $callback) {}
+
+            public function evaluate(array $request): CanonicalBacktestRuleEvaluation
+            {
+                return ($this->callback)($request);
+            }
+        };
+    }
+}
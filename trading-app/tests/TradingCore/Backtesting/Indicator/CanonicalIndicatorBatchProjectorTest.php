@@ -0,0 +1,153 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\Tests\TradingCore\Backtesting\Indicator;
+
+use App\Indicator\Core\AtrCalculator;
+use App\Indicator\Core\Momentum\Macd;
+use App\Indicator\Core\Momentum\Rsi;
+use App\Indicator\Core\Trend\Adx;
+use App\Indicator\Core\Trend\Ema;
+use App\Indicator\Core\Trend\Sma;
+use App\Indicator\Core\Volatility\Bollinger;
+use App\Indicator\Core\Volume\Vwap;
+use App\TradingCore\Backtesting\CanonicalBacktestRuleEvaluator;
+use App\TradingCore\Backtesting\Indicator\CanonicalFourHourAggregator;
+use App\TradingCore\Backtesting\Indicator\CanonicalIndicatorBatchProjector;
+use App\TradingCore\Backtesting\Indicator\CanonicalIndicatorProjectionException;
+use App\TradingCore\Backtesting\Indicator\CanonicalIndicatorProjector;
+use App\TradingCore\Backtesting\Indicator\CanonicalPhpIndicatorCalculator;
+use PHPUnit\Framework\Attributes\CoversClass;
+use PHPUnit\Framework\Attributes\DataProvider;
+use PHPUnit\Framework\TestCase;
+
+#[CoversClass(CanonicalIndicatorBatchProjector::class)]
+final class CanonicalIndicatorBatchProjectorTest extends TestCase
+{
+    private const EVALUATIONS = [
+        '2026-01-01T04:10:00.000000Z',
+        '2026-01-01T04:12:30.000000Z',
+        '2026-01-01T04:13:00.000000Z',
+    ];
+
+    public function testEveryEvaluationMatchesTheSingleTimestampProjection(): void
+    {
+        $batch = $this->batch();
+        $result = (new CanonicalIndicatorBatchProjector($this->projector()))->project($batch);
+
+        self::assertSame('canonical-indicator-batch-projection-result.v1', $result['schema_version']);
+        self::assertSame(CanonicalBacktestRuleEvaluator::canonicalHash($batch), $result['input_hash']);
+        self::assertCount(3, $result['results']);
+        foreach ([[0, 250], [2, 252], [3, 253]] as $index => [$start, $stop]) {
+            $single = $this->projector()->project([
+                'schema_version' => 'canonical-indicator-projection-request.v1',
+                'request_id' => 'walk.' . $index,
+                'evaluated_at' => self::EVALUATIONS[$index],
+                'environment' => $batch['environment'],
+                'indicator_engine_version' => 'php_fallback_v1',
+                'dataset_binding' => $batch['dataset_binding'],
+                'symbol' => 'BTCUSDT',
+                'requested_timeframes' => ['1m'],
+                'candles_by_timeframe' => ['1m' => \array_slice($batch['candles_by_timeframe']['1m'], $start, $stop - $start)],
+            ]);
+            self::assertSame($single->toArray(), $result['results'][$index]);
+        }
+
+        $withoutResultHash = $result;
+        unset($withoutResultHash['result_hash']);
+        self::assertSame(CanonicalBacktestRuleEvaluator::canonicalHash($withoutResultHash), $result['result_hash']);
+    }
+
+    /** @param callable(array<string, mixed>): void $mutate */
+    #[DataProvider('invalidBatchProvider')]
+    public function testRejectsForgedBatches(callable $mutate, string $reason): void
+    {
+        $batch = $this->batch();
+        $mutate($batch);
+        try {
+            (new CanonicalIndicatorBatchProjector($this->projector()))->project($batch);
+            self::fail('Expected batch rejection.');
+        } catch (CanonicalIndicatorProjectionException $exception) {
+            self::assertSame($reason, $exception->getMessage());
+        }
+    }
+
+    /** @return iterable<string, array{callable, string}> */
+    public static function invalidBatchProvider(): iterable
+    {
+        yield 'extra field' => [static function (array &$batch): void { $batch['evaluated_at'] = self::EVALUATIONS[0]; }, 'canonical_indicator_request_shape_invalid'];
+        yield 'single request schema' => [static function (array &$batch): void { $batch['schema_version'] = 'canonical-indicator-projection-request.v1'; }, 'canonical_indicator_request_schema_invalid'];
+        yield 'unordered evaluations' => [static function (array &$batch): void { $batch['evaluations'] = array_reverse(self::EVALUATIONS); }, 'canonical_indicator_evaluations_invalid'];
+        yield 'no evaluations' => [static function (array &$batch): void { $batch['evaluations'] = []; }, 'canonical_indicator_evaluations_invalid'];
+        yield 'union too short' => [static function (array &$batch): void { array_shift($batch['candles_by_timeframe']['1m']); }, 'canonical_indicator_window_count_invalid'];
+        yield 'unused union prefix' => [static function (array &$batch): void { array_shift($batch['evaluations']); }, 'canonical_indicator_batch_window_invalid'];
+        yield 'unused union suffix' => [static function (array &$batch): void { array_pop($batch['evaluations']); }, 'canonical_indicator_batch_window_invalid'];
+    }
+
+    /** @return array<string, mixed> */
+    private function batch(): array
+    {
+        $datasetChecksum = 'sha256:' . str_repeat('a', 64);
+        $start = new \DateTimeImmutable('2026-01-01T00:00:00.000000Z');
+        $records = [];
+        for ($index = 0; $index < 253; ++$index) {
+            $open = 100.0 + ($index * 0.1) + (($index % 7) * 0.03);
+            $close = $open + ((($index % 9) - 4) * 0.02);
+            $openAt = $start->modify('+' . ($index * 60) . ' seconds');
+            $closeAt = $openAt->modify('+60 seconds');
+            $records[] = [
+                'schema_version' => 'backtest-candle.v1',
+                'source_record_id' => hash('sha256', '1m-batch-' . $index),
+                'source_network' => 'mainnet',
+                'market_data_venue' => 'okx',
+                'market_type' => 'perpetual',
+                'symbol' => 'BTCUSDT',
+                'timeframe' => '1m',
+                'open_at' => $openAt->format('Y-m-d\TH:i:s.u\Z'),
+                'close_at' => $closeAt->format('Y-m-d\TH:i:s.u\Z'),
+                'available_at' => $closeAt->format('Y-m-d\TH:i:s.u\Z'),
+                'open' => $this->decimal($open),
+                'high' => $this->decimal(max($open, $close) + 0.17),
+                'low' => $this->decimal(min($open, $close) - 0.13),
+                'close' => $this->decimal($close),
+                'volume' => $this->decimal(10.0 + (($index * 13) % 29)),
+                'complete' => true,
+            ];
+        }
+
+        return [
+            'schema_version' => 'canonical-indicator-batch-projection-request.v1',
+            'request_id' => 'walk',
+            'evaluations' => self::EVALUATIONS,
+            'environment' => 'test',
+            'indicator_engine_version' => 'php_fallback_v1',
+            'dataset_binding' => [
+                'dataset_id' => 'backtest-dataset-' . substr($datasetChecksum, 7),
+                'dataset_checksum' => $datasetChecksum,
+                'candles_checksum' => 'sha256:' . str_repeat('b', 64),
+                'quality_report_checksum' => 'sha256:' . str_repeat('c', 64),
+                'source_checksum' => 'sha256:' . str_repeat('d', 64),
+                'source_network' => 'mainnet',
+                'market_data_venue' => 'okx',
+                'market_type' => 'perpetual',
+            ],
+            'symbol' => 'BTCUSDT',
+            'requested_timeframes' => ['1m'],
+            'candles_by_timeframe' => ['1m' => $records],
+        ];
+    }
+
+    private function projector(): CanonicalIndicatorProjector
+    {
+        return new CanonicalIndicatorProjector(new CanonicalPhpIndicatorCalculator(
+            new Rsi(), new Macd(), new Ema(), new Adx(), new Sma(),
+            new AtrCalculator(null), new Vwap(), new Bollinger(),
+        ), new CanonicalFourHourAggregator());
+    }
+
+    private function decimal(float $value): string
+    {
+        return rtrim(rtrim(sprintf('%.8F', $value), '0'), '.');
+    }
+}
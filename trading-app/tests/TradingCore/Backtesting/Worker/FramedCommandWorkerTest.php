@@ -0,0 +1,61 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\Tests\TradingCore\Backtesting\Worker;
+
+use App\TradingCore\Backtesting\Worker\FramedCommandWorker;
+use PHPUnit\Framework\Attributes\CoversClass;
+use PHPUnit\Framework\TestCase;
+use Symfony\Component\Console\Command\Command;
+
+#[CoversClass(FramedCommandWorker::class)]
+final class FramedCommandWorkerTest extends TestCase
+{
+    public function testItAnswersEveryFrameInOrderUntilEof(): void
+    {
+        [$code, $frames] = $this->serve(
+            pack('N', 7) . '{"a":1}' . pack('N', 0),
+            static fn (string $payload): array => [$payload === '' ? 2 : 0, strtoupper($payload) . "\n"],
+        );
+
+        self::assertSame(Command::SUCCESS, $code);
+        self::assertSame(
+            pack('NC', 8, 0) . "{\"A\":1}\n" . pack('NC', 1, 2) . "\n",
+            $frames,
+        );
+    }
+
+    public function testTruncatedOrOversizedFramesStopTheWorker(): void
+    {
+        $echo = static fn (string $payload): array => [0, $payload];
+
+        foreach ([
+            pack('N', 7) . '{"a":',
+            "\x00\x00",
+            pack('N', FramedCommandWorker::MAX_FRAME_BYTES + 1),
+        ] as $input) {
+            [$code, $frames] = $this->serve($input, $echo);
+            self::assertSame(Command::FAILURE, $code);
+            self::assertSame('', $frames);
+        }
+    }
+
+    /**
+     * @param \Closure(string): array{int, string} $handle
+     *
+     * @return array{int, string}
+     */
+    private function serve(string $input, \Closure $handle): array
+    {
+        $stdin = fopen('php://memory', 'w+b');
+        $stdout = fopen('php://memory', 'w+b');
+        fwrite($stdin, $input);
+        rewind($stdin);
+
+        $code = (new FramedCommandWorker())->run($handle, $stdin, $stdout);
+        rewind($stdout);
+
+        return [$code, (string) stream_get_contents($stdout)];
+    }
+}